@@ -103,6 +103,9 @@ for i in range(0, 2):  # number of queues to spin up
         Queue("ti-queue-{}".format(i), connection=redis_rq_conn)
     )
 
+# for work someone is waiting on.  every worker checks it before its own queue.
+ti_high_priority_queue = Queue("ti-queue-high", connection=redis_rq_conn)
+
 
 # imports got here for tables that need auto-created.
 # from models import temp_orcid_profile
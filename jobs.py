@@ -1,28 +1,114 @@
 from time import time
 from time import sleep
 import argparse
+import inspect
+import itertools
 import logging
+import os
+import random
+import traceback
+from collections import defaultdict
+from multiprocessing import Pool
 
 from sqlalchemy.dialects import postgresql
 from sqlalchemy import orm
+from sqlalchemy import func
+from rq.job import Job
+from rq.job import JobStatus
+from rq.utils import utcnow
+from rq import Queue
 
 from app import db
 from app import ti_queues
+from app import ti_high_priority_queue
+from models import metrics
+from models.run_checkpoint import RunCheckpoint
+from models.chunk_cost import get_seconds_per_cost
+from models.chunk_cost import record_chunk_duration
+from models.chunk_cost import make_cost_chunks
+from models.job_keys import claim_objects
+from models.job_keys import mark_running
+from models.job_keys import mark_done
+from models.job_keys import clear_job_keys
 from util import elapsed
 from util import chunks
 from util import safe_commit
 
 
 
-def update_fn(cls, method_name, obj_id_list, shortcut_data=None, index=1):
+def get_load_options(cls, load_columns=None, load_relationships=None):
+    # with no loading profile declared, load everything, deferred columns included
+    if load_columns is None and load_relationships is None:
+        return [orm.undefer('*')]
 
-    # we are in a fork!  dispose of our engine.
-    # will get a new one automatically
-    db.engine.dispose()
+    options = []
+    if load_columns is None:
+        options.append(orm.undefer('*'))
+    else:
+        options.append(orm.Load(cls).load_only(*load_columns))
+
+    if load_relationships is not None:
+        # relationships that weren't declared still load if they're used, just not up front
+        options.append(orm.lazyload('*'))
+        for relationship_name in load_relationships:
+            options.append(orm.subqueryload(relationship_name).lazyload('*'))
+    return options
+
+
+# set by rq_worker.py --warm, where jobs run in one long-lived process
+# that checks its own connections instead of forking for each job
+warm_process = False
 
+
+def update_fn(cls, method_name, obj_id_list, shortcut_data=None, index=1, load_columns=None, load_relationships=None,
+              high_priority=False, run_name=None, chunk_cost=None, dedupe=False):
     start = time()
+    update_name = u"{}.{}".format(cls.__name__, method_name)
+    if dedupe:
+        mark_running(update_name, obj_id_list)
+
+    try:
+        commit_success = run_update_chunk(cls, method_name, obj_id_list, shortcut_data, index,
+                                          load_columns, load_relationships, high_priority)
+    except Exception:
+        if run_name:
+            RunCheckpoint(run_name).chunk_failed(obj_id_list)
+        if dedupe:
+            clear_job_keys(update_name, obj_id_list)
+        raise
+
+    if dedupe:
+        if commit_success is False:
+            clear_job_keys(update_name, obj_id_list)
+        else:
+            mark_done(update_name, obj_id_list)
 
-    q = db.session.query(cls).options(orm.undefer('*')).filter(cls.id.in_(obj_id_list))
+    # so the next run can size its chunks, see models/chunk_cost.py
+    record_chunk_duration(update_name, chunk_cost, time() - start)
+
+    if run_name:
+        if commit_success is False:
+            RunCheckpoint(run_name).chunk_failed(obj_id_list)
+        else:
+            RunCheckpoint(run_name).chunk_done(obj_id_list)
+
+    # rq throws results away (result_ttl=0), but the pool workers need to know
+    return commit_success is not False
+
+
+def run_update_chunk(cls, method_name, obj_id_list, shortcut_data=None, index=1, load_columns=None, load_relationships=None,
+                     high_priority=False):
+
+    if not warm_process:
+        # we are in a fork!  dispose of our engine.
+        # will get a new one automatically
+        db.engine.dispose()
+
+    start = time()
+    metric_labels = {"method": u"{}.{}".format(cls.__name__, method_name)}
+
+    load_options = get_load_options(cls, load_columns, load_relationships)
+    q = db.session.query(cls).options(*load_options).filter(cls.id.in_(obj_id_list))
     obj_rows = q.all()
     num_obj_rows = len(obj_rows)
 
@@ -38,9 +124,10 @@ def update_fn(cls, method_name, obj_id_list, shortcut_data=None, index=1):
         safe_commit(db)
         logger.info(u"done")
 
-    q = db.session.query(cls).options(orm.undefer('*')).filter(cls.id.in_(obj_id_list))
-    obj_rows = q.all()
-    num_obj_rows = len(obj_rows)
+        # only need to get them again if some were just made
+        q = db.session.query(cls).options(*load_options).filter(cls.id.in_(obj_id_list))
+        obj_rows = q.all()
+        num_obj_rows = len(obj_rows)
 
     print "{repr}.{method_name}() got {num_obj_rows} objects in {elapsed}sec".format(
         repr=cls.__name__,
@@ -49,37 +136,347 @@ def update_fn(cls, method_name, obj_id_list, shortcut_data=None, index=1):
         elapsed=elapsed(start)
     )
 
-    for count, obj in enumerate(obj_rows):
+    # classes can run some methods over the whole chunk at once, see Person.bulk_methods
+    bulk_method = getattr(cls, "bulk_methods", {}).get(method_name)
+    if bulk_method:
         start_time = time()
-
-        if obj is None:
-            return None
-
-        method_to_run = getattr(obj, method_name)
-
-        print u"\n***\n{count}: starting {repr}.{method_name}() method".format(
-            count=count + (num_obj_rows*index),
-            repr=obj,
-            method_name=method_name
-        )
-
         if shortcut_data:
-            method_to_run(shortcut_data)
+            bulk_method(obj_rows, shortcut_data)
         else:
-            method_to_run()
-
-        print u"finished {repr}.{method_name}(). took {elapsed}sec".format(
-            repr=obj,
+            bulk_method(obj_rows)
+        print u"finished bulk {repr}.{method_name}() on {num_obj_rows} objects. took {elapsed}sec".format(
+            repr=cls.__name__,
             method_name=method_name,
+            num_obj_rows=num_obj_rows,
             elapsed=elapsed(start_time, 4)
         )
+    else:
+        # methods that call upstream apis take high_priority, see models/rate_limit.py
+        method_kwargs = {}
+        if high_priority and "high_priority" in inspect.getargspec(getattr(cls, method_name)).args:
+            method_kwargs["high_priority"] = True
+
+        for count, obj in enumerate(obj_rows):
+            start_time = time()
+
+            if obj is None:
+                return None
+
+            method_to_run = getattr(obj, method_name)
+
+            print u"\n***\n{count}: starting {repr}.{method_name}() method".format(
+                count=count + (num_obj_rows*index),
+                repr=obj,
+                method_name=method_name
+            )
+
+            if shortcut_data:
+                method_to_run(shortcut_data, **method_kwargs)
+            else:
+                method_to_run(**method_kwargs)
+
+            print u"finished {repr}.{method_name}(). took {elapsed}sec".format(
+                repr=obj,
+                method_name=method_name,
+                elapsed=elapsed(start_time, 4)
+            )
+            metrics.observe("ti_update_object_seconds", time() - start_time, metric_labels)
 
     commit_success = safe_commit(db)
     if not commit_success:
         print u"COMMIT fail"
+        metrics.inc("ti_update_commit_failures_total", metric_labels)
     db.session.remove()  # close connection nicely
-    return None  # important for if we use this on RQ
 
+    metrics.inc("ti_update_objects_total", metric_labels, num_obj_rows)
+    metrics.inc("ti_update_chunks_total", metric_labels)
+    metrics.observe("ti_update_chunk_seconds", time() - start, metric_labels)
+    metrics.flush()
+    return commit_success
+
+
+
+def iter_id_windows(cls, ids_q_or_list, window_size, limit=None):
+    """
+    Yields lists of ids, at most window_size at a time, in primary key order.
+
+    Pages through the query on the primary key (id > the last id we saw)
+    instead of reading it all at once, so each page is a range scan on the
+    index and only one window of ids is ever in memory.
+    """
+    if isinstance(ids_q_or_list, list):
+        for window in chunks(ids_q_or_list[:limit], window_size):
+            yield window
+        return
+
+    num_ids = 0
+    last_id = None
+    while limit is None or num_ids < limit:
+        q = ids_q_or_list.order_by(None).order_by(cls.id)
+        if last_id is not None:
+            q = q.filter(cls.id > last_id)
+        if limit is None:
+            q = q.limit(window_size)
+        else:
+            q = q.limit(min(window_size, limit - num_ids))
+
+        window = [row[0] for row in q.all()]
+        if not window:
+            return
+        yield window
+
+        num_ids += len(window)
+        last_id = window[-1]
+
+
+def sample_ids(cls, ids_q, limit):
+    """
+    A random sample of limit ids from the query, in primary key order, the
+    same people order_by(func.random()).limit(limit) would pick.
+
+    Returns the query itself if it doesn't have more than limit ids, so a
+    run over everything still pages through it by id.
+    """
+    ids_q = ids_q.order_by(None)
+    if ids_q.count() <= limit:
+        return ids_q
+    q = ids_q.order_by(func.random()).limit(limit)
+    return sorted([row[0] for row in q.all()])
+
+
+def get_object_costs(cls, cost_column, object_ids):
+    if cost_column is None:
+        return dict((object_id, 1) for object_id in object_ids)
+    q = db.session.query(cls.id, cost_column).filter(cls.id.in_(object_ids))
+    return dict((object_id, 1 + (cost or 0)) for (object_id, cost) in q)
+
+
+def make_chunker(cls, method, chunk_size, cost_column=None, target_seconds=None):
+    """
+    Returns a function that splits a window of ids into a list of
+    (object_ids_chunk, chunk_cost).
+
+    Without target_seconds, chunks are chunk_size ids and have no cost.
+    With it, chunks are sized so each should take about target_seconds,
+    going by cost_column and the rate the last chunks ran at.
+    """
+    if not target_seconds:
+        return lambda window: [(object_ids_chunk, None) for object_ids_chunk in chunks(window, chunk_size)]
+
+    update_name = u"{}.{}".format(cls.__name__, method)
+
+    def chunker(window):
+        costs = get_object_costs(cls, cost_column, window)
+        # read every window, so local runs pick up what their own chunks have learned
+        seconds_per_cost = get_seconds_per_cost(update_name)
+        if not seconds_per_cost:
+            # nothing's been timed yet, so fixed size chunks until something has
+            return [(object_ids_chunk, sum([costs.get(object_id, 1) for object_id in object_ids_chunk]))
+                    for object_ids_chunk in chunks(window, chunk_size)]
+        return make_cost_chunks(window, costs, target_seconds / seconds_per_cost)
+
+    return chunker
+
+
+def prepare_windows(id_windows, chunker, shuffle=False, shuffle_seed=0, checkpoint=None, move_cursor=True, claim=None):
+    """
+    Yields each window of ids as a list of (object_ids_chunk, chunk_cost).
+
+    claim takes a window and returns the ids in it that should be run.
+    """
+    for window_index, window in enumerate(id_windows):
+        # the cursor is the last id in primary key order, so take it before shuffling
+        cursor = window[-1] if move_cursor else None
+
+        if claim:
+            window = claim(window)
+
+        if shuffle:
+            # same seed and window, same order, so a run can be repeated or picked up again
+            random.Random(u"{}:{}".format(shuffle_seed, window_index)).shuffle(window)
+
+        # every id in the window can have been skipped
+        window_chunks = chunker(window) if window else []
+        if checkpoint:
+            checkpoint.add_window([object_ids_chunk for (object_ids_chunk, chunk_cost) in window_chunks], cursor)
+        yield window_chunks
+
+
+def make_update_job(queue, update_fn_args, update_fn_kwargs, object_ids_chunk):
+    job = Job.create(
+        update_fn,
+        args=update_fn_args,
+        kwargs=update_fn_kwargs,
+        connection=queue.connection,
+        timeout=60 * 10,
+        result_ttl=0,  # number of seconds
+        status=JobStatus.QUEUED,
+        origin=queue.name
+    )
+    job.meta["object_ids_chunk"] = object_ids_chunk
+    job.enqueued_at = utcnow()
+    return job
+
+
+def split_timed_out_job(job):
+    """
+    Puts a timed out update_fn job back on its queue as two half-size jobs.
+
+    Returns False if it's down to one object and can't be split.
+    """
+    (cls, method_name, object_ids_chunk) = job.args[:3]
+    if len(object_ids_chunk) < 2:
+        return False
+
+    # it took at least this long, which is worth knowing when sizing chunks
+    update_name = u"{}.{}".format(cls.__name__, method_name)
+    chunk_cost = job.kwargs.get("chunk_cost")
+    record_chunk_duration(update_name, chunk_cost, job.timeout)
+
+    half = len(object_ids_chunk) / 2
+    half_chunks = [object_ids_chunk[:half], object_ids_chunk[half:]]
+
+    costs = None
+    if chunk_cost:
+        # each half costs what its own objects do, which can be far from half the chunk
+        update = update_registry.updates.get(update_name)
+        costs = get_object_costs(cls, update.cost_column if update else None, object_ids_chunk)
+        db.session.remove()
+
+    queue = Queue(job.origin, connection=job.connection)
+    jobs = []
+    for half_chunk in half_chunks:
+        update_fn_kwargs = dict(job.kwargs)
+        if costs:
+            update_fn_kwargs["chunk_cost"] = sum([costs.get(object_id, 1) for object_id in half_chunk])
+        jobs.append(make_update_job(queue, [cls, method_name, half_chunk], update_fn_kwargs, half_chunk))
+
+    # update_fn moved the chunk to the failed ids when it timed out.  the halves go
+    # in pending, so --resume finds them, and take their ids back out of failed when done.
+    run_name = job.kwargs.get("run_name")
+    if run_name:
+        RunCheckpoint(run_name).add_window(half_chunks)
+    push_jobs(queue, jobs)
+
+    print u"{}.{}() timed out on {} objects, so requeued them as chunks of {} and {}".format(
+        cls.__name__, method_name, len(object_ids_chunk), half, len(object_ids_chunk) - half)
+    return True
+
+
+def push_jobs(queue, jobs):
+    # one round trip for the whole window.  it's a MULTI, so workers never
+    # see a job id on the queue before the job itself is saved.
+    if not jobs:
+        return
+    pipe = queue.connection.pipeline()
+    pipe.sadd(queue.redis_queues_keys, queue.key)
+    for job in jobs:
+        job.save(pipeline=pipe)
+    pipe.rpush(queue.key, *[job.id for job in jobs])
+    pipe.execute()
+
+
+# set once in each pool worker by init_pool_worker, so shortcut data
+# isn't sent along with every chunk
+_pool_worker_shortcut_data = None
+
+
+def init_pool_worker(shortcut_data):
+    global _pool_worker_shortcut_data
+    _pool_worker_shortcut_data = shortcut_data
+
+
+def run_chunk_in_pool_worker(chunk_args):
+    (cls, method_name, object_ids_chunk, index, update_fn_kwargs) = chunk_args
+    start = time()
+    try:
+        # update_fn disposes of the engine it inherited, so each worker gets its own
+        if update_fn(cls, method_name, object_ids_chunk, _pool_worker_shortcut_data, index=index, **update_fn_kwargs):
+            error = None
+        else:
+            error = u"COMMIT fail, the chunk was rolled back"
+    except Exception:
+        error = traceback.format_exc()
+        db.session.remove()
+    return (object_ids_chunk, error, elapsed(start))
+
+
+def run_chunks_in_pool(cls, method, id_windows, workers, shortcut_data=None, update_fn_kwargs=None,
+                       chunk_finished=None):
+    """
+    Runs update_fn over chunks of ids in a pool of worker processes on this machine.
+
+    Windows are run one at a time, so only one window of ids is ever waiting
+    in the pool.  chunk_finished is called with each chunk's ids as it comes back.
+    Returns (number of ids done, list of (ids, error) for chunks that failed).
+    """
+    # the workers are forked from us, so don't hand them open connections
+    db.session.remove()
+    db.engine.dispose()
+
+    pool = Pool(processes=workers, initializer=init_pool_worker, initargs=(shortcut_data,))
+    start_time = time()
+    index = 0
+    num_ids = 0
+    failures = []
+
+    try:
+        for window_chunks in id_windows:
+            chunk_args_list = []
+            for (object_ids_chunk, chunk_cost) in window_chunks:
+                chunk_kwargs = dict(update_fn_kwargs or {}, chunk_cost=chunk_cost)
+                chunk_args_list.append((cls, method, object_ids_chunk, index, chunk_kwargs))
+                index += 1
+
+            for (object_ids_chunk, error, chunk_elapsed) in pool.imap_unordered(run_chunk_in_pool_worker, chunk_args_list):
+                if chunk_finished:
+                    chunk_finished(object_ids_chunk)
+                num_ids += len(object_ids_chunk)
+                if error:
+                    failures.append((object_ids_chunk, error))
+                    print u"FAILED chunk of {} ids in {}sec, starting with {}:\n{}".format(
+                        len(object_ids_chunk), chunk_elapsed, object_ids_chunk[0], error)
+
+            ids_per_hour = num_ids / (max(elapsed(start_time), 0.01) / 3600)
+            print "\n\n{} workers have done {} ids, {} ids per hour, {} chunks failed\n".format(
+                workers, num_ids, int(ids_per_hour), len(failures))
+    finally:
+        pool.close()
+        pool.join()
+
+    return (num_ids, failures)
+
+
+def claim_pending_chunks(pending_chunks, claim, release, use_rq):
+    """
+    The pending chunks of a resumed run that should be run again.
+
+    A local run's chunks died with it, so they're all run, whatever their
+    keys say.  An rq run's jobs can still be on the queue or running, and
+    they'll take their chunks out of pending themselves, so a chunk is only
+    run again if none of its ids are claimed.
+    """
+    if not use_rq:
+        for object_ids_chunk in pending_chunks:
+            claim(object_ids_chunk, force=True)
+        return pending_chunks
+
+    resp = []
+    for object_ids_chunk in pending_chunks:
+        # done ids don't count, a chunk whose commit finished is out of pending already
+        claimed = claim(object_ids_chunk, fresh_for=0)
+        if len(claimed) == len(object_ids_chunk):
+            resp.append(object_ids_chunk)
+        elif claimed:
+            # the rest of it is still with its old job, so leave it all to that
+            release(claimed)
+    return resp
+
+
+def get_chunk_cost(object_ids_chunk, costs):
+    if costs is None:
+        return None
+    return sum([costs.get(object_id, 1) for object_id in object_ids_chunk])
 
 
 def enqueue_jobs(cls,
@@ -88,17 +485,60 @@ def enqueue_jobs(cls,
          queue_number,
          use_rq=True,
          chunk_size=25,
-         shortcut_fn=None
+         shortcut_fn=None,
+         load_columns=None,
+         load_relationships=None,
+         limit=None,
+         shuffle=False,
+         shuffle_seed=0,
+         window_size=10000,
+         workers=None,
+         high_priority=False,
+         pending_chunks=None,
+         run_name=None,
+         cost_column=None,
+         target_seconds=None,
+         fresh_for=0,
+         force=False,
+         empty_queue_first=False
     ):
     """
     Takes sqlalchemy query with IDs, runs fn on those repos.
+
+    IDs are read window_size at a time in primary key order.  With shuffle,
+    each window is shuffled before it's chunked, which spreads the work about
+    without asking postgres to sort the whole table at random.
+
+    With workers, chunks are run in that many local processes instead of RQ.
+    With high_priority, jobs go on the high priority queue and get the
+    reserved share of upstream rate limits.
+
+    With run_name, progress is checkpointed (see models/run_checkpoint.py).
+    pending_chunks are run before the query; they're the chunks a resumed
+    run never finished.  With rq, the ones whose jobs are still queued or
+    running are left to those jobs.
+
+    With target_seconds, chunks are sized by cost instead of chunk_size,
+    see make_chunker.
+
+    Objects that are already queued or running for this method, or were done
+    less than fresh_for seconds ago, are skipped (see models/job_keys.py)
+    unless force is set.  empty_queue_first empties the rq queue first, and
+    then doesn't count objects as queued, except on the high priority queue,
+    which is never emptied.
     """
 
     shortcut_data = None
+    queue_emptied = False
     if use_rq:
-        empty_queue(queue_number)
+        if empty_queue_first and not high_priority:
+            # the high priority queue is shared, so only ever empty our own
+            empty_queue(queue_number)
+            queue_emptied = True
         if shortcut_fn:
             raise ValueError("you can't use RQ with a shortcut_fn")
+        if workers:
+            raise ValueError("you can't use RQ with local workers")
 
     else:
         if shortcut_fn:
@@ -110,77 +550,176 @@ def enqueue_jobs(cls,
             )
 
     chunk_size = int(chunk_size)
-
+    # whole chunks per window, so only the very last chunk comes up short
+    window_size = chunk_size * max(1, int(window_size) / chunk_size)
 
     start_time = time()
     new_loop_start_time = time()
     index = 0
+    num_ids = 0
+    num_failed_chunks = 0
 
-    print "running this query: \n{}\n".format(
-        ids_q_or_list.statement.compile(dialect=postgresql.dialect())
-    )
-    row_list = ids_q_or_list.all()
-    print "finished query in {}sec".format(elapsed(start_time))
-    if row_list is None:
-        print "no IDs, all done."
-        return None
-
-    object_ids = [row[0] for row in row_list]
-
-    num_jobs = len(object_ids)
-    if use_rq:
-        print "adding {} jobs to queue...".format(num_jobs)
-
-    # iterate through chunks of IDs like [[id1, id2], [id3, id4], ...  ]
-    object_ids_chunk = []
-
-
-    for object_ids_chunk in chunks(object_ids, chunk_size):
-
-        update_fn_args = [cls, method, object_ids_chunk]
+    if not isinstance(ids_q_or_list, list):
+        print "paging through this query by {}: \n{}\n".format(
+            cls.id,
+            ids_q_or_list.statement.compile(dialect=postgresql.dialect())
+        )
 
-        if use_rq:
-            job = ti_queues[queue_number].enqueue_call(
-                func=update_fn,
-                args=update_fn_args,
-                timeout=60 * 10,
-                result_ttl=0  # number of seconds
-            )
-            job.meta["object_ids_chunk"] = object_ids_chunk
-            job.save()
-        else:
-            print "not using rq"
-            update_fn_args.append(shortcut_data)
-            update_fn(*update_fn_args, index=index)
-
-        if True: # index % 10 == 0 and index != 0:
-            num_jobs_remaining = num_jobs - (index * chunk_size)
-            try:
-                jobs_per_hour_this_chunk = chunk_size / float(elapsed(new_loop_start_time) / 3600)
-                predicted_mins_to_finish = round(
-                    (num_jobs_remaining / float(jobs_per_hour_this_chunk)) * 60,
-                    1
-                )
-                print "\n\nWe're doing {} jobs per hour. At this rate, done in {}min".format(
-                    int(jobs_per_hour_this_chunk),
-                    predicted_mins_to_finish
-                )
-                print "(finished chunk {} of {} chunks in {}sec total, {}sec this loop)\n".format(
-                    index,
-                    num_jobs/chunk_size,
-                    elapsed(start_time),
-                    elapsed(new_loop_start_time)
+    update_fn_kwargs = {
+        "load_columns": load_columns,
+        "load_relationships": load_relationships,
+        "high_priority": high_priority,
+        "run_name": run_name,
+        "dedupe": True
+    }
+
+    update_name = u"{}.{}".format(cls.__name__, method)
+    skip_counts = defaultdict(int)
+
+    # ids claimed (marked queued) but not yet run or put on the queue.  a window is
+    # claimed before its chunks run, so if we stop part way through one, the rest of
+    # it is released instead of being skipped as queued until its key expires.
+    unrun_ids = set()
+
+    def claim(window, force=force, fresh_for=fresh_for):
+        (claimed, skipped) = claim_objects(update_name, window, fresh_for, ignore_queued=queue_emptied, force=force)
+        for (state, count) in skipped.iteritems():
+            skip_counts[state] += count
+        unrun_ids.update(claimed)
+        return claimed
+
+    def release(object_ids):
+        clear_job_keys(update_name, object_ids)
+        unrun_ids.difference_update(object_ids)
+
+    checkpoint = RunCheckpoint(run_name) if run_name else None
+    chunker = make_chunker(cls, method, chunk_size, cost_column, target_seconds)
+    id_windows = prepare_windows(
+        iter_id_windows(cls, ids_q_or_list, window_size, limit),
+        chunker,
+        shuffle,
+        shuffle_seed,
+        checkpoint,
+        move_cursor=not isinstance(ids_q_or_list, list),
+        claim=claim
+    )
+    try:
+        if checkpoint and isinstance(ids_q_or_list, list):
+            # there's no cursor to pick a list back up from, so every chunk goes in pending up front
+            id_windows = list(id_windows)
+        if pending_chunks:
+            pending_chunks = claim_pending_chunks(pending_chunks, claim, release, use_rq)
+            print "running {} chunks left pending last time first".format(len(pending_chunks))
+            # rerun whole, so they keep their keys in pending
+            pending_costs = None
+            if target_seconds and pending_chunks:
+                pending_costs = get_object_costs(cls, cost_column, [object_id for object_ids_chunk in pending_chunks
+                                                                    for object_id in object_ids_chunk])
+            pending_windows = []
+            for window_chunks in chunks(pending_chunks, max(1, window_size / chunk_size)):
+                pending_windows.append([(object_ids_chunk, get_chunk_cost(object_ids_chunk, pending_costs))
+                                        for object_ids_chunk in window_chunks])
+            id_windows = itertools.chain(pending_windows, id_windows)
+
+        if workers:
+            (num_ids, failures) = run_chunks_in_pool(cls, method, id_windows, workers,
+                                                     shortcut_data, update_fn_kwargs,
+                                                     chunk_finished=unrun_ids.difference_update)
+            print "finished {} ids with {} workers in {}sec, {} ids per second".format(
+                num_ids, workers, elapsed(start_time), round(num_ids / max(elapsed(start_time), 0.001), 1))
+            if failures:
+                print "{} chunks failed. their ids:".format(len(failures))
+                for (object_ids_chunk, error) in failures:
+                    print u"{}: {}".format(list(object_ids_chunk), error.strip().splitlines()[-1])
+            if checkpoint:
+                print checkpoint.summary()
+            print_skip_counts(skip_counts)
+            db.session.remove()
+            return not failures
+
+        # iterate through chunks of IDs like [[id1, id2], [id3, id4], ...  ]
+        object_ids_chunk = []
+
+        for window_chunks in id_windows:
+            if use_rq:
+                queue = ti_high_priority_queue if high_priority else ti_queues[queue_number]
+                jobs = []
+                for (object_ids_chunk, chunk_cost) in window_chunks:
+                    update_fn_args = [cls, method, object_ids_chunk]
+                    chunk_kwargs = dict(update_fn_kwargs, chunk_cost=chunk_cost)
+                    jobs.append(make_update_job(queue, update_fn_args, chunk_kwargs, object_ids_chunk))
+                    num_ids += len(object_ids_chunk)
+                push_jobs(queue, jobs)
+                for (object_ids_chunk, chunk_cost) in window_chunks:
+                    unrun_ids.difference_update(object_ids_chunk)
+                index += len(jobs)
+                print "added {} jobs to queue ({} ids so far) in {}sec".format(
+                    len(jobs),
+                    num_ids,
+                    elapsed(start_time)
                 )
-            except ZeroDivisionError:
-                print ".",
+                continue
+
+            for (object_ids_chunk, chunk_cost) in window_chunks:
+                print "not using rq"
+                update_fn_args = [cls, method, object_ids_chunk, shortcut_data]
+                # update_fn looks after the chunk's keys from here
+                unrun_ids.difference_update(object_ids_chunk)
+                if not update_fn(*update_fn_args, index=index, chunk_cost=chunk_cost, **update_fn_kwargs):
+                    num_failed_chunks += 1
+                num_ids += len(object_ids_chunk)
+
+                try:
+                    jobs_per_hour_this_chunk = len(object_ids_chunk) / float(elapsed(new_loop_start_time) / 3600)
+                    print "\n\nWe're doing {} jobs per hour.".format(int(jobs_per_hour_this_chunk)),
+                    if limit:
+                        predicted_mins_to_finish = round(
+                            ((limit - num_ids) / float(jobs_per_hour_this_chunk)) * 60,
+                            1
+                        )
+                        print "At this rate, done in {}min".format(predicted_mins_to_finish)
+                    else:
+                        print
+                    print "(finished chunk {}, {} ids, in {}sec total, {}sec this loop)\n".format(
+                        index,
+                        num_ids,
+                        elapsed(start_time),
+                        elapsed(new_loop_start_time)
+                    )
+                except ZeroDivisionError:
+                    print ".",
+
+                new_loop_start_time = time()
+                index += 1
+    finally:
+        if unrun_ids:
+            # claimed but never run or queued, so the next run doesn't skip them as queued
+            print "releasing {} ids that were claimed but not run".format(len(unrun_ids))
+            release(list(unrun_ids))
+
+    if not num_ids:
+        print "no IDs, all done."
+    else:
+        print "last chunk of ids: {}".format(list(object_ids_chunk))
+    if checkpoint:
+        print checkpoint.summary()
+    print_skip_counts(skip_counts)
+    if num_failed_chunks:
+        print "{} chunks failed to commit".format(num_failed_chunks)
 
+    db.session.remove()  # close connection nicely
+    return not num_failed_chunks
 
-            new_loop_start_time = time()
-        index += 1
-    print "last chunk of ids: {}".format(list(object_ids_chunk))
 
-    db.session.remove()  # close connection nicely
-    return True
+def print_skip_counts(skip_counts):
+    if not skip_counts:
+        return
+    print "skipped {} ids: {} already queued, {} running, {} done recently".format(
+        sum(skip_counts.values()),
+        skip_counts["queued"],
+        skip_counts["running"],
+        skip_counts["fresh"]
+    )
 
 
 
@@ -201,7 +740,9 @@ update_registry = UpdateRegistry()
 
 
 class Update():
-    def __init__(self, job, query, queue_id=None, chunk_size_default=10, shortcut_fn=None):
+    def __init__(self, job, query, queue_id=None, chunk_size_default=10, shortcut_fn=None,
+                 load_columns=None, load_relationships=None, shuffle=False, cost_column=None, target_seconds=None,
+                 fresh_for=0):
 
         self.queue_id = queue_id
         self.job = job
@@ -210,39 +751,107 @@ class Update():
         self.chunk_size_default = chunk_size_default
         self.shortcut_fn = shortcut_fn
 
+        # what the job's method reads, so update_fn can load just that.
+        # None means everything: all columns including deferred ones, all relationships.
+        self.load_columns = load_columns
+        self.load_relationships = load_relationships
+
+        # run the ids in a shuffled order, and with a limit, a random sample of them.
+        # enqueue_jobs pages through the query by id itself, so don't give it an
+        # order_by(func.random()).
+        self.shuffle = shuffle
+
+        # size chunks to take about target_seconds each, counting each object as
+        # 1 + cost_column (or just 1).  an explicit --chunk turns this off.
+        self.cost_column = cost_column
+        self.target_seconds = target_seconds
+
+        # skip objects this update was done for less than fresh_for seconds ago
+        self.fresh_for = fresh_for
+
         self.name = "{}.{}".format(self.cls.__name__, self.method.__name__)
-        self.query = query.order_by(self.cls.id)
+        self.query = query
 
-    def run(self, use_rq=False, obj_id=None, num_jobs=None, chunk_size=None, min_id=None):
+    def run(self, use_rq=False, obj_id=None, num_jobs=None, chunk_size=None, min_id=None, workers=None,
+            high_priority=False, run_name=None, resume=False, retry_failures=False, target_seconds=None,
+            fresh_for=None, force=False, empty_queue_first=False):
 
         if num_jobs is None:
             num_jobs = 1000
 
-        if use_rq:
+        if use_rq and not high_priority:
             if self.queue_id is None:
                 raise ValueError("you need a queue number to use RQ")
 
         if chunk_size is None:
             chunk_size = self.chunk_size_default
+            if target_seconds is None:
+                target_seconds = self.target_seconds
+
+        if fresh_for is None:
+            fresh_for = self.fresh_for
 
         query = self.query
         if min_id:
             query = query.filter(self.cls.id > min_id)
 
+        pending_chunks = None
         if obj_id:
             # don't run the query, just get the id that was requested
             query = db.session.query(self.cls.id).filter(self.cls.id == obj_id)
+            run_name = None
+            force = True  # asked for by id, so run it whatever state it's in
+        elif run_name:
+            # named runs are checkpointed, so they can be picked up again
+            checkpoint = RunCheckpoint(run_name)
+            if resume or retry_failures:
+                if not checkpoint.exists():
+                    raise ValueError(u"there's no run called {} to pick up".format(run_name))
+                print checkpoint.summary()
+            else:
+                if checkpoint.has_unfinished_work():
+                    raise ValueError(u"{}. resume it, retry its failures, or use a new name".format(
+                        checkpoint.summary()))
+                if self.shuffle:
+                    query = sample_ids(self.cls, query, num_jobs)
+                checkpoint.start(self.name, sampled=isinstance(query, list))
+
+            if retry_failures:
+                query = checkpoint.get_failed_ids()
+            elif resume:
+                pending_chunks = checkpoint.get_pending_chunks()
+                cursor = checkpoint.get_cursor()
+                if checkpoint.is_sampled():
+                    query = []  # the whole sample went in pending when the run started
+                elif cursor:
+                    query = query.filter(self.cls.id > cursor)
         else:
-            query = query.limit(num_jobs)
+            if resume or retry_failures:
+                raise ValueError("you need to --name the run to pick up")
+            if self.shuffle:
+                query = sample_ids(self.cls, query, num_jobs)
 
-        enqueue_jobs(
+        return enqueue_jobs(
             self.cls,
             self.method.__name__,
             query,
             self.queue_id,
             use_rq,
             chunk_size,
-            self.shortcut_fn
+            self.shortcut_fn,
+            self.load_columns,
+            self.load_relationships,
+            limit=num_jobs,
+            shuffle=self.shuffle,
+            workers=workers,
+            high_priority=high_priority,
+            pending_chunks=pending_chunks,
+            run_name=run_name,
+            cost_column=self.cost_column,
+            target_seconds=target_seconds,
+            fresh_for=fresh_for,
+            force=force,
+            empty_queue_first=empty_queue_first
         )
 
 
@@ -328,6 +937,13 @@ def empty_queue(queue_number_str):
     )
 
 
+def write_metrics(filename):
+    # for the node_exporter textfile collector: python jobs.py write_metrics /path/ti.prom
+    with open(filename + ".tmp", "w") as f:
+        f.write(metrics.render_metrics().encode("utf-8"))
+    os.rename(filename + ".tmp", filename)
+
+
 def main(fn, optional_args=None):
     start = time()
 
@@ -1,7 +1,7 @@
 from sqlalchemy import text
+from sqlalchemy import or_
 from sqlalchemy import orm
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql.expression import func
 
 from app import db
 import app
@@ -11,23 +11,49 @@ from jobs import Update
 from models.product import Product
 from models.person import Person
 from models import person
+from models.event_ledger import orcid_ids_with_unsent_events
+
+# update_fn prints every object it runs, so loading profiles include what __repr__ reads
+person_repr_columns = ["id", "twitter", "orcid_id", "given_names", "family_name"]
+product_repr_columns = ["id", "doi"]
 
 q = db.session.query(Person.id)
 q = q.filter(Person.orcid_id != None)
-q = q.order_by(func.random())
 update_registry.register(Update(
     job=Person.refresh,
     query=q,
-    queue_id=0
+    queue_id=0,
+    shuffle=True,
+    cost_column=Person.num_products,
+    target_seconds=120,  # rq times jobs out at 600
+    fresh_for=60 * 60 * 24  # don't refresh anyone refreshed in the last day
 ))
 
 q = db.session.query(Person.id)
 q = q.filter(Person.claimed_at != None)
+q = q.filter(Person.orcid_id.in_(orcid_ids_with_unsent_events()))
 update_registry.register(Update(
     job=Person.email_new_stuff,
     query=q,
 ))
 
+q = db.session.query(Person.id)
+q = q.filter(Person.events_emailed != None)
+update_registry.register(Update(
+    job=Person.migrate_events_emailed,
+    query=q,
+))
+
+# one-off, for ledger rows recorded before record_events marked old events as done
+q = db.session.query(Person.id)
+q = q.filter(Person.orcid_id.in_(orcid_ids_with_unsent_events()))
+update_registry.register(Update(
+    job=Person.close_old_events,
+    query=q,
+    load_columns=person_repr_columns + ["created"],
+    load_relationships=[]
+))
+
 
 q = db.session.query(Person.id)
 update_registry.register(Update(
@@ -67,10 +93,25 @@ update_registry.register(Update(
     query=q
 ))
 
+# runs a whole chunk of people through one ProductColumns, see Person.bulk_methods
 q = db.session.query(Person.id)
+update_registry.register(Update(
+    job=Person.set_product_metrics,
+    query=q,
+    load_relationships=["products"]
+))
+
+# only rows whose stored mendeley_sums are missing or from an older version
+q = db.session.query(Person.id)
+q = q.filter(or_(
+    Person.mendeley_sums == None,
+    Person.mendeley_sums["version"].astext != str(person.MENDELEY_SUMS_VERSION)
+))
 update_registry.register(Update(
     job=Person.set_mendeley_sums,
-    query=q
+    query=q,
+    load_columns=person_repr_columns + ["mendeley_sums"],
+    load_relationships=["products"]
 ))
 
 q = db.session.query(Product.id)
@@ -79,7 +120,19 @@ q = q.filter(Product.altmetric_api_raw != {})
 q = q.filter(Product.event_dates == None)
 update_registry.register(Update(
     job=Product.set_event_dates,
-    query=q
+    query=q,
+    load_columns=product_repr_columns + ["altmetric_api_raw", "event_dates"],
+    load_relationships=[]
+))
+
+q = db.session.query(Product.id)
+q = q.filter(Product.altmetric_api_raw != None)
+q = q.filter(Product.twitter_posters == None)
+update_registry.register(Update(
+    job=Product.set_twitter_posters,
+    query=q,
+    load_columns=product_repr_columns + ["altmetric_api_raw", "twitter_posters"],
+    load_relationships=[]
 ))
 
 q = db.session.query(Product.id)
@@ -87,14 +140,18 @@ q = q.filter(Product.altmetric_api_raw != None)
 q = q.filter(Product.altmetric_score == None)
 update_registry.register(Update(
     job=Product.set_altmetric_score,
-    query=q
+    query=q,
+    load_columns=product_repr_columns + ["altmetric_api_raw", "altmetric_score"],
+    load_relationships=[]
 ))
 
 q = db.session.query(Product.id)
 q = q.filter(Product.altmetric_api_raw != None)
 update_registry.register(Update(
     job=Product.set_altmetric_id,
-    query=q
+    query=q,
+    load_columns=product_repr_columns + ["altmetric_api_raw", "altmetric_id"],
+    load_relationships=[]
 ))
 
 q = db.session.query(Product.id)
@@ -141,7 +198,16 @@ update_registry.register(Update(
 q = db.session.query(Person.id)
 update_registry.register(Update(
     job=Person.set_num_oa_licenses,
-    query=q
+    query=q,
+    load_columns=person_repr_columns + [
+        "num_fulltext",
+        "num_user_supplied_fulltext",
+        "num_any_oa",
+        "num_cc_by",
+        "num_cc_restricted",
+        "num_cc0_pd"
+    ],
+    load_relationships=["products"]
 ))
 
 
@@ -155,14 +221,17 @@ q = db.session.query(Person.id)
 #             "0000-0001-6728-7745"]))
 update_registry.register(Update(
     job=Person.set_badge_percentiles,
-    query=q
+    query=q,
+    load_columns=person_repr_columns,
+    load_relationships=["badges"]
 ))
 
 q = db.session.query(Person.id)
 update_registry.register(Update(
     job=Person.assign_badges,
     query=q,
-    shortcut_fn=lambda: ["open_license", "percent_fulltext", "all_fulltext"]
+    shortcut_fn=lambda: ["open_license", "percent_fulltext", "all_fulltext"],
+    load_relationships=["products", "badges"]
 ))
 
 q = db.session.query(Person.id)
@@ -1,41 +1,38 @@
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
 
-from models.country import country_info
-from models.scientist_stars import scientists_twitter
-
 from app import db
 from util import date_as_iso_utc
 from util import conversational_number
 from util import calculate_percentile
-from util import days_ago
 from util import as_proportion
 
 import datetime
 import shortuuid
-from textstat.textstat import textstat
+from collections import namedtuple
+
 
+# the registry lookups below are built once, at the bottom of this module,
+# after all the BadgeAssigner subclasses have been defined
 
 def get_badge_assigner(name):
-    for assigner in all_badge_assigners():
-        if assigner.__name__ == name:
-            return assigner
-    return dummy_badge_assigner
+    return _badge_assigners_by_name.get(name, dummy_badge_assigner)
+
+def get_badge_type(name):
+    try:
+        return _badge_types[name]
+    except KeyError:
+        return _badge_types["dummy_badge_assigner"]
 
 def all_badge_assigner_names():
-    return [assigner().name for assigner in all_badge_assigners()]
+    return list(_badge_assigner_names)
 
 def all_badge_assigners():
-    assigners = BadgeAssigner.__subclasses__()
-    assigners.sort(key=lambda x: x.group)
-    return assigners
+    return list(_badge_assigners)
 
 def badge_configs():
-    configs = {}
-    for assigner in all_badge_assigners():
-        if assigner.show_in_ui and assigner.valid_badge:
-            configs[assigner.__name__] = assigner.config_dict()
-    return configs
+    # shared, so read it, don't change it
+    return _badge_configs
 
 
 class Badge(db.Model):
@@ -80,12 +77,7 @@ class Badge(db.Model):
 
     @property
     def my_badge_type(self):
-        assigner = get_badge_assigner(self.name)
-        if assigner:
-            my_assigner = assigner()
-        else:
-            my_assigner = dummy_badge_assigner()
-        return my_assigner
+        return get_badge_type(self.name)
 
     @property
     def sort_score(self):
@@ -248,6 +240,33 @@ class Badge(db.Model):
         return resp
 
 
+class CandidateBadge(object):
+    # what an assigner fills in while deciding.  only becomes a Badge if assigned.
+    def __init__(self, name):
+        self.name = name
+        self.value = None
+        self.support = None
+        self.products = {}
+
+    def add_product(self, my_product):
+        self.products[my_product.doi] = True
+
+    def add_products(self, products_list):
+        for my_product in products_list:
+            self.add_product(my_product)
+
+    def remove_all_products(self):
+        self.products = {}
+
+    def make_badge(self):
+        return Badge(
+            name=self.name,
+            value=self.value,
+            support=self.support,
+            products=self.products
+        )
+
+
 class BadgeAssigner(object):
     display_name = ""
     group = None
@@ -266,21 +285,21 @@ class BadgeAssigner(object):
     show_in_ui = True
 
     def __init__(self):
-        self.candidate_badge = Badge(name=self.__class__.__name__)
+        self.candidate_badge = CandidateBadge(name=self.__class__.__name__)
         self.assigned = False
 
     @property
     def name(self):
         return self.__class__.__name__
 
-    # override this in subclasses
-    def decide_if_assigned(self, person):
+    # override this in subclasses.  features is a models.badge_features.BadgeFeatures
+    def decide_if_assigned(self, features):
         return None
 
-    def get_badge_or_None(self, person):
-        self.decide_if_assigned(person)
+    def get_badge_or_None(self, features):
+        self.decide_if_assigned(features)
         if self.assigned:
-            return self.candidate_badge
+            return self.candidate_badge.make_badge()
         return None
 
     @classmethod
@@ -307,10 +326,10 @@ class depsy(BadgeAssigner):
     importance = .6
     context = ""
 
-    def decide_if_assigned(self, person):
-        if person.depsy_id and person.depsy_percentile:
+    def decide_if_assigned(self, features):
+        if features.depsy_id and features.depsy_percentile:
             self.assigned = True
-            self.candidate_badge.value = person.depsy_percentile * 100
+            self.candidate_badge.value = features.depsy_percentile * 100
             # self.candidate_badge.support = u"You are in the {} percentile <a href='http://depsy.org/person/{}'>on Depsy</a>.".format(
             #     round(person.depsy_percentile * 100, 0),
             #     person.depsy_id
@@ -326,29 +345,8 @@ class reading_level(BadgeAssigner):
               u"It also puts you in the top {percentile}% in readability."
     pad_percentiles_with_zeros = False
 
-    def decide_if_assigned(self, person):
-        reading_levels = {}
-        for my_product in person.all_products:
-            text = ""
-            if my_product.title:
-                text += u" " + my_product.title
-            if my_product.get_abstract_using_mendeley():
-                text += u" " + my_product.get_abstract_using_mendeley()
-
-            # only do if at least three words between periods,
-            # otherwise textstat library prints too many Not Enough Words error messages
-            if text:
-                sentences = text.split(".")
-                if any([len(sentence.split())>3 for sentence in sentences]):
-                    try:
-                        grade_level = textstat.flesch_kincaid_grade(text)
-                        # print u"grade level is {} for {}; text: {}".format(grade_level, my_product.doi, text)
-                        if grade_level > 0:
-                            # is sometimes negative, strangely.  examples in ethan's profile
-                            reading_levels[my_product.doi] = grade_level
-                    except TypeError:  #if text is too short it thows this
-                        pass
-
+    def decide_if_assigned(self, features):
+        reading_levels = features.products.reading_levels
         if reading_levels.values():
             average_reading_level = sum(reading_levels.values()) / float(len(reading_levels))
             if average_reading_level <= 14:
@@ -364,19 +362,18 @@ class big_hit(BadgeAssigner):
     importance = .5
     context = u"Only {in_the_top_percentile}% of researchers get this much attention on a publication."
 
-    def decide_if_assigned(self, person):
+    def decide_if_assigned(self, features):
         self.candidate_badge.value = 0
-        for my_product in person.products:
-            if my_product.num_mentions > self.candidate_badge.value:
-                self.assigned = True
-                self.candidate_badge.value = my_product.num_mentions
-                self.candidate_badge.remove_all_products()
-                self.candidate_badge.add_product(my_product)
-                self.candidate_badge.support = u"Your greatest hit online is <a href='/u/{orcid_id}/p/{id}'>{title}</a>.".format(
-                    id=my_product.id,
-                    orcid_id=my_product.orcid_id,
-                    title=my_product.title
-                )
+        my_product = features.products.big_hit_product
+        if my_product:
+            self.assigned = True
+            self.candidate_badge.value = features.products.big_hit_mentions
+            self.candidate_badge.add_product(my_product)
+            self.candidate_badge.support = u"Your greatest hit online is <a href='/u/{orcid_id}/p/{id}'>{title}</a>.".format(
+                id=my_product.id,
+                orcid_id=my_product.orcid_id,
+                title=my_product.title
+            )
 
 
 class wiki_hit(BadgeAssigner):
@@ -386,14 +383,14 @@ class wiki_hit(BadgeAssigner):
     importance = .9
     context = u"Only {in_the_top_percentile}% of researchers are this highly cited in Wikipedia."
 
-    def decide_if_assigned(self, person):
-        num_wikipedia_posts = person.post_counts_by_source("wikipedia")
+    def decide_if_assigned(self, features):
+        num_wikipedia_posts = features.num_wikipedia_posts
         if num_wikipedia_posts >= 1:
             self.assigned = True
             self.candidate_badge.value = num_wikipedia_posts
 
-            urls = person.wikipedia_urls
-            self.candidate_badge.add_products([p for p in person.products_with_dois if p.has_source("wikipedia")])
+            urls = features.products.wikipedia_urls
+            self.candidate_badge.add_products(features.products.wikipedia_products)
             self.candidate_badge.support = u"Your Wikipedia titles include: {}.".format(
                 ", ".join(urls))
             # print self.candidate_badge.support
@@ -407,11 +404,12 @@ class global_reach(BadgeAssigner):
     support_finale = " countries."
     context = u"That's high: only {in_the_top_percentile}% of researchers get that much international attention."
 
-    def decide_if_assigned(self, person):
-        if len(person.countries_using_mendeley) > 1:
+    def decide_if_assigned(self, features):
+        countries = features.products.countries_using_mendeley
+        if len(countries) > 1:
             self.assigned = True
-            self.candidate_badge.value = len(person.countries_using_mendeley)
-            self.candidate_badge.support = u"Countries include: {}".format(", ".join(person.countries_using_mendeley))
+            self.candidate_badge.value = len(countries)
+            self.candidate_badge.support = u"Countries include: {}".format(", ".join(countries))
 
 
 class megafan(BadgeAssigner):
@@ -421,18 +419,14 @@ class megafan(BadgeAssigner):
     importance = .2
     context = u"Only {in_the_top_percentile}% of scholars have been tweeted by someone with this many followers."
 
-    def decide_if_assigned(self, person):
-        biggest_fan = None
+    def decide_if_assigned(self, features):
+        biggest_fan = features.products.biggest_fan
 
         self.candidate_badge.value = 0
-        for my_product in person.products_with_dois:
-            for fan_name, followers in my_product.twitter_posters_with_followers.iteritems():
-                if followers >= self.candidate_badge.value and followers > 1000:
-                    self.assigned = True
-                    self.candidate_badge.value = followers
-                    self.candidate_badge.remove_all_products()  # clear them
-                    self.candidate_badge.add_product(my_product)  # add the one for the new max
-                    biggest_fan = fan_name
+        if features.products.biggest_fan_product:
+            self.assigned = True
+            self.candidate_badge.value = features.products.biggest_fan_followers
+            self.candidate_badge.add_product(features.products.biggest_fan_product)
 
         self.candidate_badge.support = u"Thanks, <a href='http://twitter.com/{fan}'>@{fan}</a>.".format(
             fan=biggest_fan)
@@ -445,17 +439,9 @@ class hot_streak(BadgeAssigner):
     importance = .5
     context = u"That's a sharing streak matched by only {in_the_top_percentile}% of scholars."
 
-    def decide_if_assigned(self, person):
-        streak = True
-        streak_length = 0
-        all_event_days_ago = [days_ago(e) for e in person.get_event_dates()]
-        for month in range(0, 10*12):  # do up to 10 years
-            streak_length += 1
-            relevant_days = [month*30 + day for day in range(0, 30)]
-            matching_days_count = len([d for d in all_event_days_ago if d in relevant_days])
-            if matching_days_count <= 0:
-                # print "broke the streak"
-                break
+    def decide_if_assigned(self, features):
+        # every event is already bucketed into its 30-day month, so just walk the months
+        streak_length = get_hot_streak_length(features.products.events_per_month)
         if streak_length > 1:
             self.assigned = True
             self.candidate_badge.value = streak_length
@@ -468,15 +454,10 @@ class clean_sweep(BadgeAssigner):
     importance = .1
     context = u"Fewer than a quarter of researchers show this kind of consistency."
 
-    def decide_if_assigned(self, person):
-        num_with_metrics = 0
-        num_applicable = 0
-        for my_product in person.products:
-            if my_product.year > 2011:
-                num_applicable += 1
-                if my_product.has_mentions:
-                    num_with_metrics += 1
-                    self.candidate_badge.add_product(my_product)
+    def decide_if_assigned(self, features):
+        num_with_metrics = features.products.num_since_2012_with_mentions
+        num_applicable = features.products.num_since_2012
+        self.candidate_badge.add_products(features.products.since_2012_with_mentions_products)
 
         if (num_with_metrics >= num_applicable) and (num_with_metrics >= 2):
             self.assigned = True
@@ -490,24 +471,11 @@ class global_south(BadgeAssigner):
     importance = .4
     context = u"That's a high proportion: only {in_the_top_percentile}% of researchers publish work that inspires this level of engagement from the developing world."
 
-    def decide_if_assigned(self, person):
-        countries = set()
-
-        total_geo_located_posts = 0.0
-        total_global_south_posts = 0.0
-
-        for my_product in person.all_products:
-            for country_name, count in my_product.post_counts_by_country_using_mendeley.iteritems():
-                total_geo_located_posts += count
-                if country_name:
-                    try:
-                        if country_info[country_name]["is_global_south"]:
-                            total_global_south_posts += count
-                            self.candidate_badge.add_product(my_product)
-                            countries.add(country_name)
-                    except (KeyError, ):
-                        print u"ERROR: Nothing in dict for country name {}".format(country_name)
-                        # raise  # keep going for now
+    def decide_if_assigned(self, features):
+        countries = features.products.global_south_countries
+        total_geo_located_posts = features.products.total_geo_located_posts
+        total_global_south_posts = features.products.total_global_south_posts
+        self.candidate_badge.add_products(features.products.global_south_products)
 
         if total_geo_located_posts >= 10:
             ratio = (total_global_south_posts / total_geo_located_posts)
@@ -518,6 +486,16 @@ class global_south(BadgeAssigner):
                     ", ".join(sorted(countries)))
 
 
+def get_hot_streak_length(events_per_month):
+    # events_per_month is {months ago: number of events}, see models.badge_features
+    streak_length = 0
+    for month in range(0, 10*12):  # do up to 10 years
+        streak_length += 1
+        if events_per_month.get(month, 0) <= 0:
+            # print "broke the streak"
+            break
+    return streak_length
+
 
 def proportion_poster_counts_by_type(person, poster_type):
     total_posters_with_type = 0.0
@@ -539,13 +517,13 @@ class open_science_triathlete(BadgeAssigner):
     description = u"Congratulations, you hit the trifecta. You have an Open Access paper, open dataset, and open source software."
     importance = .5
 
-    def decide_if_assigned(self, person):
-        has_oa_paper = [p.doi for p in person.products if p.has_fulltext_url and p.guess_genre() == "article"]
-        has_data = [p.id for p in person.all_products if p.guess_genre()=="dataset"]
-        if person.depsy_id:
+    def decide_if_assigned(self, features):
+        has_oa_paper = features.products.has_oa_article
+        has_data = features.products.has_dataset
+        if features.depsy_id:
             has_software = True
         else:
-            has_software = [p.id for p in person.all_products if p.guess_genre()=="software"]
+            has_software = features.products.has_software
 
         if (has_oa_paper and has_data and has_software):
             self.assigned = True
@@ -564,10 +542,10 @@ class all_fulltext(BadgeAssigner):
 
     show_in_ui = True
 
-    def decide_if_assigned(self, person):
-        if person.num_products >= 3 and person.percent_fulltext:
-            if person.percent_fulltext >= 1.0:
-                self.candidate_badge.value = person.percent_fulltext * 100
+    def decide_if_assigned(self, features):
+        if features.num_products >= 3 and features.percent_fulltext:
+            if features.percent_fulltext >= 1.0:
+                self.candidate_badge.value = features.percent_fulltext * 100
                 self.assigned = True
 
 
@@ -579,15 +557,15 @@ class percent_fulltext(BadgeAssigner):
     importance = .9
     show_in_ui = True
 
-    def decide_if_assigned(self, person):
-        if person.products_with_dois and len(person.products_with_dois) >= 3 and person.percent_fulltext:
-            if person.percent_fulltext >= 0.5:
-                self.candidate_badge.value = person.percent_fulltext * 100
+    def decide_if_assigned(self, features):
+        if features.num_products_with_dois >= 3 and features.percent_fulltext:
+            if features.percent_fulltext >= 0.5:
+                self.candidate_badge.value = features.percent_fulltext * 100
                 self.assigned = True
-                if person.percent_open_license > 0:
+                if features.percent_open_license > 0:
                     self.candidate_badge.support = \
                         u'Even better, {}% of your papers are published under a fully Open license like CC-BY, making them available for a wide range of reuse (not just reading). Learn more about why this is important at <a href="http://sparcopen.org/our-work/howopenisit/">HowOpenIsIt.</a>'.format(
-                            int(person.percent_open_license * 100))
+                            int(features.percent_open_license * 100))
                 else:
                     self.candidate_badge.support = ""
 
@@ -599,10 +577,10 @@ class open_license(BadgeAssigner):
     importance = .8
     show_in_ui = True
 
-    def decide_if_assigned(self, person):
-        if person.products_with_dois and len(person.products_with_dois) >= 3 and person.percent_open_license:
-            if person.percent_open_license >= 0.25:
-                self.candidate_badge.value = person.percent_open_license * 100
+    def decide_if_assigned(self, features):
+        if features.num_products_with_dois >= 3 and features.percent_open_license:
+            if features.percent_open_license >= 0.25:
+                self.candidate_badge.value = features.percent_open_license * 100
                 self.assigned = True
 
 
@@ -616,21 +594,11 @@ class rick_roll(BadgeAssigner):
     context = u"Only {in_the_top_percentile}% of researchers get this achievement."
 
 
-    def decide_if_assigned(self, person):
-        for my_product in person.products_with_dois:
-            for name in my_product.get_tweeter_posters_full_names():
-                match = False
-                if name.lower().endswith("richard"):
-                    match = True
-                else:
-                    for name_part in name.lower().split(" ")[:-1]:  # don't include last name
-                        if name_part in ["rick", "rich", "ricky", "dick", "richard"]:
-                            match = True
-                if match:
-                    self.assigned = True
-                    self.candidate_badge.value = 1
-                    self.candidate_badge.add_product(my_product)
-                    # self.candidate_badge.support = u"Thanks, {}".format(name)
+    def decide_if_assigned(self, features):
+        if features.products.rick_products:
+            self.assigned = True
+            self.candidate_badge.value = 1
+            self.candidate_badge.add_products(features.products.rick_products)
 
         # if self.assigned:
         #     print "RICK!!!!", self.candidate_badge.support
@@ -645,12 +613,11 @@ class big_in_japan(BadgeAssigner):
     importance = 0.3
     context = u"Only half of researchers <a href='https://www.youtube.com/watch?v=tl6u2NASUzU'>can claim this honor.</a>"
 
-    def decide_if_assigned(self, person):
-        for my_product in person.all_products:
-            if my_product.has_country_using_mendeley("Japan"):
-                self.candidate_badge.add_product(my_product)
-                self.assigned = True
-                self.candidate_badge.value = 1
+    def decide_if_assigned(self, features):
+        if features.products.japan_products:
+            self.candidate_badge.add_products(features.products.japan_products)
+            self.assigned = True
+            self.candidate_badge.value = 1
 
 
 
@@ -662,16 +629,9 @@ class famous_follower(BadgeAssigner):
     importance = 0.3
     context = u"This isn't common: only {in_the_top_percentile}% of other researchers have been mentioned by these twitter stars."
 
-    def decide_if_assigned(self, person):
-        fans = set()
-        for my_product in person.products_with_dois:
-            for twitter_handle in my_product.twitter_posters_with_followers:
-                try:
-                    if twitter_handle.lower() in scientists_twitter:
-                        fans.add(twitter_handle)
-                        self.candidate_badge.add_product(my_product)
-                except AttributeError:
-                    pass
+    def decide_if_assigned(self, features):
+        fans = features.products.famous_fans
+        self.candidate_badge.add_products(features.products.famous_fan_products)
 
         if len(fans) > 1:
             self.assigned = True
@@ -894,3 +854,43 @@ class famous_follower(BadgeAssigner):
 #                     counts["female"], counts["male"], ratio_female)
 #                 self.candidate_badge.value = ratio_female * 100
 #                 self.assigned = True
+
+
+
+BadgeType = namedtuple("BadgeType", [
+    "name",
+    "display_name",
+    "group",
+    "description",
+    "extra_description",
+    "importance",
+    "context",
+    "support_intro",
+    "support_finale",
+    "pad_percentiles_with_zeros",
+    "valid_badge",
+    "show_in_ui"
+])
+
+def _make_badge_type(assigner):
+    return BadgeType(
+        name=assigner.__name__,
+        display_name=assigner.display_name,
+        group=assigner.group,
+        description=assigner.description,
+        extra_description=assigner.extra_description,
+        importance=assigner.importance,
+        context=assigner.context,
+        support_intro=assigner.support_intro,
+        support_finale=assigner.support_finale,
+        pad_percentiles_with_zeros=assigner.pad_percentiles_with_zeros,
+        valid_badge=assigner.valid_badge,
+        show_in_ui=assigner.show_in_ui
+    )
+
+_badge_assigners = tuple(sorted(BadgeAssigner.__subclasses__(), key=lambda x: x.group))
+_badge_assigner_names = tuple(assigner.__name__ for assigner in _badge_assigners)
+_badge_assigners_by_name = dict((assigner.__name__, assigner) for assigner in _badge_assigners)
+_badge_types = dict((assigner.__name__, _make_badge_type(assigner)) for assigner in _badge_assigners)
+_badge_configs = dict((assigner.__name__, assigner.config_dict()) for assigner in _badge_assigners
+                      if assigner.show_in_ui and assigner.valid_badge)
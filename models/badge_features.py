@@ -0,0 +1,186 @@
+from models.country import country_info
+from models.reference_data import is_scientist_on_twitter
+
+from util import days_ago
+
+from collections import defaultdict
+
+
+def get_badge_features(person):
+    return BadgeFeatures(person)
+
+
+def add_events_per_month(events_per_month, event_dates):
+    # bucket each event into its 30-day month: 0 is the last 30 days
+    for event_date in event_dates:
+        event_days_ago = days_ago(event_date)
+        if event_days_ago >= 0:
+            events_per_month[event_days_ago / 30] += 1
+
+
+def is_a_richard(name):
+    if name.lower().endswith("richard"):
+        return True
+    for name_part in name.lower().split(" ")[:-1]:  # don't include last name
+        if name_part in ["rick", "rich", "ricky", "dick", "richard"]:
+            return True
+    return False
+
+
+class BadgeFeatures(object):
+    """
+    Everything the badge assigners decide on, for one person.
+
+    Person-level values are read up front.  Values that need the products
+    are all collected in one pass over them, the first time .products is
+    used, so assigning only the openness badges never touches the products.
+    """
+
+    def __init__(self, person):
+        self.orcid_id = person.orcid_id
+        self.depsy_id = person.depsy_id
+        self.depsy_percentile = person.depsy_percentile
+        self.num_products = person.num_products
+        self.num_products_with_dois = person.product_columns.num_products_with_dois()[0]
+        self.percent_fulltext = person.percent_fulltext
+        self.percent_open_license = person.percent_open_license
+        self.num_wikipedia_posts = person.post_counts_by_source("wikipedia")
+
+        self._person = person
+        self._products = None
+
+    @property
+    def products(self):
+        if self._products is None:
+            self._products = ProductFeatures(self._person)
+        return self._products
+
+
+class ProductFeatures(object):
+
+    def __init__(self, person):
+        # reading_level
+        self.reading_levels = {}
+
+        # big_hit: most mentions, first in person.products order on ties
+        self.big_hit_product = None
+        self.big_hit_mentions = 0
+        product_order = dict((id(p), i) for (i, p) in enumerate(person.products))
+
+        # wiki_hit
+        self.wikipedia_urls = set()
+        self.wikipedia_products = []
+
+        # global_reach, big_in_japan
+        countries = set()
+        self.japan_products = []
+
+        # megafan: biggest fan, the last one seen on ties
+        self.biggest_fan = None
+        self.biggest_fan_followers = 0
+        self.biggest_fan_product = None
+
+        # hot_streak
+        self.events_per_month = defaultdict(int)
+
+        # clean_sweep
+        self.num_since_2012 = 0
+        self.num_since_2012_with_mentions = 0
+        self.since_2012_with_mentions_products = []
+
+        # global_south
+        self.total_geo_located_posts = 0.0
+        self.total_global_south_posts = 0.0
+        self.global_south_countries = set()
+        self.global_south_products = []
+
+        # open_science_triathlete
+        self.has_oa_article = False
+        self.has_dataset = False
+        self.has_software = False
+
+        # rick_roll
+        self.rick_products = []
+
+        # famous_follower
+        self.famous_fans = set()
+        self.famous_fan_products = []
+
+        for my_product in person.all_products:
+            grade_level = my_product.get_reading_level()
+            if grade_level:
+                self.reading_levels[my_product.doi] = grade_level
+
+            num_mentions = my_product.num_mentions
+            if num_mentions > self.big_hit_mentions or \
+                    (num_mentions == self.big_hit_mentions and self.big_hit_product and
+                        product_order[id(my_product)] < product_order[id(self.big_hit_product)]):
+                self.big_hit_mentions = num_mentions
+                self.big_hit_product = my_product
+
+            if my_product.year > 2011:
+                self.num_since_2012 += 1
+                if num_mentions >= 1:
+                    self.num_since_2012_with_mentions += 1
+                    self.since_2012_with_mentions_products.append(my_product)
+
+            genre = my_product.guess_genre()
+            if genre == "article" and my_product.has_fulltext_url:
+                self.has_oa_article = True
+            elif genre == "dataset":
+                self.has_dataset = True
+            elif genre == "software":
+                self.has_software = True
+
+            post_counts_by_country = my_product.post_counts_by_country_using_mendeley
+            is_global_south_product = False
+            for country_name, count in post_counts_by_country.iteritems():
+                if country_name:
+                    countries.add(country_name)
+                self.total_geo_located_posts += count
+                if country_name:
+                    try:
+                        if country_info[country_name]["is_global_south"]:
+                            self.total_global_south_posts += count
+                            self.global_south_countries.add(country_name)
+                            is_global_south_product = True
+                    except (KeyError, ):
+                        print u"ERROR: Nothing in dict for country name {}".format(country_name)
+                        # keep going for now
+            if is_global_south_product:
+                self.global_south_products.append(my_product)
+            if "Japan" in post_counts_by_country:
+                self.japan_products.append(my_product)
+
+            if not my_product.doi:
+                continue
+
+            # everything below here is only for products with dois
+
+            if my_product.post_counts_by_source("wikipedia"):
+                self.wikipedia_urls.update(my_product.wikipedia_urls)
+                self.wikipedia_products.append(my_product)
+
+            if my_product.event_dates:
+                for source, dates_list in my_product.event_dates.iteritems():
+                    add_events_per_month(self.events_per_month, dates_list)
+
+            is_famous_fan_product = False
+            for fan_name, followers in my_product.twitter_posters_with_followers.iteritems():
+                if followers >= self.biggest_fan_followers and followers > 1000:
+                    self.biggest_fan = fan_name
+                    self.biggest_fan_followers = followers
+                    self.biggest_fan_product = my_product
+                try:
+                    if is_scientist_on_twitter(fan_name):
+                        self.famous_fans.add(fan_name)
+                        is_famous_fan_product = True
+                except AttributeError:
+                    pass
+            if is_famous_fan_product:
+                self.famous_fan_products.append(my_product)
+
+            if any([is_a_richard(name) for name in my_product.get_tweeter_posters_full_names()]):
+                self.rick_products.append(my_product)
+
+        self.countries_using_mendeley = sorted(countries)
@@ -0,0 +1,65 @@
+from redis import RedisError
+
+from app import redis_rq_conn
+
+
+# sizes chunks by how long their objects are expected to take, so a chunk of
+# big profiles doesn't hit the rq timeout while a chunk of small ones takes a
+# second.  each object has a cost (1, plus something like num_products) and
+# each update has a rate in seconds per unit of cost, learned from the chunks
+# it has run before.
+
+seconds_per_cost_key = "ti:seconds_per_cost"
+
+# how much each new chunk moves the rate
+rate_smoothing = 0.2
+
+# even very cheap objects don't go in chunks bigger than this
+max_chunk_size_default = 1000
+
+
+def get_seconds_per_cost(update_name):
+    try:
+        seconds_per_cost = redis_rq_conn.hget(seconds_per_cost_key, update_name)
+    except RedisError:
+        return None
+    if not seconds_per_cost:
+        return None
+    return float(seconds_per_cost)
+
+
+def record_chunk_duration(update_name, chunk_cost, seconds):
+    if not chunk_cost:
+        return
+    seconds_per_cost = seconds / float(chunk_cost)
+    try:
+        # workers can race here, but then we just lose one chunk's worth of smoothing
+        old_seconds_per_cost = get_seconds_per_cost(update_name)
+        if old_seconds_per_cost:
+            seconds_per_cost = rate_smoothing * seconds_per_cost + (1 - rate_smoothing) * old_seconds_per_cost
+        redis_rq_conn.hset(seconds_per_cost_key, update_name, seconds_per_cost)
+    except RedisError:
+        pass
+
+
+def make_cost_chunks(object_ids, costs, max_chunk_cost, max_chunk_size=max_chunk_size_default):
+    """
+    Splits object_ids, in order, into chunks that cost up to max_chunk_cost.
+
+    An object that costs more than that on its own gets a chunk to itself.
+    Returns a list of (object_ids_chunk, chunk_cost).
+    """
+    resp = []
+    object_ids_chunk = []
+    chunk_cost = 0
+    for object_id in object_ids:
+        cost = costs.get(object_id, 1)
+        if object_ids_chunk and (chunk_cost + cost > max_chunk_cost or len(object_ids_chunk) >= max_chunk_size):
+            resp.append((object_ids_chunk, chunk_cost))
+            object_ids_chunk = []
+            chunk_cost = 0
+        object_ids_chunk.append(object_id)
+        chunk_cost += cost
+    if object_ids_chunk:
+        resp.append((object_ids_chunk, chunk_cost))
+    return resp
@@ -1,3 +1,5 @@
+from models.reference_data import get_country_name_from_iso
+
 map_mendeley_countries = {
     u'Korea (South)': "South Korea",
     u'Serbia and Montenegro': "Serbia",
@@ -20,10 +22,7 @@ map_mendeley_countries = {
 }
 
 def get_name_from_iso(iso_name):
-    for country_name, country_dict in country_info.iteritems():
-        if iso_name == country_dict["iso"]:
-            return country_name
-    return None
+    return get_country_name_from_iso(iso_name)
 
 # iso from countries_info.py in impactstory classic
 # global south info from https://meta.wikimedia.org/wiki/List_of_countries_by_regional_classification
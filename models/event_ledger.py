@@ -0,0 +1,133 @@
+from sqlalchemy import text
+
+from app import db
+import datetime
+import hashlib
+import iso8601
+
+
+def get_url_hash(url):
+    return hashlib.md5(url.encode("utf-8")).hexdigest()
+
+
+def _ledger_rows(orcid_id, posts, emailed_at=None):
+    rows = {}
+    now = datetime.datetime.utcnow().isoformat()
+    for post in posts:
+        url = post.get("url")
+        if not url:
+            continue
+        url_hash = get_url_hash(url)
+        rows[url_hash] = {
+            "orcid_id": orcid_id,
+            "url_hash": url_hash,
+            "url": url,
+            "source": post.get("source"),
+            "posted_on": post.get("posted_on"),
+            "first_seen": now,
+            "emailed_at": emailed_at
+        }
+    return rows.values()
+
+
+def is_posted_after(post, posted_after):
+    if not post.get("posted_on"):
+        return False
+    try:
+        posted_on = iso8601.parse_date(post["posted_on"]).replace(tzinfo=None)
+    except iso8601.ParseError:
+        return False
+    return posted_on > posted_after
+
+
+def record_events(orcid_id, posts, posted_after):
+    # only posts we don't have yet: events we already have keep their first_seen and emailed_at
+    q = db.session.query(EventLedger.url_hash).filter(EventLedger.orcid_id == orcid_id)
+    recorded_url_hashes = set([row[0] for row in q])
+    rows = [row for row in _ledger_rows(orcid_id, posts) if row["url_hash"] not in recorded_url_hashes]
+    if not rows:
+        return 0
+
+    # new events go in unsent, except ones from before posted_after.  those are
+    # never going to be emailed, so they go in as done and stay out of the unsent index.
+    posts_by_url_hash = dict((get_url_hash(post["url"]), post) for post in posts if post.get("url"))
+    now = datetime.datetime.utcnow().isoformat()
+    for row in rows:
+        if not is_posted_after(posts_by_url_hash[row["url_hash"]], posted_after):
+            row["emailed_at"] = now
+
+    q = text(u"""insert into event_ledger (orcid_id, url_hash, url, source, posted_on, first_seen, emailed_at)
+                values (:orcid_id, :url_hash, :url, :source, :posted_on, :first_seen, :emailed_at)
+                on conflict (orcid_id, url_hash) do nothing""")
+    db.session.execute(q, rows)
+    return len(rows)
+
+
+def record_emailed_events(orcid_id, posts):
+    # for migrating events_emailed: store these as already sent, whether or not we had them
+    now = datetime.datetime.utcnow().isoformat()
+    rows = _ledger_rows(orcid_id, posts, emailed_at=now)
+    if not rows:
+        return 0
+
+    q = text(u"""insert into event_ledger (orcid_id, url_hash, url, source, posted_on, first_seen, emailed_at)
+                values (:orcid_id, :url_hash, :url, :source, :posted_on, :first_seen, :emailed_at)
+                on conflict (orcid_id, url_hash) do update
+                set emailed_at = excluded.emailed_at
+                where event_ledger.emailed_at is null""")
+    db.session.execute(q, rows)
+    return len(rows)
+
+
+def mark_events_before_emailed(orcid_id, posted_after):
+    # for rows recorded before record_events knew about posted_after
+    q = text(u"""update event_ledger set emailed_at = :now
+                where orcid_id = :orcid_id
+                and emailed_at is null
+                and (posted_on is null or posted_on <= :posted_after)""")
+    result = db.session.execute(q, {
+        "orcid_id": orcid_id,
+        "posted_after": posted_after,
+        "now": datetime.datetime.utcnow().isoformat()
+    })
+    return result.rowcount
+
+
+def get_unsent_events(orcid_id, posted_after):
+    q = EventLedger.query.filter(
+        EventLedger.orcid_id == orcid_id,
+        EventLedger.emailed_at == None,
+        EventLedger.posted_on > posted_after
+    )
+    return q.all()
+
+
+def mark_events_emailed(events):
+    now = datetime.datetime.utcnow().isoformat()
+    for event in events:
+        event.emailed_at = now
+
+
+def orcid_ids_with_unsent_events():
+    return db.session.query(EventLedger.orcid_id).filter(EventLedger.emailed_at == None).distinct()
+
+
+class EventLedger(db.Model):
+    orcid_id = db.Column(db.Text, primary_key=True)
+    url_hash = db.Column(db.Text, primary_key=True)
+    url = db.Column(db.Text)
+    source = db.Column(db.Text)
+    posted_on = db.Column(db.DateTime)
+    first_seen = db.Column(db.DateTime)
+    emailed_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index("event_ledger_unsent_idx", "orcid_id", "posted_on", postgresql_where=emailed_at.is_(None)),
+    )
+
+    def __repr__(self):
+        return u'<EventLedger ({orcid_id}, {source}, {url})>'.format(
+            orcid_id=self.orcid_id,
+            source=self.source,
+            url=self.url
+        )
@@ -0,0 +1,110 @@
+from time import time
+from collections import defaultdict
+from redis import RedisError
+
+from app import redis_rq_conn
+
+
+# one key per (update, object id), so an object that's already queued, running,
+# or was just done isn't queued again by a second refresh or backfill.
+# the value is "queued", "running" or "done:<unix time>".  keys expire, so a
+# worker that dies or a queue that's emptied doesn't block an object forever.
+
+queued_ttl = 60 * 60 * 24
+running_ttl = 60 * 60
+done_ttl = 60 * 60 * 24 * 7  # the longest freshness window anyone can ask for
+
+
+def get_job_key(update_name, object_id):
+    return u"ti:job:{}:{}".format(update_name, object_id)
+
+
+# checks each key and claims it in one step, so nobody else can take (or finish)
+# the object in between.  returns "claimed", or the reason the key was skipped.
+# KEYS: job keys.  ARGV: now, fresh_for, ignore_queued, force, queued_ttl
+claim_script = redis_rq_conn.register_script("""
+local now = tonumber(ARGV[1])
+local fresh_for = tonumber(ARGV[2])
+local ignore_queued = ARGV[3] == "1"
+local force = ARGV[4] == "1"
+local results = {}
+for i, key in ipairs(KEYS) do
+    local value = redis.call("GET", key)
+    local result = "claimed"
+    if value and not force then
+        local state = string.match(value, "^[^:]+")
+        if state == "running" or (state == "queued" and not ignore_queued) then
+            result = state
+        elseif state == "done" and now - tonumber(string.sub(value, 6)) < fresh_for then
+            result = "fresh"
+        end
+    end
+    if result == "claimed" then
+        redis.call("SET", key, "queued", "EX", ARGV[5])
+    end
+    results[i] = result
+end
+return results
+""")
+
+
+def claim_objects(update_name, object_ids, fresh_for=0, ignore_queued=False, force=False):
+    """
+    Marks object_ids queued for update_name, except the ones that already are,
+    are running, or were done less than fresh_for seconds ago.  With force,
+    marks them all and skips nothing.
+
+    Returns (claimed object ids, {state: number skipped}).
+    """
+    if not object_ids:
+        return ([], {})
+
+    keys = [get_job_key(update_name, object_id) for object_id in object_ids]
+    try:
+        results = claim_script(keys=keys, args=[
+            int(time()),
+            fresh_for or 0,
+            int(bool(ignore_queued)),
+            int(bool(force)),
+            queued_ttl
+        ])
+    except RedisError:
+        print u"couldn't check job keys for {}, so not skipping anything".format(update_name)
+        return (object_ids, {})
+
+    claimed = []
+    skipped = defaultdict(int)
+    for (object_id, result) in zip(object_ids, results):
+        if result == "claimed":
+            claimed.append(object_id)
+        else:
+            skipped[result] += 1
+    return (claimed, dict(skipped))
+
+
+def _set_job_keys(update_name, object_ids, value, ttl):
+    try:
+        pipe = redis_rq_conn.pipeline(transaction=False)
+        for object_id in object_ids:
+            pipe.set(get_job_key(update_name, object_id), value, ex=ttl)
+        pipe.execute()
+    except RedisError:
+        print u"couldn't set job keys for {}".format(update_name)
+
+
+def mark_running(update_name, object_ids):
+    _set_job_keys(update_name, object_ids, "running", running_ttl)
+
+
+def mark_done(update_name, object_ids):
+    _set_job_keys(update_name, object_ids, u"done:{}".format(int(time())), done_ttl)
+
+
+def clear_job_keys(update_name, object_ids):
+    # failed, so it can be queued again right away
+    try:
+        keys = [get_job_key(update_name, object_id) for object_id in object_ids]
+        if keys:
+            redis_rq_conn.delete(*keys)
+    except RedisError:
+        print u"couldn't clear job keys for {}".format(update_name)
@@ -6,15 +6,25 @@ import mendeley as mendeley_lib
 
 from util import remove_punctuation
 import os
+import threading
+from time import time
+
+
+# one session per process, shared by the product threads until its token is about to expire
+_mendeley_session = None
+_mendeley_session_lock = threading.Lock()
 
 
 def get_mendeley_session():
-    mendeley_client = mendeley_lib.Mendeley(
-        client_id=os.getenv("MENDELEY_OAUTH2_CLIENT_ID"),
-        client_secret=os.getenv("MENDELEY_OAUTH2_SECRET"))
-    auth = mendeley_client.start_client_credentials_flow()
-    session = auth.authenticate()
-    return session
+    global _mendeley_session
+    with _mendeley_session_lock:
+        if _mendeley_session is None or _mendeley_session.token.get("expires_at", 0) < time() + 60:
+            mendeley_client = mendeley_lib.Mendeley(
+                client_id=os.getenv("MENDELEY_OAUTH2_CLIENT_ID"),
+                client_secret=os.getenv("MENDELEY_OAUTH2_SECRET"))
+            auth = mendeley_client.start_client_credentials_flow()
+            _mendeley_session = auth.authenticate()
+        return _mendeley_session
 
 def set_mendeley_data(product):
 
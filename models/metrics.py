@@ -0,0 +1,140 @@
+import re
+import threading
+from collections import defaultdict
+from redis import RedisError
+
+from app import redis_rq_conn
+from app import ti_queues
+from app import ti_high_priority_queue
+
+
+# counters and latency histograms for the update jobs, summed in redis across
+# all worker dynos and served in prometheus text format from /metrics.
+# record with inc() and observe(), which only add to this process's pending
+# totals; flush() sends them to redis in one pipeline.
+
+metrics_key = "ti:metrics"
+
+default_buckets = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600]
+
+metric_definitions = {
+    "ti_update_objects_total": ("counter", "Objects an update method was run on."),
+    "ti_update_chunks_total": ("counter", "Chunks of objects update_fn has run."),
+    "ti_update_commit_failures_total": ("counter", "Chunks whose commit failed."),
+    "ti_update_object_seconds": ("histogram", "Time to run an update method on one object."),
+    "ti_update_chunk_seconds": ("histogram", "Time for update_fn to load, run and commit one chunk."),
+    "ti_rq_jobs_failed_total": ("counter", "RQ jobs that raised."),
+    "ti_queue_depth": ("gauge", "Jobs waiting on each RQ queue.")
+}
+
+_pending = defaultdict(float)
+_pending_lock = threading.Lock()
+
+
+def format_labels(labels):
+    if not labels:
+        return u""
+    label_strings = []
+    for (name, value) in sorted(labels.iteritems()):
+        value = unicode(value).replace(u"\\", u"\\\\").replace(u"\"", u"\\\"").replace(u"\n", u"\\n")
+        label_strings.append(u"{}=\"{}\"".format(name, value))
+    return u"{" + u",".join(label_strings) + u"}"
+
+
+def inc(name, labels=None, amount=1):
+    with _pending_lock:
+        _pending[name + format_labels(labels)] += amount
+
+
+def observe(name, value, labels=None, buckets=default_buckets):
+    labels = labels or {}
+    with _pending_lock:
+        # buckets are cumulative, so a value counts in every bucket it fits under.
+        # the others get 0, so every bucket of the series exists.
+        for bucket in buckets:
+            _pending[name + u"_bucket" + format_labels(dict(labels, le=bucket))] += (1 if value <= bucket else 0)
+        _pending[name + u"_bucket" + format_labels(dict(labels, le="+Inf"))] += 1
+        _pending[name + u"_sum" + format_labels(labels)] += value
+        _pending[name + u"_count" + format_labels(labels)] += 1
+
+
+def flush():
+    with _pending_lock:
+        pending = dict(_pending)
+        _pending.clear()
+    if not pending:
+        return
+
+    try:
+        pipe = redis_rq_conn.pipeline(transaction=False)
+        for (sample_name, amount) in pending.iteritems():
+            pipe.hincrbyfloat(metrics_key, sample_name, amount)
+        pipe.execute()
+    except RedisError:
+        # metrics are never worth failing a job over
+        print u"couldn't save {} metrics to redis".format(len(pending))
+
+
+def get_metric_name(sample_name):
+    name = sample_name.split(u"{")[0]
+    for suffix in [u"_bucket", u"_sum", u"_count"]:
+        if name.endswith(suffix) and name[:-len(suffix)] in metric_definitions:
+            return name[:-len(suffix)]
+    return name
+
+
+le_label_pattern = re.compile(u'(^|,)le="([^"]*)"')
+histogram_suffix_order = {u"_bucket": 0, u"_sum": 1, u"_count": 2}
+
+
+def get_sample_sort_key(sample_name):
+    # each series together (same labels apart from le), its buckets in order
+    # of le and then its _sum and _count, the way prometheus parsers expect
+    (name, _, labels) = sample_name.partition(u"{")
+    suffix_rank = 0
+    for (suffix, rank) in histogram_suffix_order.iteritems():
+        if name.endswith(suffix):
+            suffix_rank = rank
+
+    le_match = le_label_pattern.search(labels)
+    if not le_match:
+        return (labels, suffix_rank, 0)
+    other_labels = labels[:le_match.start()] + labels[le_match.end():]
+    if le_match.group(1) == u"":
+        other_labels = other_labels.lstrip(u",")
+    le_value = le_match.group(2)
+    return (other_labels, suffix_rank, float("inf") if le_value == u"+Inf" else float(le_value))
+
+
+def get_queue_depth_samples():
+    samples = {}
+    for queue in ti_queues + [ti_high_priority_queue]:
+        samples[u"ti_queue_depth" + format_labels({"queue": queue.name})] = queue.count
+    return samples
+
+
+def render_metrics():
+    samples = dict((k.decode("utf-8"), float(v)) for (k, v) in redis_rq_conn.hgetall(metrics_key).iteritems())
+    samples.update(get_queue_depth_samples())
+    return format_samples(samples)
+
+
+def format_samples(samples):
+    # {sample name with labels: value} in prometheus text format
+    samples_by_metric = defaultdict(list)
+    for (sample_name, value) in samples.iteritems():
+        samples_by_metric[get_metric_name(sample_name)].append((sample_name, value))
+
+    lines = []
+    for metric_name in sorted(samples_by_metric):
+        if metric_name in metric_definitions:
+            (metric_type, help_text) = metric_definitions[metric_name]
+            lines.append(u"# HELP {} {}".format(metric_name, help_text))
+            lines.append(u"# TYPE {} {}".format(metric_name, metric_type))
+        for (sample_name, value) in sorted(samples_by_metric[metric_name], key=lambda s: get_sample_sort_key(s[0])):
+            lines.append(u"{} {}".format(sample_name, repr(value)))
+    return u"\n".join(lines) + u"\n"
+
+
+def reset_metrics():
+    redis_rq_conn.delete(metrics_key)
@@ -17,13 +17,25 @@ from models.orcid import clean_orcid
 from models.orcid import NoOrcidException
 from models.orcid import OrcidDoesNotExist
 from models.badge import Badge
+from models.badge_features import get_badge_features
 from models.orcid import make_and_populate_orcid_profile
-from models.source import sources_metadata
-from models.source import Source
-from models.refset import Refset
+from models.source import make_sources
+from models.product_columns import ProductColumns
+from models.refset import get_refset_cutoffs
+from models.refset import record_refset_badge_changes
+from models.refset import refset_campaign
 from models.emailer import send
 from models.log_email import save_email
 from models.log_openness import save_openness_log
+from models.event_ledger import record_events
+from models.event_ledger import record_emailed_events
+from models.event_ledger import mark_events_before_emailed
+from models.event_ledger import get_unsent_events
+from models.event_ledger import mark_events_emailed
+from models.rate_limit import fetch_slots
+from models.job_keys import mark_running
+from models.job_keys import mark_done
+from models.job_keys import clear_job_keys
 from util import elapsed
 from util import chunks
 from util import date_as_iso_utc
@@ -53,6 +65,12 @@ from requests_oauthlib import OAuth1Session
 from util import update_recursive_sum
 
 
+# bump this when the contents of Person.mendeley_sums change, so stored rows get recomputed
+MENDELEY_SUMS_VERSION = 2
+
+DATE_NOTIFICATION_EMAILS_STARTED = datetime.datetime(2018, 9, 10)
+
+
 class PersonExistsException(Exception):
     pass
 
@@ -147,7 +165,7 @@ def make_temporary_person_from_orcid(orcid_id):
     print u"starting make_temporary_person_from_orcid: made new person for {}".format(my_person)
 
     my_person.orcid_id = orcid_id
-    my_person.refresh()
+    my_person.refresh(high_priority=True)
 
     print u"finished make_temporary_person_from_orcid: made new person for {}".format(my_person)
 
@@ -240,6 +258,14 @@ def refresh_orcid_info_and_save(my_person):
     return my_person
 
 
+def run_in_fetch_slot(method, high_priority, slot):
+    # the slot was taken by set_data_for_all_products before the thread started
+    try:
+        method(high_priority)
+    finally:
+        fetch_slots.release(slot)
+
+
 # this should be refactored with refresh_profile().  doing it this way is dumb.
 def refresh_person(my_person, high_priority=False):
     print u"refreshing {}".format(my_person.orcid_id)
@@ -248,11 +274,7 @@ def refresh_person(my_person, high_priority=False):
     # sleep(5)
     # return my_person
 
-    my_person.refresh(high_priority=high_priority)
-    db.session.merge(my_person)
-    commit_success = safe_commit(db)
-    if not commit_success:
-        print u"COMMIT fail on {}".format(my_person.orcid_id)
+    refresh_and_commit(my_person, high_priority)
     return my_person
 
 
@@ -265,16 +287,29 @@ def refresh_profile(orcid_id, high_priority=False):
     # sleep(5)
     # return my_person
 
-    my_person.refresh(high_priority=high_priority)
-    db.session.merge(my_person)
+    refresh_and_commit(my_person, high_priority)
+    return my_person
+
+
+def refresh_and_commit(my_person, high_priority=False):
+    # mark the person the way update_fn does, so a backfill doesn't queue them
+    # while we're refreshing them or right after
+    mark_running("Person.refresh", [my_person.id])
+    try:
+        my_person.refresh(high_priority=high_priority)
+        db.session.merge(my_person)
+        commit_success = safe_commit(db)
+    except Exception:
+        clear_job_keys("Person.refresh", [my_person.id])
+        raise
 
-    commit_success = safe_commit(db)
     if commit_success:
-        print u"committed {}".format(orcid_id)
+        print u"committed {}".format(my_person.orcid_id)
+        mark_done("Person.refresh", [my_person.id])
     else:
-        print u"COMMIT fail on {}".format(orcid_id)
-
-    return my_person
+        print u"COMMIT fail on {}".format(my_person.orcid_id)
+        clear_job_keys("Person.refresh", [my_person.id])
+    return commit_success
 
 
 def top_acheivement_persons(persons, achievements, limit):
@@ -307,15 +342,36 @@ def avg_openess(persons):
 
 
 def get_sources(products):
-    sources = []
-    for source_name in sources_metadata:
-        source = Source(source_name, products)
-        if source.posts_count > 0:
-            sources.append(source)
-    return sources
+    return make_sources(products)
+
+
+def assign_badges_to_persons(persons, limit_to_badges=[]):
+    # the whole batch's badge inserts, updates and deletes go out together at the next flush
+    for my_person in persons:
+        my_person.assign_badges(limit_to_badges)
+    db.session.flush()
+
+
+def set_product_metrics_for_persons(persons):
+    # one columnar pass over every product of every person, for bulk recalculation
+    columns = ProductColumns.for_persons(persons)
+    post_counts = columns.post_counts_by_source()
+    num_mentions = columns.num_mentions()
+    num_oa_licenses = columns.num_oa_licenses()
+    for person_index, my_person in enumerate(persons):
+        my_person.post_counts = post_counts[person_index]
+        my_person.set_num_posts()
+        my_person.num_mentions = num_mentions[person_index]
+        my_person._set_num_oa_licenses_from(num_oa_licenses[person_index])
 
 
 class Person(db.Model):
+    # methods that jobs.update_fn runs over a whole chunk of persons at once
+    bulk_methods = {
+        "assign_badges": assign_badges_to_persons,
+        "set_product_metrics": set_product_metrics_for_persons
+    }
+
     id = db.Column(db.Text, primary_key=True)
     orcid_id = db.Column(db.Text, unique=True)
 
@@ -524,22 +580,39 @@ class Person(db.Model):
         self.set_data_for_all_products("set_data_from_mendeley", high_priority)
 
     def set_mendeley_sums(self):
-        self.mendeley_sums = None
-        products_with_mendeley = [p for p in self.all_products if p.mendeley_api_raw]
-        if products_with_mendeley:
-            self.mendeley_sums = {
+        # store these even when there is no mendeley data, so the profile
+        # can always be served from here instead of summing over products
+        self.mendeley_sums = self.calculate_mendeley_sums()
+        return self.mendeley_sums
+
+    def calculate_mendeley_sums(self):
+        mendeley_countries = self.mendeley_countries
+        mendeley_disciplines = self.mendeley_disciplines
+        mendeley_job_titles = self.mendeley_job_titles
+        return {
+            "version": MENDELEY_SUMS_VERSION,
             "readers": self.mendeley_readers,
-            "country": self.mendeley_countries,
-            "country_percent": as_proportion(self.mendeley_countries),
-            "subdiscipline": self.mendeley_disciplines,
-            "subdiscipline_percent": as_proportion(self.mendeley_disciplines),
-            "academic_status": self.mendeley_job_titles,
-            "academic_status_percent": as_proportion(self.mendeley_job_titles),
+            "country": mendeley_countries,
+            "country_percent": as_proportion(mendeley_countries),
+            "subdiscipline": mendeley_disciplines,
+            "subdiscipline_percent": as_proportion(mendeley_disciplines),
+            "academic_status": mendeley_job_titles,
+            "academic_status_percent": as_proportion(mendeley_job_titles),
             "h_index": self._mendeley_h_index,
             "percent_of_products": self.mendeley_percent_of_products
-            }
-        else:
-            print "no mendeley"
+        }
+
+    @property
+    def mendeley_sums_are_current(self):
+        if not self.mendeley_sums:
+            return False
+        return self.mendeley_sums.get("version") == MENDELEY_SUMS_VERSION
+
+    def get_mendeley_sums(self):
+        # rows stored before mendeley_sums was versioned are summed here but not
+        # stored, so reads never write.  the Person.set_mendeley_sums job backfills them.
+        if not self.mendeley_sums_are_current:
+            return self.calculate_mendeley_sums()
         return self.mendeley_sums
 
 
@@ -559,9 +632,11 @@ class Person(db.Model):
             if needs_to_be_added:
                 updated_products.append(product_to_add)
         self.products = updated_products
+        self.reset_product_columns()
 
 
     def recalculate_openness(self):
+        self.reset_product_columns()  # products' fulltext and license may have just changed
         self.set_openness()
         self.set_num_oa_licenses()
         openness_badges = ["percent_fulltext", "all_fulltext", "open_license"]
@@ -569,29 +644,15 @@ class Person(db.Model):
         self.set_badge_percentiles(limit_to_badges=openness_badges)
 
     def set_num_oa_licenses(self):
-        self.num_fulltext = 0
-        self.num_user_supplied_fulltext = 0
-        self.num_any_oa = 0
-        self.num_cc_by = 0
-        self.num_cc_restricted = 0
-        self.num_cc0_pd = 0
-
-        for p in self.products_with_dois:
-            if p.fulltext_url:
-                self.num_fulltext += 1
-            if p.user_supplied_fulltext_url:
-                self.num_user_supplied_fulltext += 1
+        self._set_num_oa_licenses_from(self.product_columns.num_oa_licenses()[0])
 
-            if p.fulltext_url and p.license:
-                if p.license != "unknown":
-                    self.num_any_oa += 1
-
-                if p.license == "cc-by":
-                    self.num_cc_by += 1
-                elif p.license == "cc0" or p.license == "pd":
-                    self.num_cc0_pd += 1
-                elif "cc-" in p.license:
-                    self.num_cc_restricted += 1
+    def _set_num_oa_licenses_from(self, counts):
+        self.num_fulltext = counts["num_fulltext"]
+        self.num_user_supplied_fulltext = counts["num_user_supplied_fulltext"]
+        self.num_any_oa = counts["num_any_oa"]
+        self.num_cc_by = counts["num_cc_by"]
+        self.num_cc_restricted = counts["num_cc_restricted"]
+        self.num_cc0_pd = counts["num_cc0_pd"]
 
 
     def email_new_stuff(self):
@@ -600,31 +661,19 @@ class Person(db.Model):
         if not self.email:
             return
 
-        DATE_NOTIFICATION_EMAILS_STARTED = "2018-09-10"
-        if not self.events_emailed:
-            self.events_emailed = {"emailed": []}
-
         print u"looking for new stuff to email for {}".format(self.email)
-        posts = self.get_posts()
-        posts_to_email = []
-        for post in posts:
-            post_date_iso = post["posted_on"]
-            if post_date_iso > date_as_iso_utc(self.created):
-                if post_date_iso > DATE_NOTIFICATION_EMAILS_STARTED:
-                    if post["url"] not in self.events_emailed["emailed"]:
-                        posts_to_email.append(post)
-
-        if not posts_to_email:
+        events_to_email = get_unsent_events(self.orcid_id, self.email_events_posted_after)
+
+        if not events_to_email:
             print u"nothing to email."
             return
 
         print u"have things to email!"
-        post_urls = [post["url"] for post in posts_to_email]
-        self.events_emailed["emailed"] += post_urls
+        mark_events_emailed(events_to_email)
 
         post_count_by_source = {}
-        for post in posts_to_email:
-            source = post["source"]
+        for event in events_to_email:
+            source = event.source
             try:
                 post_count_by_source[source] += 1
             except KeyError:
@@ -703,7 +752,9 @@ class Person(db.Model):
 
         # everything else
         start_time = time()
+        self.reset_product_columns()  # build the columns once, after the api calls above
         self.set_post_counts() # do this first
+        self.set_event_ledger()
         self.set_mendeley_sums()
         self.set_num_posts()
         self.set_num_mentions()
@@ -728,6 +779,11 @@ class Person(db.Model):
             sec = elapsed(start_time, 2)
         )
 
+    def set_product_metrics(self):
+        # the post, mention and license counts from calculate, without its api calls or badges.
+        # jobs.update_fn runs set_product_metrics_for_persons over whole chunks instead.
+        set_product_metrics_for_persons([self])
+
     def mini_calculate(self):
         self.set_num_posts()
         self.set_num_mentions()
@@ -877,10 +933,11 @@ class Person(db.Model):
         if not include_products:
             include_products = self.all_products
 
-        # start a thread for each product
+        # start a thread for each product, as fetch slots free up
         for work in include_products:
             method = getattr(work, method_name)
-            process = threading.Thread(target=method, args=[high_priority])
+            slot = fetch_slots.acquire(high_priority)
+            process = threading.Thread(target=run_in_fetch_slot, args=[method, high_priority, slot])
             process.start()
             threads.append(process)
 
@@ -973,18 +1030,38 @@ class Person(db.Model):
 
     @property
     def sources(self):
-        sources = []
-        for source_name in sources_metadata:
-            source = Source(source_name, self.products)
-            if source.posts_count > 0:
-                sources.append(source)
-        return sources
+        return make_sources(self.products)
 
 
     # convenience so can have all of these set for one profile
     def set_post_details(self):
         for my_product in self.products_with_dois:
             my_product.set_post_details()
+        self.set_event_ledger()
+
+    def set_event_ledger(self):
+        # done here rather than in the product threads, so it shares the person's session
+        record_events(self.orcid_id, self.get_posts(), self.email_events_posted_after)
+
+    @property
+    def email_events_posted_after(self):
+        # we only email about events from after this
+        return max(self.created, DATE_NOTIFICATION_EMAILS_STARTED)
+
+    def migrate_events_emailed(self):
+        # move the urls in the old events_emailed list into the event ledger as already sent
+        if not self.events_emailed or not self.events_emailed.get("emailed"):
+            return
+        emailed_urls = set(self.events_emailed["emailed"])
+        posts_by_url = dict((post["url"], post) for post in self.get_posts() if post.get("url"))
+        emailed_posts = [posts_by_url.get(url, {"url": url}) for url in emailed_urls]
+        num_migrated = record_emailed_events(self.orcid_id, emailed_posts)
+        print u"migrated {} emailed events for {}".format(num_migrated, self.orcid_id)
+
+    def close_old_events(self):
+        # ledger rows that went in unsent but are too old to ever be emailed
+        num_closed = mark_events_before_emailed(self.orcid_id, self.email_events_posted_after)
+        print u"closed {} events too old to email for {}".format(num_closed, self.orcid_id)
 
 
     def set_coauthors(self):
@@ -1069,7 +1146,8 @@ class Person(db.Model):
 
     @property
     def percent_open_license(self):
-        if not self.products_with_dois:
+        num_products_with_dois = self.product_columns.num_products_with_dois()[0]
+        if not num_products_with_dois:
             return None
 
         num_open_license_products = 0
@@ -1078,8 +1156,6 @@ class Person(db.Model):
         if self.num_cc0_pd:
             num_open_license_products += self.num_cc0_pd
 
-        num_products_with_dois = len(self.products_with_dois)
-
         if num_products_with_dois >= 1:
             response = min(1, round((num_open_license_products / float(num_products_with_dois)), 3))
         else:
@@ -1090,12 +1166,11 @@ class Person(db.Model):
 
     @property
     def percent_fulltext(self):
-
-        if not self.products_with_dois:
+        num_products_with_dois = self.product_columns.num_products_with_dois()[0]
+        if not num_products_with_dois:
             return None
 
-        num_products_with_dois = len(self.products_with_dois)
-        num_open_products = len([p for p in self.products_with_dois if p.has_fulltext_url])
+        num_open_products = self.product_columns.num_fulltext()[0]
 
         # only defined if three or more products
         if num_products_with_dois >= 1:
@@ -1117,15 +1192,7 @@ class Person(db.Model):
         return 0
 
     def set_post_counts(self):
-        self.post_counts = {}
-
-        for p in self.products_with_dois:
-            if p.post_counts:
-                for metric, count in p.post_counts.iteritems():
-                    try:
-                        self.post_counts[metric] += int(count)
-                    except KeyError:
-                        self.post_counts[metric] = int(count)
+        self.post_counts = self.product_columns.post_counts_by_source()[0]
 
         # print u"setting post_counts", self.post_counts
 
@@ -1136,7 +1203,7 @@ class Person(db.Model):
             self.num_posts = sum(self.post_counts.values())
 
     def set_num_mentions(self):
-        self.num_mentions = sum([p.num_mentions for p in self.all_products])
+        self.num_mentions = self.product_columns.num_mentions()[0]
 
     def set_num_products(self):
         self.num_products = len(self.all_products)
@@ -1215,50 +1282,75 @@ class Person(db.Model):
         return None
 
     def assign_badges(self, limit_to_badges=[]):
+        target_badges = self.get_target_badges(limit_to_badges)
+        self.apply_target_badges(target_badges)
 
-        for badge_assigner_class in badge.all_badge_assigners():
+    def get_target_badges(self, limit_to_badges=[]):
+        # badge name -> the Badge this person should have now, or None if they shouldn't have it.
+        # only has the badge names being assigned this time.
+        # features are collected once for all the assigners, with at most one pass over the products
+        features = get_badge_features(self)
 
+        target_badges = {}
+        for badge_assigner_class in badge.all_badge_assigners():
             badge_assigner = badge_assigner_class()
             if limit_to_badges:
                 if badge_assigner.name not in limit_to_badges:
                     # isn't a badge we want to assign right now, so skip
                     continue
-
-            candidate_badge = badge_assigner.get_badge_or_None(self)
-            already_assigned_badge = self.get_badge(badge_assigner.name)
-
+            target_badges[badge_assigner.name] = badge_assigner.get_badge_or_None(features)
+        return target_badges
+
+    def apply_target_badges(self, target_badges):
+        # build the new badge list in memory and let the session flush it: new badges are
+        # inserted, changed ones updated, and dropped ones deleted as orphans, each as one batch
+        target_badges = dict(target_badges)
+        kept_badges = []
+        value_changes = []  # (badge name, old value, new value), for the refset sketches
+
+        for already_assigned_badge in self.badges:
+            if already_assigned_badge.name not in target_badges:
+                kept_badges.append(already_assigned_badge)
+                continue
+
+            candidate_badge = target_badges.pop(already_assigned_badge.name)
             if candidate_badge:
-                if already_assigned_badge:
-                    already_assigned_badge.value = candidate_badge.value
-                    already_assigned_badge.products = candidate_badge.products
-                    already_assigned_badge.support = candidate_badge.support
-                    print u"{} already had badge, now updated {}".format(
-                        self.id, already_assigned_badge)
-                else:
-                    print u"{} first time got badge {}".format(self.id, candidate_badge)
-                    self.badges.append(candidate_badge)
-
-                    if candidate_badge.name == 'babel':
-                        print u"BABEL support: {}".format(candidate_badge.support)
-
+                value_changes.append((already_assigned_badge.name, already_assigned_badge.value, candidate_badge.value))
+                already_assigned_badge.value = candidate_badge.value
+                already_assigned_badge.products = candidate_badge.products
+                already_assigned_badge.support = candidate_badge.support
+                kept_badges.append(already_assigned_badge)
+                print u"{} already had badge, now updated {}".format(
+                    self.id, already_assigned_badge)
             else:
-                # print u"nope, {} doesn't get badge {}".format(self.id, badge_assigner.name)
-                if already_assigned_badge:
-                    print u"{} doesn't get badge {}, but had it before, so removing".format(self.id, badge_assigner.name)
+                value_changes.append((already_assigned_badge.name, already_assigned_badge.value, None))
+                print u"{} doesn't get badge {}, but had it before, so removing".format(
+                    self.id, already_assigned_badge.name)
+
+        for candidate_badge in target_badges.values():
+            if candidate_badge:
+                value_changes.append((candidate_badge.name, None, candidate_badge.value))
+                print u"{} first time got badge {}".format(self.id, candidate_badge)
+                kept_badges.append(candidate_badge)
 
-                    if already_assigned_badge.name == 'babel':
-                        print u"first, here was its BABEL support: {}".format(already_assigned_badge.support)
-                        print u"used to have babel support on dois: {}".format(already_assigned_badge.dois)
+        self.badges = kept_badges
 
-                    badge.Badge.query.filter_by(id=already_assigned_badge.id).delete()
+        if self.campaign == refset_campaign:
+            record_refset_badge_changes(value_changes)
+        self.num_badges = self.count_badges_to_show_in_ui()
 
-        self.num_badges = len(self.badges_to_show_in_ui)
+    def count_badges_to_show_in_ui(self):
+        # same badges as badges_to_show_in_ui, without sorting them
+        badges = [b for b in self.badges if b.value and b.my_badge_type.valid_badge]
+        if len(badges) > 1:
+            badges = [b for b in badges if b.name != "first_steps"]
+        return len([b for b in badges if b.my_badge_type.show_in_ui])
 
 
 
     def set_badge_percentiles(self, limit_to_badges=[]):
-        badge_names = [my_badge.name for my_badge in self.badges]
-        refsets = Refset.query.filter(Refset.name.in_(badge_names)).all()
+        refset_cutoffs = get_refset_cutoffs()
+        known_badge_names = set(badge.all_badge_assigner_names())
 
         for my_badge in self.badges:
             if limit_to_badges:
@@ -1266,12 +1358,9 @@ class Person(db.Model):
                     # isn't a badge we want to assign right now, so skip
                     continue
 
-            if my_badge.name in badge.all_badge_assigner_names():
-                # from http://stackoverflow.com/a/7125547/596939
-                matching_refset = next((ref for ref in refsets if ref.name==my_badge.name), None)
-
-                if matching_refset:
-                    my_badge.set_percentile(matching_refset.cutoffs)
+            if my_badge.name in known_badge_names:
+                if my_badge.name in refset_cutoffs:
+                    my_badge.set_percentile(refset_cutoffs[my_badge.name])
 
 
     @property
@@ -1334,25 +1423,28 @@ class Person(db.Model):
         return ret
 
 
+    @property
+    def product_columns(self):
+        # columnar view of all_products, built once and shared by the calculate steps
+        if getattr(self, "_product_columns", None) is None:
+            self._product_columns = ProductColumns.for_person(self)
+        return self._product_columns
+
+    def reset_product_columns(self):
+        self._product_columns = None
+
     @property
     def mendeley_readers(self):
-        total = 0
-        for p in self.all_products:
-            if p.mendeley_api_raw and "reader_count" in p.mendeley_api_raw:
-                total += p.mendeley_api_raw["reader_count"]
-        return total
+        return self.product_columns.mendeley_readers()[0]
 
     @property
     def mendeley_percent_of_products(self):
-        if not self.all_products:
+        num_products = self.product_columns.num_products()[0]
+        if not num_products:
             return None
 
-        count = 0
-        for p in self.all_products:
-            if p.mendeley_api_raw and "reader_count" in p.mendeley_api_raw:
-                if p.mendeley_api_raw["reader_count"] >= 1:
-                    count += 1
-        return float(count) / len(self.all_products)
+        count = self.product_columns.num_with_mendeley_readers()[0]
+        return float(count) / num_products
 
     @property
     def mendeley_countries(self):
@@ -1386,13 +1478,7 @@ class Person(db.Model):
 
     @property
     def _mendeley_h_index(self):
-        reader_counts = []
-        for p in self.all_products:
-            try:
-                reader_counts.append(p.mendeley_api_raw["reader_count"])
-            except (KeyError, TypeError):
-                reader_counts.append(0)
-
+        reader_counts = self.product_columns.mendeley_reader_counts()[0]
         t_index = h_index(reader_counts)
         return t_index
 
@@ -1407,6 +1493,7 @@ class Person(db.Model):
 
 
     def to_dict(self):
+        mendeley_sums = self.get_mendeley_sums()
         ret = {
             "_id": self.id,  # do this too, so it is on top
             "_full_name": self.full_name,
@@ -1432,12 +1519,12 @@ class Person(db.Model):
             "num_mentions": self.num_mentions,
             "num_orcid_products": len(self.all_products),
             "mendeley": {
-                "country_percent": as_proportion(self.mendeley_countries),
-                "subdiscipline_percent": as_proportion(self.mendeley_disciplines),
-                "job_title_percent": as_proportion(self.mendeley_job_titles),
+                "country_percent": mendeley_sums["country_percent"],
+                "subdiscipline_percent": mendeley_sums["subdiscipline_percent"],
+                "job_title_percent": mendeley_sums["academic_status_percent"],
                 "mendeley_url": None,
-                "readers": self.mendeley_readers,
-                "percent_of_products": self.mendeley_percent_of_products
+                "readers": mendeley_sums["readers"],
+                "percent_of_products": mendeley_sums["percent_of_products"]
             },
             "sources": [s.to_dict() for s in self.sources],
             "overview_badges": [b.to_dict() for b in self.overview_badges],
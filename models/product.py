@@ -15,6 +15,8 @@ from time import sleep
 from time import time
 from random import random
 import datetime
+import hashlib
+from textstat.textstat import textstat
 
 from app import db
 from util import remove_nonprinting_characters
@@ -26,15 +28,16 @@ from util import elapsed
 from util import cached_property
 
 from models.source import sources_metadata
-from models.source import Source
+from models.source import make_sources
 from models.country import country_info
-from models.country import get_name_from_iso
+from models.reference_data import get_country_name_from_iso
 from models.country import map_mendeley_countries
 from models.language import get_language_from_abbreviation
 from models.orcid import set_biblio_from_biblio_dict
 from models.orcid import get_doi_from_biblio_dict
 from models.orcid import clean_doi
 from models.mendeley import set_mendeley_data
+from models.rate_limit import wait_for_rate_limit
 
 preprint_url_fragments = [
     "/npre.",
@@ -102,6 +105,25 @@ def distinct_product_list(new_product, list_so_far):
     return list_so_far
 
 
+def calculate_reading_level(text):
+    # only do if at least three words between periods,
+    # otherwise textstat library prints too many Not Enough Words error messages
+    if text:
+        sentences = text.split(".")
+        if any([len(sentence.split())>3 for sentence in sentences]):
+            try:
+                grade_level = textstat.flesch_kincaid_grade(text)
+                if grade_level > 0:
+                    # is sometimes negative, strangely.  examples in ethan's profile
+                    return grade_level
+            except TypeError:  #if text is too short it thows this
+                pass
+    return None
+
+def get_reading_level_text_hash(text):
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
 def get_all_products(limit=100):
     q = db.session.query(Product.title, Product.doi, Product.id)
     q = q.filter(Product.doi != None)
@@ -139,6 +161,9 @@ class Product(db.Model):
     post_details = db.Column(MutableDict.as_mutable(JSONB))
     poster_counts = db.Column(MutableDict.as_mutable(JSONB))
     event_dates = db.Column(MutableDict.as_mutable(JSONB))
+    twitter_posters = db.Column(JSONB)
+    reading_level = db.Column(db.Float)
+    reading_level_text_hash = db.Column(db.Text)
 
     user_supplied_fulltext_url = db.Column(db.Text)
     fulltext_url = db.Column(db.Text)
@@ -198,6 +223,7 @@ class Product(db.Model):
         self.set_poster_counts()
         self.set_post_details()
         self.set_event_dates()
+        self.set_twitter_posters()
 
     @property
     def display_authors(self):
@@ -221,6 +247,9 @@ class Product(db.Model):
         # want to have defense in depth and wrap this whole thing in a try/catch too
         # in case errors in calculate or anything else we add.
         try:
+            if not wait_for_rate_limit("mendeley", high_priority):
+                self.error = "rate limit error setting mendeley metrics"
+                return
             self.mendeley_api_raw = set_mendeley_data(self)
         except (KeyboardInterrupt, SystemExit):
             # let these ones through, don't save anything to db
@@ -267,6 +296,9 @@ class Product(db.Model):
             # url = u"http://localhost:5002/v1/publications?email=team@impactstory.org"
             url = u"http://api.unpaywall.org/v2/{}?email=team+profiles@impactstory.org".format(self.doi)
 
+            if not wait_for_rate_limit("unpaywall", high_priority):
+                self.error = "rate limit error calling oadoi"
+                return
             r = requests.get(url)
             if r and r.status_code==200:
                 data = r.json()
@@ -319,6 +351,27 @@ class Product(db.Model):
         return abstract
 
 
+    def get_reading_level_text(self):
+        text = u""
+        if self.title:
+            text += u" " + self.title
+        abstract = self.get_abstract_using_mendeley()
+        if abstract:
+            text += u" " + abstract
+        return text
+
+    def get_reading_level(self):
+        # textstat is slow, so only rerun it when the title or abstract has changed
+        text = self.get_reading_level_text()
+        text_hash = get_reading_level_text_hash(text)
+        if text_hash != self.reading_level_text_hash:
+            self.set_reading_level_from_text(text, calculate_reading_level(text))
+        return self.reading_level
+
+    def set_reading_level_from_text(self, text, reading_level):
+        self.reading_level = reading_level
+        self.reading_level_text_hash = get_reading_level_text_hash(text)
+
     # don't store post_counts anymore, just calculate them
     @property
     def post_counts(self):
@@ -539,6 +592,8 @@ class Product(db.Model):
             )
             # print u"url: {}".format(url)
             try:
+                if not wait_for_rate_limit("crossref", high_priority):
+                    return None
                 r = requests.get(url, timeout=5)
                 if r.status_code==200 and r.text and u"|" in r.text:
                     doi = r.text.rsplit(u"|", 1)[1]
@@ -574,6 +629,9 @@ class Product(db.Model):
                 doi=self.clean_doi,
                 key=os.getenv("ALTMETRIC_KEY")
             )
+            if not wait_for_rate_limit("altmetric", high_priority):
+                self.error = "rate limit error setting altmetric.com metrics"
+                return
             # might throw requests.Timeout
             r = requests.get(url, timeout=10)  #timeout in seconds
 
@@ -585,6 +643,9 @@ class Product(db.Model):
                     doi=self.clean_doi,
                     key=os.getenv("ALTMETRIC_KEY")
                 )
+                if not wait_for_rate_limit("altmetric", high_priority):
+                    self.error = "rate limit error setting altmetric.com metrics"
+                    return
                 r = requests.get(url, timeout=10)  #timeout in seconds
 
 
@@ -643,19 +704,11 @@ class Product(db.Model):
 
     @property
     def sources(self):
-        sources = []
-        for source_name in sources_metadata:
-            source = Source(source_name, [self])
-            if source.posts_count > 0:
-                sources.append(source)
-        return sources
+        return make_sources([self])
 
     @property
     def events_last_week_count(self):
-        events_last_week_count = 0
-        for source in self.sources:
-            events_last_week_count += source.events_last_week_count
-        return events_last_week_count
+        return sum([source.events_last_week_count for source in self.sources])
 
     @cached_property
     def normalized_title(self):
@@ -676,7 +729,7 @@ class Product(db.Model):
 
     @property
     def countries(self):
-        return [get_name_from_iso(my_country) for my_country in self.post_counts_by_iso_country.keys()]
+        return [get_country_name_from_iso(my_country) for my_country in self.post_counts_by_iso_country.keys()]
 
     @property
     def countries_using_mendeley(self):
@@ -743,7 +796,7 @@ class Product(db.Model):
 
         try:
             for iso_country, count in self.altmetric_api_raw["demographics"]["geo"]["twitter"].iteritems():
-                country_name = get_name_from_iso(iso_country)
+                country_name = get_country_name_from_iso(iso_country)
                 if country_name in posts_by_country:
                     posts_by_country[country_name] += count
                 else:
@@ -779,40 +832,50 @@ class Product(db.Model):
     def impressions(self):
         return sum(self.twitter_posters_with_followers.values())
 
-
-    def get_tweeter_posters_full_names(self, most_recent=None):
-        names = []
-
+    def set_twitter_posters(self):
+        # one entry per tweet, in altmetric order, with only the keys the tweet has
+        self.twitter_posters = []
         try:
-            posts = self.altmetric_api_raw["posts"]["twitter"]
+            twitter_posts = self.altmetric_api_raw["posts"]["twitter"]
         except (KeyError, TypeError):
-            return names
+            return self.twitter_posters
 
-        if most_recent:
-            posts = sorted(posts, key=lambda k: k["posted_on"], reverse=True)
-            posts = posts[0:most_recent]
-        for post in posts:
+        for post in twitter_posts:
+            poster = {}
             try:
-                names.append(post["author"]["name"])
+                author = post["author"]
+                for (key, author_key) in [("handle", "id_on_source"), ("name", "name"), ("followers", "followers")]:
+                    if author_key in author:
+                        poster[key] = author[author_key]
             except (KeyError, TypeError):
                 pass
-        return names
+            try:
+                poster["posted_on"] = post["posted_on"]
+            except (KeyError, TypeError):
+                pass
+            self.twitter_posters.append(poster)
+        return self.twitter_posters
+
+    def get_twitter_posters(self):
+        # rows from before twitter_posters existed get it built on first use
+        if self.twitter_posters is None:
+            self.set_twitter_posters()
+        return self.twitter_posters
+
+    def get_tweeter_posters_full_names(self, most_recent=None):
+        posters = self.get_twitter_posters()
+
+        if most_recent:
+            posters = sorted(posters, key=lambda k: k.get("posted_on"), reverse=True)
+            posters = posters[0:most_recent]
+        return [poster["name"] for poster in posters if "name" in poster]
 
     @property
     def twitter_posters_with_followers(self):
         posters = {}
-        try:
-            twitter_posts = self.altmetric_api_raw["posts"]["twitter"]
-        except (KeyError, TypeError):
-            return {}
-
-        for post in twitter_posts:
-            try:
-                poster = post["author"]["id_on_source"]
-                followers = post["author"]["followers"]
-                posters[poster] = followers
-            except (KeyError, TypeError):
-                pass
+        for poster in self.get_twitter_posters():
+            if "handle" in poster and "followers" in poster:
+                posters[poster["handle"]] = poster["followers"]
         return posters
 
 
@@ -980,6 +1043,7 @@ class Product(db.Model):
 
 
     def to_dict(self):
+        my_sources = self.sources
         return {
             "id": self.id,
             "mendeley": {
@@ -1002,9 +1066,9 @@ class Product(db.Model):
             "altmetric_score": self.altmetric_score,
             "num_posts": self.num_posts,
             "num_mentions": self.num_mentions,
-            "sources": [s.to_dict() for s in self.sources],
+            "sources": [s.to_dict() for s in my_sources],
             "posts": self.posts,
-            "events_last_week_count": self.events_last_week_count,
+            "events_last_week_count": sum([s.events_last_week_count for s in my_sources]),
             "genre": self.guess_genre(),
             "license": self.license,
             "has_fulltext_url": self.has_fulltext_url,
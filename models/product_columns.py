@@ -0,0 +1,150 @@
+from collections import defaultdict
+
+
+class ProductColumns(object):
+    """
+    Column-per-attribute view of products, built in one pass.
+
+    Every column is a list with one entry per product.  owner holds the index
+    of the person each product belongs to, so the same view can hold one
+    person's products (for Person.calculate) or many persons' products (for
+    bulk recalculation).  The aggregate methods return one result per person.
+    """
+
+    def __init__(self, products_by_person):
+        self.num_persons = len(products_by_person)
+
+        self.owner = []
+        self.has_doi = []
+        self.num_posts = []
+        self.post_counts = []
+        self.mendeley_reader_count = []
+        self.fulltext_url = []
+        self.user_supplied_fulltext_url = []
+        self.license = []
+
+        for person_index, products in enumerate(products_by_person):
+            for my_product in products:
+                self.owner.append(person_index)
+                self.has_doi.append(bool(my_product.doi))
+
+                posts = my_product.posts
+                self.num_posts.append(len(posts))
+                if my_product.doi:
+                    post_counts = defaultdict(int)
+                    for post in posts:
+                        post_counts[post["source"]] += 1
+                    self.post_counts.append(post_counts)
+                else:
+                    self.post_counts.append(None)
+
+                try:
+                    reader_count = my_product.mendeley_api_raw["reader_count"]
+                except (KeyError, TypeError):
+                    reader_count = None
+                self.mendeley_reader_count.append(reader_count)
+
+                self.fulltext_url.append(my_product.fulltext_url)
+                self.user_supplied_fulltext_url.append(my_product.user_supplied_fulltext_url)
+                self.license.append(my_product.license)
+
+    @classmethod
+    def for_person(cls, person):
+        return cls([person.all_products])
+
+    @classmethod
+    def for_persons(cls, persons):
+        return cls([person.all_products for person in persons])
+
+    def _per_person(self, make_empty):
+        return [make_empty() for i in range(self.num_persons)]
+
+    def num_products(self):
+        resp = self._per_person(int)
+        for owner in self.owner:
+            resp[owner] += 1
+        return resp
+
+    def num_products_with_dois(self):
+        resp = self._per_person(int)
+        for owner, has_doi in zip(self.owner, self.has_doi):
+            if has_doi:
+                resp[owner] += 1
+        return resp
+
+    def num_mentions(self):
+        resp = self._per_person(int)
+        for owner, num_posts in zip(self.owner, self.num_posts):
+            resp[owner] += num_posts
+        return resp
+
+    def num_fulltext(self):
+        # products with dois that have a fulltext url at all, matching Product.has_fulltext_url
+        resp = self._per_person(int)
+        for owner, has_doi, fulltext_url in zip(self.owner, self.has_doi, self.fulltext_url):
+            if has_doi and fulltext_url != None:
+                resp[owner] += 1
+        return resp
+
+    def post_counts_by_source(self):
+        resp = self._per_person(dict)
+        for owner, post_counts in zip(self.owner, self.post_counts):
+            if post_counts:
+                for source, count in post_counts.iteritems():
+                    try:
+                        resp[owner][source] += int(count)
+                    except KeyError:
+                        resp[owner][source] = int(count)
+        return resp
+
+    def mendeley_readers(self):
+        resp = self._per_person(int)
+        for owner, reader_count in zip(self.owner, self.mendeley_reader_count):
+            if reader_count is not None:
+                resp[owner] += reader_count
+        return resp
+
+    def mendeley_reader_counts(self):
+        # zero for products without a reader count, as the h-index wants
+        resp = self._per_person(list)
+        for owner, reader_count in zip(self.owner, self.mendeley_reader_count):
+            resp[owner].append(reader_count if reader_count is not None else 0)
+        return resp
+
+    def num_with_mendeley_readers(self):
+        resp = self._per_person(int)
+        for owner, reader_count in zip(self.owner, self.mendeley_reader_count):
+            if reader_count is not None and reader_count >= 1:
+                resp[owner] += 1
+        return resp
+
+    def num_oa_licenses(self):
+        resp = self._per_person(lambda: {
+            "num_fulltext": 0,
+            "num_user_supplied_fulltext": 0,
+            "num_any_oa": 0,
+            "num_cc_by": 0,
+            "num_cc_restricted": 0,
+            "num_cc0_pd": 0
+        })
+        columns = zip(self.owner, self.has_doi, self.fulltext_url, self.user_supplied_fulltext_url, self.license)
+        for (owner, has_doi, fulltext_url, user_supplied_fulltext_url, license) in columns:
+            if not has_doi:
+                continue
+            counts = resp[owner]
+            if fulltext_url:
+                counts["num_fulltext"] += 1
+            if user_supplied_fulltext_url:
+                counts["num_user_supplied_fulltext"] += 1
+
+            if fulltext_url and license:
+                if license != "unknown":
+                    counts["num_any_oa"] += 1
+
+                if license == "cc-by":
+                    counts["num_cc_by"] += 1
+                elif license == "cc0" or license == "pd":
+                    counts["num_cc0_pd"] += 1
+                elif "cc-" in license:
+                    counts["num_cc_restricted"] += 1
+        return resp
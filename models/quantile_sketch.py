@@ -0,0 +1,119 @@
+import math
+
+
+# DDSketch-style quantile sketch: values are counted in logarithmic buckets, so any
+# quantile it returns is within relative_accuracy of the true value.  unlike t-digest
+# or KLL, bucket counts can go down as well as up, so a badge value that changes can
+# be taken back out.  sketches merge by adding counts, and serialize to plain dicts
+# (for the refset table) or "z" / "p:<key>" / "n:<key>" counters (for redis hashes).
+
+default_relative_accuracy = 0.01
+
+
+class QuantileSketch(object):
+
+    def __init__(self, relative_accuracy=default_relative_accuracy):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.zero_count = 0
+        self.positive = {}
+        self.negative = {}
+
+    def bucket_key(self, value):
+        if value == 0:
+            return "z"
+        if value > 0:
+            return "p:{}".format(int(math.ceil(math.log(value) / self.log_gamma)))
+        return "n:{}".format(int(math.ceil(math.log(-value) / self.log_gamma)))
+
+    def add_to_bucket(self, bucket_key, count=1):
+        if bucket_key == "z":
+            self.zero_count += count
+            return
+        (sign, key) = bucket_key.split(":")
+        buckets = self.positive if sign == "p" else self.negative
+        key = int(key)
+        buckets[key] = buckets.get(key, 0) + count
+        if buckets[key] == 0:
+            del buckets[key]
+
+    def add(self, value, count=1):
+        self.add_to_bucket(self.bucket_key(value), count)
+
+    def remove(self, value, count=1):
+        self.add(value, -count)
+
+    def merge(self, other_sketch):
+        self.add_bucket_counts(other_sketch.bucket_counts())
+
+    def add_bucket_counts(self, bucket_counts):
+        for (bucket_key, count) in bucket_counts.iteritems():
+            self.add_to_bucket(bucket_key, int(count))
+
+    def bucket_counts(self):
+        resp = {}
+        if self.zero_count:
+            resp["z"] = self.zero_count
+        for (key, count) in self.positive.iteritems():
+            resp["p:{}".format(key)] = count
+        for (key, count) in self.negative.iteritems():
+            resp["n:{}".format(key)] = count
+        return resp
+
+    @property
+    def count(self):
+        # buckets can dip below zero while deltas catch up; those don't count
+        return sum([count for (value, count) in self._ordered_buckets()])
+
+    def _bucket_value(self, key):
+        # the point in the bucket with the smallest worst-case relative error
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def _ordered_buckets(self):
+        # (representative value, count), smallest values first
+        buckets = []
+        for key in sorted(self.negative.keys(), reverse=True):
+            buckets.append((-self._bucket_value(key), self.negative[key]))
+        if self.zero_count:
+            buckets.append((0.0, self.zero_count))
+        for key in sorted(self.positive.keys()):
+            buckets.append((self._bucket_value(key), self.positive[key]))
+        return [(value, count) for (value, count) in buckets if count > 0]
+
+    def value_at_rank(self, rank):
+        seen = 0
+        for (value, count) in self._ordered_buckets():
+            seen += count
+            if rank < seen:
+                return value
+        return None
+
+    def cutoffs(self, num_cutoffs=100):
+        # same ranks as the refset cutoffs: the first value in each of
+        # num_cutoffs nearly-equal chunks of the sorted values
+        n = self.count
+        ranks = [i * (n / num_cutoffs) + min(i, n % num_cutoffs) for i in range(min(n, num_cutoffs))]
+
+        resp = []
+        buckets = iter(self._ordered_buckets())
+        seen = 0
+        value = None
+        for rank in ranks:
+            while rank >= seen:
+                (value, count) = buckets.next()
+                seen += count
+            resp.append(value)
+        return resp
+
+    def to_dict(self):
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": self.bucket_counts()
+        }
+
+    @classmethod
+    def from_dict(cls, sketch_dict):
+        sketch = cls(relative_accuracy=sketch_dict.get("relative_accuracy", default_relative_accuracy))
+        sketch.add_bucket_counts(sketch_dict.get("buckets", {}))
+        return sketch
@@ -0,0 +1,127 @@
+import os
+import uuid
+from time import time
+from time import sleep
+from redis import RedisError
+
+from app import redis_rq_conn
+
+
+# upstream calls are shared between interactive refreshes (high_priority) and
+# backfills.  backfills only get part of each budget, so a refresh somebody
+# is waiting on still goes through during a full Person.refresh run.
+
+high_priority_share = float(os.getenv("HIGH_PRIORITY_SHARE", 0.25))
+
+# calls per second, across all processes.  set them from the environment as the
+# upstream limits change; the defaults leave headroom under what each one says:
+#   altmetric: limits are per api key, and are reported back in the
+#     X-HourlyRateLimit-Limit and X-DailyRateLimit-Limit headers.  it answers
+#     429 when we're over, and set_data_from_altmetric retries without twitter.
+#   crossref: its X-Rate-Limit-Limit / X-Rate-Limit-Interval headers have
+#     allowed 50 calls a second.
+#   unpaywall: asks for no more than 100,000 calls a day.  that's about 1.2 a
+#     second on average, so 20 a second is only for the short bursts of a refresh.
+#   mendeley: publishes no fixed limit and answers 429 when we're over, so this
+#     is a conservative guess.
+upstream_rate_limits = {
+    "altmetric": int(os.getenv("ALTMETRIC_RATE_LIMIT", 10)),
+    "crossref": int(os.getenv("CROSSREF_RATE_LIMIT", 20)),
+    "unpaywall": int(os.getenv("UNPAYWALL_RATE_LIMIT", 20)),
+    "mendeley": int(os.getenv("MENDELEY_RATE_LIMIT", 10))
+}
+
+
+def get_allowed_calls(upstream, high_priority=False):
+    limit = upstream_rate_limits[upstream]
+    if high_priority:
+        return limit
+    return max(1, int(limit * (1 - high_priority_share)))
+
+
+def wait_for_rate_limit(upstream, high_priority=False, max_wait=60):
+    """
+    Waits for a slot in this second's budget for upstream.
+
+    Returns False if there wasn't one within max_wait seconds, so the caller
+    can treat it like a 429.  If redis is down we don't hold anything up.
+    """
+    allowed = get_allowed_calls(upstream, high_priority)
+    give_up_at = time() + max_wait
+
+    while True:
+        window = int(time())
+        key = u"ti:rate_limit:{}:{}".format(upstream, window)
+        try:
+            pipe = redis_rq_conn.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, 5)
+            (num_calls, _) = pipe.execute()
+            if num_calls <= allowed:
+                return True
+            # give it back, so waiting backfills don't eat into the reserved share
+            redis_rq_conn.decr(key)
+        except RedisError:
+            return True
+
+        if time() >= give_up_at:
+            return False
+        sleep(max(0.01, window + 1 - time()))
+
+
+class FetchSlots(object):
+    """
+    Caps how many upstream fetch threads run at once across every process:
+    the web app's refreshes and all the rq workers' backfills share one pool.
+    The last num_reserved slots can only be used by high priority work.
+
+    Each slot in use is a member of a redis sorted set, scored by when it was
+    taken.  Slots older than lease_seconds are taken back, so a process that
+    dies holding slots doesn't keep them.
+    """
+
+    key = "ti:fetch_slots"
+
+    def __init__(self, num_slots, num_reserved, lease_seconds=60 * 5, poll_seconds=0.05):
+        self.num_slots = num_slots
+        self.num_reserved = num_reserved
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+
+    def acquire(self, high_priority=False):
+        """
+        Waits for a slot and returns it, to pass to release.  If redis is down
+        we don't hold anything up, and return None.
+        """
+        limit = self.num_slots if high_priority else self.num_slots - self.num_reserved
+        slot = uuid.uuid4().hex
+        while True:
+            now = time()
+            try:
+                pipe = redis_rq_conn.pipeline()
+                pipe.zremrangebyscore(self.key, 0, now - self.lease_seconds)
+                pipe.zadd(self.key, slot, now)
+                pipe.zrank(self.key, slot)
+                pipe.expire(self.key, self.lease_seconds)
+                (_, _, rank, _) = pipe.execute()
+                if rank < limit:
+                    return slot
+                # oldest slots first, so give ours back and wait our turn
+                redis_rq_conn.zrem(self.key, slot)
+            except RedisError:
+                return None
+            sleep(self.poll_seconds)
+
+    def release(self, slot):
+        if slot is None:
+            return
+        try:
+            redis_rq_conn.zrem(self.key, slot)
+        except RedisError:
+            pass
+
+
+fetch_slots = FetchSlots(
+    int(os.getenv("FETCH_SLOTS", 40)),
+    int(os.getenv("FETCH_SLOTS_RESERVED", 10))
+)
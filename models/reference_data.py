@@ -0,0 +1,52 @@
+import io
+import os
+
+
+# static lookup tables, each loaded the first time it is used and then kept for the life of the process
+
+data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+_tables = {}
+
+
+def _get_table(name, loader):
+    try:
+        return _tables[name]
+    except KeyError:
+        table = _tables[name] = loader()
+        return table
+
+
+def _read_lowercase_lines(filename):
+    # one entry per line, blank lines and lines starting with # skipped
+    with io.open(os.path.join(data_dir, filename), "r", encoding="utf-8") as f:
+        lines = [line.strip().lower() for line in f]
+    return frozenset(line for line in lines if line and not line.startswith(u"#"))
+
+
+def _load_country_names_by_iso():
+    from models.country import country_info
+    resp = {}
+    for country_name, country_dict in country_info.iteritems():
+        resp.setdefault(country_dict["iso"], country_name)
+    return resp
+
+
+def url_slugs_to_redirect():
+    return _get_table("url_slugs_to_redirect", lambda: _read_lowercase_lines("url_slugs_to_redirect.txt"))
+
+def scientists_twitter():
+    return _get_table("scientists_twitter", lambda: _read_lowercase_lines("scientists_twitter.txt"))
+
+def country_names_by_iso():
+    return _get_table("country_names_by_iso", _load_country_names_by_iso)
+
+
+def is_url_slug_to_redirect(slug):
+    return slug.lower() in url_slugs_to_redirect()
+
+def is_scientist_on_twitter(twitter_handle):
+    return twitter_handle.lower() in scientists_twitter()
+
+def get_country_name_from_iso(iso_name):
+    return country_names_by_iso().get(iso_name)
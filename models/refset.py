@@ -2,19 +2,25 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import deferred
-from sqlalchemy.orm import Load
-from sqlalchemy import orm
 from sqlalchemy import text
 from sqlalchemy import func
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 import datetime
-from collections import defaultdict
+import logging
+import uuid
+from time import time
+from time import sleep
+from redis import RedisError
 
 from app import db
+from app import redis_rq_conn
 
 from models.badge import Badge
-from models.badge import get_badge_assigner
+from models.badge import get_badge_type
+from models.quantile_sketch import QuantileSketch
 from util import safe_commit
-from util import chunk_into_n_sublists
+from util import elapsed
 
 def base_count_people_query():
     from models.person import Person
@@ -22,10 +28,13 @@ def base_count_people_query():
     count_q = db.session.query(Person)
     return count_q
 
+# the people whose badges make up the refsets
+refset_campaign = "2015_with_urls"
+
 # make this standalone function so everywhere uses the same query for this
 def refine_refset_query(base_query):
     from models.person import Person
-    q = base_query.filter(Person.campaign == "2015_with_urls")
+    q = base_query.filter(Person.campaign == refset_campaign)
     return q
 
 def num_people_in_db():
@@ -44,73 +53,410 @@ def num_people_in_refset():
     return count
 
 
-def update_refsets():
-    from models.person import Person
+# update_refsets bumps this, so every process knows to reload its cached cutoffs
+refset_version_key = "refset_version"
+
+_refset_cache = {
+    "loaded": False,
+    "version": None,
+    "cutoffs": {}
+}
+
+def bump_refset_version():
+    try:
+        return redis_rq_conn.incr(refset_version_key)
+    except RedisError:
+        logging.exception("couldn't bump the refset version, cached refsets will be stale")
+        return None
+
+def load_refset_cutoffs():
+    rows = db.session.query(Refset.name, Refset.cutoffs).all()
+    return dict((name, cutoffs) for (name, cutoffs) in rows)
+
+def get_refset_cutoffs():
+    # badge name -> cutoffs, cached in this process until the refset version changes
+    try:
+        version = redis_rq_conn.get(refset_version_key)
+    except RedisError:
+        logging.exception("couldn't get the refset version, reading refsets from the db")
+        return load_refset_cutoffs()
+
+    if not _refset_cache["loaded"] or _refset_cache["version"] != version:
+        _refset_cache["cutoffs"] = load_refset_cutoffs()
+        _refset_cache["version"] = version
+        _refset_cache["loaded"] = True
+    return _refset_cache["cutoffs"]
+
+
+def get_refset_badge_names():
+    q = text(u"""select distinct b.name
+                from badge b join person p on p.orcid_id = b.orcid_id
+                where p.campaign = :campaign and b.value is not null""")
+    rows = db.session.execute(q, {"campaign": refset_campaign}).fetchall()
+    return [row[0] for row in rows]
+
+
+def calculate_refset_cutoffs(name, num_in_refset):
+    # the same cutoffs as sorting every value (plus the zero padding) and taking the
+    # minimum of each of 100 nearly-equal chunks, but done in postgres.
+    # chunk i starts at index i*(n/100) + least(i, n%100); asking percentile_disc for
+    # half a row past that start lands on exactly that row.
+    q = text(u"""
+        with badge_values as (
+            select b.value
+            from badge b join person p on p.orcid_id = b.orcid_id
+            where p.campaign = :campaign and b.name = :name and b.value is not null
+        ),
+        num_values as (
+            select count(*) as n from badge_values
+        ),
+        padded_values as (
+            select value from badge_values
+            union all
+            select 0.0
+            from num_values, generate_series(1, greatest(:num_in_refset - num_values.n, 0))
+            where :pad_with_zeros
+        ),
+        num_padded_values as (
+            select count(*) as n from padded_values
+        ),
+        fractions as (
+            select (i * (n / 100) + least(i, n % 100) + 0.5) / n::float as fraction
+            from num_padded_values, generate_series(0, least(n, 100) - 1) as i
+        )
+        select percentile_disc(array(select fraction from fractions order by fraction))
+            within group (order by value)
+        from padded_values
+    """)
+    params = {
+        "campaign": refset_campaign,
+        "name": name,
+        "num_in_refset": num_in_refset,
+        "pad_with_zeros": get_badge_type(name).pad_percentiles_with_zeros
+    }
+    cutoffs = db.session.execute(q, params).scalar()
+    return cutoffs or []
+
+
+def calculate_refset_sketch(name, num_in_refset):
+    # the same population as calculate_refset_cutoffs, bucketed in postgres
+    sketch = QuantileSketch()
+    q = text(u"""
+        select case
+                when b.value = 0 then 'z'
+                when b.value > 0 then 'p:' || ceil(ln(b.value) / :log_gamma)::int
+                else 'n:' || ceil(ln(-b.value) / :log_gamma)::int
+            end as bucket_key,
+            count(*)
+        from badge b join person p on p.orcid_id = b.orcid_id
+        where p.campaign = :campaign and b.name = :name and b.value is not null
+        group by 1
+    """)
+    params = {"campaign": refset_campaign, "name": name, "log_gamma": sketch.log_gamma}
+    rows = db.session.execute(q, params).fetchall()
+    sketch.add_bucket_counts(dict((bucket_key, count) for (bucket_key, count) in rows))
+
+    if get_badge_type(name).pad_percentiles_with_zeros:
+        sketch.add(0, max(num_in_refset - sketch.count, 0))
+    return sketch
+
+
+# badge value changes since the last full update_refsets, per badge name, as
+# hincrby counters on the sketch buckets.  added to Refset.sketch on read.
+def refset_sketch_delta_key(name):
+    return u"refset_sketch_delta:{}".format(name)
+
+def _sketch_bucket_key_for_badge_value(name, value):
+    # people without the badge count as zeros in padded refsets, and not at all otherwise
+    if value is None:
+        if get_badge_type(name).pad_percentiles_with_zeros:
+            return "z"
+        return None
+    return QuantileSketch().bucket_key(value)
+
+def record_refset_badge_changes(changes):
+    # changes is a list of (badge name, old value, new value), None meaning no badge.
+    # they wait on the session and only go to redis once the badges are committed,
+    # so a rolled back or lost refresh doesn't leave the sketches counting it.
+    if changes:
+        db.session().info.setdefault("refset_badge_changes", []).extend(changes)
 
-    print u"getting the badge percentile refsets...."
 
-    # only get out the badge objects
-    q = db.session.query(Person).options(
-             Load(Person).load_only("campaign", "orcid_id"))
-    q = q.options(orm.noload('*'))
-    q = q.options(orm.subqueryload("badges"))
+# update_refsets counts a badge's sketch in postgres and clears its deltas, and
+# both have to see the same changes, or a change lands in the new sketch and a
+# new delta too (or in neither).  so a session with changes registers as a writer
+# from before its commit until its deltas are written, and update_refsets takes
+# the lock and waits for the writers to finish before counting.  while the lock
+# is held, new writers wait for it.
+refset_sketch_lock_key = "refset_sketch_lock"
+refset_sketch_writers_key = "refset_sketch_writers"
+refset_sketch_lock_seconds = 60 * 10
+refset_sketch_writer_lease_seconds = 60
 
-    # limit to just what we want for the refset
-    q = refine_refset_query(q)
+def start_refset_sketch_writer():
+    """
+    Waits until update_refsets isn't counting, then registers a writer and
+    returns it, to pass to finish_refset_sketch_writer.  If redis is down
+    there's nothing to keep consistent with, so returns None.
+    """
+    writer = uuid.uuid4().hex
+    give_up_at = time() + refset_sketch_lock_seconds
+    while True:
+        try:
+            pipe = redis_rq_conn.pipeline()
+            pipe.zadd(refset_sketch_writers_key, writer, time())
+            pipe.exists(refset_sketch_lock_key)
+            (_, is_locked) = pipe.execute()
+            if not is_locked:
+                return writer
+            redis_rq_conn.zrem(refset_sketch_writers_key, writer)
+        except RedisError:
+            return None
+        if time() > give_up_at:
+            logging.error(u"waited too long for update_refsets, writing refset sketch changes anyway")
+            return None
+        sleep(0.05)
 
-    # and do the get
-    rows = q.all()
+def finish_refset_sketch_writer(writer):
+    if writer is None:
+        return
+    try:
+        redis_rq_conn.zrem(refset_sketch_writers_key, writer)
+    except RedisError:
+        pass
 
-    print u"query finished, now set the values in the lists"
-    refset_list_dict = defaultdict(list)
-    for person in rows:
-        for badge in person.badges:
-            # print "BADGE", badge
-            # handle the nones below, with the zeros
-            if badge.value != None:
-                refset_list_dict[badge.name].append(badge.value)
+def lock_refset_sketches():
+    # returns False if another update_refsets has the lock
+    redis_rq_conn.zremrangebyscore(refset_sketch_writers_key, 0, time() - refset_sketch_writer_lease_seconds)
+    if not redis_rq_conn.set(refset_sketch_lock_key, "locked", ex=refset_sketch_lock_seconds, nx=True):
+        return False
+    # writers that registered before the lock was set are committing now, so let them finish
+    while redis_rq_conn.zcount(refset_sketch_writers_key, time() - refset_sketch_writer_lease_seconds, "+inf"):
+        sleep(0.05)
+    return True
 
+def unlock_refset_sketches():
+    redis_rq_conn.delete(refset_sketch_lock_key)
+
+@event.listens_for(Session, "before_commit")
+def _start_writing_refset_badge_changes(session):
+    if session.info.get("refset_badge_changes") and "refset_sketch_writer" not in session.info:
+        session.info["refset_sketch_writer"] = start_refset_sketch_writer()
+
+@event.listens_for(Session, "after_commit")
+def _write_committed_refset_badge_changes(session):
+    changes = session.info.pop("refset_badge_changes", None)
+    if changes:
+        write_refset_badge_changes(changes)
+    if "refset_sketch_writer" in session.info:
+        finish_refset_sketch_writer(session.info.pop("refset_sketch_writer"))
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_rolled_back_refset_badge_changes(session, previous_transaction):
+    # a session that's removed without committing takes its changes with it
+    session.info.pop("refset_badge_changes", None)
+    if "refset_sketch_writer" in session.info:
+        finish_refset_sketch_writer(session.info.pop("refset_sketch_writer"))
+
+def write_refset_badge_changes(changes):
+    bucket_deltas = {}  # delta key -> {bucket key: change in count}
+    for (name, old_value, new_value) in changes:
+        old_bucket_key = _sketch_bucket_key_for_badge_value(name, old_value)
+        new_bucket_key = _sketch_bucket_key_for_badge_value(name, new_value)
+        if old_bucket_key == new_bucket_key:
+            continue
+        deltas = bucket_deltas.setdefault(refset_sketch_delta_key(name), {})
+        if old_bucket_key:
+            deltas[old_bucket_key] = deltas.get(old_bucket_key, 0) - 1
+        if new_bucket_key:
+            deltas[new_bucket_key] = deltas.get(new_bucket_key, 0) + 1
+    add_refset_sketch_deltas(bucket_deltas)
+
+def add_refset_sketch_deltas(bucket_deltas):
+    try:
+        pipe = redis_rq_conn.pipeline(transaction=False)
+        for (delta_key, deltas) in bucket_deltas.iteritems():
+            for (bucket_key, count) in deltas.iteritems():
+                if count:
+                    pipe.hincrby(delta_key, bucket_key, count)
+        pipe.execute()
+    except RedisError:
+        logging.exception("couldn't record refset sketch changes")
+
+def take_refset_sketch_deltas(names):
+    # read and clear the deltas in one MULTI, so no change lands between the two
+    delta_keys = [refset_sketch_delta_key(name) for name in names]
+    if not delta_keys:
+        return {}
+    try:
+        pipe = redis_rq_conn.pipeline()
+        for delta_key in delta_keys:
+            pipe.hgetall(delta_key)
+        pipe.delete(*delta_keys)
+        bucket_counts_list = pipe.execute()[:-1]
+    except RedisError:
+        logging.exception("couldn't clear refset sketch changes")
+        return {}
+    resp = {}
+    for (delta_key, bucket_counts) in zip(delta_keys, bucket_counts_list):
+        resp[delta_key] = dict((bucket_key, int(count)) for (bucket_key, count) in bucket_counts.iteritems())
+    return resp
+
+def refset_inputs_changed():
+    # have any refset badge values changed since the last full update_refsets?
+    names = get_refset_badge_names()
+    saved_names = set([name for (name, ) in db.session.query(Refset.name).all()])
+    if set(names) - saved_names:
+        return True
+    try:
+        pipe = redis_rq_conn.pipeline(transaction=False)
+        for name in names:
+            pipe.hvals(refset_sketch_delta_key(name))
+        for bucket_counts in pipe.execute():
+            if any([int(count) for count in bucket_counts]):
+                return True
+    except RedisError:
+        logging.exception("couldn't get refset sketch changes, so assuming there are some")
+        return True
+    return False
+
+def get_refset_sketch(my_refset):
+    if not my_refset.sketch:
+        return None
+    sketch = QuantileSketch.from_dict(my_refset.sketch)
+    try:
+        sketch.add_bucket_counts(redis_rq_conn.hgetall(refset_sketch_delta_key(my_refset.name)))
+    except RedisError:
+        logging.exception("couldn't get refset sketch changes, using the last full refset")
+    return sketch
+
+def update_refsets_from_sketches():
+    # cheap in-between refresh: new cutoffs from the sketches, without recounting everyone
+    for my_refset in Refset.query.all():
+        sketch = get_refset_sketch(my_refset)
+        if sketch:
+            my_refset.cutoffs = sketch.cutoffs()
+            my_refset.updated = datetime.datetime.utcnow().isoformat()
+            print u"refreshed refset {} from its sketch, cutoffs {}".format(my_refset.name, my_refset.cutoffs)
+    safe_commit(db)
+    bump_refset_version()
+
+def compare_refset_sketches_to_exact():
+    # how far the sketch cutoffs are from the exact ones, as the largest relative error per badge
     num_in_refset = num_people_in_refset()
+    resp = {}
+    for name in get_refset_badge_names():
+        exact_cutoffs = calculate_refset_cutoffs(name, num_in_refset)
+        sketch_cutoffs = calculate_refset_sketch(name, num_in_refset).cutoffs()
+        errors = []
+        for (exact, approx) in zip(exact_cutoffs, sketch_cutoffs):
+            if exact:
+                errors.append(abs(approx - exact) / abs(exact))
+            else:
+                errors.append(abs(approx))
+        if len(exact_cutoffs) != len(sketch_cutoffs):
+            errors.append(1.0)
+        resp[name] = max(errors) if errors else 0
+        print u"refset {}: max relative error of sketch cutoffs is {}".format(name, resp[name])
+    return resp
 
-    for name, unsorted_values in refset_list_dict.iteritems():
-        print u"refreshing refset {}".format(name)
 
-        assigner = get_badge_assigner(name)
-        if assigner.pad_percentiles_with_zeros:
-            # pad with zeros for all the people who didn't get the badge
-            unsorted_values.extend([0] * (num_in_refset - len(unsorted_values)))
+def calculate_refset_sketch_taking_deltas(name, num_in_refset):
+    # the new sketch counts everything committed so far, and the deltas taken with it
+    # are the same changes, because nothing commits in between.  see lock_refset_sketches.
+    try:
+        is_locked = lock_refset_sketches()
+    except RedisError:
+        logging.exception("couldn't lock the refset sketches, counting anyway")
+        is_locked = None
+    if is_locked is False:
+        raise ValueError("another update_refsets is counting the refset sketches")
 
-        # now sort
-        refset_list_dict[name] = sorted(unsorted_values)
+    try:
+        sketch = calculate_refset_sketch(name, num_in_refset)
+        deltas = take_refset_sketch_deltas([name])
+    finally:
+        if is_locked:
+            try:
+                unlock_refset_sketches()
+            except RedisError:
+                logging.exception("couldn't unlock the refset sketches, they'll unlock when the lock expires")
+    return (sketch, deltas)
 
-        # now pick out the cutoffs, minimum value at each of 100
-        cutoffs = []
-        for sublist in chunk_into_n_sublists(refset_list_dict[name], 100):
-            sublist_values = sublist
-            if sublist_values:
-                cutoffs.append(min(sublist_values))
 
-        this_badge_refset = Refset(name=name, cutoffs=cutoffs)
-        print u"saving refset {} with cutoffs {}".format(name, cutoffs)
+def update_refsets():
+    print u"getting the badge percentile refsets...."
+
+    num_in_refset = num_people_in_refset()
+    names = get_refset_badge_names()
+
+    taken_deltas = {}
+    try:
+        for name in names:
+            print u"refreshing refset {}".format(name)
+            cutoffs = calculate_refset_cutoffs(name, num_in_refset)
+            (sketch, deltas) = calculate_refset_sketch_taking_deltas(name, num_in_refset)
+            taken_deltas.update(deltas)
 
-        db.session.merge(this_badge_refset)
+            this_badge_refset = Refset(name=name, cutoffs=cutoffs, sketch=sketch.to_dict())
+            print u"saving refset {} with cutoffs {}".format(name, cutoffs)
+
+            db.session.merge(this_badge_refset)
+    except Exception:
+        # nothing's saved, so the old sketches need their deltas back
+        add_refset_sketch_deltas(taken_deltas)
+        raise
 
 
     # and finally save it all
 
-    safe_commit(db)
+    commit_success = safe_commit(db)
+    if not commit_success:
+        # the old sketches are still the saved ones, so they need their deltas back
+        print u"COMMIT fail on refsets, putting the sketch changes back"
+        add_refset_sketch_deltas(taken_deltas)
+    bump_refset_version()
+
+
+
 
+def update_badge_percentiles():
+    # recompute every stored Badge.percentile from the current cutoffs, without loading anyone.
+    # same as calculate_percentile: the number of cutoffs below the value, over the number of cutoffs.
+    q = text(u"""
+        update badge b
+        set percentile = case
+            when b.value is null then null
+            else (
+                select count(*)
+                from jsonb_array_elements_text(r.cutoffs) as c(cutoff)
+                where c.cutoff::float < b.value
+            )::float / jsonb_array_length(r.cutoffs)
+        end
+        from refset r
+        where r.name = :name
+        and b.name = r.name
+        and jsonb_array_length(r.cutoffs) > 0
+    """)
 
+    names = [name for (name, ) in db.session.query(Refset.name).all()]
+    for name in names:
+        start = time()
+        result = db.session.execute(q, {"name": name})
+        safe_commit(db)
+        print u"updated {} {} badge percentiles in {}sec".format(result.rowcount, name, elapsed(start))
 
 
 class Refset(db.Model):
     name = db.Column(db.Text, primary_key=True)
     updated = db.Column(db.DateTime)
     cutoffs = db.Column(JSONB)
+    sketch = db.Column(JSONB)
 
-    def __init__(self, name, cutoffs):
+    def __init__(self, name, cutoffs, sketch=None):
         self.name = name
         self.cutoffs = cutoffs
+        self.sketch = sketch
         self.updated = datetime.datetime.utcnow().isoformat()
 
     def __repr__(self):
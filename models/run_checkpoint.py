@@ -0,0 +1,97 @@
+import datetime
+import json
+
+from app import redis_rq_conn
+
+
+# where a bulk update run has got to, kept in redis so a run that dies can be
+# picked up again with update.py --resume.
+#
+# ids are handed out in windows, in primary key order.  before a window is
+# run, its chunks go in the pending hash and the cursor moves to the window's
+# last id.  update_fn takes each chunk out of pending when it commits, or
+# moves its ids to the failed set if it doesn't.  so a resumed run needs the
+# pending chunks plus everything after the cursor, and nothing else.  the
+# pending chunks are rerun as they are, so they keep their keys, and whichever
+# job finishes a chunk takes it out of pending.
+#
+# a sampled run (a list of ids, see jobs.sample_ids) has no cursor.  all its
+# chunks go in pending when it starts, so the pending chunks are all it needs.
+
+class RunCheckpoint(object):
+
+    def __init__(self, run_name):
+        self.run_name = run_name
+        self.key = u"ti:run:{}".format(run_name)
+        self.pending_key = self.key + u":pending"
+        self.failed_key = self.key + u":failed"
+
+    def exists(self):
+        return redis_rq_conn.exists(self.key)
+
+    def start(self, update_name, sampled=False):
+        pipe = redis_rq_conn.pipeline()
+        pipe.delete(self.key, self.pending_key, self.failed_key)
+        pipe.hmset(self.key, {
+            "update": update_name,
+            "started": datetime.datetime.utcnow().isoformat(),
+            "sampled": int(sampled)
+        })
+        pipe.execute()
+
+    def is_sampled(self):
+        return redis_rq_conn.hget(self.key, "sampled") == "1"
+
+    def get_cursor(self):
+        cursor = redis_rq_conn.hget(self.key, "cursor")
+        if cursor is None:
+            return None
+        return cursor.decode("utf-8")
+
+    def add_window(self, object_ids_chunks, cursor=None):
+        pipe = redis_rq_conn.pipeline()
+        for object_ids_chunk in object_ids_chunks:
+            pipe.hset(self.pending_key, get_chunk_key(object_ids_chunk), json.dumps(object_ids_chunk))
+        if cursor is not None:
+            pipe.hset(self.key, "cursor", cursor)
+        pipe.hset(self.key, "updated", datetime.datetime.utcnow().isoformat())
+        pipe.execute()
+
+    def has_unfinished_work(self):
+        pipe = redis_rq_conn.pipeline()
+        pipe.hlen(self.pending_key)
+        pipe.scard(self.failed_key)
+        (num_pending, num_failed) = pipe.execute()
+        return bool(num_pending or num_failed)
+
+    def chunk_done(self, object_ids_chunk):
+        pipe = redis_rq_conn.pipeline()
+        pipe.hdel(self.pending_key, get_chunk_key(object_ids_chunk))
+        pipe.srem(self.failed_key, *object_ids_chunk)
+        pipe.execute()
+
+    def chunk_failed(self, object_ids_chunk):
+        pipe = redis_rq_conn.pipeline()
+        pipe.hdel(self.pending_key, get_chunk_key(object_ids_chunk))
+        pipe.sadd(self.failed_key, *object_ids_chunk)
+        pipe.execute()
+
+    def get_pending_chunks(self):
+        resp = [json.loads(chunk_json) for chunk_json in redis_rq_conn.hvals(self.pending_key)]
+        return sorted(resp, key=get_chunk_key)
+
+    def get_failed_ids(self):
+        return sorted([object_id.decode("utf-8") for object_id in redis_rq_conn.smembers(self.failed_key)])
+
+    def summary(self):
+        return u"run {}: cursor at {}, {} chunks pending, {} ids failed".format(
+            self.run_name,
+            self.get_cursor(),
+            redis_rq_conn.hlen(self.pending_key),
+            redis_rq_conn.scard(self.failed_key)
+        )
+
+
+def get_chunk_key(object_ids_chunk):
+    # ids are only ever in one chunk of a run, so the first one names it
+    return object_ids_chunk[0]
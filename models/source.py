@@ -1,4 +1,5 @@
 import datetime
+from collections import defaultdict
 from util import days_ago
 
 
@@ -65,11 +66,45 @@ sources_metadata = {
 }
 
 
+def make_sources(products):
+    """
+    Walks the products once and returns a Source for every source with posts,
+    with posts_count and events_last_week_count already filled in.
+    """
+    posts_counts = defaultdict(int)
+    events_last_week_counts = defaultdict(int)
+
+    for my_product in products:
+        post_counts = my_product.post_counts
+        if post_counts:
+            for source_name, count in post_counts.iteritems():
+                posts_counts[source_name] += int(count)
+
+        if my_product.event_dates:
+            for source_name, date_list in my_product.event_dates.iteritems():
+                if source_name in sources_metadata:
+                    events_last_week = [d for d in date_list if days_ago(d) <= 7]
+                    events_last_week_counts[source_name] += len(events_last_week)
+
+    sources = []
+    for source_name in sources_metadata:
+        if posts_counts[source_name] > 0:
+            sources.append(Source(
+                source_name,
+                products,
+                posts_count=posts_counts[source_name],
+                events_last_week_count=events_last_week_counts[source_name]
+            ))
+    return sources
+
+
 class Source(object):
 
-    def __init__(self, source_name, products):
+    def __init__(self, source_name, products, posts_count=None, events_last_week_count=None):
         self.source_name = source_name
         self.products = products
+        self._posts_count = posts_count
+        self._events_last_week_count = events_last_week_count
         super(Source, self).__init__()
 
     @property
@@ -78,6 +113,8 @@ class Source(object):
 
     @property
     def posts_count(self):
+        if self._posts_count is not None:
+            return self._posts_count
         post_counts = 0
         for my_product in self.products:
             if my_product.post_counts and self.source_name in my_product.post_counts:
@@ -88,6 +125,8 @@ class Source(object):
 
     @property
     def events_last_week_count(self):
+        if self._events_last_week_count is not None:
+            return self._events_last_week_count
         events_last_week_count = 0
         for my_product in self.products:
             if my_product.event_dates and self.source_name in my_product.event_dates:
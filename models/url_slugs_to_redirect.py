@@ -1,12978 +0,0 @@
-#!/usr/bin/python
-# -*- coding: iso-8859-15 -*-
-
-url_slugs_string = u"""JohannesKarstensen
-SvenVanPoucke                                           
-MuhammadYakutAli                                        
-PaulJohnson                                             
-KarinaTamashiro                                         
-StevenTaylor                                            
-ChelseaLeachman7114                                     
-MaryTolcos                                              
-PolDeVos                                                
-ClaudiaRicci                                            
-JaneCoughlan                                            
-TaoGuo                                                  
-KateOrton-johnson                                       
-RachelTurner                                            
-VictoriaRasero                                          
-LingliTseng                                             
-LaszloSajtos                                            
-CaitlinMoore                                            
-JeffreyGillan                                           
-phette23                                                
-isabellecanda                                           
-user50279                                               
-BelenNOvoa                                              
-davidrein                                               
-EduLeorri                                               
-BehroozRasuli                                           
-SnigdhaPattnaik                                         
-ElizabethSeymour                                        
-AlexeyGanin                                             
-HoracioSaggion                                          
-BrunoAug                                                
-BradLeVeck                                              
-AkhileshGaharwar                                        
-CynthiaGibas                                            
-CarloFornaini                                           
-AntonioJoseMonforte                                     
-rosannequinnell                                         
-AshokReddyDinasarapu                                    
-FranciscoOrtiz                                          
-GeorgiosSamiotis                                        
-ErwanMonier                                             
-DannyPerez                                              
-LiliTSENG                                               
-JoseMDuarte                                             
-Danielhoz                                               
-KenCoar                                                 
-ravipappu                                               
-BeverleyCopnell                                         
-SallySmith                                              
-MaryMargotMaleckar                                      
-AMEYABIHANI                                             
-georgeruban                                             
-MonikaMichalak                                          
-RajasekharanPE                                          
-JoseMariaPerezCollados                                  
-EduardoMoreno940                                        
-aswathykumaran                                          
-CarlosAraya                                             
-caoanyuan                                               
-RhondaAllard                                            
-DominicThewlis5149                                      
-MasaoYamagishi                                          
-HeatherMcCullough8834                                   
-RayBrown                                                
-JeroenBosman                                            
-harsha159nature                                         
-NaserAlsharairi                                         
-TakashiFujimori                                         
-LucaTurin                                               
-EldarBaykiev                                            
-JeffGraf                                                
-GildenirCarolinoSantos                                  
-AllisonAtteberry                                        
-HeidiUphoff                                             
-MartaMinana                                             
-ManojPant                                               
-DavidLee                                                
-CharoSerralMontore                                      
-PeterGross                                              
-MelanieWindrich                                         
-JepsonPaul                                              
-RajdeepBasu                                             
-JaimePaez                                               
-ThaliaGoldstein                                         
-DanielKrupp                                             
-AlbertoPriego                                           
-AndrewLetten4775                                        
-ArthurSmith                                             
-liwangli                                                
-ThaisMorata                                             
-nalankannan                                             
-ArielBrito                                              
-JamesCressey                                            
-AmyBrunvand                                             
-NagendraPrasad                                          
-CaitlinBakker                                           
-HesamTalebiyan                                          
-MartinKronbichler3577                                   
-AntonyBorel                                             
-EserDemi                                                
-rajarachakatla                                          
-JudithFox                                               
-LynnWiley                                               
-KathrynFrederick                                        
-MariaPerez                                              
-DhruvBhate                                              
-MayaSoyoa                                               
-CatrionaManville                                        
-MaxFloettmann                                           
-M.Pillado                                               
-MarkStephens                                            
-PruebaAltms                                             
-DevajyotiDeka                                           
-CarolineMoffat                                          
-RobertCostanza                                          
-MohammadShakerSabetnasab                                
-ArielAndrea                                             
-CerenAvci                                               
-NicolettaRighini                                        
-TimChapman                                              
-YiWenHon                                                
-thibaulthonegger                                        
-EhabAlnfrawy                                            
-FaridAlisafaei                                          
-JonButterworth                                          
-KessyLawrence                                           
-alevelci                                                
-MartinLea                                               
-MostafaZamanian                                         
-ScottHocknull                                           
-JohnBrosz                                               
-RobinBerjon                                             
-jarmosaarikko                                           
-andreluxen                                              
-JacobReimer                                             
-NickHigham                                              
-lukaskoster                                             
-AkiraOConnor                                            
-IsabelleVea                                             
-AlmaMontes                                              
-LucieKalousova                                          
-YohannisMarti                                           
-MatthewConnell                                          
-ThomasJellis                                            
-TomaszRutkowski                                         
-ManuelBuenoLluch                                        
-KimberlyNicholas                                        
-ThesisIndia                                             
-davecormierpei                                          
-CitaMuller                                              
-RickJohnson                                             
-KevBrick                                                
-GeoffDavis                                              
-caitsydney                                              
-Chen-YiTu                                               
-MichaelCrisp                                            
-BiswapriyaMisra                                         
-eeide                                                   
-JohnTCathey                                             
-DebbieGemmill                                           
-AlisonOlcottMarshall                                    
-SamirKumarJalal                                         
-SaskiaBoonzajerFlaes                                    
-DanielKoenig279                                         
-JohnSelby                                               
-FredHasselman                                           
-karthikbalajee                                          
-ChristopherSalas-Wright                                 
-LindaCorrin5435                                         
-JakeKaupp                                               
-AngelesCampos                                           
-AngeloAntonini                                          
-liuyang                                                 
-NicholasThoburn                                         
-SlimanJBensmaia                                         
-fdebaste                                                
-conjugateprior                                          
-JanDriessen                                             
-MarkPopielarski                                         
-EimearBarrett                                           
-RandyReichardt6317                                      
-pradeepbalmiki                                          
-TrevorCollins                                           
-JonathanDaw                                             
-marc_cscott                                             
-LauraAlba-Juez                                          
-DonShepard                                              
-TarlachMcGonagle                                        
-DushadRam                                               
-ChristianSchroder                                       
-JohnWiley                                               
-FakhirahLyana                                           
-TimVarga                                                
-AmandaStanley                                           
-EricWood                                                
-AnaIvkovic                                              
-EdwardByers                                             
-AmberLeahey                                             
-AhmedAlkaisi                                            
-RobertSyme                                              
-RalfDepping                                             
-ChristopherBrown                                        
-GeorgianaGhiciuc                                        
-LarsFrolund                                             
-christopheterzian                                       
-KarineLangevin                                          
-BarbaraWegiel                                           
-IsabelleDurance                                         
-JoelClaassen                                            
-DavidGatfield                                           
-MarkusList                                              
-DouglasRobinson3                                        
-PrimalPappachan                                         
-JessicaBreland                                          
-DavidTremouilles                                        
-DougMoncur                                              
-SoumyadeepMukhopadhyay                                  
-AitorGastón                                             
-JuliannScholl                                           
-MohammadGhanei                                          
-katedoherty                                             
-PratikNagaria                                           
-sarbariswaika                                           
-WolframLutterer7506                                     
-TseenKhoo                                               
-MatthewMcCabe                                           
-GabrielLozano                                           
-PaulHJensen                                             
-AmandaCooper                                            
-UlrikeSehy                                              
-StacyKonkiel1298                                        
-DavidBailey                                             
-ChaoXu                                                  
-nagendrachauhan                                         
-VincentTraag                                            
-DanielleSchoffman                                       
-JustinYeakel                                            
-UPMAshik                                                
-DominiqueBabini                                         
-GregoryAlushin                                          
-FlorianWellmann                                         
-TimMcGinley                                             
-meren                                                   
-katharinegrafestes                                      
-PennilynHiggins                                         
-MikkoHuotari                                            
-IoannaSougleri                                          
-ElizabethBayliss                                        
-SenthilArumugam                                         
-DianaPaton                                              
-KathleenBaird                                           
-NathanielStanley                                        
-LaurieBridges                                           
-RobertoCerbino                                          
-JohnLeppert                                             
-SashaRubin                                              
-GiuseppeDellaRicca                                      
-YeeSernNg                                               
-ShannonFaley                                            
-MauricePillet                                           
-MatthewGilbert                                          
-SubhrojyotiBhowmick                                     
-NohaAttallah                                            
-LuisMejias                                              
-SaraJalalzadeh                                          
-zishansiddiqui                                          
-JohnMills                                               
-SumonaMukherjee                                         
-GregDowney                                              
-SteffenMader                                            
-SaraDavisBowman                                         
-RogerArce                                               
-StuartMumford                                           
-BrianNorberg                                            
-Pierre-YvesHenry                                        
-grantbudas                                              
-MatthewSisk                                             
-LuisMochan                                              
-SergeyKornilov                                          
-LucretiaMcCulley                                        
-SharonMcDonnell                                         
-CamillaSpeller                                          
-AdamRunions7899                                         
-FernHames                                               
-ManolisMavrikis                                         
-AngelesRodriguez                                        
-ParaschivGabriela-Mihaela                               
-LorcanKenny                                             
-ChristophAdami                                          
-OliverReiser                                            
-AlejandraAristizabal                                    
-MarcinAdamski                                           
-1001velacup                                             
-ShawnGraham6644                                         
-DebraMcKeown                                            
-ChristianHummeluhr                                      
-EduardoJoseDosSantosDiniz                               
-GustavoSaposnik4032                                     
-morafie                                                 
-Patriciasiques                                          
-patriciamanascarbonero                                  
-JessicaSacher                                           
-aaron.r.colak                                           
-RafaelPena-Miller5390                                   
-HeatherYoung-Leslie                                     
-WE                                                      
-MikaelVejdemo-Johansson                                 
-LouisaEvans                                             
-jouhadimehdi                                            
-StephenRoxburgh                                         
-iquezada                                                
-ErikBauch                                               
-BrigidBarron                                            
-DominicWilson                                           
-fulviodacquisto                                         
-LorenaOEnglish2088                                      
-JorgePullin                                             
-JackySowden                                             
-KrisannaMachtmes7266                                    
-CristinaPulido                                          
-AthanassiosGouglas                                      
-HarounChenchouni                                        
-sozonpapavlasopoulos                                    
-DoralynRossmann                                         
-ODPRNResearch                                           
-KiranPandey                                             
-DrRamachandranGuruprasad                                
-AbhinandanKumar                                         
-XiaoliChen                                              
-AbbieBrown                                              
-JonathanGalazka                                         
-stacytest1                                              
-BrianFoote                                              
-ClementLevallois                                        
-VivekKumar6286                                          
-JabulaniRayGumbo                                        
-jagdishsapkale                                          
-ThomasSwann                                             
-KacieDickinson                                          
-XiaoguangXue                                            
-FrancoiseLeTran                                         
-IainMcKechnie                                           
-EduardoAngulo                                           
-LeeLeeLai                                               
-TazeemZainab                                            
-NicholasSurawski                                        
-MatthewMahutga                                          
-TsubasaMatsui                                           
-CharlesSullivan                                         
-CarlosGarcia-Zorita                                     
-BenjaminLakenOld                                        
-SinaMashek                                              
-JanisOzolins                                            
-CatherineAnderson                                       
-user51142                                               
-VictoriaTsoukala                                        
-IngoRohlfing                                            
-SamrMezghanni                                           
-DeepakUpreti                                            
-ManishJoshi                                             
-PaulMcAdam                                              
-PaulGilbert                                             
-UrsulaPieper                                            
-JenniferWallace                                         
-PeterFields                                             
-IoannisTomkos                                           
-AlexBisson-Filho                                        
-Fay-WeiLi1983                                           
-DominikHaudenschild                                     
-marinagomez                                             
-stephanieswarbreck                                      
-VegaPerez-ChirinosChurruca                              
-PunyaNavaratnarajah                                     
-PaulNutter                                              
-SujathaJagannathan                                      
-HiromasaOno                                             
-CesarVictora                                            
-LauraCzerniewicz482                                     
-KellyBlanchat                                           
-A.DavidLews                                             
-JonHussey                                               
-Rakeshagarwal                                           
-YiCui                                                   
-GejzaJenca                                              
-LeonardSklar                                            
-SabineHossenfelder                                      
-ChristinaTse3798                                        
-DougCheung                                              
-MarizTadros                                             
-GladysVanesaFernandez                                   
-MosheIsraeli                                            
-sarahiceniceros                                         
-JennyZhang                                              
-111111111                                               
-sohinibasu                                              
-PhilipMarsden                                           
-AlexandraLeeper                                         
-brianmathews                                            
-GaneshChandra                                           
-AshishSharma                                            
-TatyanaBusygina                                         
-MatthewReichert                                         
-CurtisLind                                              
-JuanBossio                                              
-DurmusSinanKorpe                                        
-JoseLMauriz                                             
-Ashishpandey                                            
-AnnetteBecker                                           
-JoseRuasAraujo                                          
-SaraiChisala                                            
-KhyatiBabaria                                           
-GholamrezaMotalleb                                      
-AbdulRehman                                             
-AndreaTwiss-Brooks1320                                  
-MilenaDobreva                                           
-AmparoCosta                                             
-NicholasDulvy                                           
-TahaYasseri                                             
-HilaryThompson                                          
-SherinHashem                                            
-MikCarbajalesDale                                       
-noormustafa                                             
-BrigitteDos                                             
-ParthasarathiMukhopadhyay272                            
-MohamedRadhouaneAniba                                   
-AntonyPrabhu                                            
-AdamTatarynowicz                                        
-NatalieCooper                                           
-EmilyWalvoord                                           
-TeresaBarcena                                           
-SiegfriedHekimi3833                                     
-SergeSchiffmann                                         
-GAcquaah-Mensah                                         
-VinaySharma                                             
-NikolaosKaridis                                         
-SaimaHafeez                                             
-NAHEEMKT                                                
-PaulMacklin                                             
-DOMENICOPESSINA                                         
-MrityunjayGupta                                         
-AlexLang                                                
-DickCo3406                                              
-morenolendine                                           
-BiancaCrowley                                           
-mathiaslichterfeld                                      
-MurrayThomson                                           
-RoopendraSingh                                          
-AlanCliff                                               
-av                                                      
-JoMackiewicz                                            
-UvaniaNaidoo                                            
-gregbrown                                               
-JorgeGalindo-Villegas                                   
-RadoslawLenarczyk                                       
-BrianFitzgerald                                         
-CaitlinChristian-Lamb                                   
-mahdihabibi-koolaee                                     
-RohanCurrey                                             
-NathanielvonderEmbse                                    
-DiegoAllen-PerkinsAvendano                              
-ABHISHEKKUMAR                                           
-KaterineBermudez                                        
-CristinaMinella                                         
-DhataPraditya                                           
-JenniferSeaton                                          
-StefanoMarchesini                                       
-AndresBaselga                                           
-user50785                                               
-AngelM.Delgado-Vazquez                                  
-DavidHope                                               
-StefanKasberger                                         
-JianboHou                                               
-MarcoTecilla                                            
-IstvanKiraly                                            
-CharlesPriore                                           
-MariaMariselaSanchez-Chaparro                           
-CesarOrlandoPallaresDelgado                             
-osamanejim                                              
-ValeriaScotti                                           
-PuraCenteno                                             
-IanLi                                                   
-REYCARABEO                                              
-MontseCarrasco                                          
-AlexanderBotte                                          
-IncioPineiro                                            
-kena                                                    
-StephenElliott                                          
-shanjuzhang                                             
-RafaelAlvarado                                          
-HallisonPhelipeLopesdeCastro                            
-JordiFiguerola                                          
-drsharadamenasinkai                                     
-AylaStein                                               
-NoelCox                                                 
-edwinsuarez                                             
-GustavoLiberatore                                       
-LydiaMcLean                                             
-HaiyanTan                                               
-EdgarGoluch                                             
-RNajmanovich                                            
-FionaMartin                                             
-KyliePoulton                                            
-JillLeonard                                             
-DouglasMilanez                                          
-AlexandraGonzalez-Eras                                  
-DanielZelazo                                            
-AnaMariaSanchez                                         
-renaudfabre                                             
-EtemKarakaya                                            
-YinYin5223                                              
-DanieleBotaro                                           
-NancyKim                                                
-BuddhikaThilangaBandaraWijerathne                       
-sjackman                                                
-AndrewSinger                                            
-JoannekeKruijsen                                        
-AnnaKosmutzky                                           
-NigelMabvuure                                           
-RabiahKhan                                              
-AmeetDoshi                                              
-RobertFrodeman                                          
-AndreasHein                                             
-CoutoLorenzoRegina                                      
-HanaYunnus                                              
-PeizhengMa                                              
-IlyaIvlev                                               
-HichemOmrani                                            
-TaranehJavanbakht                                       
-StylianosChatzimanolis                                  
-BrianEnquist                                            
-MarcNeumann                                             
-CezaryDomanski1249                                      
-CatherineTurner                                         
-OliverMartinSelz                                        
-juanchen                                                
-LewisWheaton                                            
-christian_spagnol                                       
-penngcb                                                 
-WoutervandenBos                                         
-AndrewFarke                                             
-AlejandroUribeTirado6138                                
-BinYang                                                 
-RobertRoot-Bernstein                                    
-RyanMcDevitt                                            
-WolfgangReinhardt                                       
-JessicaFarah                                            
-RebeccaReznik-Zellen                                    
-SolomonVimal                                            
-SauliusMarcinkonis                                      
-AntoninaRoll-Mecak                                      
-NancyDudek                                              
-mahmoudzakaria5699                                      
-DavidDiaz                                               
-AravindAkella                                           
-AnikoDudas                                              
-AndrzejKlimczuk4793                                     
-ElizabethPerkin                                         
-NuriaCerda-Esteban                                      
-FranciscojavierManzano-Moreno                           
-ChrisArmbruster                                         
-ArianaSCota                                             
-AuroraAlvarezVeinguer                                   
-SueThomas                                               
-robertarabellotti8716                                   
-CynthiaParr                                             
-RebeccaJefferson                                        
-SaloniKrishnan                                          
-rosyJan5287                                             
-SharonPanth                                             
-ZoltanSylvester                                         
-MarianaPereiraPinho                                     
-DenisaKera                                              
-MainakDutta                                             
-LuisAlbertoSanchez-Vargas                               
-HolgerRapp                                              
-JonathanLin                                             
-AntonioOrtegaSantos                                     
-ClaraBravo                                              
-PaulaTraver                                             
-colditzjb                                               
-AleksandrBeliaev                                        
-AlokaKhanna                                             
-PetervandenBesselaar                                    
-saeedshafieisabet                                       
-DamiaGil-Cano                                           
-ChristopherNolan                                        
-TarjaKokkola                                            
-HananElBakkali                                          
-DanMacLean                                              
-FloranteLopina                                          
-LucaSebastiani                                          
-FabioMercorio                                           
-JenniferGoldman-Levine                                  
-CarmenLopez-Suarez                                      
-LainiBurton                                             
-StinaJohansson5334                                      
-MicheleAnzidei2735                                      
-JongwookLee                                             
-ajaychaubey                                             
-LizCable                                                
-chartgerink                                             
-DannyFriedmann                                          
-OlivierRey                                              
-LinaBlovesciuniene                                      
-LuciaChovancova                                         
-RichardKidd231                                          
-user51681                                               
-SadiaNafees                                             
-HishamDahmoush                                          
-MichelDONGMO                                            
-P                                                       
-DirkSchweitzer                                          
-AnneMartin                                              
-StefanoGovoni                                           
-RamKumarasubramanian                                    
-ChristineBrown                                          
-MohammadH.H.                                            
-SandraCochrane                                          
-PaulScofield                                            
-JulieWalker                                             
-DarioRanocchiari                                        
-Es                                                      
-TimothyDuguid                                           
-aitzazrai                                               
-AaronLuebbe5623                                         
-LinaBlovesciuniene8375                                  
-FedericoToschi                                          
-JuliaCarreno3398                                        
-PaulaCoelho                                             
-ChrisLong                                               
-ThamilmaranKathamuthu                                   
-ClaireWooton                                            
-MichaelMcLennan                                         
-VivecaLindOhlsson                                       
-VanesaAtala                                             
-ManuelLorite                                            
-AmaliaMas                                               
-AinaBorras                                              
-LucasWiessing                                           
-XiaoxuanJia                                             
-ZacharyFeuerstein                                       
-CursoDoctoradoceu                                       
-KwakuOduro-Appiah                                       
-RenateDeinzer                                           
-JenniferDierauer                                        
-SamOakley                                               
-TimWilliams1004                                         
-SophiaRainbird                                          
-junaidqadri                                             
-susantapattanayak                                       
-RafaelRepiso4245                                        
-TimAppelhans                                            
-MariaVaquero                                            
-AlexanderSokolov                                        
-JamesHeilman                                            
-KatharineSchlesinger                                    
-ClaireDillenbeck                                        
-JianqiangBao                                            
-NiklausGrunwald                                         
-luceromontes                                            
-MedicalDissertations                                    
-ewastrzelecka                                           
-sammySam                                                
-OlivierLeMaitre                                         
-LeonieElliott-Graves                                    
-ChristianLinders                                        
-AnaGisbert                                              
-heatherdoran                                            
-TonDietz                                                
-DeniseHammond                                           
-Mrie-FranceWaxin                                        
-FeitoAman                                               
-KartikGanapathi                                         
-Anne-WilHarzing9220                                     
-zeynepgunay                                             
-user72434                                               
-AndreasJungherr                                         
-IftachNachman                                           
-CatrinMoore                                             
-YannickLeMoullec                                        
-CarlMay                                                 
-EllenFlatby                                             
-khanasid                                                
-testme                                                  
-JavadKhazaei                                            
-ChristianKraglundAndersen                               
-JohannesSchunter                                        
-PennyBeile7268                                          
-KristofferBackstrom                                     
-TimoLueke                                               
-AmberGriffiths                                          
-F.JavierGarciaCastano                                   
-MariaAyala-Gascon                                       
-AatmeshShrivastava                                      
-JamesWilson5183                                         
-MikeMorgan                                              
-BartekWilczynski                                        
-RamsyAgha                                               
-KevinBrick9953                                          
-SumeyyeYar                                              
-ZoeJohan                                                
-TobiasLindner                                           
-PaulKudlow                                              
-ChrisCotter                                             
-ChristopherHart                                         
-VincentPham                                             
-GretaLinder                                             
-AlexisBrewer                                            
-SajidSiraj                                              
-AbigailMcbirnie                                         
-Lachenmeier                                             
-VilhelminaUllemar                                       
-SteveDiggle                                             
-JeaninePrime                                            
-GINESAVERDEJORIOS                                       
-gretarichardson                                         
-AbhayKumar                                              
-NoeliaRodriguezManiega                                  
-JavierdelCampo                                          
-ChristopherFriedline                                    
-AnaRosaGomezCano                                        
-NicolasSchmelling                                       
-EuanAdie                                                
-CarmenSuarezBlanco                                      
-ErinMckiernan                                           
-cristinagonzalez                                        
-DaceLagerborg                                           
-GizemKorkmaz                                            
-OmerGokcumen                                            
-user51479                                               
-MeaganAsh                                               
-Chih-WeiLai                                             
-WojciechCzart                                           
-ElizabethYakel                                          
-CeciliaFalk                                             
-AikoNakanoHylander                                      
-PeterJurica                                             
-BelalBatiha                                             
-MahmoodKhosrowjerdi                                     
-user51225                                               
-PauloFonseca7064                                        
-AndrewChang                                             
-DavidLowe                                               
-JenniferBeamer                                          
-RebeccaWilliams                                         
-ShojiTakahashi                                          
-sumairatariq2474                                        
-BrandonWetzel                                           
-AchazvonHardenberg                                      
-ozcankilincci                                           
-tarunbagga                                              
-ThilinaDeSilva                                          
-MarkDomke                                               
-CarolHixson                                             
-ZhongpingQue                                            
-shi-minchen                                             
-UlfKronman                                              
-vgonzalezruiz                                           
-CorralesLorenzo                                         
-EmilOWKirkegaard                                        
-HenryEdison                                             
-ErinRobinson                                            
-JeffreyCraig                                            
-wafisiala                                               
-ElizabethConnor                                         
-JovanSmith                                              
-VivienRolfe                                             
-MichelleHadchouel                                       
-ShunHongo                                               
-Dr.RupakChakravarty                                     
-PippaSmart                                              
-chunliliu                                               
-MJGimeno                                                
-AmroMasarwah                                            
-JaneMansfield                                           
-sarahsupp                                               
-ArunArumugaperumal                                      
-EileenShepherd                                          
-TimWilliams                                             
-CliveMuir                                               
-RoyStorey                                               
-pruebaprueba4506                                        
-RebeccaRoberts                                          
-CarlosMacias-Romero                                     
-PavelPazdera                                            
-ColbieReed                                              
-FionaStill-Drewett                                      
-TaroOkayama                                             
-AntonioE.Serrano                                        
-SumantaPatro                                            
-DianeDawson                                             
-BerylBenderly                                           
-CSiow                                                   
-DianaBohorquez                                          
-ChristianGumpenberger                                   
-MatthewMacmanes                                         
-NickRong                                                
-rogiersbart                                             
-EricGirard                                              
-HASSANMURTAZA                                           
-WhitePJ                                                 
-TellenBennett                                           
-AnushreeDwivedi                                         
-AntoinettedeBont                                        
-BHOJKUMAR                                               
-JonathanVieira                                          
-AdrianRauchfleisch                                      
-MatheusColliSilva                                       
-ChristianSandvig                                        
-NicoleBlalock                                           
-GerardJPVanWesten                                       
-hsu.leslie                                              
-MichaelMakris                                           
-JordanDalton                                            
-ChusCarreiraMino                                        
-SebastianBustingorry                                    
-guojunli                                                
-francoislionnet                                         
-ArunPratap                                              
-LaurieMook                                              
-MohitKumarJolly                                         
-EmilyBurdfield-Steel                                    
-LeeMachado                                              
-NastaranShishegar                                       
-bilalahmed7032                                          
-NunoMacedo                                              
-UzairAhmed                                              
-MollyKeener                                             
-JoseSarmiento                                           
-CarlosGodoyRodriguez                                    
-ChristinaJohansson                                      
-SebastianVentura                                        
-ShuangchunYan                                           
-PierLuigiMartelli                                       
-jason                                                   
-ReginaAvila                                             
-BrettPonsler                                            
-abdelilaharredouani                                     
-OlivierGodinot                                          
-TeppeiFujikawa9224                                      
-HenrikKarlsson                                          
-AdamSheingate                                           
-ZohrehZahedi                                            
-ManuelRamirez-Sanchez8211                               
-catrionaelder                                           
-DavidFlynn                                              
-jaeincho                                                
-DavidHansen                                             
-JensHanssonCeder                                        
-michaelkruepke                                          
-KristofferKarlsson                                      
-XingJiang                                               
-PascalQuemerais8401                                     
-DavidHubbard                                            
-LidiaOliveira                                           
-LindsayRizzardi                                         
-GraceAjuwon                                             
-JonahDuckles                                            
-GeneShreve                                              
-IsaacKohane                                             
-TynanHoffman                                            
-GaryBraun                                               
-VarelaCamacho                                           
-QianaJohnson                                            
-BenDesbrow                                              
-ValentineDurand                                         
-gomesgomees                                             
-VikashBhardwaj                                          
-webmining                                               
-DavidScherer                                            
-AndreBrock                                              
-AlexQuistberg                                           
-CrisLapthorn                                            
-DarenCard                                               
-RafeBlandford                                           
-MichaelLewis                                            
-DanielHelman                                            
-EvonHekkala                                             
-tleonardi                                               
-HaraldH.H.W.Schmidt                                     
-LisaStaten                                              
-ChristopherRamnanan                                     
-SaraKjellberg9111                                       
-refset-25fq4z                                           
-DavidLMiller                                            
-MelodieMcGeoch                                          
-LuanaDias                                               
-JosepGibert                                             
-DinaCastro                                              
-MiguelA.F.Sanjuan                                       
-dimitrioskaraiskos                                      
-clydeholsapple                                          
-ScottChamberlain                                        
-RichardWest                                             
-MarionSills                                             
-JulianGarcia4117                                        
-BilalAhamd                                              
-KarthikRaman                                            
-KeithMarkman                                            
-EmmanuelBischoff                                        
-CarmenRodriguez3300                                     
-AnkitGupta2670                                          
-JoaquinCochero                                          
-ChealsyeBowley                                          
-DeboraFernandez                                         
-JasonDean                                               
-PeterVerheyen                                           
-MichelleHendricks2477                                   
-MaherMoakher                                            
-MichelleHendricks                                       
-TaraHadler                                              
-MargaretMcVeigh                                         
-andytattersall9242                                      
-FaridaVis                                               
-AndrewSchultz                                           
-CarunchoVictoria                                        
-jingdading                                              
-TomTullius                                              
-julipardor                                              
-AdelinoCanario                                          
-JaneJohnsonOtto                                         
-FabioGiglietto                                          
-CarmenMartin                                            
-ChristopherRen                                          
-SevukanRathinam                                         
-TamikaHeiden1255                                        
-ErikHom                                                 
-VitaliiLunov                                            
-ValentinaCillo                                          
-MariaConnor                                             
-LlarinaGonzalez-Solar                                   
-EleonoraBelfiore                                        
-franciscorvillatoro                                     
-GianlucaDemartini7249                                   
-KaterineBermudez6204                                    
-NileshIngale                                            
-faizulnisha                                             
-EugeniaMoreno                                           
-EricCeleste                                             
-OresteNardello                                          
-NikolaosGraikos                                         
-AadiNarayanaVarma                                       
-juliewelburn                                            
-GhislainAtemezing                                       
-AliciaLopez                                             
-MariaJosefaPeraltaGonzalez                              
-CurtFischer1418                                         
-JesseStein                                              
-ManusWard                                               
-HassanAzzazy                                            
-FaycalBouhafs                                           
-OscarMagna                                              
-MichelleSidler                                          
-TomasLopesdaFonseca                                     
-IsidroAguillo7046                                       
-ArianKriesch4853                                        
-ahedans                                                 
-kannannalan                                             
-JulieDecock                                             
-PamelaGood                                              
-patilv                                                  
-SoniaHowell                                             
-subhranshubhusansahoo                                   
-JasonGallant                                            
-MatthiasRillig                                          
-FlorinFortis                                            
-RobertMahaney                                           
-OrlandoRodriguesFerreira                                
-MatteoPasquali                                          
-PatriciaBado                                            
-MoisesAndreNisenbaum                                    
-NiranjanCasinader                                       
-MariaJoseJuanJorda                                      
-phylliskregstein                                        
-AndreaArtoni                                            
-Junghans                                                
-TameeshSuri                                             
-MariaMoro                                               
-tejkhaket                                               
-StephenLinton                                           
-LukasRuber                                              
-ManishDatt                                              
-KathleenAhernGould                                      
-LekshmiK                                                
-ColinBlack                                              
-ArtemijKeidan                                           
-AndrewNovick                                            
-NicolasVABRET                                           
-NeilSipe                                                
-RuthMacMullen                                           
-AlbertGroen                                             
-TobiasHollerer                                          
-JosephineAdams2819                                      
-JeffMandel                                              
-SharlynnSweeney                                         
-DanielEscandellMontiel                                  
-AprilColosimo                                           
-LindseySikora                                           
-LaurenceBianchini                                       
-AbbieBrown7896                                          
-NovellaMoncrieff                                        
-TakahiroEzaki8432                                       
-jennacondie                                             
-HusseinSuleman                                          
-HIB_50770                                               
-ChristofSchoch                                          
-JamesLavelle                                            
-LawrenceJunZhang                                        
-NelsonFernandez                                         
-LorenzoAlvarez-Filip                                    
-DavidPalfreyman                                         
-BrianRich                                               
-BasVanSteensel                                          
-LaureleneFaye                                           
-GeorgeLozano56604                                       
-FatimaEspinoza                                          
-ShannonJohnson                                          
-MacitIlkit                                              
-GiovanniLodi                                            
-JeffreyCarrier                                          
-FedericoPianzola                                        
-PaulaSimoes                                             
-ReneHageman                                             
-LeighBurrows                                            
-kcranstn                                                
-kimyounglim                                             
-JenniferFishman4713                                     
-ElenaYaroshenko                                         
-GuillermoReales                                         
-user50687                                               
-MatthewOMeagher                                         
-AidanRocke                                              
-EnoEbenso                                               
-TomasLagunas                                            
-SamuelFurse                                             
-MohammadHoque                                           
-DorotheaSalo                                            
-LarsOlsen                                               
-LanceFortnow                                            
-HeinerMercado                                           
-user50866                                               
-MichelGarey                                             
-AnnHollifield                                           
-CelineCammarata9211                                     
-ChristieSCOLLON                                         
-dartar                                                  
-ChristianStutzer                                        
-AnnaMalykhina                                           
-dhavalkumarthakker5890                                  
-pepegotera                                              
-FilippoPolcaro                                          
-OyinlolaOyebode                                         
-LorenzoGhiadoni                                         
-KeisukeKuroda                                           
-EleanorKnott                                            
-ElenaCarreton                                           
-TinaSkinner-Adams                                       
-rogerjacobs                                             
-MartinNielsen                                           
-SoutoVictoria                                           
-ThomasPietri                                            
-HumbertAlexanderGarridoArenas                           
-KamalEldeirawi                                          
-LeonardoBacigalupe                                      
-DavidSanders                                            
-HimadriSingh                                            
-DanLockton                                              
-MarkCosta                                               
-EmanuelPeres                                            
-FernandoBarbosaJr                                       
-JordiGarcia                                             
-TimothyLebo                                             
-WilliamsNwagwu                                          
-QueenSquareDementiaBRU                                  
-LingxiaoJiang                                           
-ElizabethWhipple                                        
-IainSpray                                               
-VolodymyrKulyk                                          
-ShervinAssari                                           
-michaelkruepke6922                                      
-EmilyWheeler                                            
-PhilipLoring                                            
-NeesJanvanEck                                           
-MayRyan                                                 
-HuiminHu                                                
-NoraleneUy                                              
-CatherineScott                                          
-IvanJureta                                              
-IvanFGonzalez                                           
-DamienRiggs                                             
-AleemSyed                                               
-KathleenKeating                                         
-andreasscheidegger                                      
-DanielBride9390                                         
-AbdullahKendoush                                        
-anupamameher                                            
-edisondamar                                             
-KristopherCotter                                        
-TimothyPeters                                           
-RubenUrbizagastegui-Alvarado                            
-MohammadMoeinHosseiniManesh                             
-TanyaBerry                                              
-DavidAndersson                                          
-EstherRafael                                            
-DanielMunch2215                                         
-DavidPosada                                             
-FlorianaColombo                                         
-IbenMartinsen                                           
-JoseVicenteLopez-Bao                                    
-PascualLopez-Lopez                                      
-MariaLuisaSaenz                                         
-fenren                                                  
-JaneStrudwick                                           
-Jan-ErikThrane                                          
-JasonAli2332                                            
-PetrosXanthopoulos                                      
-JARLogan                                                
-mvanselm                                                
-gopikuttanA                                             
-AbdulvahabMukhtarov                                     
-SanjayKansra                                            
-MichaelMichalkiewicz                                    
-evievergauwe                                            
-HubertHackl                                             
-JianingSong                                             
-user50581                                               
-KarenKonings                                            
-ColleenFisher                                           
-SeanCooper                                              
-EnzoMariaVingolo                                        
-ClaudeMessier                                           
-GianmariaSilvello                                       
-StanleyBlue                                             
-AhmedDalmar                                             
-LuigiaScudeller                                         
-PatriciaVergara                                         
-RafaelPena-Miller                                       
-AmandaIzenstark                                         
-JennaHartel                                             
-BelenAlvarez                                            
-anabaiges                                               
-natashasimons                                           
-AlessandroCatenazzi                                     
-ChristianBrueffer                                       
-SAJJASRIKANTH                                           
-NicholasBaker                                           
-ReviveDissertation                                      
-DoloresMartinez                                         
-julianPena-Castro                                       
-FernandoNunes                                           
-SwapnilSanmukh                                          
-PraveenNaiduVummadisetty                                
-pruebaprueba2                                           
-ManishJoshi9684                                         
-JoaoPadilha                                             
-milani                                                  
-YasumitsuOgra                                           
-JessicaLisle                                            
-ManuelRamirez-Sanchez                                   
-MuneshKumar                                             
-raziasultana                                            
-mjwb                                                    
-TomWilliams                                             
-MagnusPersson                                           
-ArthurPoropat                                           
-MarcBernard                                             
-FlorenciaPratto6381                                     
-shubhanagarkar                                          
-JoeFontaine                                             
-DanielBest                                              
-FaolanSmyth                                             
-JureTriglav                                             
-DavidLightfoot                                          
-MorganErnest                                            
-StefanieHaustein                                        
-KatherineCronin                                         
-kecskemeti                                              
-KartheekAnekella                                        
-NicolaKleyn                                             
-ErnestAbadal                                            
-ValentinaPerrera                                        
-AdamByron                                               
-PatriciaASoranno                                        
-LouisFerreira                                           
-AlexanderHektor                                         
-BelenFernandezMartinez                                  
-RobertFraser                                            
-FaisalAlamgir                                           
-ChristopherSchadt                                       
-AntonioCorreia1187                                      
-JohnCarter                                              
-JuanUgalde                                              
-JohnDavidBousfield                                      
-DaisyChiang                                             
-RaniaBaleela                                            
-JordiSole-casals                                        
-LarryNeale                                              
-PeterHumburg                                            
-SeemaMihrshahi                                          
-EloyRamos-Cordoba                                       
-IndranilMitra                                           
-ArnabShome                                              
-AidaFernandez                                           
-ManousosKlados                                          
-PauloLeitao                                             
-SaeedEftekharAzam                                       
-StaceySlager                                            
-ErinFurtak                                              
-DanielM.Busiello                                        
-JohnRiskind                                             
-IrinaIsla                                               
-bjorn.gilstadgmail.comGilstad                           
-JakeNebel                                               
-hemantghimire                                           
-JacobYount                                              
-AnaMedina                                               
-AdelaBran                                               
-XavierBarber                                            
-SeyedHamidRezaSanei                                     
-AlasdairDempsey                                         
-andriesvdm                                              
-sarahshaffer                                            
-DavidSwofford                                           
-SajishMathew                                            
-EmilyAlvino                                             
-PooyaGhaderi                                            
-JavierUranga                                            
-KailaspathiVishwakarma                                  
-HuyKhongDuc                                             
-ChunLiang                                               
-marysebouchard                                          
-JuliaEarl                                               
-MariaManuelBorges                                       
-JulianOlden                                             
-ashokmittal                                             
-leouieda                                                
-robertpaton                                             
-BelindaLee                                              
-RaphaelRoyaute                                          
-mikethompson                                            
-AyelenRodriguezCervera                                  
-DevinRafferty                                           
-AntonioBaeza                                            
-JohnMitchell                                            
-mariannelomans                                          
-ChristianAnibas                                         
-RubenDagda                                              
-AndreSerradas4074                                       
-SusanKerrigan                                           
-LeySander                                               
-yasartonta                                              
-DanDeSanto                                              
-MichaelCusimano                                         
-mohammadhassan                                          
-SugoshPrabhu                                            
-jingdading1522                                          
-ENKabachkov                                             
-caoay                                                   
-LaurenceWright                                          
-NeenaRavindran                                          
-TanyaCassidy                                            
-BillWhite                                               
-DiegoSotomayor6728                                      
-JosephX.Zhou                                            
-openphacts                                              
-NavotAkiva                                              
-LauraSartiani                                           
-VaclavBelak                                             
-Yu-TiHuang                                              
-IslaFay                                                 
-MariaAlmagro                                            
-JesseYoung                                              
-EllenFilgo9865                                          
-ThomasRooney                                            
-HanGui                                                  
-ernestospinak                                           
-EstebanFroizBalado                                      
-LauraGarciaCarrascosa                                   
-MeganBarnes                                             
-PabloDorta-Gonzalez                                     
-BeulahMuller                                            
-R.N.Otten                                               
-AmberKaur                                               
-HelenaCasas-Tost                                        
-MaciejWojcikowski                                       
-srjanuchowskihartley                                    
-nidhiram                                                
-CHristianGeltner                                        
-JohannaFunk                                             
-SaraFernandez                                           
-AndrewTreloar                                           
-YounsukLee                                              
-KimberlyLarson                                          
-CameronMclean                                           
-RosaMartinez-Val                                        
-RichardSmith-Unna8018                                   
-mattiasJuhl8601                                         
-NicoleAbreu                                             
-ThomasPocreau                                           
-SubhajitGanguly                                         
-armish                                                  
-TamaraRathcke                                           
-lopezsepulcre                                           
-ClarindaCerejo                                          
-PranabaNayak2796                                        
-CarlosSousaPinto                                        
-MartinaFranzen3379                                      
-SharmilaThillainathan                                   
-LeonDerczynski                                          
-FiroozehDokhani                                         
-OuraniaPreventza                                        
-KleberNeves                                             
-chertlconner                                            
-TimMorris                                               
-JackieSkinner                                           
-LauraJimenez                                            
-joeGREEN                                                
-HayleyPemble                                            
-FlorianDuclot857                                        
-NatalieGuest                                            
-SomenameSomeother                                       
-AlessandroSarretta                                      
-albertomartin                                           
-dixonbe                                                 
-KeithKahn-Harris                                        
-GeoffBall                                               
-ClausWilke                                              
-JoeyNicholson                                           
-JillShephard                                            
-DeborahJackson                                          
-SimonDanner                                             
-EdWarga5317                                             
-ClareSutherland                                         
-MichaelFrewer                                           
-RamonEspinoza-Lewis                                     
-alandransfield                                          
-HelenHathaway                                           
-RichardWilliams                                         
-SunilSaharan                                            
-JoseManuelLavandeira                                    
-andrewgreenman                                          
-AndreyGlazovsky                                         
-ShinjiniMukherjee                                       
-TimothyAungst                                           
-NikolaosKallithrakas-Kontos                             
-PaulFlicek                                              
-susanacorullon                                          
-MaxMosterd                                              
-MarcelodeOliveira                                       
-HwajinYang                                              
-SannaMonkola                                            
-karolss                                                 
-JulietHardesty                                          
-user50826                                               
-LiminGuan                                               
-SueWilliamson                                           
-Lorena.Siguenza-Guzman                                  
-ShahzamanHAQUE                                          
-ChrisPhelan                                             
-AliciaFranco-Trillo                                     
-SandraRivera                                            
-divyasalhan                                             
-FaniCerda                                               
-AatmeshShrivastava8191                                  
-joannehughes                                            
-user50877                                               
-RosieHigman                                             
-PauloSchor                                              
-JakeWestfall                                            
-francoisbastardie1199                                   
-GailMcMillan                                            
-RouliLykogianni                                         
-IzharBar-Gad                                            
-TaraBrigham                                             
-fabianoSilva                                            
-ShervinMotamedi                                         
-JackBircher                                             
-AmitFinkler                                             
-ariadnevromen                                           
-TBrigham                                                
-TamaLeaver                                              
-MaximilianoSalatino                                     
-fabriziomacagno                                         
-refset-s2dfrg                                           
-CharlesReid                                             
-OMERF.ORSUN                                             
-JieWang                                                 
-Jorge                                                   
-JohnHarker                                              
-user51941                                               
-BrandonKohrt                                            
-PiotrStec                                               
-AnneFletcher                                            
-ChloeFurnival                                           
-AjithAbraham                                            
-DanielRozell                                            
-lauraCzerniewicz8083                                    
-KRUSHNAMISHRA                                           
-JoshuaPearce                                            
-AaronQuinlan                                            
-DanThompsdon                                            
-GerdAntes                                               
-MichaelPriehs                                           
-leratotladi                                             
-MichaelKnee                                             
-MamcarzAndrzej                                          
-MichaelBehm                                             
-KellyHatch                                              
-JuliaSchoelermann                                       
-CharlotteFrost                                          
-mustafatas                                              
-SergioAcuna                                             
-WamiqRaza                                               
-CarmineTinelli                                          
-JoyDavidson                                             
-user51069                                               
-SuganthiKS                                              
-GabrielSchui                                            
-igorcima                                                
-GenevieveHoffman                                        
-DavidNecas                                              
-ManuelaBarretoNunes                                     
-JenniferChan                                            
-VijayGorantla                                           
-CarlLachat                                              
-ZafeiriaRoumelioti                                      
-tjvision                                                
-ParminderKaur                                           
-MorenoCurti                                             
-VasjaRoblek                                             
-ShinichiTodoroki                                        
-MorganaAndrade                                          
-BenDryer                                                
-AndreaGaggioli                                          
-JuergenMuench                                           
-DavidCorney                                             
-BeatriceMarselli                                        
-lornerosenfield                                         
-MalindaSeymore                                          
-EdwinShin                                               
-JohannesKehrer                                          
-ThomasNear                                              
-FerhanGirginSagin                                       
-DominiqueBrossard                                       
-KimpreetMann                                            
-PhillipEdwards                                          
-CristofolRovira                                         
-MatthewBuys                                             
-timpoisot                                               
-LuisTorgo                                               
-GaryFoley                                               
-MKellyIrving                                            
-EdwardLyon                                              
-KennethDeBaets                                          
-RoobanThavarajah                                        
-ReneMalenfant                                           
-PierreMounier                                           
-PhilMartin                                              
-DanRosauer                                              
-DanielPass                                              
-SaraDBarber                                             
-NanetteNorris                                           
-LuisZaman                                               
-ElspethMcKay                                            
-MarkoBalabanovic                                        
-hamishsawyer                                            
-KrishnaroopDey                                          
-Charles-HenriNyns                                       
-AndreaBedini                                            
-RenataCurty                                             
-KatharineWhite5899                                      
-ipek.kulahci                                            
-MarthaL.TrujilloG.                                      
-JoannePaterson                                          
-ManjunathH.M.                                           
-user50878                                               
-VenturaFernandez                                        
-DavidSchoppik                                           
-DMDrown                                                 
-OMERKULHANCI                                            
-DavidCHAN                                               
-TerrieMoffitt                                           
-RaniYadav-Ranjan                                        
-NicholasMatzke3460                                      
-AndrewPreston2704                                       
-JeffreyLeek                                             
-PaolaVillani                                            
-manoncadeville                                          
-refset-mjs2br                                           
-A.Jamekhorshid                                          
-edharvey                                                
-DeanaBrown                                              
-BrettNener                                              
-NazlinBhimani5393                                       
-AnthonyMaire                                            
-PauloAguiar                                             
-gengxiaoying                                            
-GonzaloLopez-Abente                                     
-SusanneHansson                                          
-ChristineAgius                                          
-DKPARK                                                  
-AlexisAchim                                             
-RobFreckleton                                           
-JonathanGross                                           
-DidacMargaix-Arnal                                      
-meriraggi                                               
-PierreKerfriden                                         
-XiaogeGan                                               
-BenitoCampos                                            
-LauraMolloy                                             
-TanyaGrayJones                                          
-Terliesner                                              
-sureshvijay                                             
-isabellefrancois                                        
-jaideraf                                                
-JasonDewland                                            
-YUEWANG                                                 
-JodiRowley                                              
-VivekPatel                                              
-JanVandenBergh                                          
-ElizabethTait                                           
-davidjphipps                                            
-DavidLusseau                                            
-TerryBrock                                              
-DebraKolah                                              
-HassanChizari                                           
-bilalahmad                                              
-delfinastuto                                            
-AlisonSutton                                            
-SeanGarrett-Roe                                         
-MarcoViceconti                                          
-FadiCharchar                                            
-refset-p7fu08                                           
-LeslieAdriaanse                                         
-TanyaHarden                                             
-HermanTse                                               
-ManuelPerez                                             
-BhupinderBhullar                                        
-basaltena                                               
-LambertHeller                                           
-RajivNariani                                            
-OscarMarin                                              
-FranciszekRakowski                                      
-devinderkaur                                            
-StevenRozen                                             
-AlisonAriss                                             
-user50551                                               
-CataldoMusto                                            
-PaulNeuhaus                                             
-HarukaOzaki                                             
-PublicationsExample                                     
-BrunoChareyre                                           
-imansalehinia                                           
-NurullahAkkoc                                           
-MiquelLlorente                                          
-DietramScheufele                                        
-Anupamasuresh                                           
-IbrahimFarag                                            
-MathiasAstell                                           
-AntonellaManca                                          
-GraceAtkins                                             
-SarahHuggett                                            
-CoryBuxton                                              
-NaotoKojima                                             
-CoreyDavis                                              
-user50897                                               
-SaraMcnamee                                             
-ParliamentaryOfficeofScienceandTechnologyPOST           
-StevenRoberts                                           
-ErnestoGuccione                                         
-ValeriaFrighi                                           
-DavidVago                                               
-RnGrapenthin                                            
-RishabhJain                                             
-DavidCullen                                             
-JohnLuo                                                 
-AlexisDitkowsky                                         
-KonnoMinoru                                             
-user56418                                               
-MohamadIvanFanany                                       
-AntjeMenssen                                            
-PatrickHochstenbach                                     
-LisaOlsson                                              
-PatriceBellot                                           
-user50928                                               
-JosueTurpo                                              
-user50706                                               
-RomainGuiet                                             
-HenryRowsell                                            
-MorrasMaria                                             
-lucacerniglia                                           
-RobertTardif                                            
-MarieBardsley                                           
-user50847                                               
-MarkHemhauser                                           
-AnnieCollinger                                          
-SusanRoelofs                                            
-SarahPotvin                                             
-JamesHillard                                            
-AntjeMenssen8024                                        
-AndreasBreiter                                          
-AdamMicolich                                            
-JamesAustin                                             
-ShawnMcGrane                                            
-SageBionetworks                                         
-NisaBakkalbasi                                          
-HaoQi                                                   
-RosieCroft                                              
-AnneBarker                                              
-Rhema                                                   
-StacyKonkiel6598                                        
-MatthewPerson                                           
-JerryTom                                                
-xiuyuangong                                             
-JuliaDominguez                                          
-JorgeLozano-Juste                                       
-SivatejSarva                                            
-OlavoAmaral                                             
-user51272                                               
-zahrabatooli                                            
-kkkk                                                    
-kimberlycoulter                                         
-SaraKjellberg                                           
-GaetandeRassenfosse                                     
-DarylGrenz                                              
-XuanXiang                                               
-AndrewNelson                                            
-CynthiaDeale                                            
-KonstantinaMartzoukou                                   
-RajendraVaidya                                          
-SandyHirsh                                              
-MikeSchacht                                             
-ArisSynodinos                                           
-PatriciaAlonsoGalban                                    
-DiegoJ.Lizcano                                          
-TitusAwokuse                                            
-waynehayes                                              
-mearna                                                  
-ElenaLaricheva                                          
-CarolineGauchotte-Lindsay                               
-AlexanderKarlovskiy                                     
-timothylynch                                            
-SadafAshfaque                                           
-MohsenGRAIA                                             
-EvangelosMitsakis                                       
-user51001                                               
-TimonOefelein                                           
-WilliamGunn                                             
-XingWen                                                 
-ALiviaBorges                                            
-RachelFoster                                            
-Miguel-AngelVera-Baceta                                 
-HillaryYoung                                            
-SoniyaYambem                                            
-SeanCollins                                             
-EvaRodriguez                                            
-JohnHesketh                                             
-SuzanneAbbott                                           
-ThomasBodey                                             
-IrinaPandarova                                          
-AudieAtienza                                            
-MarisaCorral                                            
-wladmirmotta                                            
-BradleyStevenson                                        
-TimothySchofield                                        
-yaohuangao                                              
-MichaelWebster                                          
-Marie-JeanThoraval                                      
-JohanHysing                                             
-LenutaUrsachi                                           
-BehroozHooshyarYousefi                                  
-SubodhAcharya                                           
-FranciszekHasiuk                                        
-LynleyPound                                             
-SiphethileGcukumana                                     
-JulieSchneider                                          
-RobertaMaestro                                          
-AlexMeisami                                             
-boudethilary                                            
-PrashanthVarma                                          
-PatriceTerrier                                          
-AlistairScott                                           
-JorisQuik                                               
-lorenabarba                                             
-GretchenTrkay                                           
-AmandaNewton                                            
-danielfernandez                                         
-CathyKroll                                              
-MikaNieminen                                            
-josmel                                                  
-joanstarr                                               
-PriscilaAlbuquerque                                     
-DavidGoldstein                                          
-nickhudson                                              
-SharathSrinivasan                                       
-PatriciaHswe                                            
-yoavram                                                 
-C.AnthonyLewis                                          
-MeganBresnahan                                          
-NinaGrunberger                                          
-AprilClyburne-Sherin                                    
-ElizabethEvenden                                        
-froggleston                                             
-MichaelStoelzle                                         
-JonathanWestaway                                        
-PatriciaBermudez                                        
-GregNadon                                               
-ErnestMoore                                             
-DagmaraChojecki                                         
-JohnKnaff                                               
-JoanneJordan                                            
-CarlosCaicedo                                           
-DermotLynott                                            
-metiscnbolt                                             
-zmjones                                                 
-ZeHenriqueTargino                                       
-beths                                                   
-SarahBurnsGilchrist                                     
-MarilynForeman                                          
-amirvafaeian                                            
-pendarahmadzadeh                                        
-HeikeLutermann                                          
-RobertoAngelone                                         
-NicolaBellotto                                          
-AlScott                                                 
-MarkBrown                                               
-AdrianStier3541                                         
-JeremiasGalletti                                        
-JonathanBennie                                          
-CuadernosdeLiteratura                                   
-RaabiaMumtaz                                            
-DanielPoitras                                           
-EmreCorek                                               
-DanielGrunberger                                        
-PeterSolymos                                            
-Sondek                                                  
-AngelicaRisquez                                         
-AmyBaxter                                               
-BogumilKaras                                            
-HeshamNMustafa                                          
-GEXIAOWANG                                              
-Alan.J.Richardson                                       
-DarioCantu                                              
-ErnestoRamirez                                          
-DucNguyen                                               
-RobinThurmeier8917                                      
-BenedictIgwe                                            
-user50023                                               
-vannyleng                                               
-VajiraWeerasinghe                                       
-GerardoMarti                                            
-DanielleSmith                                           
-FionaThomson                                            
-DanielSmilkov                                           
-TomRanner                                               
-yfimia                                                  
-CraigSmibert                                            
-SamuelBrockington                                       
-KevinGuay                                               
-NevenkaZdravkovska                                      
-FulanitoDetal                                           
-KathleenNeumann                                         
-SaraValla                                               
-RicardoGomez-Lopez                                      
-savvialeonidou                                          
-KevinLindstom                                           
-PorciaVaughn                                            
-sarahfeeny                                              
-HadleyWickham                                           
-MarcosYanez-Arca                                        
-DavidAMills                                             
-AboozarRamezani                                         
-NICHOLASCAMPBELL                                        
-AndrewHoskins                                           
-DiegoForero1135                                         
-DevrishiGoswami                                         
-LeifSinger                                              
-RebeccaOwen                                             
-PaulTakhistov                                           
-dikshitagupta                                           
-ErikaSalomon                                            
-laurenbenhammou                                         
-PatriciaAbdelRahim                                      
-SaraTabaei                                              
-SauravTuladhar                                          
-KellyDurkin                                             
-CarlDeath                                               
-DrewSteen                                               
-TracyLove                                               
-BabettaMarrone                                          
-SusanneClee                                             
-dvmphd                                                  
-KauêCosta                                               
-JaimedeJuan-Sanz                                        
-Edward_P_Morris                                         
-MargaretSmith                                           
-RuthGarside                                             
-MaryRice                                                
-MikeSears                                               
-MikeSchafer                                             
-MarianneHuebner                                         
-AslihanDincer                                           
-AbigailSewell                                           
-BrianNosek                                              
-camilaschuck                                            
-SandraVazquez-Gomez                                     
-StevenCranford                                          
-DupiLumab                                               
-FarhadShokraneh                                         
-EricSnajdr                                              
-DavidDye                                                
-RosaPadros                                              
-PabloSantos                                             
-SarahHayman                                             
-SimonAsika                                              
-SipeiZhang                                              
-AndreasHilboll                                          
-WilliamHart                                             
-RaquelHerrera                                           
-UsmanAnsari                                             
-dustynroberts                                           
-YunshengMa                                              
-Sau-ChinChen                                            
-rahulkjha                                               
-PascalCrépey                                            
-ClarissaSmith                                           
-TimCarnus                                               
-KajsaSjoholm                                            
-JosephKraus                                             
-user50769                                               
-NestorClabo                                             
-AnaArantes                                              
-mihovilPletikos                                         
-IbrahimBaggili                                          
-MarkusDeimann                                           
-AHHurlbert                                              
-BarbaraRobson                                           
-TakumaOhmichi                                           
-JeanAnderson                                            
-BorjaEsteve-Altava                                      
-RahulGoel                                               
-CarlBoettiger                                           
-user51083                                               
-JavierCarrillo                                          
-JamesVanDyke2253                                        
-SibsankarJana6054                                       
-MaureenChiware                                          
-WaldemarHummer                                          
-FrankBennett                                            
-AnneThessen                                             
-cathysarli                                              
-SuryaSaha                                               
-AmyBarnes                                               
-NikolaS.Nikolov                                         
-PaulMoayyedi                                            
-DavidHorwitz                                            
-PeterLoewen                                             
-AdamLipkin                                              
-Kuei-YangHsiao                                          
-user50827                                               
-KirstyMeddings                                          
-KateCrosby                                              
-JosephBulbulia                                          
-jidongli                                                
-MelissaGasparotto3486                                   
-AlexMesoudi                                             
-Renevonschomberg2289                                    
-ChristophScherber                                       
-RenaldoBelfon                                           
-CosimaRughinis                                          
-DavidSparks                                             
-JohnvanDuynhoven                                        
-EugeneJudson                                            
-EmilieCombet                                            
-LionelPage                                              
-BarbaraHan                                              
-Jean-MarcGarnier                                        
-CatherineKlersy                                         
-RaulOchoa-Hueso                                         
-StefanSchutt                                            
-GeorgKucsko                                             
-AhmedRattani                                            
-SarahCrowley                                            
-RaulCanay                                               
-soniaruiz                                               
-TiloMathes                                              
-MihaiPodgoreanu                                         
-PhilippeSmet                                            
-ValeryRidde4335                                         
-ElenaPapaleo                                            
-JeffreyHancock                                          
-MarkelVigo                                              
-UmbertoAnselmi-Tamburini                                
-NursatBicer                                             
-NiklasBlomberg                                          
-CelineFrere                                             
-CecilePerrin                                            
-DanGezelter                                             
-HoiSteven                                               
-RobertInsall                                            
-riccardo.berta                                          
-user51806                                               
-KaiBlin                                                 
-MaryEdbrooke                                            
-ElenaBennett                                            
-MichaelMassett                                          
-equiperenard                                            
-CalvinYip                                               
-JenniferJohnson                                         
-ThorstenBecker                                          
-zongjingliang                                           
-lsi                                                     
-KaushalRege                                             
-AndrewWesolek6958                                       
-JanSenderek                                             
-HyandaviBalla                                           
-LynneGoldstein                                          
-DanilKing                                               
-StefanoGrimaz                                           
-DeborahPowell                                           
-RickGilmore                                             
-FabioNonino                                             
-JanetBobango                                            
-ElliotFishman                                           
-tamaraenglish                                           
-adrianotort                                             
-DaveBridges                                             
-CarloDeSanti                                            
-SarinaKilham                                            
-EmmanuelDupoux                                          
-CaterinaStrambioDeCastillia                             
-GabeGossett                                             
-DavideFucci                                             
-CarloMorasso                                            
-RafaelLevi                                              
-JoshRamsbottom                                          
-DerekGroen                                              
-MehdiNoori                                              
-CarlosParra-López                                       
-LiamPhelan                                              
-WilliamBaird                                            
-EnricoFerrari                                           
-WilmaChan                                               
-WilliamThomas                                           
-KristinaKillgrove                                       
-KellyOakeson                                            
-sreenivasv                                              
-GoodwinJinesh                                           
-humayunirshad                                           
-ElizabethEggleston                                      
-junpark                                                 
-ShingoKitamura                                          
-ThierryRodon                                            
-LauraDee                                                
-FlorFernandez                                           
-AbhishekKothari                                         
-KennethSchafer                                          
-LarsBerger                                              
-AliciaChen                                              
-LucaDiGaspero                                           
-BrandonAlmy                                             
-DevendraBiswal                                          
-RuthCarlos                                              
-BernhardRoss                                            
-SeanDavis                                               
-yasushimasuda                                           
-YongWu                                                  
-XiaotianChen                                            
-LoreleiCaraman                                          
-MarIglesias-Garcia                                      
-LineMelgaard                                            
-JanWillemGorter                                         
-LukaKronegger                                           
-NaomiShaw7914                                           
-AndrewTaylor                                            
-MaxPatel                                                
-janecho2542                                             
-AubertLandry                                            
-JordanMonk                                              
-AlessandroCamiz                                         
-KebiJimenez                                             
-FarhanaIzwaniEzani                                      
-ottopichlhoefer                                         
-MonicaBillio                                            
-ArnaudTarantola                                         
-FrancescaMoreno                                         
-ArnaldoSilva                                            
-JohnKaye                                                
-NaomiBirdthistle                                        
-BarbroHellquist                                         
-FrithjofArp                                             
-AlanLiu                                                 
-TomLewis                                                
-MaevaVignes                                             
-SeanYates                                               
-GabrieleWollnik-Korn                                    
-MehdiAmirkhani                                          
-JuanLuna                                                
-AnaTodorovic                                            
-MATIASSPEKTOR                                           
-FranciscoJesusMartinezGalindo                           
-MuhammadzaeemNOMAN                                      
-GregorGorjanc                                           
-shikhaanand                                             
-MiguelBranco                                            
-EvePaquette-Bigras                                      
-GlobalJr.ESPM                                           
-bilalahmed                                              
-user50178                                               
-SarahRobinson                                           
-ChristineSwanson                                        
-HOILINGSENG                                             
-SeyedHamedAlemohammad                                   
-DaveGerrard                                             
-FedericoPrefumo                                         
-AndreaFanelli                                           
-SujayRaghavendra.N                                      
-ScottCowie                                              
-PradeepPaulGeorge                                       
-KengoMorohashi                                          
-DavidCarter8853                                         
-MartinDonnelly                                          
-FabienCampagne                                          
-Gruber                                                  
-ArmanAbrahamyan                                         
-bilalahmad4355                                          
-YousefMohassab                                          
-AshtonVerdery4822                                       
-JohnFoxe                                                
-ScottRobinson                                           
-RehanaLeak                                              
-camillebonneaud                                         
-ChristyResearch                                         
-DaveJohnston                                            
-EricShifrut                                             
-SathyaGopalakrishnan                                    
-GroIvanderMeeren                                        
-SebastienFournier                                       
-GrantMcAuley                                            
-OliverBeckstein                                         
-MatthewSivils                                           
-KojiItahana                                             
-CalvinLai                                               
-JesusOmarOceguedaGonzalez                               
-begler                                                  
-nicolabenvenuti                                         
-RyanFink                                                
-LewisShapiro913                                         
-fatemehnadimi                                           
-SarahKieweg                                             
-AndyDin                                                 
-DarrenSaunders                                          
-SebastianSuarez                                         
-WarrickNelson                                           
-SebastienDarchen                                        
-EricLin                                                 
-JillHowlin2956                                          
-CedricBrimaco                                           
-SusanGlen                                               
-BogdanAntonescu                                         
-ElaineVaughan                                           
-SebastianRahtz                                          
-EwoutterHaar                                            
-wouterknapen                                            
-JohnHyland                                              
-FraserJanuchowski-Hartley                               
-ImranIbrahim                                            
-EvanTobias                                              
-RuilingGuo                                              
-SebastianKarcher                                        
-VolkerGrimm                                             
-AlfosnoLopez                                            
-Mani                                                    
-ScottSpicer                                             
-TamaraKudykina                                          
-AnthonyParolari                                         
-AnneSmuda                                               
-SalvadorJ.Diaz-Cano                                     
-MohamedFahmy                                            
-DeborahHelman                                           
-GregLever                                               
-RobertHetland                                           
-KathrynDuncan                                           
-SeanYates3566                                           
-heinzpampel                                             
-DavidKlinke                                             
-SimoneMantellini                                        
-acevedorocha                                            
-MalRoss                                                 
-FalkReckling7383                                        
-JeniferGundry                                           
-AndreaSplendiani                                        
-SimonePerandini                                         
-OscarWilliamCaicedoAlarcon                              
-LynnThitchener                                          
-BrookMoyers                                             
-ConorNeill                                              
-CyrusShaoul                                             
-PascalRochadaSilva                                      
-mariamorras                                             
-MarcoAzpurua                                            
-OskiaAguirre                                            
-BarbaraDamianedaSilva                                   
-bendmorris                                              
-DavidCashman                                            
-KimmoEriksson                                           
-OrlandoGregorio758                                      
-fengma                                                  
-FlorianHofhansl                                         
-PhilipUren                                              
-AnneliesVredeveldt                                      
-annfiddler                                              
-OlusolaAjilore                                          
-MichaelSchulte-Mecklenbeck                              
-AmeliaMartin                                            
-CarmenMurciaBesada                                      
-AlexandreVicente                                        
-LOKOSSOUGatien                                          
-SharonPoisson                                           
-ChristopherGwyn                                         
-GabrielaConstantinescu                                  
-BrianThomas                                             
-IndiraAcevedoRodriguez                                  
-NicolasPerony                                           
-stacykonkiel5756                                        
-ArendHintze                                             
-CharlesStangor                                          
-JamieKinney                                             
-IsabelleNault                                           
-JonathanSkinner                                         
-CalebCohoe                                              
-cynthiastromgren                                        
-sumairatariq                                            
-cabezasfeli                                             
-VanessaGabler                                           
-KayAxhausen                                             
-CarlosQuispe-Geronimo                                   
-samuelcassady                                           
-CKKNAIRNair                                             
-VladyslavBondarev                                       
-AnatoliyGruzd                                           
-DarioMartinBenito                                       
-user51732                                               
-PhilipMai                                               
-LornaDawes                                              
-HsiaoVoon                                               
-AGUILO-LUCIAPILAR                                       
-ElwinReimink                                            
-MarkTremayne                                            
-adam__moore                                             
-CarlosSuarez-Balseiro                                   
-MarkGreenlee                                            
-zhaixiaofang                                            
-RafaelPinto                                             
-MaBazsa                                                 
-BrunoVilela                                             
-DhruvKazi                                               
-KathleenRoberts                                         
-MariaOsuna                                              
-IvoGrigorov                                             
-WENDIQIAO                                               
-SergeLegendre                                           
-PaulBracke                                              
-JodiJohnstone                                           
-ANURADHAPS                                              
-JamieMQuinn                                             
-AmyHarrington                                           
-SimoneMantellini9567                                    
-XavierHarrison                                          
-heidikristinolsen                                       
-JonathanMiller                                          
-DiegoPol                                                
-IfadoAltmetrics                                         
-DerenEaton                                              
-WalterLittle                                            
-MaryEllen                                               
-SHANGXIAOQIAN                                           
-JoanaFerrer                                             
-GillesLouppe                                            
-JaccovanOssenbruggen                                    
-DerekTaylor                                             
-AnnaKijas                                               
-StaceyLee                                               
-BarbaraPrainsack                                        
-KatrinaKeith                                            
-MalteWillmes851                                         
-CatherineYoung                                          
-AdelaJarolimkova                                        
-DanStarrs                                               
-ShailendraJoshi                                         
-AndrewToogood                                           
-StefanoMazzoleni                                        
-GabrieldaSilva                                          
-HeatherChesters3508                                     
-MalcolmMcCallum                                         
-SethSpielman                                            
-SteveWagstaff                                           
-AdamEdwards                                             
-ShirleyMccartney                                        
-SergioRapuano                                           
-TamaraCapper                                            
-shimkin                                                 
-LalehKardar                                             
-UlfOrom                                                 
-NeilSipe3299                                            
-ZiaWadud                                                
-AlistairMunro                                           
-NarayananSubramanian                                    
-KathleenBowmer                                          
-TrungDongHuynh                                          
-MuhammadSohail                                          
-AndrewHyde                                              
-CarlosLuisGonzalezValiente                              
-pgroth                                                  
-ChristopheLancrin                                       
-JournalCellMolecularResearch                            
-shengwang                                               
-FrankBeier                                              
-HeatherSchafer                                          
-BrunoDanis                                              
-AngelMFelicisimo                                        
-jesusmartinez-padilla                                   
-MaaruthyYelleswarapu                                    
-UCLHBRC                                                 
-GeorgePerry                                             
-PabloPazos                                              
-RiccardoSCALENGHE                                       
-gunjanpandey                                            
-JeffreyKimbrel                                          
-ArunkumarKachapur                                       
-sanchez-corrales                                        
-AnnexPublishers                                         
-navaneethasubbaiyan                                     
-DavidLuebke                                             
-EdgarGomezCruz                                          
-JonathanSeaquist                                        
-ShayneTaback                                            
-KirstenMoanaThompson                                    
-ShriramRajpathak                                        
-SecundinoFernandez                                      
-DeniseCampbell-Scherer                                  
-meekantest                                              
-AdrienKissenpfennig1753                                 
-AnweshaBohler                                           
-SeanMcGee                                               
-HeathBlackmon                                           
-NicolKeith                                              
-JeremyKupsco                                            
-VictorSantiagoPineda                                    
-DavidSnyder                                             
-AlfonsoBueno-Orovio                                     
-PhilippaMiddleton                                       
-vienergie                                               
-MeganFitzgibbons                                        
-IoannisBaziotis                                         
-MarcGarcia-Borras                                       
-CarlosMaldonado8961                                     
-ShrikantMantri                                          
-NoellePaufler                                           
-rajeevsharma                                            
-Junchen                                                 
-PatrickMoynihan                                         
-JordanNielsen                                           
-KenWang                                                 
-ShuLiu                                                  
-MinaTadrous                                             
-CatherineAdams                                          
-StephanieBradbury                                       
-AlessandroFalaschi                                      
-sunitasubramanian                                       
-PaulSacco                                               
-cmadan                                                  
-RaduBarsan                                              
-HwaLiangLeo                                             
-HeikeSeidel                                             
-BansalLab                                               
-AshleyPratt                                             
-JinuSudhakaran                                          
-VarishMulwad                                            
-MargaretBean                                            
-JohnDBullough                                           
-FrankvanHarmelen                                        
-FernandoGallardo                                        
-PrashunGorai                                            
-msimon                                                  
-GaryMarchionini                                         
-EvangelosSimeonidis                                     
-ShriRam                                                 
-JaredKibele                                             
-AndreaShier                                             
-PrasannaKumari                                          
-PierrichPlusquellec                                     
-LuisEduardoBravo4577                                    
-IanRowlands                                             
-sarahreidell                                            
-JamiePerry                                              
-joseluisortega                                          
-ShrutiSyal                                              
-CassandraStar                                           
-KirstyDay                                               
-NicSurawski9347                                         
-PinaLalli                                               
-YongHwanKim                                             
-NagendraPrasad3183                                      
-GeoffHUsic                                              
-TomGrant                                                
-AlanaHadfield                                           
-SiavashSaremi-Yarahmadi                                 
-ShyamVisweswaran                                        
-LourdesBasabe-Desmonts                                  
-DomHelmlinger                                           
-YpedeJong                                               
-SultanAl-daihani                                        
-JonnaHahto                                              
-shiyingtian                                             
-hideyayamazaki                                          
-AngelaKennedy                                           
-NicolasBaeyens                                          
-IndranilMitra3219                                       
-AmiraFirdaus                                            
-KarimElKasmi                                            
-JakobFarmer                                             
-JamesMcInerney                                          
-KenGross                                                
-EvaAmsen                                                
-Civ                                                     
-AshwinGopinath                                          
-RohanPais                                               
-NicolasBaeyens9507                                      
-DiegoCalderonGarrido                                    
-NathanYoung                                             
-StevanMarkovic                                          
-AndersWandahl8678                                       
-ClaytonSinyai                                           
-TracyBruce                                              
-LaurieMiller                                            
-GuillermoCampitelli                                     
-VincentSmith                                            
-AnjaMuller9018                                          
-danielCohen3640                                         
-TatsuyaHigashi                                          
-KumaranRajagopal                                        
-NicolasCardozo                                          
-JitenderKumar                                           
-BarbaraManighetti                                       
-BeatrizGarciaFernandez                                  
-AchazvonHardenberg8863                                  
-TobiasHeed                                              
-FrantzeskosPapanikos                                    
-SeanClouston                                            
-SamuelChalmers                                          
-YoilanFimia-Leon2964                                    
-ReynolJunco                                             
-MichelleMittrach                                        
-SiobhanDunne                                            
-ChikaraFurusawa                                         
-SixtoGonzalez                                           
-CristinaNaveiras                                        
-fernandocastanos                                        
-GregWhitney                                             
-SuzanneChapman                                          
-DougKlein                                               
-MoradElkadouri                                          
-orlaGrant                                               
-FernandoTricas                                          
-SinéadKeogh                                             
-SvetalShukla                                            
-chandrabhati                                            
-Pierre-OlivierMontiglio                                 
-StephenPan                                              
-AbdullahGok                                             
-EmilianoMori                                            
-DFlemmingHansen                                         
-ZoePettwayUnno                                          
-EricShiu                                                
-SigrunVehling                                           
-peterdesmet                                             
-Kien-PongYap9404                                        
-CarstenStage                                            
-MamayYa                                                 
-ErinPollard                                             
-CatalinaOyler                                           
-AkikoHayashi-takagi                                     
-SharonCrozier-DeRosa                                    
-aa84640                                                 
-AndrewSullivan                                          
-ahmadbaba                                               
-HCohen                                                  
-GregoryParadis                                          
-diazfeli                                                
-DavidScheutz                                            
-PeterLaver                                              
-user51755                                               
-AdamLisbon                                              
-HenrikNielsen                                           
-franciscorejon-guardia                                  
-brunomasiero                                            
-AlfredGumbwa9569                                        
-ArkaPattanayak                                          
-user50440                                               
-sjoerdhak                                               
-SimonKerridge                                           
-HendrikMueller                                          
-MatthewMiller                                           
-user51600                                               
-micheleanzidei                                          
-ShonnaMcBride                                           
-MargaretBremner5862                                     
-CamillaLindelow                                         
-AkashSindhu                                             
-AlexNorman                                              
-aliaesses                                               
-CarmeloCarlo-Stella59777                                
-XimenaNelson                                            
-JoanGavalda                                             
-SimonBush6219                                           
-AshleySDoane                                            
-AndreAppel                                              
-HeikeLaman                                              
-CharlieMansfield                                        
-KarolinaKarjalainen                                     
-SoichiTokizane                                          
-EdKerk                                                  
-MatthewFalzone                                          
-JohnFaithfull                                           
-CarriePurbeck                                           
-NathanEvaniew                                           
-arandaabel                                              
-jinzeng                                                 
-AnitaCollins                                            
-NicholasBadcock                                         
-BridgitBurns                                            
-JamesMoore                                              
-GarethGriffith                                          
-gernotbrodnig                                           
-MinHoTSE                                                
-LewisMitchell                                           
-MelissaBridges                                          
-RobertHynds                                             
-NikolaSander                                            
-ChrisArmstrong                                          
-DuncanCampbell                                          
-HannahDouglas                                           
-AlisonPhipps                                            
-DebraBernhardt                                          
-MAuricioPalacios                                        
-mattiasjuhl                                             
-ChrisRusanowski                                         
-JeanneHoover                                            
-GianniCesareni                                          
-YaoYao                                                  
-KaltriNuredini                                          
-IgorTetko                                               
-CarolineSinkinson                                       
-EmanuelSchmid-Siegert                                   
-MarcoaLopezSanchez                                      
-CurtisAtkisson                                          
-PiotrMarekSmolnicki                                     
-CindyShirkey                                            
-SrinivasRamachandran                                    
-KatieGresham                                            
-KristinMcNealy                                          
-BelenAlvarezGarcia                                      
-ScottWallace                                            
-VeljkoVeljkovic                                         
-CezaryDomanski                                          
-PeterSmith                                              
-FranklinBaldo                                           
-StevePettifer41849                                      
-YehiaElkhatib                                           
-toennies                                                
-KatherineBussey                                         
-KamiKoldewyn                                            
-margitandresen                                          
-SolbrittAndersson                                       
-ChristineChambers                                       
-ChrisCasey                                              
-DerlieMateo-Babiano464                                  
-TitusBrown                                              
-vnaddeo                                                 
-MichelangeloVianello                                    
-InamulHasanMadar                                        
-BrianBranfireun                                         
-MedicalEditingIntern                                    
-DeniceAdkins                                            
-StefanoFerraina                                         
-VeronaChiu                                              
-AndrewDaum                                              
-MariellaPazzaglia                                       
-RSekharChivukula                                        
-BorisAdryan                                             
-NatividadGomez                                          
-CandidaDewes                                            
-sbotond                                                 
-petermcdonald                                           
-JibranKhokhar                                           
-CarmeloCarlo-Stella                                     
-AhmadouDicko                                            
-MarcoKalz                                               
-SeanHill                                                
-LucaValbonetti                                          
-UwPhinex                                                
-heidihofer6083                                          
-MarcoBrandizi                                           
-MatthiasLiffers                                         
-DavidDomingo                                            
-GrahamMcCann8889                                        
-ChadBousman                                             
-SomeoneSomeone                                          
-EricaWright                                             
-BethSheppard                                            
-DariuszLeszczynski                                      
-CajSodergard                                            
-SamuelLaBarge                                           
-JohnStanton-Geddes                                      
-DenisTolkach                                            
-AbbasBukhari                                            
-CarolineKnowles                                         
-ChandraGiri                                             
-BruceCaron                                              
-EszterHargittai                                         
-EberhardRHilf                                           
-CaseyYdenberg                                           
-ShunsukeOno                                             
-EnricoBocciolesi                                        
-MartonVoros                                             
-MichaelByron                                            
-MusaWakl                                                
-KetkiBhtia                                              
-JavierGonzalez-Gallego                                  
-DafyddGwynEvans                                         
-RichardJudson                                           
-ceibalceibal                                            
-EhsanArdjmand8290                                       
-JonGoodall                                              
-MatthewAllen1410                                        
-AlanPearce                                              
-GeorgiosSotiriadis                                      
-NadjaNeumann                                            
-DanieleMauro                                            
-HelenStallman                                           
-GabrieleGuidi                                           
-ClaudiaGonzalez                                         
-IsabellaPeters                                          
-jfstich                                                 
-SaraLaurentz                                            
-MarceloFernandes                                        
-KevinHealy                                              
-HoFaiChan                                               
-MiguelMartin-Landrove                                   
-JeffreyMiller                                           
-ankitgupta                                              
-OpenScience38918                                        
-CeliaMartinez                                           
-AugustoBuchweitz                                        
-SophieKay                                               
-mohammadkhazaei                                         
-andersdrachen                                           
-lailajaber                                              
-TakahiroEzaki                                           
-TimoNiedermeyer                                         
-SVHGLibrary                                             
-JoseMora                                                
-ALIRAZA                                                 
-RogierKievit                                            
-JasonStajich                                            
-mfenner                                                 
-matthewfrank                                            
-JoaoMoreira                                             
-AedahAbu-Bakar                                          
-AnnemareeLloyd                                          
-FirozKasim                                              
-MariaJoseLobeiras                                       
-JamesPrince                                             
-MarcJekel                                               
-evajimenez                                              
-OsamuOnodera                                            
-ElsaKramer                                              
-AkashAmin                                               
-ThomasStephens                                          
-PiliRoel                                                
-DanielAlba                                              
-FrancescoFavero                                         
-EmilyRothman                                            
-MerindaHensley                                          
-SandraDestradi                                          
-ThomasHannan                                            
-JSchmitz                                                
-user50704                                               
-NatalieGarrett                                          
-milagalyavieva                                          
-PatrickBlessinger                                       
-CharlesHefer                                            
-SuzanneBeech                                            
-ChiXiong                                                
-adfig                                                   
-KevinBrick9076                                          
-GiuseppeVallone                                         
-AndreSerradas                                           
-user51544                                               
-user51537                                               
-giovanniparigi                                          
-EstherGil                                               
-AndyNobes                                               
-AlastairWilson                                          
-TimurKhusyainov                                         
-MariaToyoda                                             
-SlawomirWisniewski                                      
-MikkoOjanen                                             
-ElizabethMurray                                         
-SetsunaLau                                              
-KevinPurcell                                            
-MikkelAndersen                                          
-DanielDraper                                            
-JasmineCardozoMoreira                                   
-DeepakPant                                              
-AndresChamarro4030                                      
-RafiaMirza                                              
-NikolaiStenfors                                         
-AndrewGormley                                           
-MichelLTremblay                                         
-MikeS                                                   
-JackieBrodsky                                           
-AymenSOUSSI                                             
-ShellyJohnson                                           
-AnthonyHalog                                            
-JMSuelves                                               
-SKLaw                                                   
-EthanGarner                                             
-egonstemle                                              
-JonathanRhodes                                          
-BonariaBiancu                                           
-EstherCalderon                                          
-MeghanSlining                                           
-RafaelLopez                                             
-BertVandenBygaart                                       
-willemvandeveen                                         
-HoLeungNg                                               
-HollyMiller                                             
-ErickLoomis                                             
-SaundraLipton                                           
-AnthonyDAugustine                                       
-MohammedM.Alani                                         
-AlessandroOggioni                                       
-barryryan                                               
-VikashBhardwaj5068                                      
-AnchaleePRoberts                                        
-CesarRivera                                             
-SudeepUprety                                            
-mohammedalamr                                           
-henridelebecque                                         
-rabbitchen                                              
-HeidiBecker                                             
-DirkPfeiffer                                            
-LuisaRivera                                             
-SamanthaMcClellan                                       
-GrzegorzOsinski                                         
-JeremyTravis                                            
-MitchellCBrown                                          
-MiriamPrys                                              
-KristinPersson                                          
-annaosland                                              
-HulyaKelecioglu                                         
-MohammadZamaninasab                                     
-IanPereira                                              
-MiquelPuertas                                           
-chrishanretty                                           
-mjlassila                                               
-BarbaraBarbosaNeves                                     
-dacrotty                                                
-GustavoFischman                                         
-XianwenWang                                             
-BrentBangs                                              
-MohammedEldosuky                                        
-WillHudson                                              
-AlessiaBardi                                            
-RM                                                      
-SarahElichko                                            
-JamesAllen-Robertson                                    
-AditiBandyopadhyay                                      
-PiotrSiuda                                              
-EllyaZulaikha                                           
-MiriamBlake                                             
-MiquelCodina                                            
-CarlotaBalsa-Sanchez                                    
-MichaelEisen                                            
-EvaPhanvanova                                           
-DimitriosZikos                                          
-DebraBurns                                              
-BoonlertAroonpiboon                                     
-PaoloRighi                                              
-SarahKeim                                               
-HenryPotts                                              
-JenniferHill                                            
-MichaelKatehakis                                        
-shuangniyang                                            
-zhenlinyang                                             
-KeywanRiahi                                             
-GertVanValkenhoef                                       
-JayakiranRebelli                                        
-nadimkhan                                               
-AkankshaSood                                            
-angelamariarizzo                                        
-DanielSchroder                                          
-HemantGupta                                             
-JeffGinger                                              
-JayHoward                                               
-KazuyukiIshihara                                        
-GarthTarr                                               
-naerjournalUA                                           
-NaomiShaw                                               
-sghose                                                  
-RoxanneConnelly                                         
-AzamatDuishenov                                         
-NathanielHermosa                                        
-EsteveFernandez                                         
-SergioMartinez53534                                     
-AaronWong                                               
-alperyilmaz                                             
-MurariSingh                                             
-NataliaBarkalina                                        
-NataliaManola                                           
-IsabelleTannous                                         
-PieroParchi                                             
-GregoryGordon                                           
-NeilHarris                                              
-CesarCandelas                                           
-BillCooke                                               
-claribelramirez                                         
-user50394                                               
-TalSela                                                 
-EstefaniaGomez                                          
-DominikaBorek                                           
-DavidKolesky                                            
-AndrewRae                                               
-BenjaminRae                                             
-NicholasMurray                                          
-EricBradley                                             
-MARTALAGO                                               
-BethKarlin                                              
-neerajpul                                               
-JanetDavies                                             
-GIRISHBATHLA                                            
-LakshmipriyaThyagarajan                                 
-LibbyHemphill7898                                       
-NikitaMitkin                                            
-HazilaTiman                                             
-NicholasPeters                                          
-SeanLee                                                 
-JuanLCantalapiedra                                      
-XumingHe                                                
-JuanCarlosFierro-Gonzalez                               
-shariftaha                                              
-AmirPaster                                              
-drscholes                                               
-StephenPearson                                          
-brantfaircloth                                          
-FabioGouveia                                            
-CristinaOliveira                                        
-FraserJanuchowski-Hartley2882                           
-AlanHaynes                                              
-RezaBagheri                                             
-GustavoSaposnik                                         
-RolandJWMeesters                                        
-JacobusSWessels                                         
-AwanthaDissanayake                                      
-BarbaraPetersohn                                        
-kordyuk                                                 
-ramr                                                    
-NatalieThompson23651                                    
-KellyThompson                                           
-NicolaWilson                                            
-DemelzaIreland                                          
-EdgardVidal                                             
-MichaelClayton                                          
-PeterBaumgartner                                        
-juanlarrain                                             
-karinabjorkedal                                         
-SMaj-Hong                                               
-NicholasHall                                            
-RobertVanderHart                                        
-BarbaraBonous-Smit                                      
-MiguelLopezdeHeredia                                    
-DebadritaMandal                                         
-DavidMichels                                            
-MaxMaurer                                               
-TamiAlbin                                               
-AlexandrosFrantzis                                      
-FrancoPrati                                             
-examplescholar                                          
-ClaraFowler                                             
-KaitClark                                               
-NicolasBernet                                           
-RoseliDElboux                                           
-OliverGriffith                                          
-KarenShashok                                            
-NicholasWeiler                                          
-vahidhejazi                                             
-DanieleRotolo                                           
-LuisGandin                                              
-HASSANRAZA                                              
-UmarFarooq                                              
-MKJones                                                 
-SamSpade                                                
-NizarAbu-Jaber                                          
-DavidMcMenemy                                           
-AnnaTolwinska                                           
-KathleenPitz                                            
-NIEVESESCORSIGLESIAS                                    
-NicoleColovos                                           
-RodrigoLopez                                            
-MatthewRogers                                           
-ArmenPoghosyan                                          
-meriac                                                  
-NidalAlshwawreh                                         
-TrudiJacobson                                           
-MatiasTueros                                            
-NikhatGhouse                                            
-BeatriceLugger                                          
-BevanWeir                                               
-HerrieSchalekamp                                        
-NobuhiroKaneko                                          
-KelliBabcock                                            
-NikolajJuulNitschke                                     
-ShijuSamVarughese                                       
-Supportsfol                                             
-AramBaram                                               
-KaziArif-Uz-Zman                                        
-ChrisWillberg                                           
-EricLichtfouse                                          
-HontasFarmer                                            
-ChristianGary                                           
-PatrickSunter                                           
-KatherineApfelbaum                                      
-BhanwarPuniya                                           
-SabinaBelli                                             
-carolhansen                                             
-JuergenWastl                                            
-RobertHaines                                            
-GONZALEZGONZALEZ                                        
-RobertoTodeschini                                       
-AlfredinaRosaOliveiradoVale                             
-BryanGore                                               
-BethAutin                                               
-PallabPradhan                                           
-AndrewFerguson5183                                      
-CarlosAzevedo                                           
-DanielCadena                                            
-AliceSTWong                                             
-MaciejWnuk                                              
-NoorHussain                                             
-KevinSudi                                               
-user50747                                               
-BillAngelbeck                                           
-NobukoMiyairi                                           
-OmwoyoBosireOnyancha                                    
-CAULibHong                                              
-RossanaDucato                                           
-gianlucabrunori                                         
-ShwetaBansal                                            
-NothingNobody                                           
-O.C.Norocel                                             
-DiegoForero                                             
-NobukoMiyairi8626                                       
-user51361                                               
-NorovirusTest                                           
-AlexdeWaal                                              
-ChristopherGandrud                                      
-rebeccajones                                            
-JulieElliott                                            
-JoseRaulCanayPazos                                      
-BradDavis                                               
-BryanWong90630                                          
-BryanWong79056                                          
-BaolianCheng                                            
-OivindStrand                                            
-ChristianHoffmann                                       
-ChristinaTse                                            
-KarenHapgood                                            
-AppolaireAlexandre                                      
-AlonsoEstrada-Cuzcano7293                               
-JenniferStromer-Galley                                  
-OwenLebel                                               
-MichaelBeller                                           
-JasonOrgan4502                                          
-SaschaHusa                                              
-OttoHeringer                                            
-StephenPorter                                           
-YuliaDemianova                                          
-StuartFraser                                            
-ChristianGodenschwager                                  
-OnurVarol                                               
-BrianBuck                                               
-CareyMing-LiChen                                        
-AmyNeeser                                               
-OrouGaoue                                               
-OscarLVeiga                                             
-OlafSchmidt                                             
-KensakuNomoto                                           
-ArethaMaposa                                            
-SpencerWestby                                           
-AriannaGorletta                                         
-IainDuggin                                              
-GerardPages-Camps                                       
-TerryOwen                                               
-KAUSARAHMAD                                             
-JulioFreyre-Gonzalez                                    
-CarlyMilliren                                           
-JoseLuisMicol                                           
-AlexHTaylor                                             
-christopherbare                                         
-JavierMartinez-Lopez                                    
-SandeepReddivari                                        
-AlexMChubaty                                            
-GustavoRamirez                                          
-PalomaGuzzardo                                          
-PabloIgnacioEscribano                                   
-JamesPritchett                                          
-KonradKarczewski                                        
-PaoloMangiafico                                         
-DirkLewandowski                                         
-PareshShah                                              
-KelleyWhitten                                           
-ChristopherCThompson                                    
-ChristianScheckhuber                                    
-abhinavsaxena6164                                       
-MoniqueValcour                                          
-UshaHaley                                               
-ChristianKurrat                                         
-MishaelSanchez-Perez                                    
-paauitobernard                                          
-CarlosPena                                              
-marce-nogue                                             
-ChrisRiedy                                              
-RobynHall                                               
-ChristopheLeterrier                                     
-AbbyBenninghoff                                         
-AlexRuthmann                                            
-CamilleFerguson                                         
-ISASAltmetrics                                          
-DulceOliveira                                           
-JefersonMendoncadosSSilva                               
-SimonvanNorden3248                                      
-MikeGalsworthy                                          
-NunoNunes                                               
-SunilRajput                                             
-KellyMoroney                                            
-BenraLiz                                                
-BenKirman                                               
-garylogin                                               
-JuliaWolfson                                            
-AngelaConnelly                                          
-NorZairahAbRahim                                        
-NickHopwood                                             
-mn                                                      
-MikeGSmith                                              
-ArnabGhosh                                              
-CharlieStrauss                                          
-MaryDesmond                                             
-SaschaFoerster                                          
-MarekGierlinski                                         
-OliverBothe                                             
-AndreasStylianou                                        
-NESCent                                                 
-asdadffadfvsas                                          
-AntonioJesusPerez-Luque                                 
-paulfrankland                                           
-ChrisPonting                                            
-SamDubberley                                            
-ALFONSOINFANTEMORO                                      
-WeiGao                                                  
-Woo-JinShin                                             
-JordanComins                                            
-BoyanaKonforti                                          
-PaulGandel                                              
-ZhenZhen                                                
-JordenCummings                                          
-NatashaBarlow                                           
-AtharKharal                                             
-InmaDovalPorto                                          
-CarolAnneMeyer                                          
-NicolasRobinson-Garcia                                  
-CarolaTilgmann                                          
-BharathSampadi                                          
-beatrizregueira                                         
-JESUSPENEDO                                             
-PingZhang                                               
-user50236                                               
-asm                                                     
-ValdineiaFerreira                                       
-FelixLangevinHarnois                                    
-Marc-AndreTremblay                                      
-MarcusViniciusSilva                                     
-AyanaMartins                                            
-NathaliaAvila                                           
-nicolaghirardi                                          
-user50406                                               
-CatherineTetard-Jones                                   
-FabienBurki                                             
-JohnOMalley                                             
-CrystalHall                                             
-IngeSeim                                                
-EugenStoica                                             
-MuhammadIrfan-maqsood                                   
-ChongYing                                               
-dsquintana                                              
-JayantVaidya                                            
-RufoFernandez                                           
-JonathanMoran                                           
-CarlSoulsbury                                           
-AnneFreeland                                            
-QiangCheng                                              
-rajendrakumbhar                                         
-stefanogiuliani                                         
-AbhijeetBakre                                           
-SteveLee                                                
-hollybowers                                             
-ChrisBenner                                             
-SusanRoush                                              
-AlfonsoValencia                                         
-IngridKnapp                                             
-DugaldMcGlashan                                         
-ThomasPenders                                           
-AndrewCrane                                             
-AidinNiamir                                             
-KuanHuang                                               
-AndrewRSmith                                            
-SantamChakraborty                                       
-TilmannHabermas                                         
-RossLazarus                                             
-JasonPell                                               
-MarcCollinson                                           
-KateWilliams                                            
-DanielO'Donnell                                         
-Ming-ChiTsai                                            
-ChangKeunJung                                           
-ClaireWakefield                                         
-MARTINHOLCIK                                            
-KittyEmery7789                                          
-Ilkkahavukkala                                          
-FredyRSGutierrez                                        
-xulei                                                   
-tulasijinka                                             
-dominicbroadhurst2499                                   
-stacykonkiel2                                           
-TimcdLucas                                              
-LucianaMarino                                           
-kristishort                                             
-HarrietDashnow                                          
-user50342                                               
-KendallRoark                                            
-VladimirStrezov                                         
-JuanFernandez                                           
-FromMars                                                
-ChristianPoehlmann                                      
-ChristopherJang                                         
-MJoseLobeiras                                           
-DavidNickerson                                          
-JoannaCookney                                           
-SalimZaki                                               
-CjAi                                                    
-claasdamken                                             
-AbhishekBurri                                           
-AmeliaGibson                                            
-ChristopherMuhs                                         
-AbhishekGupta                                           
-DanielOrellana                                          
-JACQUELINEMARTINS                                       
-OtavioPapa                                              
-JenniferBeamer2775                                      
-TorstenSeemann                                          
-FranziskaStelzer                                        
-user50929                                               
-ClaireOlson                                             
-HeidiSenior                                             
-KentAnderson                                            
-FranciscoPinto                                          
-MiguelCentellas                                         
-PatriciaRosa                                            
-TaraDas                                                 
-MarcusViniciusSilva9636                                 
-DavidChivall                                            
-HadasShema                                              
-JeffWDoak                                               
-ClaireBeecroft                                          
-SidneyMorrisJr.                                         
-DanielPritchard                                         
-NathanFisher                                            
-harrieknippenberg                                       
-DanielSelby                                             
-RobShields                                              
-FahdAlhazmi                                             
-PedroGonnet                                             
-MeganMcGinnis                                           
-maryampakdaman                                          
-EdwardChouchani                                         
-nicog                                                   
-TrevorHamilton                                          
-adamtrevitt                                             
-Kien-PongYap                                            
-MichaelTaylor                                           
-BrianGallagher                                          
-DorahNesoba                                             
-ChristopherStave                                        
-CarolynMcGibbon                                         
-ClaireMCobley                                           
-MyriamNeaimeh                                           
-MohammedAlQuraishi                                      
-RobinMeckley                                            
-DanielMaggin                                            
-JaneCavanaugh                                           
-LeslieDelserone                                         
-nicgri                                                  
-LaurenMuscatine                                         
-ShaneGero                                               
-MarkHanke                                               
-DavideViaggi                                            
-OtakarVeleba                                            
-HansWillems                                             
-KarenGutzman                                            
-nicogriff                                               
-ReemBassiouney                                          
-PeterHellyer                                            
-CarrieLevinson                                          
-GaryLewin                                               
-7omasz                                                  
-BettyLadner                                             
-JPeterDonnelly                                          
-kikokiko                                                
-KevinCampbell                                           
-RichardLilford                                          
-AileenClarke                                            
-testimpactstory2                                        
-AntonioFigueras9772                                     
-AnnaWetterberg                                          
-SaumitraJoshi                                           
-HeilaLotz-Sisitka                                       
-MichaelLebreton                                         
-HopeCenter                                              
-ZachariahClaybaugh                                      
-TatsuyaHigashi1565                                      
-robinklein                                              
-ClaraRiera                                              
-JasonSawler                                             
-MarianaFuentes                                          
-EllenFilgo                                              
-ClaytonMiller                                           
-gerardocolmenar                                         
-EmilyBethDevine                                         
-AnnaWiener                                              
-ConstantineBoussalis                                    
-FelixThoemmes                                           
-LesleyKing                                              
-LuzMarinaAlvare                                         
-BenSalem                                                
-CourtlandYockey                                         
-AliciaAparicio6177                                      
-JeffMason                                               
-GeoffWhitty                                             
-RachelVacek                                             
-DhavalNandu                                             
-ShunsakuNishiuchi                                       
-SimonJorgenson                                          
-AndreaRawlings                                          
-JohnRogerAndersen                                       
-KieronOConnor                                           
-DrAndrewBurgess                                         
-kevinrichetin                                           
-ConerdFrederickson                                      
-DavidLandis                                             
-LisaHanson                                              
-FranciscoBarcelo                                        
-KylieBlack                                              
-StevenMarkus                                            
-AlfredGumbwa                                            
-SeanMullen                                              
-ToreStrandvik                                           
-Hanna-MariPuuska                                        
-ErichHuang                                              
-ClaudioMattiussi                                        
-JenineHarris                                            
-L.M.W.Leggett                                           
-ArmandoSalinas                                          
-TomBalemesa                                             
-NicolaCooper                                            
-ClareWotton                                             
-tessapronk208                                           
-AdamWebb                                                
-AllisonFullard4912                                      
-LiamStanton                                             
-Nasimhoosh                                              
-PuruswottamAryal                                        
-DavidHurtado                                            
-JulieElliott5442                                        
-MichaelSteeleworthy                                     
-franciscosegado                                         
-AdamFagen                                               
-JessicaHill                                             
-AndrewShepherd                                          
-LisaGraumlich                                           
-LizBanks                                                
-XiaolongGeng                                            
-DhavalNandu9684                                         
-DebbieBooth                                             
-PennyBishop                                             
-AndreLuzardo                                            
-LeonWalls                                               
-michaelbeierlein                                        
-MinuetteLe                                              
-ChristopherRose                                         
-tramullas                                               
-BradleyWhite2348                                        
-RickyJeffrey                                            
-Jean-BaptisteMouret                                     
-DanOhair                                                
-JuergHodler                                             
-CodyBehles                                              
-ColinWen                                                
-ChrisStevens                                            
-Marc-AndreCornier                                       
-MatteoVergani                                           
-BrentNelson                                             
-DIEGOORZAEZ                                             
-BenMcleish                                              
-LibbyHemphill                                           
-MarynaKaravai                                           
-ConchaSoler                                             
-KarenAntell                                             
-WendyWu                                                 
-GustavoE.Fischman                                       
-StevenRamm                                              
-AlejandroMontenegro-Montero                             
-DaweiLin                                                
-Chirstianfritsen                                        
-PanagiotaManti                                          
-RachelGuyer                                             
-YoshifumiAoki                                           
-BlasM.Benito                                            
-giribio                                                 
-DraganJukic                                             
-ColleenLyon                                             
-GLADYSPATRICIAABDELRAHIMGARZON                          
-HenningKlarlund                                         
-CatherineParr                                           
-AlbertoSalomone                                         
-cassandraalmeida                                        
-HuanLiu                                                 
-SofiaGeorgakopoulou                                     
-AlanaGrech                                              
-DenisCornet                                             
-ClareHumphries                                          
-CoreyFincher                                            
-IsabellaPeters5381                                      
-PhilipMachanick                                         
-LiseSandenbergh                                         
-AndrewGonzalez                                          
-MaxiKindling                                            
-tinachrzastowski9209                                    
-mahmoudzakaria                                          
-AzamatNuriddinov                                        
-AlyciaBittner                                           
-CorradoSpadafora                                        
-ThiagoAvila                                             
-AllanScherlen                                           
-AlisaSurkis                                             
-AlyssaGoodman                                           
-MilosJovanovic                                          
-MatthiasLein                                            
-SharifMukul                                             
-JulianaTrajano                                          
-EliecerGutierrez                                        
-MichelliCosta                                           
-thibautlamadon                                          
-NeilSaunders                                            
-JiefengJiang                                            
-TerryOrd                                                
-SaketChoudhary                                          
-ManishRana                                              
-AlfonsoPierantonio                                      
-AlexeyTikhomirov                                        
-KevanMeinershagen                                       
-KhaledTumbi                                             
-AmandaHill                                              
-OrlandoGregorio                                         
-ShoSato                                                 
-DanielSandsDanielSands                                  
-amyearhart                                              
-AxelToelke                                              
-JohnCole                                                
-StefanWashietl                                          
-AmoghAmbardekar                                         
-AllisonStevens                                          
-AmirTaheri-Ghahfarokhi                                  
-ColinMilligan                                           
-ThibautLery                                             
-JeffStringer                                            
-AmirAryani                                              
-aeserran                                                
-AmyBrand                                                
-AmaliaBeisler                                           
-AngeloGargantini                                        
-RicardoDagnino                                          
-FatmaKaplan                                             
-AnjaSchmidt                                             
-CrisFerguson                                            
-Simon-ShlomoPoil                                        
-AlexanderNavarreteMunoz                                 
-AndreasArvanitogiannis                                  
-GergelySzollosi                                         
-AnandPatel                                              
-drbarnes                                                
-aleebrahim                                              
-AAlswaid                                                
-AntonPersikov                                           
-Dr.NaderAleEbrahim                                      
-AnilKumarChalla                                         
-AdamBrufsky                                             
-RichardWebster                                          
-TakashiHamaji                                           
-AshokBaral                                              
-habib                                                   
-AndoniCR                                                
-FrancescoVaccarino                                      
-CristinaRodriguez-rodriguez                             
-CristhianParra2                                         
-CurtisSuttle                                            
-CristinaMasoller                                        
-AnnaKlinkova                                            
-CrispinWilliams                                         
-DaichiYanagisawa                                        
-AnneKlepp                                               
-MartinThanbichler4890                                   
-HideakiTakeda                                           
-GavinSimpson                                            
-KarenLomond                                             
-DAVDittrich                                             
-ErinBarsan                                              
-dhlunt                                                  
-user50736                                               
-ClaireRyder                                             
-user50484                                               
-HannahBradby9940                                        
-AnnaStina                                               
-FrederickFoulds                                         
-DafnisBatalle                                           
-CrystalCameron-Vedros                                   
-CristinaTomas                                           
-JasonWinkler                                            
-ArunShanker                                             
-J.CarlosVillaescusa                                     
-arthurcharpentier                                       
-AntheaSutton                                            
-arthurbuchberg                                          
-SarahWade                                               
-TimothyElfenbein                                        
-AxelZeitler                                             
-AudreyBennett                                           
-user50849                                               
-AsadKhan                                                
-ArunPrasadBalasundaram                                  
-anne-sophiealvarez                                      
-asi.23056                                               
-AntonioJ.Gomez                                          
-ArianKriesch                                            
-BrandonKnight                                           
-AntoineDeMarree                                         
-AshrafMaleki                                            
-AudreyBeardsley                                         
-AS                                                      
-AsifAhmed                                               
-AurelienMondon                                          
-AshwinRao                                               
-ArielHorowitz                                           
-BahmanRoostaei                                          
-AntonioARNeves                                          
-Ann-MareeGraham                                         
-balhoff                                                 
-AlexandraNoronha5931                                    
-BlazejMiasojedow                                        
-PierreVandergheynst                                     
-BenjaminVincent                                         
-BenMorris                                               
-BenMarwick3726                                          
-BrianDilkes                                             
-LelandTaylor                                            
-BradlyAlicea                                            
-BruceOddson                                             
-BrianFisher779                                          
-BruceDrinkwater                                         
-BillLefurgy                                             
-BrendanMaughan-Brown                                    
-DaKelly                                                 
-LauraForrest                                            
-BrianMcgill                                             
-LaurentBeney                                            
-BilliePeterson                                          
-JohnChodacki                                            
-AlphonseMacDonald                                       
-DanielBarbosa                                           
-iainh_z                                                 
-LaureVerret                                             
-DanielFalster                                           
-LaurieCarlson                                           
-LauraBoweringMullen                                     
-DamianoPreatoni                                         
-LauraSchimming                                          
-CH                                                      
-LaurieScrivener                                         
-imanghalehkhondabi                                      
-DanielClark                                             
-DanielaKerle                                            
-JohnMoravec                                             
-DanyaLeebaw                                             
-LarsHolmNielsen                                         
-AnupamaSathyamurthy                                     
-JeffreyMogil                                            
-mayrasanjuan                                            
-MichaelLadisch                                          
-EllenRandva                                             
-DanielParker                                            
-DanielJHocking                                          
-MichelaMontesi                                          
-CatherineOlsson                                         
-joelrios9199                                            
-MyrnaMorales                                            
-TorikAyoubi                                             
-Lotfisayahi                                             
-ValeryRidde6219                                         
-MargaritaNafpaktitis                                    
-LeahSiskind                                             
-LeonardoBaccini                                         
-LawrenceHunter                                          
-GerardoCoello                                           
-LaurentARNAUD                                           
-AndrewScholey                                           
-LaurissaGann                                            
-LeeJones                                                
-DavidBowler                                             
-InaBlumel                                               
-LeightonReid                                            
-AmyWhitehead                                            
-LeiMa                                                   
-AlbertoLabarga                                          
-KalyanKumarPasumarthy                                   
-VickiCormie                                             
-LawrenceHsieh                                           
-leightonpritchard                                       
-MichaelHofer                                            
-LoicLepiniec                                            
-AnatoleGOUNDAN                                          
-DanilDobrynin                                           
-LeighBlackall                                           
-LeaAnnMatura                                            
-LawrenceOch                                             
-AlejandroUribeTirado                                    
-DavidDahl                                               
-DavidHighton                                            
-LinaCarvalho                                            
-PedroPrincipe                                           
-DavidCBlackburn                                         
-DavidClarke                                             
-DavidDeRoure                                            
-DarganFrierson                                          
-DavidArmanini                                           
-DavidCottrell                                           
-DavidBunck                                              
-AlisonPearce                                            
-DarioAmbrosini                                          
-DanielSMillsDanielSMills                                
-DanielJackson                                           
-DavidBishop                                             
-PrateekMahalwar                                         
-LeeHulbert-Williams                                     
-HideakiMabashi-Asazuma                                  
-DavidColquhoun                                          
-DavideRizzo                                             
-ChristianNiklas                                         
-DavideRivola                                            
-PhilippeJulien                                          
-PiaSpryMarques                                          
-DavidBaltrus                                            
-lfernandes                                              
-PedroValdivia-Moral                                     
-TheivasanthiThirugnanasambandan                         
-EvertBosdriesz                                          
-DavidGonzalezAlvarez                                    
-arianaeichelberger                                      
-danielcesarini                                          
-LibraryHelp                                             
-librarygrrrl                                            
-DavidSamson                                             
-DavidGlance                                             
-LillianStevenson                                        
-DavidLeBauer                                            
-KasperHansen                                            
-DavidGarcia                                             
-LilianHoffecker                                         
-johnrigby                                               
-LindaCorrin                                             
-DavidOsterbur                                           
-DeanGesch                                               
-DavidHahn                                               
-DeborahFenner                                           
-LarsArvestad                                            
-LeonievanDrooge                                         
-RichardHosking                                          
-deanhendrix                                             
-DeniseCummins                                           
-DeniseLandry-hyde                                       
-DavidWinter                                             
-DavidShotton                                            
-DavidStadelmann                                         
-DeborahGreene                                           
-user51176                                               
-DavidPalaciosMartinez                                   
-DiegoSampedro                                           
-DianaThomas                                             
-AndrewKemp                                              
-KristinaArnebrant                                       
-PavolProkop                                             
-DavidMebane                                             
-DavidWoods                                              
-DeeMagnoni                                              
-DavidKicklighter                                        
-DavidWiley                                              
-MatthewGeary                                            
-anthonygordon                                           
-DidzisElferts                                           
-ArashTaheri                                             
-BrendaQuaye                                             
-NiallAlcock                                             
-davidmsheridan                                          
-DimitriosKoureas                                        
-DeborahLupton                                           
-AliMobasheri                                            
-DiegoChavarro                                           
-DianaEscalante                                          
-DeborahMongeau                                          
-DiegoRestrepo                                           
-DerlieMateo-Babiano                                     
-dhgzsihgthldsghdsligh                                   
-DianeLefebvre                                           
-DavidKelliher                                           
-wiegerwamelink                                          
-DerekJones                                              
-DouglasArnold                                           
-DouglasRobinson2                                        
-DevinBerg                                               
-DouglasRobinson                                         
-DiegoRiaño-Pachón                                       
-KHersch                                                 
-DenisaKera1403                                          
-DianaCunningham                                         
-DavidVelasco                                            
-EdWarga                                                 
-DirkPostma                                              
-DMytilinaios                                            
-DianeWahl                                               
-QuinnFletcher                                           
-DonnaKafel                                              
-DonnaGilton                                             
-DonaldBlumenfeld-Jones                                  
-BlancheK                                                
-DimaAbdallah                                            
-EdgarMartinez-Moro                                      
-DiegoVarela                                             
-YvonneBuckley                                           
-dieterwuttke                                            
-ThereseSkagen                                           
-DylanBould                                              
-ElaineChalus                                            
-denishaine                                              
-ramlanmohdimam                                          
-AmrShaarawi                                             
-ElinCharles-Edwards                                     
-DimitarPoposki                                          
-DuncanAlford                                            
-DominiqueRoche                                          
-EdgardoOrtiz-Jaureguizar                                
-DimitriForero                                           
-francescoaliotta                                        
-HormetjanYiltiz                                         
-DougWay                                                 
-EmilyFord                                               
-MilosBuric                                              
-EmmanuelBréton                                          
-ElenaTarnavsky                                          
-Dr.WinfriedBoeing                                       
-GeorgeUnick                                             
-EgorKotov                                               
-ElisaCorteggianiCarpinelli                              
-AndersJohansen                                          
-HudaIbeid                                               
-EduardoQuintana                                         
-MotokiWatabe                                            
-EncyclopaediaIranica                                    
-costasbouyioukos                                        
-MoniqueMendelson                                        
-EliseWach                                               
-EdClayton                                               
-KanUeji                                                 
-EmilyLines                                              
-EllsCampbell                                            
-EdRybicki                                               
-EletaExline                                             
-dd                                                      
-EmrahCoraman                                            
-ElizabethKetterman                                      
-ADRIANAGARCIA                                           
-EmilyMcAuley                                            
-EricLegge                                               
-MogensHenrikSorensen                                    
-ellencole_                                              
-ErmelineJaggi                                           
-EndymionCooper                                          
-ElisCarlstrom                                           
-ErikaWayne                                              
-user50508                                               
-NadjaReissland                                          
-VascoCadavez                                            
-LeonardoMelo                                            
-ErnstKoster                                             
-EricaBurleigh                                           
-ErikaDowell                                             
-EricSmith                                               
-ElizabethLeclair                                        
-EricStrobl                                              
-EmanuelFronhofer                                        
-ErinBlakeney                                            
-EmmaFuller                                              
-Elson                                                   
-ElishaRoberson                                          
-EmmaWatsonEmmaWatson                                    
-erhanturan                                              
-LindseyMoses                                            
-ErkinSeker                                              
-EnriqueJavierCarrasco-Correa                            
-StanColcombe                                            
-ErikaMudrak                                             
-DavidSchuster                                           
-FabienLeonard                                           
-EvgenyAsmolov                                           
-farzamsafarzadeh                                        
-IainMoppett                                             
-MickCraig                                               
-EricDoehne                                              
-EnricCamon                                              
-EricaThieman                                            
-ElisaManzotti                                           
-matteomanfredini                                        
-Wan-PingLee                                             
-DaveCharles                                             
-EugenioIvorra                                           
-fake1fake1                                              
-EugenioCulurciello                                      
-FedericoLasserre                                        
-fabricebrito                                            
-EugenioFerreira                                         
-NaoyaOKU                                                
-F.BasakAydemir                                          
-NataliaChinchaladze                                     
-FabioChizzolini                                         
-AjayKhanna                                              
-EmanuelNazareth                                         
-MarilouBourdages                                        
-barissonmgnin                                           
-JoachimKimmerle                                         
-ferdinandopucci                                         
-FionaM                                                  
-felimoya                                                
-FloraShrode                                             
-FinGalligan                                             
-FlorianDworkowski                                       
-DavidPetersen                                           
-VivianaFonti                                            
-FeiliTu-Keefner                                         
-FernandoAleman                                          
-SheilaWilliams                                          
-fehmi                                                   
-MikaylaAllen                                            
-CerstinMahlow                                           
-FelixGreaves                                            
-FernandoAntunes                                         
-FelixKronenberg                                         
-FlorentMouliere                                         
-FelixMuerdter                                           
-FintanBracken                                           
-FenjaZiegler                                            
-FelipeMurphy-Armando                                    
-Azizeh-MitraYousefi                                     
-DHuber                                                  
-FrankFarach                                             
-FranklinSayre                                           
-fernandapesetta                                         
-FrankParry                                              
-JJMerelo                                                
-EdelynVerona                                            
-ParulBhatnagar                                          
-FrancesBunn                                             
-BarrieHayes                                             
-FrançoisGagnon                                          
-TanjaBekhuis                                            
-FrankSerafini                                           
-FrancesDevlin                                           
-FranMartin                                              
-NeilDickson                                             
-FrankHuysmans                                           
-FranckPeron                                             
-GeorginaGurney                                          
-FrankNothaft                                            
-FranciscoBalao                                          
-FredericBriand                                          
-leandromiranda                                          
-GaiaVarese                                              
-FredericoSousa                                          
-MD                                                      
-GabrieleToietta                                         
-FredericGiraut                                          
-WilliamPang                                             
-GabrielFinkelstein5831                                  
-Gafoor                                                  
-user50817                                               
-user50725                                               
-LizNeeley                                               
-LisaGurney                                              
-GaryFreiburger                                          
-GaryKaplan                                              
-GarretMcMahon                                           
-FredJ.Hickernell                                        
-GabriellaReznowski                                      
-GadYair                                                 
-GabrielleCarey                                          
-LouisdeKoker495                                         
-LorenzoDeSio                                            
-GarethPrice                                             
-FTusell                                                 
-GabrielaFernandez-Viejo                                 
-ClaudiaKoltzenburg                                      
-LineBarkved                                             
-GillesFrison                                            
-TommasoSavino                                           
-BirgeWolf                                               
-lopez-borrull                                           
-IanGriffin                                              
-MichaelMucalo                                           
-MikelIzquierdo                                          
-BrandonBigEagle                                         
-LornaWildgaard                                          
-ArnavAnjaria                                            
-LisaMandle                                              
-LivioOboti                                              
-LluísBrotons                                            
-GasparJekely                                            
-LinhBaoNgo                                              
-ClaytonBolitho                                          
-GeorgianaBostean                                        
-ListOf                                                  
-JoshuaCarp                                              
-PeterPeter                                              
-ghardin                                                 
-GuillaumeMauger                                         
-GeorgeChacko                                            
-GeneralCollection                                       
-ReginaldoTrindade                                       
-JonathanHardman                                         
-GasparSanchez                                           
-MohammadMansoori                                        
-ChristianQScheckhuber                                   
-PiotrAdamczyk                                           
-PGrajeda                                                
-GregoryCopenhaver                                       
-GinaKessler                                             
-user51645                                               
-GiletJulien                                             
-GianlucaDellaVedova                                     
-constantineOulis                                        
-GeirOttersen                                            
-GeorgeTsogas                                            
-GeoffreySpear                                           
-GianlucaDemartini                                       
-GregWatson                                              
-GillianHallam                                           
-GenomeBC                                                
-GokulKesavan                                            
-ChloeDelmas                                             
-GregoryGoldsmith                                        
-PietroGhezzi                                            
-CharlesGerena                                           
-MunehiroAsally                                          
-SarahDalrymple                                          
-JacobJolij                                              
-GlebBasalyga                                            
-gtsak                                                   
-GrahamMcCann                                            
-GiovanniDeGasperis                                      
-guisadoyoa                                              
-GustafNelhans                                           
-GiorgioLevy                                             
-GuillaumeBastille-Rousseau                              
-GregerLInden                                            
-GregPotter                                              
-GinnyPittman                                            
-GraceLi                                                 
-GraemeStuart                                            
-GiuseppePintaude                                        
-GustavDelius                                            
-VMbalasubramaniam                                       
-KerenDali                                               
-HarrisonInefuku                                         
-NickMurphy                                              
-HardySchwamm                                            
-JeromeVicente                                           
-ChristopherHiller                                       
-HakimMeskine                                            
-harris                                                  
-LisaRichardson                                          
-DanielCohen                                             
-MelissaLewis                                            
-HackenbergMichael                                       
-E.J.Choe                                                
-HalAtkins                                               
-HannesMutschler                                         
-HannahWood                                              
-LouiseTripp                                             
-HaoChen                                                 
-HaraldWinkler                                           
-HarpreetSingh                                           
-HanneloreVanhaverbeke                                   
-HayderAl-aubaidy                                        
-HaoZhang                                                
-AnnavantVeer                                            
-HaraldGropengiesser                                     
-ArneSmolders                                            
-VeyselBilalArslankara                                   
-JarbasBonetti                                           
-JasonOrgan                                              
-LucyMontgomery9875                                      
-PierreLARMANDE                                          
-CedricLaczny                                            
-CoralSheldon-Hess                                       
-JohnGershman                                            
-LuoSi                                                   
-SusanRoush5064                                          
-DanieleMaiolo                                           
-milasguisad                                             
-LucMalaval                                              
-LucasNussbaum                                           
-Luobang                                                 
-MaciejGastol                                            
-HelenaMihaljevic-Brrandt                                
-LuísTojo                                                
-LuisCunha                                               
-LudovicDenoyer                                          
-LukasElmer                                              
-Louis_EricTrudeau                                       
-LupicinioIñiguez-Rueda                                  
-LyubomirPenev                                           
-juangonzalez                                            
-AndrewMartin                                            
-hoz                                                     
-hmmmmm                                                  
-HongHuang                                               
-hsmarinho                                               
-HelenaStewart                                           
-HelenChan                                               
-GustavoLannelongue                                      
-AndreaTagarelli                                         
-HelioRocha                                              
-JessicaWoolman                                          
-KaustubhRane                                            
-HadiIzadi                                               
-HenryTrotter                                            
-HenrydeVries                                            
-HidekiUosaki                                            
-MiguelCatalan                                           
-HugoMartinez                                            
-HilmarLapp3930                                          
-HitoshiHasegawa                                         
-H.KemalIlter                                            
-HennieStoffberg                                         
-HimanshuSinha                                           
-HoutanNoushmehr                                         
-HilmarLapp1794                                          
-Hsiu-CheWang                                            
-HongxiaWang                                             
-JonasAnseeuw                                            
-RevistaIbero-americanadeEstrategia                      
-HugoMartinez-Cabrera                                    
-FreireAna                                               
-IgnasiLabastida                                         
-LisaLodwick                                             
-MHarvey                                                 
-IanViney                                                
-IanGent                                                 
-IgnacioSerraStepke                                      
-RobGuralnick                                            
-CamillaWhittington                                      
-PabloRojas                                              
-HidehiroSakurai                                         
-InesMergel                                              
-IngridVanBiezen                                         
-ImogenClarke                                            
-IFZAltmetrics                                           
-IgorCesarino                                            
-IgnacySawicki                                           
-IngridMason                                             
-IdoRoll                                                 
-IndratAria                                              
-HumbertoDebat                                           
-HuguesBeaufrere                                         
-IaraLacher                                              
-tinewyckhuys                                            
-IsidroAguillo                                           
-IoriSuiyama                                             
-izzatalsmadi                                            
-IriaDelRío                                              
-IanBrooks                                               
-HeidiMuenchberger2675                                   
-NyashaChambwe                                           
-iris3chang                                              
-DianaThomas5966                                         
-IPOL                                                    
-GrantHill-Cawthorne                                     
-IslaKuhn                                                
-ChrisReid                                               
-IeamEditor                                              
-JacekPiskozub                                           
-paulbaker                                               
-IvanTopisirovic                                         
-isharacomix                                             
-IvaniaCerón-Souza                                       
-PatrickNewell                                           
-milanesyuya                                             
-IonYarritu                                              
-ISSAMTOUHAMI                                            
-IrshadCassim                                            
-IseultLynch                                             
-IonasErb                                                
-IrinaZeylikovich                                        
-IvanKempson                                             
-fabiofrezatti                                           
-JamesStevenson                                          
-JamesKirkpatrick                                        
-JaleesRehman                                            
-JamesOnken                                              
-JamesCoan                                               
-JamesMorris                                             
-JamesBielo                                              
-DanielSchwartz                                          
-JaimePotti                                              
-LeoOtterbein                                            
-CarlChristensen                                         
-LeslieReynolds                                          
-JamesDavis                                              
-IanOBoyle8106                                           
-rzepa                                                   
-JackieWirz                                              
-JameelShaik                                             
-JamieConklin                                            
-JackieWolstenholme                                      
-JackRumble                                              
-JamesHand                                               
-jameshardcastle                                         
-MiggiePickton                                           
-james                                                   
-JaimeR.Pagan-Jimenez                                    
-ericSTEVENS                                             
-JaredHoppenfeld                                         
-JamesLevis                                              
-JaneVanGalen                                            
-JanLabitzke                                             
-JamieLynch                                              
-JamesWatts                                              
-JayshreeMamtora                                         
-seogikang                                               
-GeorgeLozano                                            
-RenataSolimini                                          
-JasonClark                                              
-JaneBowering                                            
-JimStemper                                              
-JanGeertHiddink                                         
-JanetSiegmund                                           
-HannahDee                                               
-JanVandamme                                             
-FerranCalabuig                                          
-JanWedekind                                             
-JanetBrown                                              
-GiovanniCoppola                                         
-JaneCostanza                                            
-PeterSommer                                             
-JaroslavHron                                            
-JaneneBatten                                            
-jbjb                                                    
-MahanteshBiradar                                        
-JasonBairdJackson                                       
-JasonSnyder6289                                         
-jcachat                                                 
-ValeriePrilop                                           
-PiotrasCimmperman                                       
-Jean-GabrielElie                                        
-JuliaGustavsen                                          
-jeanliu                                                 
-JasonFriedman                                           
-LukeGeorghiou                                           
-JavierAlonso                                            
-JasonSatel                                              
-JasonNomura                                             
-CristKhachikian                                         
-PetrKlapetek                                            
-mhs                                                     
-JeffPelz                                                
-JasonRoberts                                            
-JasonSnyder                                             
-JeffHammond                                             
-JeffDonlea                                              
-JaysonFelty                                             
-SAJLISSAJLIS                                            
-user51909                                               
-JacobBerg                                               
-JeffreyRobens                                           
-Po-KaiHuang                                             
-AndrewWalker                                            
-JefferyHorsburgh                                        
-JeffBowman                                              
-Po-KaiHuang2209                                         
-ChiaraLoda                                              
-MikaelElbaek                                            
-KrzysztofSwierkosz                                      
-MajedAl-lehaibi                                         
-MartinBuckley                                           
-JulioSantillan-Aldana                                   
-NancyBrannaman                                          
-JenniSanderson                                          
-Jean-MichelPereira                                      
-jemanuel                                                
-JennieKnies                                             
-BrianBot241                                             
-JefferySaven                                            
-subhranshusahoo                                         
-AlexandraAssisRosa                                      
-SusanPowelson4529                                       
-JenniferStearns                                         
-YinYin                                                  
-shatrunjaisingh                                         
-JenniferGardy                                           
-JennyWakefield                                          
-PurpleFlower                                            
-AnesaHosein                                             
-RabishankarGiri                                         
-LisaVanhoose                                            
-JenniferALiss                                           
-Jens-ErikMai                                            
-JenniferCostanza                                        
-JenniferBonnet                                          
-KheiraBelhadj-ziane                                     
-jachicaiza                                              
-JesusCortes-Rodicio                                     
-JeremyWilmer                                            
-JenniferBrewer                                          
-JeremiahPeiffer                                         
-JensMichaelis                                           
-RafaelKCampos                                           
-DanaErnst                                               
-jfsantos                                                
-RemusPoradin                                            
-AhmadSamirAlfaar                                        
-RichardFinkers                                          
-JessicaVandeleest                                       
-BlairGoodridge                                          
-GuillaumedeLartigue                                     
-JesusP.Mena-Chalco                                      
-DanielHurley                                            
-JessicaLindholm                                         
-RafaelSCalsaverini                                      
-SheldonDanziger                                         
-JesseRaab                                               
-refset-8wnr3s                                           
-JillEmery                                               
-J.MarcOverhage                                          
-JMCabrero                                               
-JessicaPolka                                            
-JimRegan                                                
-JeromeDeiss                                             
-JHealthBiolSci-JHBS                                     
-JessL                                                   
-MojcaStojan-Dolar                                       
-jessielymn                                              
-JinLee                                                  
-nicolasroy                                              
-JianZhang                                               
-JiriDybal                                               
-JillAnderson                                            
-JimO'donnell                                            
-JeremyButler                                            
-KelseyWood                                              
-AlessandroDeRosis                                       
-JimCresswell                                            
-SumuduFernando                                          
-JillHowlin                                              
-JizhouLi                                                
-JianDai                                                 
-SeeWahCheng                                             
-SarahPassonneau4864                                     
-JezAlder                                                
-JoãoFeitosa                                             
-JoannaWolfe                                             
-WooJaeKim                                               
-TessaPronk                                              
-GulcinCribb                                             
-JochenBihn                                              
-JochenSchirrwagen                                       
-joannabriggsinstitute                                   
-JoeGardiner                                             
-rajeshchaudhari                                         
-JoannaDunlap                                            
-JoanWee                                                 
-JoannaBurkhardt                                         
-BeckyBoes                                               
-RafalBuldak                                             
-IrfanKhan                                               
-MonaHaraty                                              
-abbourke                                                
-JoeGalewsky                                             
-AndrewStewart                                           
-JoaoRodrigues                                           
-LauraWarman                                             
-JohanSchimanski                                         
-JoergDietz                                              
-JoaoBomfim                                              
-JohannesFahrmann                                        
-JohnHammersley                                          
-JohnCreighton                                           
-WalterSessions                                          
-JohnBarnett                                             
-JohnEscobar                                             
-JoeySprague                                             
-JohannesStrobel                                         
-JoelFajans                                              
-JohnDobson                                              
-JohnPOverington                                         
-JoannaPong                                              
-SharonSlade                                             
-RajuDatla                                               
-ReneMilk                                                
-KeisukeKomoda                                           
-JessicaDraughon                                         
-JimWitschey                                             
-JorgeGonzalezAlonso                                     
-BoSophiaXiao                                            
-MarthaBrogan                                            
-JonasRubenson                                           
-JoseDeSordi                                             
-JonathanFranca-Koh                                      
-JonathanFrome                                           
-GillianDornan                                           
-MehmetOrhan                                             
-JonHawkings                                             
-PaulVierkant                                            
-JorikBooij                                              
-JohnStinchcombe                                         
-JennyOleen                                              
-JohnZelenski                                            
-AshleySutherland                                        
-PaoloSonego                                             
-RichardCGerkin                                          
-remediosmelero                                          
-JonCorson-Rikert                                        
-JohnVandenberg                                          
-JohnWarren                                              
-JosefFStuefer                                           
-RaymondJ.Turner                                         
-ItoshiNIKAIDO                                           
-JonLund                                                 
-JorgePrado                                              
-refset-if1h0z                                           
-MollyBrown                                              
-DavidHaberthur                                          
-JosephRey                                               
-Jose_L_Oliver                                           
-JonHumphries                                            
-JonathanRohrer                                          
-JoSharrocks                                             
-JonathanNabe                                            
-JoseGarcia-Cordero                                      
-LarsWesterberg                                          
-JonHill                                                 
-GabrielFrancescoli                                      
-josekarvalho                                            
-JRDemey                                                 
-JosipaVisic                                             
-JosephBrancale                                          
-jsench                                                  
-JoseLozano                                              
-M.DavidMarks                                            
-RajaV                                                   
-JordanYaron                                             
-JuanCarlosVillarreal                                    
-GionataMassi                                            
-ChristophMarty                                          
-refset-vxqc06                                           
-AlexandraKohlSchwartz                                   
-JoseManuelSanchez                                       
-RamasamyKumaresan                                       
-josemi_fv                                               
-JoseRodrigues                                           
-sebastiangoncalves                                      
-MallikarjunDora                                         
-JoseMartinez                                            
-jowens                                                  
-CharlesHuber                                            
-JosephHancock                                           
-pascalcuxac                                             
-JuanAndreiVillarroel                                    
-jslefche                                                
-ArturoErdely                                            
-RickBaker                                               
-JuliaLeong                                              
-julian-urbano                                           
-JuliaKeller                                             
-ResearchTrends                                          
-RenatoCorrea                                            
-user50756                                               
-JulianParkhill                                          
-RhettBrymer                                             
-JudyLuther                                              
-JuliaCarreno                                            
-HillaryYoung4992                                        
-ManmohanSharma                                          
-MarianneMolin                                           
-JulianaFreire                                           
-MarcioVonMuhlen                                         
-WeiWei                                                  
-MarcStein                                               
-JudithGulpers                                           
-MalteWillmes                                            
-MarcGreenberg                                           
-MarcDelBigio                                            
-MarcioFabricio                                          
-ManueldelaCruzGutierrez                                 
-ManousosValyrakis                                       
-MargyLindem                                             
-MarciaDorityBaker                                       
-MichaelVanScott                                         
-MarcoTullney                                            
-PaolaRicaurte                                           
-AnnHanlon                                               
-MikelAlonso                                             
-JuliaPeacocke                                           
-JuliaKelly                                              
-MargieRuppel                                            
-MartadelaCuesta                                         
-MarcoMarengo                                            
-MariaMorris                                             
-EnricoCaprio                                            
-JulioMeneses                                            
-KarimMercha                                             
-KarinMeyer5856                                          
-MarcoPessoa                                             
-MariaCeliaMalay                                         
-MarcosCatalan                                           
-MariaAlencar                                            
-KamakshiRajagopal                                       
-KarenChapman                                            
-KarlaFeijs                                              
-JustinKirby                                             
-KarenBlock                                              
-KarenVella                                              
-KariWoods                                               
-KarenGischlar                                           
-KaivonFintel                                            
-KarineJamet                                             
-SandraPorter                                            
-MarcoHerrera-Valdez                                     
-MarcoScalvini                                           
-RenatoFCorrea                                           
-EboniA.Johnson                                          
-AgnetaLindsten                                          
-jxtx                                                    
-Chih-HsiuLin                                            
-PaulaPardo                                              
-JulienMairal                                            
-KarlaStrieb                                             
-JulienAutebert                                          
-JuneAhn                                                 
-KateKeller                                              
-KatarzynaSzkuta                                         
-kashifzia                                               
-KatharinaBrecht                                         
-KatharineDickson                                        
-katepoole                                               
-JamesCahill                                             
-KatharineEvans                                          
-KateUmbers                                              
-JulieWu                                                 
-WojciechJaskowski                                       
-RichardHartman                                          
-RichardGomer                                            
-RiccardoFusaroli                                        
-RobertLarson                                            
-RebeccaSGraves                                          
-CarlosSilva                                             
-KatrineWhiteson                                         
-AiltondosSantos                                         
-KathrynHuff                                             
-KathleenFitzpatrick                                     
-KarlNilsen                                              
-KateWeinbrecht                                          
-GerdKortuem                                             
-MitchellStanton-Cook                                    
-KayvanKousha9075                                        
-xoseA.RegosVarela                                       
-KazukiMaezawa                                           
-LisaCollins                                             
-JoelMainland                                            
-AlanJohnson                                             
-IsaacChacon                                             
-ReidBrennan                                             
-GuidoFanelli                                            
-RicardoFerraz                                           
-JensMalmkvist                                           
-RichardPearse                                           
-RobinThurmeier                                          
-SelimGomez                                              
-KateClancy                                              
-KateGibbings                                            
-KazunariMiyamichi                                       
-KeitaMatsuno                                            
-KendallMartin                                           
-SiobhanDunne6232                                        
-SiobhanDunne9837                                        
-KatsuhiroMoriya                                         
-phb                                                     
-FranciscoCouto                                          
-KatherineMack                                           
-KeithCollier                                            
-KennethGleason                                          
-KavehBazargan                                           
-KBMD                                                    
-KeitaBando                                              
-KeesKleinGoldewijk                                      
-KayvanKousha                                            
-JudithHalasz                                            
-KentSpackman                                            
-RogerSanchez                                            
-KevinAnn                                                
-KennethPomerantz                                        
-KathleenBrown                                           
-KIatropoulou                                            
-KathleenWeldon                                          
-RosannaCantavella                                       
-Eythan-DavidVolcot                                      
-AlexMarsden                                             
-KhengSeangLim                                           
-EleonoraSchiappa                                        
-KentHolsinger                                           
-KhaledAlmohammadi                                       
-KevinDolby                                              
-KendraAuberry                                           
-KellyJones                                              
-KeithKillingbeck                                        
-JoseLuisMenendez                                        
-KhaledSalama                                            
-KenningArlitsch                                         
-KelseyCorlett-Rivera                                    
-KonstantinosChorianopoulos                              
-KennethAJacobson                                        
-KirrilyPells                                            
-MarieMcVeigh                                            
-KindredWinecoff                                         
-KirkHess                                                
-KingsleyUkwaja                                          
-XavierAgenjo                                            
-JulMendes                                               
-KennethFlynn                                            
-MarkZastrow                                             
-KokHoongLeong                                           
-kojitsuda                                               
-auroragarcia-fernandez                                  
-kvarinca                                                
-KristaGraham                                            
-KimberleyBarker                                         
-KieranFenby-hulse                                       
-kim_rutherford                                          
-knuredini                                               
-KingaHosszu                                             
-KimberlyHoffman                                         
-KierenMayers                                            
-kristenyt                                               
-MorrisMary                                              
-KristaAlexander                                         
-vahidkarima                                             
-KristaOke                                               
-JeffHatten                                              
-KatherineBannar-Martin                                  
-KosukeTanabe                                            
-KrystenJones                                            
-KVSPrasad                                               
-KranthiVarala                                           
-IanHall                                                 
-KristinJanke                                            
-Kate_Dougherty                                          
-kmdouglass                                              
-KristianSpilling                                        
-MarkNewton                                              
-MarkVrabel                                              
-MartinHromada                                           
-KunihiroMaeda                                           
-KristinKaschner                                         
-KwekYanChong                                            
-HannuKinnunen                                           
-DavidBoucher7343                                        
-JanPierskalla                                           
-MariaPrager                                             
-MarkAdams7897                                           
-MartinWestwell                                          
-JuanAntonioBarreraGomez                                 
-MarieAscher                                             
-YasukazuNakamura                                        
-MarkusHartl                                             
-AndrewSmith                                             
-JeramiaOry                                              
-jeffreyhandy                                            
-KatrinWeller                                            
-lindsayvickery                                          
-MarkParsons                                             
-MarionWalton2                                           
-MartinSmith                                             
-MarissaDickins                                          
-maria-telpoukhovskaia                                   
-MarkStrong                                              
-MarkBentley                                             
-MarkStevenson                                           
-MassimilianoTarozzi                                     
-MattiaMenchetti                                         
-DaveClarke                                              
-MattijsSmits                                            
-MaryAnneHansen                                          
-ChristopherCarson                                       
-MatthewGifford                                          
-MaryVanUllen                                            
-MatthewGrimes                                           
-MatteoDainese                                           
-MatthewCalamia                                          
-MatthewFConway                                          
-MaryGilmartin                                           
-greglinch                                               
-MaryAagard                                              
-MatthewRocklin                                          
-MatthewParsons                                          
-MatthewKaiser                                           
-MariqueAucamp                                           
-RajeshRansing                                           
-MarieSpeare                                             
-MarinaHirota                                            
-MartinSzomszor                                          
-MattAndrews                                             
-MatthewMitchell                                         
-MartinaValentini                                        
-MayaShvartsman                                          
-EleniStroulia                                           
-MeganBailey                                             
-MelindaBaerwaldMelindaBaerwald                          
-MatthewSylvain                                          
-MaxSenges                                               
-TitoDutta                                               
-MatusValach                                             
-MelanieLou                                              
-MatthewDunn                                             
-VikasBehrani                                            
-MaryElting                                              
-FredreHattingh                                          
-EmanuelKulczycki                                        
-MatthewLasich                                           
-MeganHarries                                            
-MelindaTrudgen                                          
-MateKapovic                                             
-JohnDidion                                              
-MEHDIRassafiani                                         
-MarkusBayer                                             
-MeredithJones                                           
-MeiLingLo                                               
-mayagroner                                              
-MeghanByrne                                             
-MelissaCragin                                           
-maxrubner                                               
-marsanchezsomolinos                                     
-ColetteReal                                             
-DiarmaidHyland                                          
-KarmenBrooks                                            
-ClareOGradyWalshe                                       
-Shreekantkarkun                                         
-MarcoCosentino                                          
-ChristineRies                                           
-MdRajibulHasan                                          
-MaximeGarcia                                            
-MattWiebe                                               
-JohnGray                                                
-SarahSutton                                             
-DanielPollyea                                           
-FelixdelValleGastaminza                                 
-MelodyMcMahon                                           
-PaulPival                                               
-PaulFyfe                                                
-PaulLloyd                                               
-MartenWinter                                            
-JohnStanford                                            
-MonaDomosh                                              
-RolandFabritius                                         
-user50172                                               
-PatrickTomlin                                           
-PaulBoshears                                            
-PeterWesthoff                                           
-PatrickFrings                                           
-LauraDooley                                             
-PaulParsons                                             
-PatriciaHerron                                          
-PasqualePagano                                          
-PaulDonovan                                             
-HouriehHamrah                                           
-PatrickMüller                                           
-PaulKiprof                                              
-SharronHinchliff                                        
-FrancoisGould                                           
-PetrosKountouris                                        
-PedroMagalhaes                                          
-PeterGehr                                               
-PeterBalan                                              
-PeterVermeersch                                         
-PetkoKalev                                              
-GioiaChilton                                            
-PeterKnutLundquist                                      
-PennyBeile                                              
-PaulConstantine                                         
-PeterDubovskii                                          
-GeorgeSithole                                           
-JoshBolick                                              
-PeterMoller                                             
-JeaneSoriano                                            
-PengHwaAng                                              
-AlexanderSmith                                          
-PetrusPaulusKruger                                      
-OferKedem                                               
-michael.s.murillo                                       
-PeterBinkley                                            
-ElineSikkema                                            
-PeterWebster                                            
-IsabelleLaforest-Lapointe                               
-SallyKeith59560                                         
-MichaelEisen8255                                        
-PeggiKamisato                                           
-PeerReviewed                                            
-PedroLacerda                                            
-SarahJeong                                              
-MichaelGlass                                            
-PeterAugust                                             
-michaelrutenbergschoenberg                              
-jphekman                                                
-ReglindisDeRidder                                       
-LarsKullman                                             
-LiwenVaughan                                            
-MichaelWhitton                                          
-MichaelATaylor                                          
-MuyangaZiba                                             
-EdmundHart                                              
-MichelleMccrackin                                       
-krishnarajc                                             
-LoriKoelsch                                             
-AskerJeukendrup                                         
-Michelle_Armstrong                                      
-GuerenaSalvador                                         
-MichaelHyman                                            
-MichaelHead                                             
-csandovalcastro                                         
-michaelorgan                                            
-MichalKania                                             
-MichelleDalmau                                          
-ChuckKardous                                            
-mgaljvieva                                              
-mga                                                     
-ColleenMacKinnon                                        
-MichelleLloyd                                           
-EmmaBurrows                                             
-MichelleMurray1                                         
-MichelleKellySchultz                                    
-MichaelDreslik                                          
-MicheloSimuyandi                                        
-MarkkuJaaskelainen                                      
-MiikaKomu                                               
-VirginiaJones8017                                       
-MichalSvoboda                                           
-MickaelLelimousin                                       
-KojiChono                                               
-JulianeSchonfeldt                                       
-EdgarSelzer                                             
-MicheleMarino                                           
-JiafengJin                                              
-MichałBojanowski                                        
-mitchellthompson                                        
-aysenmustafa                                            
-AllanJamesStevenson                                     
-ArjunGuneratne                                          
-aaa                                                     
-MikeLin                                                 
-ehenneken                                               
-MariaEugeniaDiazPerez                                   
-MariaGonzalez                                           
-LauraSheble                                             
-MichaelSears3774                                        
-alecblack                                               
-ArvinBhana                                              
-BetteRathe                                              
-VirginiaPannabecker387                                  
-kerfors                                                 
-John-PaulSmiley                                         
-timothyhla                                              
-CourtneyFitzpatrick                                     
-ClaireGabriel                                           
-user51707                                               
-MohammadBarkhi                                          
-Philippeauzel                                           
-PranabaNayak                                            
-KrisJack                                                
-LisavandenBerg                                          
-TimothyLanders                                          
-AgronomyForSustainableDevelopment                       
-CanerUguz                                               
-NanChen                                                 
-CathyBow                                                
-KitBrown-Watts                                          
-FrederiqueBordignon                                     
-ErinBraswell                                            
-VikaZafrin                                              
-AbhinavGoswami                                          
-TimothyErrington                                        
-IldefonsMagransdeAbril                                  
-JacobDunn                                               
-PhilippeCudre-mauroux                                   
-DavidBunck1211                                          
-BenSheldon                                              
-PrakashDutta                                            
-DenisOMeally                                            
-MarieCasey                                              
-CateCameron                                             
-rafaelsidi                                              
-AmyTaylor                                               
-JakeHartnell                                            
-user51940                                               
-user51859                                               
-user51915                                               
-PhilipBett2                                             
-sandraharris                                            
-PhilippeGirones                                         
-PolinpapilinhoKatina                                    
-PieterVansteenkiste                                     
-JoVandesompele                                          
-PlaasNews                                               
-LizBeddoe                                               
-williamdaughton                                         
-oleMors                                                 
-DorinN.Poenaru                                          
-CodyParis                                               
-XiaoyuanZhou                                            
-PhilipBett                                              
-ConstantinosAntoniou                                    
-qubyte                                                  
-MichaelInkpen                                           
-nicoanten                                               
-ehsanardjmand                                           
-erdalcenesiz                                            
-MattFitzpatrick                                         
-NicholasHeavens                                         
-JackParmer                                              
-Gjalt-JornPeters                                        
-StacyTye-Williams                                       
-user50099                                               
-NgangHeokTang                                           
-NagendraHegde                                           
-SusanaRodriguez-Echeverria                              
-josemifv                                                
-Nanakorn                                                
-NASAGISSLibrary                                         
-NaomiPrady                                              
-RachelAnkeny                                            
-SusanneManz                                             
-CristinaGilSanz                                         
-NicholasMason                                           
-RachelMeyers                                            
-NicolaIvory                                             
-RajendraAwasthi                                         
-DimitriyMasterov                                        
-rafaeldelgadoruiz                                       
-puttappadodmane3784                                     
-RajendraPaudel                                          
-vinitghedia                                             
-DominicThewlis                                          
-AditiPai2955                                            
-ChristopherMoore                                        
-nipunbatra                                              
-BarbaraChing                                            
-SafwanAhmad                                             
-NitinRughoonauth                                        
-ShrividhyaSrinivasan                                    
-CarolineHallam                                          
-OliverBridle                                            
-NileshKumar                                             
-IsabelBernal                                            
-NinaVyatkina                                            
-PaoloRomano                                             
-RalphAldredge                                           
-RaymondHamel                                            
-RafaelMunoz-Carpena                                     
-NigelKaye                                               
-DEShepherd                                              
-RandyReichardt                                          
-RaquelD.Moita                                           
-securityri                                              
-VarshaKhodiyar                                          
-RaymondDaniel                                           
-SitiPatonahMohamad                                      
-AnnetteChristy                                          
-RebekahPratt                                            
-ReganEarly                                              
-RaoulKamadjeu                                           
-Maria-JoseVarelaSalinas                                 
-Maria-JoseVarelaSalinas5294                             
-RamaGullapalli                                          
-JimRanalli                                              
-JeremyWithers                                           
-MiguelA.Martinez-Prieto                                 
-JulieDupouy                                             
-marykajewski                                            
-DennisGoldschmidt                                       
-kayur                                                   
-ShihuHu                                                 
-kateDemedeiros                                          
-osimod                                                  
-RebeccaDore                                             
-SaurabhShahane                                          
-nochance                                                
-RebeccaBryant                                           
-PaolaSgado                                              
-WinstonHide                                             
-RebeccaPointer                                          
-RicahrdTopgaard                                         
-RenseNieuwenhuis                                        
-RichardBoles                                            
-rcgrosado                                               
-JenniferWhitty                                          
-user50924                                               
-GaryBurd                                                
-lksdfasfdasdjkasdl                                      
-NaderTaheriQazvini                                      
-RiaandeJongh                                            
-AitorAmeztegui                                          
-RebeccaLawrence                                         
-IgorSteinmacher                                         
-ChristopheMoreau                                        
-manuelrodriguez-pascual                                 
-gaurav                                                  
-HyeriKim                                                
-MedhaPathak                                             
-ElenaMinonesMoyano                                      
-ChristopherBrisbin                                      
-PedroIncio5873                                          
-BernhardRiecke                                          
-MelanieBri                                              
-XavierREZAI                                             
-alisdairmcneill                                         
-PerrinBeatty                                            
-SandraMiguel                                            
-ToddKashdan                                             
-RichardKlasco9042                                       
-MairaNagel                                              
-SandroZampieri                                          
-MichaelRosenberg                                        
-IM                                                      
-RichMallett                                             
-LisaSchilling                                           
-nicolasMinc                                             
-PanagiotaPapakonstantinou                               
-RobertHastings                                          
-RobertMcgeachin                                         
-SalmanSamsonRogers                                      
-HeshamAttalla                                           
-RichardSherwood                                         
-richardwaites                                           
-ToveAndersson                                           
-RK                                                      
-RobertKosztyla                                          
-DevajyotiDeka3910                                       
-RobertAmanfu                                            
-RobertFekete                                            
-JoseRibamarFerreira-Junior                              
-RobertCook                                              
-RobertLew                                               
-RobertKincaid                                           
-MarianneGauffriau                                       
-RickBonnie7168                                          
-roberto.sassi                                           
-RomainTartese                                           
-RossGayler                                              
-RomainMelet                                             
-KatherineCullerton                                      
-RosieC                                                  
-RobinWilson                                             
-RobertoWillyanVerjulio                                  
-ThomasHolbrook                                          
-RyanFoster                                              
-RobinChampieux                                          
-RoozbehNaemi                                            
-RosemaryChang                                           
-rosyjan1775                                             
-RosemaryRodd                                            
-RyanWatkins                                             
-sambolton                                               
-saeidabolfazli                                          
-SaikatRay                                               
-sameergupta                                             
-JorgeMachado                                            
-SamDawkins                                              
-r-rellan-alvarez                                        
-RoxanneShirazi                                          
-SamirLemes                                              
-RyanPavlik                                              
-RucsandraMoldovan                                       
-SamanthaBlake                                           
-RonaldKumar                                             
-sack                                                    
-RussellWarne                                            
-RobKeery                                                
-RobinDrogemuller                                        
-SamSearle                                               
-ErinWashington                                          
-samuelbolton                                            
-SaMedicalJournal                                        
-ConsueloGonzalo                                         
-MarkWood                                                
-RuslanSalamatin                                         
-sammolyneux                                             
-hamadhedaya                                             
-JulioAlonso-Arevalo                                     
-OmarValsson                                             
-RodrigoGonzalez-Reyes                                   
-RobertParkes                                            
-JulieDunn                                               
-DavidHolstius                                           
-ns                                                      
-StacyKonkielTest                                        
-RobynSampson                                            
-aaronquincocesloren                                     
-ValeriGolev                                             
-GustavoGomezRodriguez                                   
-karthikteegalapalli                                     
-JuanaMorcillo                                           
-AmyDonahue                                              
-SarahPratta                                             
-DanielaDuca                                             
-GerritNiezen                                            
-ShanZhong                                               
-AimeeRoundtree                                          
-DavidHogg                                               
-InnocentAwasom4712                                      
-user50285                                               
-DebbieDonahue                                           
-JamesCarrington                                         
-DennysEduardoRossetto                                   
-SarahPurcell                                            
-user50049                                               
-ImreVida                                                
-thomaspalmer                                            
-SandraBraman0                                           
-sandiewong                                              
-MarialisaScata                                          
-StephanieHampton                                        
-DrBobPatton                                             
-Ruzinoor                                                
-SaraHart                                                
-DanForeman-Mackey9308                                   
-NeydaGilman                                             
-NickSurawski                                            
-SarahPassonneau                                         
-DhavalkumarThakker                                      
-StevenHamblin                                           
-SandyEdmonton                                           
-SebastianSchafer                                        
-AnaPorto                                                
-SarahMorton                                             
-SandroSperandei                                         
-SeverianoDosAnjosVilaboa8200                            
-MasaoTamasao                                            
-DiomidisSpinellis                                       
-christianbergeron                                       
-akarsharora                                             
-ZulfiqurAli                                             
-SasanPartovi                                            
-KristinTarbell                                          
-SasankoSekharGantayat                                   
-VenkataRamanaDuddu                                      
-ScottLarge                                              
-RupeshKumar                                             
-JensGempt                                               
-vinodyadav                                              
-RuteSofia                                               
-SamanEhsan1138                                          
-MatthewCampbell6950                                     
-MarkWare                                                
-MichalisGerolimos                                       
-LuisCardenas                                            
-MyronBruce                                              
-JonathanHammersley                                      
-KerryRoss                                               
-DaveHaans                                               
-ShannonFarrell                                          
-SeanHoban                                               
-NealHaddaway                                            
-SelindaBerg                                             
-SethShipman                                             
-sasakit                                                 
-ShakilaYacob                                            
-ChristophSteinbeck                                      
-birukou                                                 
-giovannidiveroli                                        
-KathleenCusters                                         
-ShatakshiPandit                                         
-KarinaCampista                                          
-ShrivatsIyer                                            
-ScottFrey                                               
-DanielBowen                                             
-EugenioJZoqui                                           
-ShahrzadMazhari                                         
-DevAnand                                                
-SilasRibas                                              
-SilvanSchmid                                            
-ManuelKuhs                                              
-VanessaBarolsky                                         
-RafGuns                                                 
-SharifKM                                                
-PaulChynoweth                                           
-user50333                                               
-slimanbensmaia                                          
-SheilaRyder                                             
-BarryIrwin5452                                          
-BrianHole                                               
-VincentBonin                                            
-StevenOffenbacher                                       
-ToongTjiekLiauw                                         
-SimonCoates                                             
-AGAtanasov                                              
-SilviaMelo-Pfeifer                                      
-RichardWelsh                                            
-FernandaPeset                                           
-SimonSwift                                              
-SimonBridge                                             
-Dominikstoll                                            
-JeffreyHsu                                              
-K.ChadClay                                              
-DominiqueFournier                                       
-SimoneBelli                                             
-SimonvanNorden                                          
-SteveAlexander                                          
-StefanTabacu                                            
-StevenEngler                                            
-SilviaGrimaldi                                          
-StefanMunnich                                           
-SteveQuarrie                                            
-StephenWilliams8458                                     
-SteveRamm                                               
-StevenOvadia                                            
-StefanAReinsberg                                        
-StevenESmith                                            
-JamieHanson                                             
-StephenHicks                                            
-StephanieGlegg                                          
-StaffanKarlsson                                         
-KateDry                                                 
-StefanieKethers                                         
-StephanieFitzgerald                                     
-StephenFrawley                                          
-StephaneBrutus                                          
-AndrewJohnston                                          
-StephenShea                                             
-stephenbarrass                                          
-JeffreyHeer                                             
-NabilBoudraa                                            
-SpencerKeralis                                          
-SusanLeemburg                                           
-SuzanneDuryea                                           
-SudhaBatchu                                             
-SueBlodgett                                             
-SusanMikkelsen                                          
-stuartyeates                                            
-sukhadamishra                                           
-SunhwanJo                                               
-SusanLavalley                                           
-BarbaraCostello                                         
-SusanJohnson                                            
-StoyanVergiev                                           
-SteveVanTuyl                                            
-StuartBretschneider                                     
-SureshKannan                                            
-StephenQuackenbush                                      
-SusanArchambault                                        
-StephanThilen                                           
-StephanieSimms                                          
-SusanBraxton                                            
-JamesCotton                                             
-SueWoodson                                              
-suniljoseph1                                            
-St-PierrePhilippe                                       
-TerrellRussell                                          
-SuzanneShurtz                                           
-StuartBretschneider3137                                 
-StuartAli                                               
-TakayukiHayashi                                         
-TainaSaarinen                                           
-SyrilPettit                                             
-TadaoHirota                                             
-TamarSadeh                                              
-user50899                                               
-TeresaMartins                                           
-TeresaSemedo                                            
-SuzannePorath                                           
-TerenceWalsh                                            
-SuzannePilaarBirch                                      
-SubhabrataMukherjee                                     
-Tarique                                                 
-TeresaSordeMarti                                        
-TheoBampouras                                           
-ThaliaWheatley                                          
-TarcizioSilva                                           
-TerjevanderMeeren                                       
-RicharddeGrijs                                          
-MaicolOspinaBedoya                                      
-SumbulJawedKhan                                         
-VictoriaMetcalf                                         
-TestttttTesttttt                                        
-ThorunnHelgason                                         
-testing123                                              
-KeithBennett                                            
-TinaChrzastowski                                        
-TiagoBraga                                              
-TaoZhang                                                
-TaraCataldo                                             
-TaylorNik                                               
-TiborKoltay                                             
-NormanLi                                                
-TiffanyVeinot                                           
-ThomasCropper                                           
-MohammadRahmanian                                       
-AnneLibby                                               
-ThomasUpton                                             
-thieme                                                  
-TimothyGreen                                            
-TiffanyBogich                                           
-user51054                                               
-PennyAndrews                                            
-ThomasRichter                                           
-ThomasSutherland                                        
-thomasaspray                                            
-JessicaOgden                                            
-PattayilJoy                                             
-ZhenlongLi                                              
-ThibautPAYEN                                            
-CostisDallas                                            
-user50535                                               
-PawelBiernat                                            
-AndrzejDabrowka                                         
-traversaro                                              
-sadafAbbasi                                             
-LisaAnderson                                            
-MichaelWangler                                          
-MasashiMiyano                                           
-NoraNikolac                                             
-YolandaCalvoDiaz                                        
-TomReinsfelder                                          
-TitusSchleyer                                           
-TomofumiOkuda                                           
-TongqiWei                                               
-TobyGreen                                               
-XiangYan                                                
-KellyCobey                                              
-SharonRankin                                            
-MadelineFarron                                          
-SoniaChiasson                                           
-VirginiaRivas                                           
-MarkWilson                                              
-XerardoXusto                                            
-TylerBackman                                            
-tl                                                      
-JieXu                                                   
-TroyMix                                                 
-ClarisseBarbier                                         
-TylerElliott                                            
-RyanScherle                                             
-GianmariaLiccardi                                       
-ElizabethTurtle                                         
-TobiasHaushahn                                          
-RachaelCraig                                            
-TomPike                                                 
-Tina(Test)Adams                                         
-AlexandreMantion                                        
-TingWu                                                  
-TN1982                                                  
-TonySantos                                              
-jesusvicente-carbajosa                                  
-TomGriffin                                              
-StacyTest                                               
-RobertHunt                                              
-TomasBaiget                                             
-user50128                                               
-user50045                                               
-UrsulaKelly                                             
-user50148                                               
-user50052                                               
-JermeyMatthews                                          
-TuomasEerola                                            
-TravisSimcox                                            
-ToddBryant                                              
-TudorOprea                                              
-ToddMitchell                                            
-TzuhengWu                                               
-user50087                                               
-user50050                                               
-user50040                                               
-user50068                                               
-RyutarohMatsumoto                                       
-UlrichSchroeders3723                                    
-JeffCain                                                
-user34644                                               
-user50043                                               
-nadiakhan                                               
-BertaDelgado                                            
-user50085                                               
-GarciaChus                                              
-user50091                                               
-user50095                                               
-user50096                                               
-user50137                                               
-user50145                                               
-UlrichDirnagl                                           
-user50125                                               
-user50191                                               
-NancyPontika                                            
-user50248                                               
-user50252                                               
-user50281                                               
-user50258                                               
-user50220                                               
-user50276                                               
-user50189                                               
-user50304                                               
-user50305                                               
-user50351                                               
-user51334                                               
-user50309                                               
-user50262                                               
-user50264                                               
-LV                                                      
-user50269                                               
-NancySchiller                                           
-user50260                                               
-StanleyColcombe                                         
-user50306                                               
-user50214                                               
-user50270                                               
-user50231                                               
-user50228                                               
-user50378                                               
-user50353                                               
-user50232                                               
-user50166                                               
-user50184                                               
-user50223                                               
-MartinFitzpatrick                                       
-PrashantiManda                                          
-ChristinaClarke                                         
-maryamokhovati                                          
-MartinEnsslen                                           
-JohnBarile                                              
-JimCaryl                                                
-FiberFuseInfo                                           
-YaxinZhao                                               
-NathalieCornee                                          
-PravinKamble                                            
-StephaneLeDizes                                         
-user50458                                               
-user50367                                               
-IbironkeLawal                                           
-PeterTennant                                            
-KattyRohoden                                            
-DianeDeLuco                                             
-SusanaMorales                                           
-JyotiranjanSahoo                                        
-MuratEkici                                              
-TiagoChiavegatti                                        
-JonathanTapson                                          
-LindseyEdwards                                          
-user50031                                               
-AlanMaddock                                             
-Hyang-MinByun                                           
-user50053                                               
-AimanTulaimat                                           
-ChristineMcDonald                                       
-CuiyingMu8347                                           
-user50451                                               
-user50544                                               
-GrantAbt                                                
-DouglasThomson                                          
-AhmetErdemir                                            
-MayaBialik                                              
-DietrichVolmer                                          
-user50420                                               
-user50536                                               
-user50393                                               
-user50392                                               
-user50526                                               
-user50405                                               
-user50445                                               
-user50480                                               
-MassimoPollifroni                                       
-user50414                                               
-metwalyaly                                              
-user50419                                               
-user50518                                               
-user50389                                               
-user51159                                               
-user50387                                               
-user50380                                               
-user50437                                               
-user50474                                               
-user50523                                               
-user50379                                               
-user50493                                               
-user50396                                               
-MichaelDavies                                           
-user50541                                               
-user50545                                               
-user50453                                               
-user50497                                               
-user50680                                               
-user50683                                               
-user50413                                               
-user50400                                               
-user50624                                               
-user50634                                               
-user50606                                               
-user50383                                               
-YlvaSommerland                                          
-user50584                                               
-user50647                                               
-user50660                                               
-user50601                                               
-KevinRead                                               
-user50659                                               
-user50547                                               
-user50563                                               
-user50598                                               
-user50655                                               
-user50656                                               
-user50666                                               
-user50618                                               
-user50701                                               
-user50564                                               
-user50651                                               
-user50588                                               
-user50780                                               
-user50880                                               
-user50727                                               
-user50699                                               
-user50668                                               
-user50698                                               
-GuillermoArmandoRondaPupo                               
-user50643                                               
-user50815                                               
-user50836                                               
-user50752                                               
-user50800                                               
-user50719                                               
-AllisonBrungard                                         
-StephenHicks88                                          
-MichaelCalver                                           
-user50745                                               
-user50940                                               
-user50760                                               
-user51332                                               
-StevenBernstein                                         
-RachelNowak                                             
-user50786                                               
-user50821                                               
-user50843                                               
-user50835                                               
-user50906                                               
-user50853                                               
-user51074                                               
-user50860                                               
-user50859                                               
-user50901                                               
-user50722                                               
-user50723                                               
-user50915                                               
-user50741                                               
-user50941                                               
-user50742                                               
-user50923                                               
-user50896                                               
-user50734                                               
-user50776                                               
-user51094                                               
-malcolmmccallum7022                                     
-user51000                                               
-user50955                                               
-user50949                                               
-user50970                                               
-user51088                                               
-user51086                                               
-user50963                                               
-user51035                                               
-user50968                                               
-user51026                                               
-user50972                                               
-JasonPerlmutter                                         
-PhilippeGuy                                             
-user50981                                               
-user51043                                               
-AllisonCarr                                             
-user51017                                               
-SandraMakwembere                                        
-user51168                                               
-user51226                                               
-user50971                                               
-user50988                                               
-user51053                                               
-user51002                                               
-HendrikWagenaar                                         
-VikaA.Kovariansi                                        
-user51051                                               
-SamanthaKSaland                                         
-user50994                                               
-user50993                                               
-user50980                                               
-user51038                                               
-user51068                                               
-user51046                                               
-user51284                                               
-user51285                                               
-user51227                                               
-user51262                                               
-user51012                                               
-user51213                                               
-user51243                                               
-SMuralithar                                             
-peerj                                                   
-user51275                                               
-StevenHarvey                                            
-user51255                                               
-AlonsoEstradaCuzcano2949                                
-user51258                                               
-SimonHodgson                                            
-user51097                                               
-MatthewBThompson                                        
-user51232                                               
-user51123                                               
-user51180                                               
-SachinThakre                                            
-Juxi                                                    
-user51270                                               
-user51215                                               
-user51099                                               
-user51111                                               
-MatthewCampbell                                         
-user51126                                               
-user51239                                               
-user51157                                               
-user51161                                               
-user51228                                               
-user51146                                               
-user51121                                               
-ValWooff                                                
-user51192                                               
-user51230                                               
-user51391                                               
-user51175                                               
-user51306                                               
-user51717                                               
-DavidSheridan                                           
-SaikiranChandha                                         
-ElitaBaldridge                                          
-user51455                                               
-FerdinandoPucci1641                                     
-user51343                                               
-user51383                                               
-user51465                                               
-user51378                                               
-user51296                                               
-user51506                                               
-user51504                                               
-user51527                                               
-JackMartin                                              
-VitorDuarteTeodoro                                      
-user51401                                               
-ArpitaIddya                                             
-user51528                                               
-user51520                                               
-user51322                                               
-user51312                                               
-RachelGlover                                            
-user51397                                               
-user51471                                               
-MiriamBlake5578                                         
-user51511                                               
-user51535                                               
-user51404                                               
-user51519                                               
-KatherineAkers                                          
-user51423                                               
-ErikMullers                                             
-AndreaMarchitelli                                       
-BenjaminHaibe-Kains                                     
-user51326                                               
-IsaacG.Darriba                                          
-benmudrak                                               
-victorzarate                                            
-user51365                                               
-user51453                                               
-user51434                                               
-JessicaLindholm5944                                     
-user51298                                               
-StanislavLapinski                                       
-user51615                                               
-user51715                                               
-user51686                                               
-user51565                                               
-HanZhang                                                
-NihaMohanKulshreshtha                                   
-user51687                                               
-user51601                                               
-JuanaSeoaneAntelo                                       
-user51736                                               
-ChristopherMoore3231                                    
-user51536                                               
-user51638                                               
-YueZhao                                                 
-user51629                                               
-user51700                                               
-user51625                                               
-arychiu                                                 
-user51575                                               
-user51574                                               
-user51573                                               
-user51690                                               
-user51902                                               
-user51973                                               
-user51635                                               
-user51602                                               
-user51594                                               
-user51873                                               
-user51633                                               
-user51708                                               
-user51740                                               
-user51630                                               
-TobiasWarnecke                                          
-CengizHakanAYDIN                                        
-user51691                                               
-user51663                                               
-user51710                                               
-user51659                                               
-user51850                                               
-user51964                                               
-VanesaLoureiro                                          
-user51896                                               
-user51782                                               
-user51894                                               
-user51944                                               
-user51777                                               
-user51874                                               
-user51942                                               
-AlexLancaster                                           
-user51967                                               
-user51834                                               
-refset-8c8dni                                           
-DavidRibar                                              
-ShivanandGuness                                         
-user51876                                               
-user51761                                               
-user51771                                               
-user51939                                               
-user51788                                               
-user51787                                               
-user51805                                               
-user51922                                               
-user51801                                               
-VamsiKodali                                             
-VanessaCampanacho                                       
-victoriacatenacci                                       
-VictoriaWhite                                           
-VadimGureyev                                            
-user51938                                               
-user51891                                               
-user51904                                               
-user51798                                               
-user51888                                               
-RonaldMonson                                            
-XiaoleiHuang                                            
-AbhayA.Sagade                                           
-VeerleVanDenEynden                                      
-user51984                                               
-VasileiosFotopoulos                                     
-bmpvieira                                               
-AndyShepherd                                            
-PaolaAmar                                               
-VangelisTsiligiris                                      
-miluozhang                                              
-VickyGrant                                              
-VickiTedeschi                                           
-TomoyasuMani                                            
-PaulSchacht                                             
-AndyByers                                               
-user51982                                               
-vamsikodali3387                                         
-GeorginaAdams                                           
-ValerieFridmacher                                       
-user51987                                               
-user51976                                               
-VictorianoIzquierdo                                     
-ValeryRidde                                             
-VijayKumarChakka                                        
-VicenteFranciscoGonzalezAlbuixech                       
-VerityOliver                                            
-veerendrasagar                                          
-WeiJeng                                                 
-VasilisPromponas                                        
-victorbailey                                            
-VeroniqueLejard                                         
-walshji                                                 
-VinitkumarSingh                                         
-WaltonJones                                             
-VioletaGarcia-Hernandez                                 
-PaolaDeCastro                                           
-VipulMathur                                             
-VineetYadav                                             
-HubbardBrook                                            
-InmaManteconFernandez                                   
-danielestevez                                           
-CarmelaMento                                            
-user51752                                               
-VirginiaWotring                                         
-komalsharma                                             
-AnneAxel                                                
-VincentDelafont                                         
-WeiYang                                                 
-WilliamMichener                                         
-WilliamBarnett                                          
-FRANCISCOJOSECELADACAJAL                                
-VladiMir                                                
-VincentCosta                                            
-AlbertRefiti                                            
-EmilyDobbs                                              
-GemmaTaylor                                             
-SusanaTorres                                            
-ChristopherBrown7738                                    
-WilliamFyson                                            
-Wei-TingLu                                              
-WendyCRobertson                                         
-WilliamTyler                                            
-XavierBofill-DeRos                                      
-user51682                                               
-AntonioJMatas                                           
-ZsofiaDemjen                                            
-JamesBlack                                              
-WenhaoJiang                                             
-wundo                                                   
-WilliamBanks                                            
-Wladyslaw-Marek-Kolasa                                  
-wmijnhardt                                              
-WilfredMijnhardt                                        
-LinziKemp                                               
-WilliamVencill                                          
-WendaRamma                                              
-WeiYang76218                                            
-NicholasKing                                            
-YongliLI                                                
-YizheChen                                               
-XiangmingDing                                           
-MiguelMatias                                            
-YvonneBelanger                                          
-ZdenaDobesova                                           
-AmberStechman                                           
-XiaoboHuang                                             
-ZacharyWeinberg                                         
-YulyeJessicaRomoRamos                                   
-YunuenMontelongo                                        
-YuncongChen                                             
-ykeskin                                                 
-BenLaufer                                               
-ZsoltMagyar                                             
-xx                                                      
-VilleJokinen                                            
-zashktorab                                              
-ZakharMaletskyi                                         
-OsmanBerkUSTA                                           
-MaryWeiser-Evans                                        
-PennyCrook                                              
-AlejandroValverde                                       
-ElizabethFitzgerald                                     
-SiddeswaraGuru                                          
-AnnAgee                                                 
-LaurenAlbrecht                                          
-BruceGerman                                             
-LauraSymul                                              
-user51189                                               
-FranciscoJEsteban                                       
-MarybethMcCartin                                        
-AndreeRathemacher                                       
-user50567                                               
-BreeGrillo-Hill                                         
-mortezasadeghi                                          
-monicarettig                                            
-ClaytonSinyai2                                          
-JacobRatliff                                            
-user51634                                               
-user50934                                               
-PhaedraCress                                            
-JayHesselberth                                          
-BrandenTarlow                                           
-BruceBecker                                             
-MarionWalton                                            
-BrendanSinnamon                                         
-Eui-HyeokYang                                           
-user50796                                               
-CG                                                      
-wongffa                                                 
-YvoSmulders                                             
-AntonEnright                                            
-VirveSarapik                                            
-BokaiZhu                                                
-FrankA.Stengel                                          
-JavierRecari                                            
-MariaMedin                                              
-BriannaMarshall                                         
-aronwalsh                                               
-CaraWong                                                
-DanielDeCarvalho                                        
-EdwardStrong                                            
-MirkoBischofberger                                      
-ScottEacott                                             
-EricHaaland                                             
-HamzehaliNourmohammadi4607                              
-olivierjoannes-boyau                                    
-JohanSeijsing                                           
-MicheleMauri                                            
-BramLuyten                                              
-user51044                                               
-ChadHewitt                                              
-lianataverniti                                          
-AndreGorgens                                            
-BradChapman                                             
-JanSchmoranzer                                          
-MariaParga                                              
-CallumCampbell                                          
-KateGanski                                              
-yosukemaruyama                                          
-JeffTsao                                                
-YongchaoYang                                            
-GabyFachler                                             
-ChristinaPikas                                          
-LizDennett                                              
-PaulKemp                                                
-JohnLannin                                              
-anaNuno                                                 
-nahidlotfian                                            
-RubenBouzas                                             
-DanielLinares                                           
-syamilic                                                
-XSEDEtheExtremeScienceandEngineeringDiscoveryEnvironment
-ZahidManzoor                                            
-HedderikvanRijn                                         
-SidaWang                                                
-AkiVehtari                                              
-AndyDeSoto                                              
-CraigEvans                                              
-vahidgharebaghloo                                       
-EricKaufmann                                            
-IlyaRusin                                               
-LewisShapiro                                            
-tnhh                                                    
-AlfredoGutierrezBorrero                                 
-RajeevKrishnadas                                        
-ndanthi                                                 
-FrankOMara                                              
-EmilieMainz                                             
-monique.prime                                           
-BernhardWesels                                          
-AlexanderPisarchik                                      
-KateHudson                                              
-MarthaSofiaGonzalez-Insuasti                            
-JanetCrum                                               
-LarysaNadolny                                           
-DipenSinha                                              
-EricMorgan                                              
-CarolDeering                                            
-JoséAlfredoSánchez                                      
-YasamKemalAkpak                                         
-JonathanErvine                                          
-ErickdelaBarrera                                        
-saraserag                                               
-JoãoFerreira                                            
-LauraPasquini                                           
-MonaKamar                                               
-ghasemomidali                                           
-user50211                                               
-LauraPyle                                               
-RonGilmour                                              
-RobertaBrandao                                          
-JensErling                                              
-CaroleWeaver                                            
-asddsf                                                  
-heatherwright                                           
-user50044                                               
-CorinneGray                                             
-sa                                                      
-LauraPapaleo                                            
-MuharremBayraktar                                       
-MarcelSilva                                             
-AndrewLucas                                             
-anahibalbi                                              
-MohammadMhadiRoozbahani                                 
-HannahDugdale                                           
-DanielFriess                                            
-AndreasPoehlmann                                        
-PhilipShapira                                           
-SujoyDasgupta                                           
-JulianOlden5398                                         
-LorieKloda                                              
-SharonYang                                              
-MariaGutierrezCalvete                                   
-jgieseking                                              
-LailaSimpson                                            
-VirginiaArechavala-Gomeza                               
-CarolineMbogo                                           
-AmitYadav                                               
-testme2                                                 
-JuusoParkkinen                                          
-KunalGaneshpure                                         
-Alex.H.Taylor                                           
-JoVerbeeck                                              
-KellyGrossmann                                          
-JuanAntonioMoriano                                      
-BabakArdekani                                           
-AnnScherzinger                                          
-Jian-RongYang                                           
-NancyLaGreca                                            
-MaggieZraly                                             
-JordiLandier                                            
-JohnSondek                                              
-DellHorey                                               
-LukasKlement2618                                        
-RobertCHampshire                                        
-LukeCraven                                              
-DeborahSills                                            
-DaniloBlank                                             
-TinaNeville                                             
-MichelleBrady                                           
-AleezaGerstein                                          
-GaetanoInvernizzi                                       
-ToddCzubek                                              
-BarbaraKieslinger                                       
-JasonHart                                               
-SaraMitha                                               
-MatthewFitzpatrick                                      
-user51060                                               
-StephenEuston                                           
-raffaelemarchetti                                       
-KatherineChew                                           
-TomSteele                                               
-AlexanderKubisch                                        
-AnkurSaxena                                             
-user50208                                               
-SteveBrantley                                           
-MollyWaring                                             
-GloriaHayden                                            
-DannSklarew                                             
-HamzehaliNourmohammadi                                  
-CameronStow                                             
-DarrenBoehning                                          
-StevenHuff                                              
-JoshuaTHurman                                           
-DAVIDANDERSON                                           
-GholsonLyon                                             
-DanielBeucke                                            
-FernandaFoertter                                        
-DmitryGrapov                                            
-user50177                                               
-StavrosZenios                                           
-NikDholakia                                             
-AsgerVaeringLarsen                                      
-JosieAhlquist                                           
-CeliaEmmelhainz                                         
-HughCarroll                                             
-AlexZhang                                               
-JoseM.Lopez-Novoa                                       
-AbdhielArnaldoBustamanteNavarrete                       
-user50282                                               
-TamsinEdwards                                           
-AlistairMalcolm                                         
-BenSikes                                                
-JonWilkins                                              
-ehsanhosseinian                                         
-DanielBride                                             
-BobetteWolski                                           
-ErikBlack                                               
-MaryEllenSloane                                         
-ThomasPrellberg2                                        
-isabellevila                                            
-negaresma                                               
-RonHackney                                              
-ThomasPrellberg                                         
-FrancescaDanesi                                         
-rabindradalei                                           
-PujaSingh                                               
-LesanthaChathuranga                                     
-EhsanM                                                  
-EmilieAspray                                            
-BrunoNeves                                              
-AmaliaArvaniti                                          
-MarcoBaciarello                                         
-TatsuoShibata                                           
-MaggieRWagner                                           
-ShawnGraham                                             
-SilvioPeroni                                            
-PrashantGupta                                           
-MichaelWillis                                           
-user50072                                               
-JenniferThomas                                          
-AngelaLorena                                            
-MartaPerez                                              
-CarlAnthony                                             
-LibioHuaroto                                            
-JeffWilliams                                            
-RodriguezTeresa                                         
-SriAmudhaS                                              
-susanyan                                                
-MJLopez                                                 
-ChrisHughes                                             
-maryvalverde                                            
-RussellGray                                             
-CristhianParra                                          
-PaulPrinsloo                                            
-KatherinePiatek                                         
-AnneMidwinter                                           
-BrianPlouffe                                            
-ThomasDoyle                                             
-emiliobesada                                            
-JamesCunningham                                         
-NolanNichols                                            
-ThomasAlderson                                          
-DominiqueAdriaens                                       
-ArtemiosVoyiatzis                                       
-TamaraPianos                                            
-ShichengXu                                              
-BishnuThapa                                             
-UnivalleHealthResearch                                  
-VincentBond                                             
-IanPeake                                                
-jjjj                                                    
-CarstenFelden                                           
-DebVerhoeven                                            
-JamesAnderson                                           
-MarkSujan1673                                           
-KieranOSullivan                                         
-JenEaster                                               
-AniruddhaBelsare                                        
-DavidBerardan                                           
-MartinRees                                              
-SusanPowelson                                           
-JulioAltamirano                                         
-BryanWong19689                                          
-JayaseelanMurugaiyan                                    
-ChrisBarclay                                            
-DavidFiander                                            
-SatishMunnolli                                          
-EmilianoSpezi                                           
-FernandoCagua                                           
-SouthAfricanJournalofScience                            
-NuriaCodina                                             
-JuanFelipeBotero                                        
-MartinBrandle                                           
-DanielHalperin                                          
-melissacadnapaphornchai                                 
-SarahGallagher3813                                      
-youkai                                                  
-JohnHolloway                                            
-AlexHardisty                                            
-LBenny                                                  
-PeterCumpson                                            
-Josemarchenadominguez                                   
-JulieKwan                                               
-RafaelS.deSouza                                         
-UPNEETSOKHI                                             
-edwardallen                                             
-Gil-SooHan                                              
-FlorenceDebarre                                         
-DanielStageman                                          
-CostantinoBalestra                                      
-AbdullahKahraman                                        
-JuliaSollenberger                                       
-TimothyCarter                                           
-EdgarHuang                                              
-LanceW.ChristiansenDO                                   
-JacquelineRadebaugh                                     
-InaKopp                                                 
-NinaMaskulin                                            
-EliasCastanas                                           
-JimScrivens                                             
-AnnieHughes                                             
-user38247                                               
-MichaelTryby                                            
-BarbaraFister                                           
-saeidsafavi                                             
-HelenaGomes                                             
-ariespirgel                                             
-LeonieNicholas                                          
-MihaelaBanekZorica                                      
-KatieEvans                                              
-AlbertA.Antolin6523                                     
-christianpearce                                         
-LynneFox                                                
-yuliyang6221                                            
-Sivasai_Balivada                                        
-gianinacabanilla                                        
-WilliamCullerneBown                                     
-AndrewOfstehage                                         
-AirinaAlenyevna                                         
-EdiPrifti                                               
-ChristopherBrewster                                     
-PaulGrace                                               
-AlexHolcombe                                            
-PavithraViswanath                                       
-CharlotteBrown                                          
-CatherineArrese                                         
-farahnaznaderi                                          
-TomaszDurakiewicz                                       
-KateAnderson1350                                        
-TimKastelle                                             
-JorgeGoncalves                                          
-INMAltmetrics                                           
-SairaMathew                                             
-MichelaMOntesi3382                                      
-FranciscoMorey                                          
-RebeccaPriestley7478                                    
-OwenChurches                                            
-OliviaWu                                                
-CharlesPence                                            
-ReneeHsia                                               
-DanielMacqueen                                          
-GeorgeLan                                               
-VladimirTrajkovski                                      
-yuliyang                                                
-SaraStudwell                                            
-JamesWilson                                             
-NIOO-KNAW                                               
-MichaelPaulus                                           
-BranimirCacic                                           
-MariliaAntunez                                          
-CraigFry                                                
-kevincarvalho                                           
-SuzanFiack                                              
-CarloDuprel                                             
-IoannisNGrigoriadis                                     
-AntonyDEmanuele                                         
-WendyKopf                                               
-jackstilgoe                                             
-IlkinSabiroglu                                          
-CarriePrice                                             
-LinlinZhao                                              
-RyanWright5080                                          
-JuanAntonioMorenoMurcia                                 
-StefanoPluchino                                         
-XinLi                                                   
-BobRudis                                                
-stefanomariaiacus                                       
-LuisAndreValeSilva                                      
-LizzyRolando                                            
-WendyK.TamCho                                           
-AndrewJohnson                                           
-DanielReirden                                           
-MattCunningham                                          
-KatieHarding                                            
-KateSeers                                               
-JonRitterbush                                           
-DavidCarter                                             
-StephenGarrett                                          
-Dr.MuhammadShoaibAhmedani                               
-MartinPatrick                                           
-KevinDKohl                                              
-charlaganov                                             
-ColinWilliams                                           
-DrMayankTrivedi                                         
-ZoePrytherch                                            
-BlancaRodriguez                                         
-ThomasBackhaus                                          
-TriantafyllosKaloudis                                   
-TomJohnstone                                            
-MarcHesse                                               
-RickBonnie                                              
-NancyGreco                                              
-EndymionCooper1530                                      
-MarkdeBruyn                                             
-SharynWise                                              
-OlgaJarrin                                              
-GiedriusVanagas                                         
-VirginiaBarbour                                         
-EdHarris                                                
-RachelOConnor                                           
-ArpanMohanty                                            
-LinglyTseng                                             
-BaiXiaomei                                              
-KalliatValsaraj                                         
-EmmaYearwood                                            
-StevenHoi                                               
-MentewabAyalew                                          
-kskinui                                                 
-AlexisRebolledo                                         
-KevinShakesheff                                         
-MarkFerguson                                            
-ThomasLemberger                                         
-user50962                                               
-LindseyHeagy                                            
-KennethKeiler                                           
-GrantPenny                                              
-vinaykumarkondeti                                       
-PaulaCallan                                             
-BerniePope                                              
-PamDawson                                               
-PhilippAltmann                                          
-AkshayRaut                                              
-NynkeJoSmit                                             
-RachelHendery                                           
-MichaelReilly                                           
-ManuelArcilaGarrido                                     
-TERNAEKOS                                               
-jeroenraes                                              
-JackieEdwards                                           
-ZEWAltmetrics                                           
-RobertRicci                                             
-J.KirkHarris                                            
-MattWood                                                
-AssignmentIndia                                         
-ShaneHanlon                                             
-CGrantSussex                                            
-NadirWeibel                                             
-SarahGallagher5515                                      
-GloriaRamaboea                                          
-nkigen                                                  
-LeahMakley                                              
-ElinCharles-Edwards6830                                 
-EhsanGhafari                                            
-JohnCherrie                                             
-KellyE.Miller                                           
-AMichaelFroomkin                                        
-BlakeStamps                                             
-JonathanLeeGibson                                       
-SharonMajchrzak-Hong                                    
-stefanievandevijvere                                    
-AlexandreCamargoMartensen                               
-KaylaBrooks                                             
-WenZhang                                                
-BriettaPike                                             
-marcushanwell                                           
-PaulMerritt                                             
-mangkhollensingson                                      
-NebojsaDavcik                                           
-EnriqueVivoni                                           
-CatherineCronin                                         
-VincentCho                                              
-SophiaNimphius                                          
-JoyBose                                                 
-IOMAltmetrics                                           
-GaborCsardi                                             
-TracieFrederick                                         
-KatsumiHashimoto                                        
-IoannisMatsangouras                                     
-AlexanderGorban                                         
-JosiqueLorenzo                                          
-KatieMcCallum                                           
-SandeepGantotti                                         
-AmigoMonica                                             
-DaveTang                                                
-AmyKirby                                                
-JosephMonaco                                            
-EugeneBarsky                                            
-JoseV.Die                                               
-MertKorkali                                             
-YangWu                                                  
-EhsanMohammadi9110                                      
-MikeSmorul                                              
-HelenEdwards                                            
-ZlatinaKazlacheva                                       
-MartijnSlot                                             
-JulianaReis                                             
-AbhishekNagaraj                                         
-MiguelAndrade                                           
-epistemographer                                         
-ChayanikaBarman                                         
-JuanGaitan                                              
-Armendariz-SanchezSaul                                  
-TomaszZuradzki                                          
-MarkGenung                                              
-EricBrown                                               
-TessaJones                                              
-user50188                                               
-RomainTartese8087                                       
-KatherineHall                                           
-NicholasMay                                             
-JeffreyDrazen                                           
-AraKooser320                                            
-SpencerBliven                                           
-BruceConnolly                                           
-GeorgeSoliman                                           
-ErikaGoble                                              
-FangLin                                                 
-user51385                                               
-SylviaGeorge-Williams                                   
-PetriKursula                                            
-JeffreyIanRoss                                          
-PatrickTDolan                                           
-AdelAladwani2535                                        
-MarkAberdour                                            
-RichardDavis                                            
-JeffChristiansen                                        
-AnthonySalvagno                                         
-stacykonkiel4106                                        
-BeatrizDiazPauli                                        
-urizlopezmariadelcarmen                                 
-KimberlyLenters                                         
-KennethWelch7955                                        
-IsabelleEngeli                                          
-GordonWarren                                            
-PatriciaSayre-McCoy                                     
-JanMagnusson                                            
-Mary-AnnClarkes                                         
-JoaoViana                                               
-JimLeFager                                              
-KirkHevener3707                                         
-JodyHoesly                                              
-KateRadford                                             
-AndrewMackinnon                                         
-amycook                                                 
-TimSeal                                                 
-JenniferStockdale                                       
-CatherineLemmer                                         
-GerbenZaagsma                                           
-KatiaChornik                                            
-LiubkaTrujillo                                          
-KylieSadler                                             
-asad                                                    
-AnthonyPatterson2826                                    
-JonEickmeier                                            
-MelChua                                                 
-JongHa                                                  
-JasonNoble                                              
-TonyHolder                                              
-manuel-mariaortega-marlasca                             
-GinaChiodo                                              
-AndrewHopkins                                           
-goaway                                                  
-WillMorgan                                              
-DIWAltmetrics                                           
-AliciaTimme-Laragy                                      
-JamesRising                                             
-zohrehabbassi                                           
-ChristineBrodeur                                        
-AsgerVringLarsen                                        
-BenjaminHarris                                          
-iSEEM                                                   
-CemalArdil                                              
-MatthewMarsteller                                       
-ChrisDeBlois                                            
-ChelsieLalonde5572                                      
-user50092                                               
-user50295                                               
-KenPrehoda                                              
-TomPriddle                                              
-ReedBJacob                                              
-EmanuelCarrilho                                         
-WilliamCWetzel                                          
-KelliTrei                                               
-MatthewOldach                                           
-JochenApel                                              
-BrianRichards                                           
-JorisEekhout                                            
-tttt                                                    
-ddfdfdfddfdffdfd                                        
-SimonBush                                               
-AlanMorrison                                            
-kikoyamaguchi                                           
-VeronikaZhukova                                         
-user51426                                               
-DavidCisneros                                           
-JulieMundy-taylor                                       
-IBIMAPublishing                                         
-AlexandraNoronha                                        
-MilanDelor                                              
-MikeShallcross                                          
-T.H.M.Gellar-Goad                                       
-MichaelHutchins                                         
-MichaelJeltsch                                          
-ChrisCameron                                            
-FranckRamus                                             
-ChristineBrodeur2186                                    
-TransitoFerreras-Fernandez                              
-HelenPalm                                               
-DirkLangenberg                                          
-LisaFederer9563                                         
-AlisonJeppesen-Wigelsworth                              
-KevinFowlks                                             
-ThomasTurner                                            
-FrankFrank                                              
-EvanKingsley                                            
-Carlos-Garcia-Zorita                                    
-KatieFortney                                            
-MartinCallanan                                          
-sjwatsonecology                                         
-andremchagas                                            
-Jean-ChristophePeyssard                                 
-MattHolland                                             
-PatriciaBellamy                                         
-MilivojKuzmic                                           
-MinvydasRagulskis                                       
-LoriBrown                                               
-RichardLuxton                                           
-EverlyBrown                                             
-JianLi                                                  
-EdwardMorrow                                            
-KesSchroer                                              
-thomas.hanne                                            
-user50758                                               
-ChristopheCloquet                                       
-GianfrancoBuccheri                                      
-GilesCarden                                             
-KimberlyMeltzer                                         
-SergioMartinez                                          
-justinbroglio                                           
-KimSnary                                                
-IanHutchins                                             
-LeslieHolland                                           
-AndreaZanni                                             
-DeweiTang                                               
-AlexeiVernitski                                         
-LarissaShamseer                                         
-KirsiJaatinen                                           
-arashsadrieh                                            
-GiriKrishnan                                            
-KirstinPoot                                             
-CourtneyMatthews                                        
-BobSidhu                                                
-GlynisJones                                             
-ColeTrapnell                                            
-ejmasicampo                                             
-NatalieThompson                                         
-AlexWade                                                
-ZMTAltmetrics                                           
-SimonScientist                                          
-DarrenLogan                                             
-MarindaGriffin                                          
-CristobalUrbano                                         
-KimberlyYang                                            
-CoreyBradshaw                                           
-DanieleGiacobello                                       
-GiorgioLocatelli                                        
-khaledNoubani                                           
-Krissoff                                                
-KirbyShannon                                            
-StephenDewhurst                                         
-Gheorghe-DoruRoiban                                     
-RoxanaHickey                                            
-dlipps                                                  
-M                                                       
-EmilyRich                                               
-VesaOikonen                                             
-KristinaSheeler                                         
-KlaasSchouten                                           
-Fritz_Sager                                             
-ArildWaeraas                                            
-KundanNepal                                             
-KrzysztofLamorski                                       
-kpmansfield                                             
-HerderAltmetrics                                        
-GaryMcKeown                                             
-AdamWorrall                                             
-wgoldman                                                
-AlisonGBoyer                                            
-Christoudias                                            
-laetitialepourhiet                                      
-MarkStillwell                                           
-KonradKording                                           
-JeffHebert                                              
-klauszinoecker                                          
-MariahMeek                                              
-OmotadeOloyede                                          
-PedroIncio                                              
-KyleGrayson                                             
-NaerJournal                                             
-JoaoPLeitao                                             
-PaulMatson                                              
-richardtelford                                          
-KyleHuston                                              
-NatalieHelbig                                           
-LaraSkelly                                              
-JasonZevin                                              
-KwartalnikEdukacja                                      
-AndersLanzen                                            
-MubarakAlkhatnai                                        
-BrendanCantwell                                         
-LarsPenke                                               
-AmyKoshoffer                                            
-AnnaRemington                                           
-ChristophRensing                                        
-JohnAlbarran                                            
-AndrewByrne                                             
-GunalpUzun                                              
-AndyGardner                                             
-GuyLeonard                                              
-LauraKelley                                             
-LaurenLeighton                                          
-EliotMcIntire                                           
-LaurenHarris                                            
-AndreSoares                                             
-LauraMcLellan                                           
-LauraDevenney                                           
-lekaaakaaal                                             
-ArielLira                                               
-BenEggleston                                            
-BlueObelisk                                             
-ChaomeiChen                                             
-LauraLagier                                             
-JanL                                                    
-ArtemKozlov                                             
-EdwinWang                                               
-FranciscoCuevas-Muniz                                   
-AndrewLetten                                            
-IanStevenson                                            
-NinaExner                                               
-LouisdeKoker                                            
-LaurentLefort                                           
-LaurenWare                                              
-LaVerneGray                                             
-LaurenPressley                                          
-CamiloCorchuelo                                         
-PalPacher                                               
-EmilienSchultz                                          
-ShermanDorn                                             
-BriaParker                                              
-TylerSmith                                              
-LesaMitchell                                            
-HamidHashemi                                            
-DanielKoenig                                            
-ArtDewulf                                               
-CaroleBrault                                            
-ArkoLucieer                                             
-LeonardRome                                             
-ritayanmitra                                            
-AleAlgra                                                
-JaimeBlanck                                             
-MariaLourdesQuiroaHerrera                               
-ScottKilgariff                                          
-RenskevanWijk                                           
-ZacharyCasey                                            
-MariaLourdesQuiroaHerrera8951                           
-GiuliaZanetti                                           
-AlessandroFoi                                           
-CarloMorasso8764                                        
-KandaceKnudson                                          
-HuiLin                                                  
-RobertAnnett                                            
-LesAnsley                                               
-CarolTilley                                             
-DuncanParkes                                            
-AlfonsoAguilar-Perera                                   
-GulleyLab                                               
-arne                                                    
-WillRussell                                             
-BryanPon                                                
-MichaelGrady                                            
-korydonsmith                                            
-MichaelHeron                                            
-CarolynMilla                                            
-MykaEstes                                               
-andrewkretz                                             
-AdamMarblestone                                         
-ProfRiemer                                              
-davidnolfi                                              
-MichaelDeNotto                                          
-HamiltonVarela                                          
-HeatherCooper                                           
-RosanaFerrero                                           
-NathanSorenson                                          
-michaelgonzalez                                         
-PhilippeApparicio                                       
-W.RheaIngram                                            
-MarkusDahlem                                            
-madeleineball                                           
-SebastianSchornack                                      
-SethBigelow                                             
-IanOBoyle                                               
-EikeLurz                                                
-MichaelGerlek                                           
-MichaelHendricks                                        
-LindaBannister                                          
-EricLofgren                                             
-LuciaTome                                               
-LindaSandstrom                                          
-PeterKille                                              
-HenrikToftSimonsenHenrikToftSimonsen                    
-MichaelCurtin                                           
-CarolLucke                                              
-CarlosGardeazabalBravo                                  
-LilianFriptuleac                                        
-MichaelHabib558                                         
-HamadAlshetaiwi                                         
-colm                                                    
-MallikarjunDora7443                                     
-DominiqueTaylor                                         
-richardridge                                            
-IanGibson                                               
-JerdaineSterling                                        
-ClaudioRiccomini                                        
-KurtThorn                                               
-AshrafMaleki7598                                        
-LionelVincent                                           
-sarakyeo                                                
-Li-PenWang                                              
-SarahRoseCavanagh                                       
-user51333                                               
-kml                                                     
-JeremyLea                                               
-HeatherDawson                                           
-bijanyeganeh                                            
-ZacharySchoenberger                                     
-SylvainFoissac                                          
-Cordonfeliz                                             
-LisaChinn                                               
-PhilipBarnett                                           
-PilarAlberdi                                            
-HeatherBrown                                            
-HiteshParmar                                            
-AnitaDeWaard                                            
-CraigFranklin                                           
-DarrenCusanovich                                        
-PaulLaissue                                             
-AndreaPhillott                                          
-EricSpanton                                             
-SarahNorthfield                                         
-ClareFieseler                                           
-HeidiMuenchberger                                       
-PhilipPalmer                                            
-MeaghanBrown                                            
-ArkoLucieer55743                                        
-LigiPaul                                                
-KlausBoisen                                             
-LSEUSAppblog                                            
-LorenaPantano                                           
-AssafZaritsky                                           
-LaboratoireDeBiotechnologieDeLenvironnement             
-SunjeDallmeier-Tiessen                                  
-TaraRobenalt                                            
-LiviaMeszaros                                           
-AndreasMehler                                           
-LucaAgostinoVitali                                      
-EleonoraMolesti                                         
-LisaPautler                                             
-LoriDeHertogh                                           
-MariaSvenningsson                                       
-KevinOBrien                                             
-ArnaudCeol                                              
-LucienCarroll                                           
-MargaretKirkwood                                        
-LQuilter                                                
-DavisMcCarthy                                           
-LyndalO'Gorman                                          
-sofiagomes                                              
-IainDavidson                                            
-jorgecardoso                                            
-LisabethChabot                                          
-ManuelaFonseca                                          
-LucioBonato                                             
-SuzieGoodell                                            
-AnnetteBailey                                           
-IainCraig                                               
-MagdalenaSvanberg                                       
-MANTUSAHA                                               
-Yuliu                                                   
-PamelaBagley                                            
-AndreaScharnhorst                                       
-LukasKristofferSchwarz                                  
-pamelalaird                                             
-LisaAncelet                                             
-LukasKohl                                               
-LuisSandoval                                            
-LuisFilipeSilverioLima                                  
-JasonRogers                                             
-hdzimmermann                                            
-massimo-franceschet                                     
-ChrisLarsen                                             
-AudraMitchell                                           
-AllisonGriffey                                          
-JimMacnamara                                            
-AlvaroSanchez                                           
-AntonioDiazAndrade                                      
-BozenaPawlowska                                         
-BojanMacan                                              
-JulietaRosell                                           
-MatthijsHammer                                          
-HeatherMcCullough                                       
-LucyChambers                                            
-RobinWilson4444                                         
-JonathanTonkin                                          
-benjamingoult                                           
-GonzalezNieves                                          
-MonicaPerez-Rios                                        
-MatthewPage                                             
-MatthewPennell                                          
-Greig_de_Zubicaray                                      
-guillaumerivalle                                        
-MichelleGreene                                          
-JacquelineBeggs                                         
-simosacchi                                              
-user50768                                               
-ChristopherWeight                                       
-AnnEwbank                                               
-JuanLuisCabrera                                         
-MarcMazerolle                                           
-JasonByrne                                              
-GermánOrizaola                                          
-KendraLewis                                             
-KiemTa                                                  
-KamilZwolski                                            
-AnimalDemographyUnit                                    
-MatthewSmith                                            
-MarcyCarrel                                             
-TsungFeiKhang                                           
-JulioRica                                               
-NatalieMarty                                            
-DenisNesterov                                           
-SarahMolloy                                             
-user51004                                               
-WillJennings                                            
-JoyKu                                                   
-KyleMandli18522                                         
-JamesHetherington                                       
-HenkVoorbij                                             
-BastaniVahid                                            
-BernardHenrissat                                        
-JoseMiguelBras                                          
-gauravvarshney                                          
-user51559                                               
-AlbertA.Antolin                                         
-darrengood                                              
-AliciaAparicio                                          
-AlexeyAlekhin                                           
-BessSadler                                              
-DianeCox                                                
-MichaelGoodrich                                         
-SianRoderick                                            
-AnjanetteYoung                                          
-ChristopherBlanford                                     
-ChristophMetzendorf                                     
-JoHare                                                  
-ArlinStoltzfus                                          
-SimonKnight                                             
-BenoitKornmann                                          
-BenSaunders                                             
-aaronmeakman                                            
-user51627                                               
-ReidLifset                                              
-NancyFaget                                              
-JocelynMcDonald                                         
-StaceyWebb                                              
-PierStefanoCorasaniti                                   
-TestTest36316                                           
-anilparwani                                             
-Jean-LucJung                                            
-ClaudeLavoie                                            
-AlbertoDelRio                                           
-AndrewPovey                                             
-MaryBetts-Gray                                          
-DickCo                                                  
-CarlosMaldonado                                         
-FatemehBahmani                                          
-AntonioCorreia                                          
-James-T-Becker                                          
-MariliaAntunez9575                                      
-KristinHeath                                            
-ConorTaff                                               
-GretchenHofmann                                         
-ChristianVollmer                                        
-uocpublicacions                                         
-AngelaBednarek                                          
-AlexPlocik                                              
-AlejandroPazos                                          
-IshengTsai                                              
-AshleyAhlbrand                                          
-CONGYIZHANG                                             
-user51136                                               
-GaryMirams                                              
-ericalenton                                             
-AntonioMaraver                                          
-MatthewSigmon                                           
-RahulAnantharaman                                       
-user51877                                               
-StevenGallinger                                         
-user51988                                               
-AnonymousUser                                           
-AndrewGuerin                                            
-BoucherDavid                                            
-user51261                                               
-CarlJacquemyn                                           
-AntonioGraca                                            
-LouiseGoff                                              
-EmmaKnowles                                             
-AnaheedAyoub                                            
-user51767                                               
-linoometto                                              
-user50763                                               
-StasaMilojevic                                          
-user51512                                               
-AchimWolf                                               
-DanForeman-Mackey                                       
-karlschweighofer                                        
-RAWRhodes                                               
-XiaolingShen8318                                        
-RobertMann                                              
-user50553                                               
-MesferAlamri                                            
-user50542                                               
-AchazvonHardenberg4416                                  
-gianluca                                                
-PrakashBhatPrakashBhat                                  
-PamelaJacobs                                            
-BarakaMaiseli                                           
-AndyBrass                                               
-AndreaMargulis                                          
-JulianGarcia                                            
-MatthewWolverton                                        
-ArmandSeguin                                            
-Pierre-MichelForget                                     
-AliShiri                                                
-TobiasSiebenlist                                        
-MadelonWillemsen                                        
-StephenJJohnson                                         
-KateAnderson                                            
-LucyMontgomery7538                                      
-VenkataSunkesula                                        
-MattRussell                                             
-PedroVieira                                             
-mattlaw                                                 
-SusanWingert                                            
-MauricioPerillo                                         
-JesseKwiek                                              
-AnneGaskett                                             
-LukeParkitny                                            
-AdamGazzaley                                            
-AndrewClarke                                            
-user50012                                               
-AnnaBerhidi                                             
-shashankagarwal                                         
-AdamCullinane                                           
-AlbertoDiazAnel                                         
-maureenweicher                                          
-LesleySkalla                                            
-nicolasgriffon4272                                      
-KarenMcCreesh                                           
-MauriceCollins                                          
-JohanJonker                                             
-MaureenBeck                                             
-user50841                                               
-ScottGoetz                                              
-SergioRomeoLopezAlonso                                  
-JimMorris-Knower                                        
-AlexanderDariusOrnella                                  
-IanFoster                                               
-AleksBlumentals                                         
-AdamMarshall                                            
-AndrewKing                                              
-ReneDreos                                               
-AlbertoMoraglio                                         
-AlirezaJalali                                           
-AndrewWesolek                                           
-NiallHaslam                                             
-AdamRoddy                                               
-user50615                                               
-AlbertoLluchLafuente                                    
-AlfonsoGutierrez-Adan                                   
-SergioSalustiano                                        
-user50230                                               
-csbj                                                    
-AhmedBassiouni                                          
-AkashSingh                                              
-GlWallau                                                
-Abhishek_KumarMishra                                    
-DavidCottrell8742                                       
-AlfHakonHoel                                            
-AditiPai                                                
-MandyRispoli                                            
-ShawnGomez                                              
-user50010                                               
-LesterKobzik                                            
-CaitrionaLee                                            
-Erickcardenas                                           
-Alshaweshmam                                            
-EnricoGlerean                                           
-ccc                                                     
-AmandaFolk                                              
-AlmudenaBartolome                                       
-AminGhazanfari                                          
-OlivierLeDeuff                                          
-iSEEM2                                                  
-AliBransi                                               
-AlexanderWatkins                                        
-BrianAbelsonBrianAbelson                                
-LaneThames                                              
-refset-0sfy99                                           
-ddfdddfdf                                               
-gp                                                      
-Atiliobustos                                            
-TimPeoples                                              
-DBolchini                                               
-francoisvanschalkwyk                                    
-RichardTol                                              
-AnkoorPatel                                             
-FaresQeadan                                             
-ScottCarlson                                            
-carstenkessler                                          
-anaisbaudot                                             
-user50986                                               
-AndrewDarby                                             
-AnnaChen                                                
-AngelaJeanes                                            
-AndriusPuksas                                           
-MauricioSchoebitz                                       
-KarenNeves                                              
-mohananand                                              
-AndySouth                                               
-ErikBusby                                               
-IldefonsoDavidRuizLopez                                 
-PabloMinguez                                            
-SarahPotvin358                                          
-matthewbetts                                            
-SeanRands                                               
-user51182                                               
-StefanTaubert                                           
-EmilioDelgadoLopez-Cozar                                
-GordonMcDonald                                          
-user50143                                               
-AndreasPrlic                                            
-AnilCebeci                                              
-etal                                                    
-MatthewBrush                                            
-NoreleeKennedy                                          
-RGRutledge                                              
-FEIFEICHENG                                             
-AmeliaGuadalupe-Grau                                    
-grolimur                                                
-JamesShepherd                                           
-GabrielKrouk                                            
-CharisAnastopoulos                                      
-JodiReevesFlores                                        
-MaximoTorero                                            
-FabioladeGoni                                           
-KazuhiroHayashi                                         
-MiguelHervas                                            
-DavidPascual                                            
-RicardoCarmona-Galan                                    
-LisaGoddard                                             
-AliMohammadi                                            
-AdrianoAguzzi                                           
-TimMoss                                                 
-J.E.Fitzgerald                                          
-sibellevilaca                                           
-AlistairStead                                           
-Povedajoseantonio                                       
-VincenzoD'Aguanno                                       
-IsaacChenchiah                                          
-JannaMorrison                                           
-XinJin                                                  
-AndrewHenderson                                         
-richardashdown                                          
-ahmadchan                                               
-VincenzoD'Aguanno63087                                  
-GillesVanwalleghem                                      
-AlysJordan                                              
-hchaase                                                 
-MichaelNoll-Hussong                                     
-BarryIrwin                                              
-CatherineMuller                                         
-agdturner                                               
-GabrielUsera                                            
-StephenWolfson                                          
-AndrewFerguson                                          
-AlonsoEstradaCuzcano                                    
-AlessandroPonti                                         
-JohannesEichlerWaageJohannesEichlerWaage                
-StevenWatterson                                         
-SPRG(SustainablePracticesResearchGroup)                 
-PierreTocquin                                           
-BjoernBrembs                                            
-MarkNesbitt                                             
-StewartWills                                            
-StevePettifer                                           
-ParhamSolaimaniKartalaei                                
-SPBouzas                                                
-StevenGallo                                             
-LudwigKappos                                            
-AngelDe-Juanas                                          
-BarryDunne                                              
-hvribeiro                                               
-KathleenLehman                                          
-TingYuChou                                              
-AndrewTredennick                                        
-BradJessup                                              
-AndrewGewirth                                           
-DeborahEdwards                                          
-AngeliaWagner                                           
-SeanT.Hammond                                           
-MeghanEcclestone                                        
-JeffreyHollister                                        
-HeinrichVolschenk                                       
-gregoryjordan                                           
-andreas.sjodin                                          
-AndrewSallans                                           
-MazaherSalamat-talab                                    
-cindy                                                   
-AlonsoRamirez                                           
-sachinkumarpatil9397                                    
-NadjaHeine                                              
-asdasdasdas                                             
-JeanneLeBer                                             
-SaraRovira-Esteva                                       
-ErinWimmer                                              
-PetervanHeusden                                         
-DougAngus                                               
-KerstinVoelz                                            
-SwayamdiptaBhaduri                                      
-AnitaKNivedha                                           
-ShawnSerbin                                             
-JeremyDale                                              
-CalvinThigpen                                           
-AlessioRovere                                           
-AntoninoIngargiola                                      
-JoshuaTewksbury                                         
-amirkashani                                             
-AshleyChen                                              
-JaleesRehman52414                                       
-McCordb                                                 
-AmandaRegan                                             
-AntonellaDeRobbio                                       
-user50987                                               
-AbderrahmanHachani1501                                  
-AnselmEnders                                            
-JamesHokanson                                           
-StephenWilliams                                         
-GavinHarper                                             
-MarcoArkesteijn                                         
-WallyGrotophorst                                        
-user50077                                               
-user50572                                               
-user50574                                               
-HollyFalk-Krzesinski                                    
-KarlBroman                                              
-michaelgilson                                           
-RenumathyDhanasekaranRenumathyDhanasekaran              
-GregHall                                                
-micahvandegrift                                         
-VanessaTobias                                           
-HarriLempiainen                                         
-ThomasMunro                                             
-AndreaRyce                                              
-JakobVos                                                
-ScottPhinney                                            
-ShoaibSufi                                              
-AaronSorensen                                           
-HirakPatra                                              
-JonathanEisen-Slideshare                                
-FLIAltmetrics                                           
-AndrasMicsik                                            
-SonjaUtz                                                
-AndrewHaun                                              
-MauricioAlencar                                         
-JohnJohn                                                
-musamhlanga                                             
-AzamBazrafshan                                          
-AndreMouraAndreMoura                                    
-PaulScott                                               
-SteveWhittaker                                          
-VenkataSureshBonthala                                   
-DieterHochuli                                           
-AngelaCochramAngelaC                                    
-MarionaMasgrauJuanola                                   
-AntonyWalsh                                             
-arevalofeli                                             
-sulagnadas                                              
-MohammadMahdiRoozbahani                                 
-AnnekeDirkx                                             
-oliviacarter-pokras                                     
-NicolaSim                                               
-NIOOKNAW                                                
-DuPil                                                   
-BonnieShucha                                            
-IvanGrubisic                                            
-SaraValla2670                                           
-KempenhaegheBibliotheek                                 
-RichardSmith-Unna                                       
-ShenmengXu                                              
-domenicomongelli                                        
-CaroleGoble                                             
-YaronHershkovitz                                        
-AmarensMatthiesen                                       
-AnaBugnot                                               
-PhilipPlatts                                            
-DanLeehr                                                
-BrunoBellisario                                         
-DavidFox                                                
-LaurentChiche                                           
-k.JaneBurpee                                            
-lorcandempsey                                           
-SougataBardhan                                          
-KatieHinde                                              
-GeFeng                                                  
-MarcoMorgenstern                                        
-JeffersonCarvalho-Sobrinho                              
-AnaSimonovic                                            
-MartinCasasVazquez                                      
-FranciscoFlorez-Revuelta                                
-emrinke                                                 
-TamMignot                                               
-ndiakopoulos                                            
-JuliaGross                                              
-ArnaudFoulquier                                         
-AlbertVilella                                           
-JonTennant                                              
-ChristophLutz                                           
-AshleyShuler                                            
-AlisonTong                                              
-LorimerMoseley                                          
-williamfeeney                                           
-MatthewCiszek                                           
-ScottWHYoung                                            
-EnriqueGracia                                           
-DanielManzano                                           
-JohnRumbold                                             
-SeanMackinnon                                           
-LeonardKemper                                           
-AnaBelenBorracheroCortes                                
-DerekNee                                                
-JayMcCarthy                                             
-EdNordine                                               
-MaryHess                                                
-ChristianCole                                           
-JorySchossau                                            
-ChristianHimpe                                          
-JasonHudak                                              
-DavidScaduto                                            
-MeganBeech                                              
-ClarissaGosling                                         
-DavidHarris                                             
-JanWessnitzer                                           
-user51265                                               
-HoraceCrogman                                           
-StevenBrooks                                            
-CatharinavonKoskull                                     
-Ui                                                      
-ChrisSeal                                               
-EduardoDalcin                                           
-RiccardoRotondo                                         
-MeganPaceley                                            
-RobFagan                                                
-ChristinaSorensen                                       
-Codinafeliz                                             
-JeanelleSheeder                                         
-cfsdfsdf                                                
-DustinMarshall                                          
-JustinPeacock                                           
-cobi                                                    
-ArtículosSerrano-Vicente                                
-cuiyingmu                                               
-CaridadMArias-Macias                                    
-AnnaJonsson                                             
-AleksPluskowski                                         
-ketchum                                                 
-ChristopherDodson                                       
-YvanLeBras                                              
-SarahGoodier                                            
-NataliaSernova904                                       
-LOLAMARSET                                              
-ChristophLehmann                                        
-HelenWebb                                               
-MaryDonovan                                             
-ChristopherBartley                                      
-ElisabethLeonard                                        
-KatinaToufexis                                          
-StacyWare                                               
-AdamSummers                                             
-AnguloCarrere                                           
-DanielStandage                                          
-DanielKipnis                                            
-JenniferDoty                                            
-PilarTornos                                             
-AntonioBanfi1                                           
-DavidJayHarris                                          
-ShlomiReuveni                                           
-jtap                                                    
-lkplkp                                                  
-MeganWillis                                             
-JeffreySpies                                            
-WalterFinsinger                                         
-Jean-MichelLEFLOCH                                      
-EricBrace                                               
-OwenPetchey                                             
-DerekLaw                                                
-ScottHanrath                                            
-JesusMiguelFloresVivar                                  
-AnthonySantella                                         
-karkkainen                                              
-MareikeKurz                                             
-DannyDavies                                             
-KiyomiDeards                                            
-FedericoDelGiorgioSolfa                                 
-user50426                                               
-AllanBradley                                            
-AaronLuebbe1695                                         
-LuisQuerol                                              
-DamianMonllor-Satoca                                    
-JordiPapsMontserrat                                     
-MarioLiraJunior                                         
-JohannaFolk                                             
-MarkMaceachern                                          
-AdrianMilesAdrianMiles                                  
-JessicaChong                                            
-MartaRoca-Lefler                                        
-JeffAllen                                               
-AgataChmurzynska                                        
-CharlesNadeau                                           
-RAFAPSOE                                                
-ChristinaHollifield                                     
-CristianMunteanu                                        
-KeithLyons                                              
-AnthonyHarmar                                           
-jjstoessel                                              
-CathyUrquhart                                           
-BhavenKataria                                           
-MDavidKessler                                           
-JamesVanDyke                                            
-KrzysztofGorgolewski                                    
-wdawdadasd                                              
-ScottMarley                                             
-James-F-Hainfeld                                        
-AndrewAsher                                             
-MatthewLowder                                           
-AntalWozniak                                            
-Anne-MarieKrachler                                      
-AafkevanDijk                                            
-MaartenWijnants                                         
-user51238                                               
-BryanWong                                               
-EdHerb                                                  
-DuaneZietsnab                                           
-AlisonHunter                                            
-MatthiasBussonnier                                      
-KimCarter                                               
-rovirafeli                                              
-DavideNunes                                             
-AntonioMoneo                                            
-DanielEgan                                              
-EmilioJoseJuarez-Perez                                  
-ElisabethLex                                            
-RobertFitzgerald                                        
-ElliottGonshor                                          
-DanielleLemay                                           
-EliseoGuallar                                           
-hhhh                                                    
-HavalShirwan                                            
-ElizabethGadd                                           
-CateMacinnis-Ng                                         
-AprilInniss                                             
-AntoinLawlor                                            
-witoldrudnicki                                          
-MarthaKyrillidou                                        
-TiagoFerreira                                           
-YuanyeZhang                                             
-ZhiQi                                                   
-NicolasPons                                             
-user50852                                               
-Xose-PedroRodriguez                                     
-DanielTorres-Salinas94697                               
-YvesDubief                                              
-PeterThrall                                             
-MelanieBertrand                                         
-AnnemieGeeraerd                                         
-GiuseppeVeltri                                          
-7                                                       
-DanReed                                                 
-RosaBalbin                                              
-AprilArmstrong                                          
-RachidSerraj                                            
-AntonisVllassopoulos                                    
-LuisDiazdelRio                                          
-IvorDouglas                                             
-AntonioGuiomar                                          
-MeinhardHaltmayer                                       
-refset-b4e5gl                                           
-ThomasArildsen                                          
-DagmaraRiitano                                          
-jasonkarl                                               
-CeciliaAragon                                           
-JosephMcArthur                                          
-AmeliaVaughan                                           
-DalkhatEdiev                                            
-PaulaStellaTeixeira                                     
-DanielleJacobs                                          
-EricvanFurth                                            
-JanWeaver                                               
-sadiquequreshi                                          
-HarmKnoops                                              
-EloiseDray                                              
-MartinKamler                                            
-NicolasVignon-Zellweger                                 
-Emmanuel.Vincent                                        
-ErkanSenses                                             
-user50807                                               
-KimberlyVanderWaal                                      
-Yong-XiangLi                                            
-coakleymeghan                                           
-MerrieDavidson                                          
-PeabodyEssex                                            
-farzanalatif                                            
-NicolasTromas                                           
-SandyLiu                                                
-MelindaKennewat                                         
-EvelinePeeters                                          
-AdrianRegos                                             
-BhavinPatel                                             
-ElijahSpina                                             
-SloaneViola                                             
-HilaryHThompson                                         
-ToddSuomela                                             
-JamesPringle                                            
-MatthewPriem                                            
-BahmanGhiassi                                           
-AliciaSalaz                                             
-BalwantSingh                                            
-user50714                                               
-estivill-torrusguillermo                                
-AlexandraPittman                                        
-GeromeBreen                                             
-TimofeyErmilov                                          
-AntonioCarlosLessa                                      
-LindaNorbury                                            
-BennoSimmons                                            
-AsaLangefors                                            
-adelaladwani                                            
-SteffenLemke6035                                        
-DavidBoucher                                            
-MarinusSwanepoel                                        
-JackLee                                                 
-IrfanKURTBAS                                            
-HisatoTakagiCVS                                         
-meliusweideman                                          
-MelissaSpangenberg                                      
-JoBoyden                                                
-SCammiss                                                
-ThaneChambers                                           
-HughShanahan                                            
-JonathonKram                                            
-Daniamann                                               
-Felixmoya_anegon                                        
-VinodScaria                                             
-JacquelineArciniega                                     
-sebastienBarbarot                                       
-LisaFederer                                             
-AshutoshTiwari                                          
-michaelberney                                           
-BradleyTaber-Thomas                                     
-NeilMerritt                                             
-ElaineChalus7567                                        
-SarahGallagher                                          
-FelicityBoardman                                        
-ScottFabricant                                          
-SergiRoura                                              
-AnasImtiaz                                              
-ShujunLi                                                
-MartinThanbichler9618                                   
-DanielSpichtinger                                       
-kanchanchattar                                          
-JournalofFinance                                        
-DanielTsang                                             
-MasaharuMotoshita                                       
-ClaudetteCloutier                                       
-ShrutiSardeshmukh                                       
-LauraEngel                                              
-RobJohnson                                              
-chinamills                                              
-ChandramouliChandrasekaran                              
-JamesMakinson                                           
-MikeSmit                                                
-HelenJarvie8297                                         
-RatiLama                                                
-AndreaCopeland                                          
-JanetCrum3036                                           
-StevenHeine                                             
-DanielSpichtinger1706                                   
-FredericDuconge                                         
-FilisteaNaude                                           
-MelisAkman                                              
-PatrickShiu                                             
-OlaUthman                                               
-djproctor                                               
-konrad                                                  
-EleniKoulocheri                                         
-IJHPMIJHPM                                              
-SvetlaBaykoucheva                                       
-ColleenWillis                                           
-lida                                                    
-NouriBenZakour                                          
-AlexSutherland                                          
-SsegawaKiwanuka                                         
-DanielPearlman                                          
-JanHavlicek                                             
-AdamRunions                                             
-FlorTrillo                                              
-TeroKivela                                              
-ManolisWallace                                          
-BobKosovsky                                             
-ivanaprahamian                                          
-heikoschroeder                                          
-MarcinhetPanhuis                                        
-MarkPickering                                           
-ConstanceMalpas                                         
-EmanueleSerrelli                                        
-jorgeazevedo                                            
-StephenWilson                                           
-SilviaMolina                                            
-FrancisRemedios                                         
-GaetanDroc                                              
-CatherineDunford                                        
-waltertangarife                                         
-DavidLewis                                              
-TomasLAGUNAS8615                                        
-ArndisSimonsen                                          
-RelenaRibbons                                           
-MarianaMathias                                          
-KuldeepSingh9599                                        
-SijoThandapilly                                         
-DavidNordfors                                           
-paulgarner                                              
-MarcPerry                                               
-ChristopherBaker                                        
-VenkatasubramanianViswanathan                           
-DianaTomchick                                           
-NicosNicola                                             
-MarkPhillips                                            
-TraLok                                                  
-MajedAl-lehaibi129                                      
-MaraDaltabuitTest                                       
-marco                                                   
-ManonBurger                                             
-eglinger                                                
-ChemicalEngineeringNortheasternUniversity               
-AbhishekPratap                                          
-MarcDeconchat                                           
-marcfolia                                               
-MarkSansom                                              
-moreno                                                  
-GiseliAdornatodeAguiar                                  
-MarcFetscherin                                          
-AdahAlmutairi                                           
-MajedAl-lehaibi2013                                     
-CristinaBlanco-Andujar                                  
-MaiSamy                                                 
-CynthiaOsman                                            
-EmilioFerrara                                           
-Manuel_joaoCosta                                        
-BenW                                                    
-MANISHKUMAR                                             
-MahdeAssafi                                             
-CarolynWilcox                                           
-MargaritaPivovarova                                     
-MariaComanescu                                          
-CarrieSchuman                                           
-user51127                                               
-user50275                                               
-user50846                                               
-MathewWillmott                                          
-AlexanderSaeri                                          
-JennyDelasalle                                          
-JudithKamalski                                          
-donnadalessandro                                        
-IgnacioMastro                                           
-MariaSchwaederle                                        
-CatherineStephen                                        
-MarioDiwersy                                            
-MarioAlmeida-Neto                                       
-francoisbusquet                                         
-MarkMaritz                                              
-CelineCammarata                                         
-ChadwickRiggs                                           
-HenryAlitto                                             
-markkingston                                            
-RolandoBerlinguerPalmini                                
-MarkLee                                                 
-MariaClaraPaixaodeSousa                                 
-MarkFarrar                                              
-MarkButlin                                              
-user51190                                               
-AgneLarsson                                             
-MatildaDhima                                            
-xwu                                                     
-MaryNakamura                                            
-BertdeJong                                              
-MartinWooster                                           
-MRMacaskill                                             
-MatthewMartyn                                           
-GerinaldoCamacho                                        
-JonathanEisen                                           
-AndresPrieto                                            
-CherylWells                                             
-MattHayward7231                                         
-marykraljic                                             
-martinpotschka                                          
-ChandraShekhar                                          
-mattbacon                                               
-CharlesOfria                                            
-BarryRadler                                             
-ArnauMontagud                                           
-agusprima                                               
-JamesSchreiber                                          
-JohnJCronin                                             
-GianniSava                                              
-user51156                                               
-FredericWelsch                                          
-JohnSomner                                              
-JohnDupuis                                              
-Laurehaak                                               
-ghikjhfgghghhkkae                                       
-LaurenMaggio                                            
-msandri                                                 
-DavidBuckley                                            
-4fe74de1010bd6c81f32325340d7e829                        
-ChrisSounness                                           
-MatteoAdorisio                                          
-AllegraSwift                                            
-TalYarkoni                                              
-ClaudiaSerbanuta                                        
-EKMFSites                                               
-AlexandraSaz                                            
-RahulKalla                                              
-ChrisMoyer                                              
-joeritijdink                                            
-yukihata                                                
-MohammedKhaledTumbi                                     
-ChristinaMedina-Ramirez                                 
-DavidMcDaid                                             
-EricKan                                                 
-user51427                                               
-carlosrodriguezrellan                                   
-SameemAbdulKareem                                       
-MichaelLane                                             
-peppeliberti                                            
-AdityaSingh                                             
-michaelwolz                                             
-user50582                                               
-arrollofeli                                             
-MichaelHolmes                                           
-Surya                                                   
-MichaelLaakasuo                                         
-MichaelLandis                                           
-AntoniaDesmond                                          
-MichaelJCox                                             
-MichelleHarrison                                        
-JoHawkins                                               
-MichielMoll                                             
-MichelleWilde                                           
-BinghuangCai                                            
-YukiNaito                                               
-GabrieleMarranci                                        
-Christian-AlbrechtKiel                                  
-AlexanderMazein                                         
-michelamontesi2015                                      
-MichelleMaden                                           
-KlausSchliep                                            
-user51376                                               
-QuentinAtkinson                                         
-karthik                                                 
-keita                                                   
-Adrienkissenpfennig                                     
-SixtoAGonzalez                                          
-NguyenTienHuy                                           
-MichaelWilson                                           
-JonathanEisen-Figshare                                  
-MiklasNjor                                              
-miguelfosasdepando                                      
-MikelZaratiegui                                         
-DavoodNakhaie                                           
-corduroy                                                
-AlanFaulkner-Jones                                      
-JMRodriguez-Llanes                                      
-DanielKershaw                                           
-MiekeKleppe                                             
-JonathanEisen-GoogleScholar                             
-DavidGiles                                              
-AngelCuadrado                                           
-MilanMacoun                                             
-RossWilderman                                           
-MihhailZujev                                            
-ChristianSchloegl                                       
-JacquesBothma                                           
-MogamatShafickHassan                                    
-lohnsmitgh                                              
-MitaWilliams                                            
-MiYeonLee                                               
-mlhodge                                                 
-MistyKirby                                              
-LaetitiaPlaisance                                       
-AnthonyScopatz                                          
-tdido                                                   
-Ankurgoel                                               
-mlanfranchi                                             
-AsbjornDahl                                             
-ChristineDArpa                                          
-OmarWagih                                               
-RobertaRabellotti                                       
-MiroslavBeblavy7702                                     
-AngelaDAgostino                                         
-OwenJones                                               
-KimHolmberg                                             
-NicholasHudson                                          
-MirjamCurno                                             
-MohammadaminErfanmanehs                                 
-HermanAguinis                                           
-AlexandreSchimel                                        
-user51163                                               
-AlexWatt                                                
-AliciaWise                                              
-AlessandroBozzon                                        
-MohamadAbdalla                                          
-MichaelShallcrossMichaelShallcross                      
-LebRikiz                                                
-chschind                                                
-NanaBit-Avragim                                         
-PruMitchell                                             
-ResLiz                                                  
-RichardBoyce                                            
-PetrSimecek                                             
-ChrisBulock                                             
-MinnaJuotasniemi                                        
-StephenRoyle                                            
-GaryCollins                                             
-mojtabaabc                                              
-MontseFontboté                                          
-MollyStrothmann                                         
-user51507                                               
-AleksandraUkleja                                        
-montserratpalma                                         
-ClaireBalmer                                            
-AlicePfeifer                                            
-YesanSellan                                             
-JillVenton                                              
-MontserratGuillen                                       
-ThomasSchlaepfer6233                                    
-ClaudiaHolland                                          
-MonicaVandieren                                         
-SenatorJeong                                            
-ClaraHenderson                                          
-MohammedKhayum                                          
-NacholChaiyaratana                                      
-NadiaFernandezdePinedo                                  
-CarolynGardner                                          
-MichelleCarnegie                                        
-MurariTapaswi                                           
-MuratDuman                                              
-TobiasEgner                                             
-KaiSassenberg                                           
-MartinWittenberg                                        
-SarahManns                                              
-PaulWilson                                              
-IvanOoluzza                                             
-NajmehJafari                                            
-AmrAbed                                                 
-HumbertoSanchez                                         
-PaulMaurizio                                            
-HakanWesterblad                                         
-MargaretHeller                                          
-TeresaLorente                                           
-KalishAlan                                              
-NaokiTakizawa                                           
-MurrayHenwood                                           
-AlvaroRoldan                                            
-NatashaVizcarra                                         
-MaryMangan                                              
-JonathanGoodall                                         
-NathanielWeygant                                        
-NarineBaghdasaryan                                      
-MurugesuSivapalan                                       
-TrevorDiMartino                                         
-NDGibson                                                
-AmyChen                                                 
-AshleyDavis-Alteri                                      
-CoreyMurata                                             
-natro                                                   
-natalieanneward                                         
-natashakuruppu                                          
-NataliHelberger                                         
-NataliaSernova                                          
-NathanGlazer                                            
-user51040                                               
-JonathanFortney                                         
-NasimAnnabi                                             
-KatherineBranch                                         
-AllenSprague                                            
-user51058                                               
-user51049                                               
-user51793                                               
-MiriamMatamales                                         
-alvarcabezas                                            
-MatthewRoss                                             
-NickAnderson                                            
-KayeStenvers                                            
-NathanOlson138                                          
-LorienDelaney                                           
-NiamhWalker-Headon                                      
-NiclasEricsson                                          
-MatthewShirley                                          
-user50565                                               
-KennethMacMahon                                         
-NathaliceCardoso                                        
-JenniferThornton                                        
-NellyRosario                                            
-maureenconvery                                          
-NiamhBrennan                                            
-ClaudioMSantana                                         
-NickCrumpton                                            
-AxelBruns                                               
-abbyjohn                                                
-NiktaFakhri                                             
-user50594                                               
-NoamKaplan                                              
-NiklasMahler                                            
-CiaranHeavey                                            
-KamilMizgier                                            
-ErinmaOchu                                              
-NicoleThomas                                            
-NicoleMuscanell                                         
-NikolaosKourkoumelis                                    
-KristenDang                                             
-PaulKnoepfler                                           
-NeilStewart                                             
-ColinGerber                                             
-NormanWoolley                                           
-PeterGriffiths                                          
-GarethKnight                                            
-PauRue                                                  
-NirmalaKannankutty                                      
-RobertDeaner                                            
-KimSterenborg                                           
-RussellLang                                             
-MaurizioMarchesini                                      
-user50999                                               
-OlesyaMryglod                                           
-GailClement                                             
-OlegKudryavtsev                                         
-Nowosad                                                 
-AndrewBooth                                             
-user51642                                               
-NuriaTorra                                              
-SimonBuckinghamShum                                     
-AmiyaalIlany                                            
-foofof                                                  
-michaeldalessandro                                      
-StephanieWright                                         
-JamesSpencer                                            
-OlivierKlein                                            
-OriFriedman                                             
-RGyore                                                  
-nyhsu                                                   
-oikf                                                    
-EoinCasey                                               
-OlayinkaOlagoke                                         
-AnnaPhilpott                                            
-OlgaZolotova                                            
-Cornelia.Weise                                          
-HaiderFAltimimi                                         
-FelixScholkmann                                         
-AnneCostigan                                            
-user51680                                               
-SebastianGibb                                           
-MichalKokowski                                          
-OliverFerschke                                          
-AdamGinsburg                                            
-GaiaRemer                                               
-abadfeli                                                
-oriololive                                              
-GMahesh                                                 
-AurelieCarlier                                          
-RichardFfrench-Constant                                 
-WillCornwell                                            
-omidkaramzadhe                                          
-CynthiaFraser                                           
-AaronIngham                                             
-ChrisWallace                                            
-AmaraNwosu                                              
-AndrewBoothAndrewBooth                                  
-sdfsdf                                                  
-christopheplomion                                       
-PabloCouto                                              
-user51302                                               
-mjhughes                                                
-PandelisPerakakis                                       
-J.ChristopherHowk                                       
-AmandaGarton                                            
-oussamasidhom                                           
-AndreaTwiss-Brooks                                      
-PamBriggs                                               
-onurerbilgin                                            
-AmaniBell                                               
-KTVaughan                                               
-JohnBaumgartner                                         
-AnnMartin                                               
-TakeruNakazato                                          
-boualembenatallah                                       
-OuLibrary                                               
-AlexGolub                                               
-ThomasHoernschemeyer                                    
-janecho                                                 
-AaronAdams                                              
-PaolaGalimberti                                         
-AmelBarich                                              
-osmanekekon                                             
-AileenLun                                               
-VikramUnnithan                                          
-PatriciaMcCabe                                          
-AnaRosaCandela                                          
-EricJardine                                             
-pattiepunch                                             
-PlatoSmith                                              
-user51892                                               
-n                                                       
-philip                                                  
-PANBIBLIOTEKAR                                          
-NathanMortimer                                          
-user50762                                               
-AshokKrishnamurthy                                      
-ParloSingh                                              
-PascalGiraux                                            
-PatricioAbad                                            
-GopalThinakaran                                         
-AndrewSteen                                             
-PatriciaRepresas                                        
-PatrickHenry                                            
-kamelmansouri                                           
-PatrickCaveney                                          
-PaulduToit                                              
-DavidSamuels                                            
-PatrickMegonigal                                        
-RalphKenna                                              
-MorganDavid                                             
-user51153                                               
-NeilChueHong                                            
-PatriciaMcMillan                                        
-PascalQuemerais                                         
-LarryLannom                                             
-nicolasgriffon                                          
-PaulRamsay                                              
-naupakaz                                                
-paulb                                                   
-PaulMitchell                                            
-PatrickSchloss                                          
-AntoinetteRobinson                                      
-CristinaRossi                                           
-PaulCoxon                                               
-PaulaForbes                                             
-LucyCheke                                               
-HubertBRANGER                                           
-NIMBioS                                                 
-CraigMills                                              
-AndreasLadner                                           
-PaulaKnee                                               
-user50037                                               
-AlistairDove                                            
-PatrickDunleavy                                         
-SebastienChevrot                                        
-yananZhao                                               
-johnnydoe                                               
-LaurelHaak                                              
-PatrickGraybill                                         
-PawanYadav                                              
-paulrennert                                             
-paul.wilson                                             
-PaulReich                                               
-PedjaPavlicic                                           
-AmyVecchione                                            
-PeterKrawczel2                                          
-jhardcastle                                             
-PeterMorgan                                             
-VictoriaLudasOrlofsky                                   
-ADRPHD                                                  
-AndersJohansson                                         
-PeterDoorn                                              
-perimassimo                                             
-jensnieschulze                                          
-PeggyHoon                                               
-PeterKjellberg                                          
-AliceDaish                                              
-PaulSheehy                                              
-PavolSokol                                              
-PaulSWeiss                                              
-sbc                                                     
-PeterHalligan                                           
-AnaSofiaReboleira                                       
-VanessaBoudewyns                                        
-PeterVincent                                            
-C.SeanBurns                                             
-amirrezaasnafi                                          
-PeterPeters                                             
-PeterKivisto                                            
-PeterSlaughter                                          
-AndersWandahl                                           
-PeterBencsik                                            
-CesarSanchez                                            
-PeterMcQuilton                                          
-ChrisPerry                                              
-AndreaDarling                                           
-PetraDedicova8157                                       
-KarlRWotton                                             
-WitoldDzwinel                                           
-CristianoChiamulera                                     
-AbhinavSaxena                                           
-PeterBurkhard123                                        
-WolfgangG.Stock                                         
-SamanthaStehbens                                        
-PetriHelo                                               
-PeterTerry                                              
-PhilipRamsey                                            
-CLAUDIOMORETTI                                          
-philipperavaud                                          
-philipmontenigro                                        
-pilarstrutin-belinoff                                   
-PhillipLevin                                            
-EberhardKuester                                         
-PhilipTrembath                                          
-PhilippLeitner                                          
-JenSnowball                                             
-phanhoudomlith636                                       
-PhilAlmond                                              
-PhilippDahm                                             
-AABoyles                                                
-JRF                                                     
-TorbjrnTorsheim                                         
-SarahBota                                               
-RenoFilla                                               
-AsaBenHur                                               
-PhilippeDessus                                          
-csmeyns                                                 
-DaiqingYang                                             
-CrothersStephen                                         
-CueponcaxochitlD.MorenoSandoval                         
-LeonardBesselink                                        
-LarsJuhlJensen                                          
-RobModini                                               
-JamesP                                                  
-PrakitSomta                                             
-PranavNaithani                                          
-PierreVALETTE-FLORENCE                                  
-PietBakker                                              
-ShadiHijazi                                             
-PruCook                                                 
-AndrePires                                              
-QingpengZhang                                           
-PriscilaRamos-Ibeas                                     
-prakashkaripoth                                         
-pruebaprueba                                            
-AndrewPerkins                                           
-rajeshyella                                             
-ArturoRubio                                             
-CONSORTStatement6930                                    
-SaraMannheimer                                          
-QuentinBlochet                                          
-PuttappaDodmane                                         
-RajendraAwasthi3667                                     
-JulieCoiro                                              
-SimonAlberti                                            
-ZacharySiders                                           
-AndreFalcao                                             
-A.TownsendPeterson                                      
-RabishankarGiri9920                                     
-JorgeElizalde                                           
-MariaJenmalm                                            
-RachelHaggerty                                          
-AmandaStevens                                           
-AudreTrumpiene                                          
-IndigoEsmonde                                           
-ChrisBridle                                             
-RebeccaHunt                                             
-RajanSankaranarayanan                                   
-BarbaraBrydges                                          
-RandySouther                                            
-AiméeMorrison                                           
-ClarkeIakovakis                                         
-GlenLichtwark                                           
-ravdeepkour                                             
-RamezAL-Koudmani                                        
-RamonFonseca                                            
-BarbaraHock                                             
-RaulArellano                                            
-RossMacdonald                                           
-RebeccaBlocksome                                        
-DanielAshton                                            
-rahulkumar                                              
-RamonaPekelo                                            
-RamonEscuriet                                           
-RayG.Butler                                             
-PeterBower                                              
-AlCunningham                                            
-MarkHorowitz                                            
-DanielKsepka                                            
-refset-dlukif                                           
-abcabc                                                  
-RebeccaLave                                             
-FredericaTheodoulou                                     
-RebeccaYu                                               
-AlexMcLean                                              
-HannahPeck                                              
-RecepBentli                                             
-ReginaNuzzo                                             
-badisdjamaa                                             
-RuiCBernardes                                           
-LeannaArchambault                                       
-ReinerBrueller                                          
-RosieC3461                                              
-PierreDumouchel                                         
-user51776                                               
-DanielHook                                              
-KaraHoover                                              
-ChristophBudjan                                         
-JamesHart                                               
-ReinhartReithmeier                                      
-shaytzur                                                
-DanielaSolomon                                          
-PuiHo                                                   
-AndreiFoldes                                            
-DanielBlaineMarchant                                    
-AndresChamarro                                          
-RenzoCarlucci                                           
-ThomasDoring                                            
-RenzoKottmann                                           
-RobertFarrow                                            
-ReneeDennison                                           
-RenatoPassos                                            
-ChristineNeilson                                        
-DanielBHayhow                                           
-ReneeSmit                                               
-RajikaPerera                                            
-ChrisHope                                               
-AlainMonteil                                            
-user50973                                               
-sallywortley                                            
-user50268                                               
-ReneMilk8160                                            
-AngelaCook                                              
-SinnEr                                                  
-SebastienPfeffer                                        
-LeslieMaheCollazoExposito                               
-ReubenNjuguna                                           
-MatthieuLeray                                           
-ChiaChenChang                                           
-ReshmaAshar                                             
-AdrianStier                                             
-LindaHerzberg                                           
-RichardKlasco                                           
-rfhunt                                                  
-ReneVonSchomberg                                        
-DanielBrowne                                            
-RichardBroekman                                         
-SolbrittTest                                            
-JoanMoranta                                             
-user50946                                               
-AvinashManian                                           
-RickMutsaers                                            
-Alisha764                                               
-RienneJohnson                                           
-RonaldHochreiter                                        
-GeneSprings                                             
-NinaJeliazkova                                          
-RudolfMumenthaler                                       
-RichardKidd                                             
-RobertFroud                                             
-SeanLuyk                                                
-IanDunlop                                               
-RieSmethurst                                            
-RobbieBarbero                                           
-JamesSaunders                                           
-RobertdelMas                                            
-RikteshSrivastava                                       
-AndrewSharkey                                           
-user51350                                               
-danieleregge                                            
-user51096                                               
-RobertLasley                                            
-rizwanbulbul                                            
-AnnShowalter                                            
-RobertoSanchez                                          
-DanielSchillereff                                       
-RobertoViola4086                                        
-RobertEpstein                                           
-RodreckDavid                                            
-AndrewChow                                              
-sigezou                                                 
-VarunaBanduseela                                        
-RobertMorrell                                           
-RodneyMalesi                                            
-RobertSchloesser                                        
-RobynCampbell                                           
-DannySoetanto                                           
-FedericoRubagotti                                       
-MireiaDelandes                                          
-AlexanderPriven                                         
-RobertoGaleazzi                                         
-RogerBaines                                             
-romanmyronchenko                                        
-RodGardner                                              
-XingtianXu                                              
-robingustafsson                                         
-BarakaCelestinSempuga                                   
-RosaFernandez                                           
-CarenCooper                                             
-BeckyRaboy                                              
-brain                                                   
-RohanChaubal                                            
-RohitAnthonySinha                                       
-AnnalisaDeSilvestri                                     
-RodrigoCostas                                           
-RockyBalboa                                             
-AntonioBarros                                           
-BitaSedaghati                                           
-AlexKrbanjevic                                          
-LizHall                                                 
-ElviraBrattico                                          
-AshishPatel                                             
-RowanCockett                                            
-AshleeLillis                                            
-rosyjan                                                 
-PawelKozlowski                                          
-AuswafAhsan                                             
-AmmonSalter                                             
-RoseWorrell                                             
-user51090                                               
-RossClark                                               
-AndrewJFerguson                                         
-PUNEETCHOPRA                                            
-recepcolak                                              
-RubiaGomesMorato                                        
-divyalasya                                              
-ErolAkcay                                               
-sachinkumarpatil                                        
-Tina(Test2)Adams                                        
-PaulStroobant                                           
-RuxandraBotez                                           
-KabirC.SenKabirC.Sen                                    
-AndresPandiella                                         
-SabineLouet                                             
-TimothyDobbins                                          
-sadeghzafari9647                                        
-TonyHarmar                                              
-RyanJoseph                                              
-SaedAbdou                                               
-RudolfNieuwenhuys                                       
-CaseyBergman                                            
-RussellCrawford                                         
-RudiTheunissen                                          
-RuthIsserlin                                            
-vivekkumar                                              
-CharmQgp                                                
-badgley                                                 
-MarianoRico                                             
-HishamEldai                                             
-JohnMeasey                                              
-LouwVenter                                              
-DatTran                                                 
-BradleyHemminger                                        
-SallyKeith                                              
-ClaudioMattiussi914                                     
-SallyVHunter                                            
-LolitaKwok                                              
-SamuelPEAN                                              
-OneEarthFutureFoundation                                
-lisamclaughlin                                          
-DavidBidwell                                            
-DavidDiMuro                                             
-TommasoVenturini                                        
-SaharAl-Keshwan                                         
-SaimaAman                                               
-JeanCamp                                                
-SanJames                                                
-SanjanaRavi                                             
-LynnKysh                                                
-TroyRhoades                                             
-andytattersall                                          
-LeeMachado3547                                          
-DavidGreene                                             
-YasminJiwani                                            
-sandhyach                                               
-SalvadorCalabuig                                        
-LyndaCooper                                             
-ChrisLastname                                           
-SanjivGupta                                             
-GuoliangLi                                              
-SantaAgreste                                            
-SandraGoodnough_Hanneman                                
-2011JST                                                 
-SamaraMcPhedran                                         
-BarbaraRitaBarricelli                                   
-SandipRath                                              
-PeterMcCormick                                          
-AlexTaylor                                              
-SantoshSr                                               
-DiseaseOntology                                         
-SantiagoLapena                                          
-IfWAltmetrics                                           
-SarahBeasley                                            
-BrockKirwan                                             
-DavidWarrington                                         
-JasonHuff                                               
-SunilJoseph                                             
-SanthoshEapen                                           
-SaraGottlieb                                            
-DavidPalmer                                             
-LisaSchiff                                              
-SanthoshEapen6661                                       
-SaraBerginc                                             
-DawnStahura                                             
-DavidSchoppik9146                                       
-sandytatla                                              
-LisaRonan                                               
-ArunKarnad                                              
-mohammadAbuannadi                                       
-PatriciaZeniMarchiori                                   
-nickblagden                                             
-BruceSlutsky                                            
-YaacovPetscher                                          
-RobinFeatherstone                                       
-SarahKenny                                              
-SarahOtner                                              
-ThomasSchalch                                           
-SarahJohnson                                            
-SarahMBrown                                             
-CarlBoettiger444                                        
-DebraDonnelly                                           
-DeclanNaughton                                          
-AnnaSharman                                             
-JacobLeachman                                           
-DeniseNicholson                                         
-DirkHahnel                                              
-SarahGraves                                             
-UbertoPozzoli                                           
-XavierArgout                                            
-DimitrisKarlis                                          
-SarahCrissinger                                         
-Susantest                                               
-SarahOates5933                                          
-SarahCahalane                                           
-DavidGArmanini                                          
-StephenYang                                             
-SaraZimmerman                                           
-PatricioJeraldo                                         
-AmberynThomas                                           
-SarahVenisSarahVenis                                    
-SarahRudd                                               
-user51692                                               
-SathishkumarSelvaraj                                    
-DinoCitraro                                             
-MorcilloLopez                                           
-Jean-PierreGattuso                                      
-KyoimYun                                                
-WayneHansen                                             
-SarahYoung                                              
-SaralynReeceHardy                                       
-AntonioLiotta                                           
-FrancescoRagazzi                                        
-jaimepascual                                            
-BrianBill                                               
-bobinson                                                
-RobinFriedman                                           
-PatrickBruno                                            
-satoshimanita                                           
-SByrnes                                                 
-satkow                                                  
-AntonioDiez-Juan                                        
-SavitriGarivait                                         
-ChelseyCrandall                                         
-SattarIzwaini                                           
-SaswatMohapatra                                         
-user51454                                               
-UriGophna                                               
-UlmanLindenberger                                       
-MarkBillinghurst                                        
-IsmaelRafols                                            
-DmytroFilchenko                                         
-sarican                                                 
-LizNeeley76177                                          
-WimCrusio                                               
-user50113                                               
-LauraSare                                               
-AndreaAnichini                                          
-RichardBickerton                                        
-user51219                                               
-RobyGevarghese                                          
-user50997                                               
-SeanRiley                                               
-SebastianHoffmann                                       
-LucMoreau                                               
-robertboldt                                             
-BaptisteGault                                           
-SebastianBassi                                          
-KevinKohl                                               
-MatthewWallenstein                                      
-AmrapaliZaveri                                          
-MarlaKeenan                                             
-NataliaReixach                                          
-robertoviola                                            
-SerafinoCicerone                                        
-JonSlate                                                
-user50921                                               
-heathertest                                             
-DonovanParks                                            
-ErichBrenner                                            
-AliceDoek                                               
-EverettSpringer                                         
-JosedosSantos                                           
-JulieMeyer                                              
-sebastienuyttenhoef                                     
-serughettigiorgia                                       
-XingXing                                                
-ShamprasadPujar                                         
-RichardLusk                                             
-LucyPatterson                                           
-SergejAndrejev                                          
-ShahnazMiri                                             
-SethAxen                                                
-SergioAndradeOchoa                                      
-ShenshenXu                                              
-KarenCheney                                             
-IbenBrndum                                              
-user51260                                               
-VincentLagarde                                          
-AnneChurchland                                          
-SharonKnieper                                           
-DonRojas                                                
-bdc                                                     
-ShellyMaskell                                           
-SHJafari                                                
-ShaneMcCorristine                                       
-JamesThompson                                           
-SigitWibowo                                             
-FranciscoI.Pugnaire                                     
-DrewWright                                              
-WilliamBlanco-Bose                                      
-SibeleFausto                                            
-duffeleanor                                             
-AndrewPreston                                           
-MichaelPMcCreery                                        
-ShashankGhantoji                                        
-KateDougherty                                           
-RobertZeller                                            
-TimPaglione                                             
-shaunho                                                 
-AdamBleckert                                            
-user51286                                               
-IlyaVeer                                                
-JacobKOella                                             
-SibsankarJana                                           
-Nannochloropsisgaditana                                 
-ThomasDeering                                           
-ShigangYue                                              
-EdiFirmansyah                                           
-candan                                                  
-mfcovington                                             
-EdwinHorlings                                           
-EbonyHartwell                                           
-jf                                                      
-KaitlynGaynor                                           
-PeterLund                                               
-zoleikhamahmudi                                         
-AdamWitney                                              
-Jan-JasperFast                                          
-JoelSnyder                                              
-BrianFox                                                
-slamtihasna                                             
-SimoneHaas                                              
-SimonLeather                                            
-LeonAnderson                                            
-FrancescoCilurzo                                        
-EricDezielEricDeziel                                    
-ericberlow                                              
-EdithTaleisnik                                          
-NicholasFabina15754                                     
-LorettaWestcott                                         
-StandaPejsa                                             
-S.LukeFlory                                             
-SinemSiyahhan                                           
-BenjaminHayden                                          
-SnejankaPenkova                                         
-somayeseyedsalehi                                       
-LionelMullerIgaz                                        
-SjurdurHammer                                           
-BenGoldman                                              
-SJRaybone                                               
-SriAmudha                                               
-StephenBronack                                          
-user50235                                               
-BeckyGooby                                              
-AmandaB.Daly                                            
-SorchaHyland                                            
-EdTallent                                               
-BarryFreeman                                            
-AsimKhwaja                                              
-NirvikarDashora                                         
-user51256                                               
-DavidInnes                                              
-KevinTennent                                            
-jeroenbarte                                             
-GeorgeScott                                             
-KateWeatherall                                          
-DonaldPhillips                                          
-MartynAmos                                              
-SophieBuigues                                           
-KennethLocey                                            
-srmulcahy                                               
-AndreKoch                                               
-StacyKowalczyk                                          
-srinathkaipa                                            
-AmitKatiyar                                             
-StephanieCheyer                                         
-MiiaPARNAUDEAU                                          
-StephenTurner73114                                      
-IraMills                                                
-SunyoungKim                                             
-StephanieGodfrey                                        
-Proofofconcept                                          
-JeffTrimarchi                                           
-AdaEmmett                                               
-SadieBoniface                                           
-CyrilRibeyre                                            
-ChunWeiChoo                                             
-StephanieSchulte                                        
-HernanLopez-Schier                                      
-Jean-FrancoisDufayard                                   
-SteveBaron                                              
-ParthasarathiMukhopadhyay                               
-NickBrindle                                             
-StephanieWuerth                                         
-StephanieGrubenmann                                     
-JacintoDavila                                           
-RamiZwick                                               
-SteveRanford                                            
-HilaryGeoghegan                                         
-EduardoRobles                                           
-SilmarTeixeira                                          
-Kayvankousha1                                           
-FabrizioGhiselli                                        
-RicardoZayas                                            
-JerrySchulz                                             
-MorrisBirnbaum                                          
-SteveMcCann                                             
-SteveWagstaf                                            
-ElaineAyres                                             
-TracyBuker                                              
-GeorgeKritsotakis                                       
-JessicaSTAPLEY                                          
-PatriceChalon                                           
-anilparwani48257                                        
-SteveLianoglou                                          
-JamesDalton                                             
-AndreuViader                                            
-SuritDas                                                
-testimpactstory55169                                    
-ehm1                                                    
-SueWortman                                              
-suniljosepj                                             
-LucasWaltzer                                            
-ThomasFinger                                            
-SurenSamarchyan                                         
-ElisabethDudziak                                        
-AndrewOrta                                              
-AniNenkova                                              
-DeeDenver                                               
-YasushiHiromi                                           
-SudhamshuDahal                                          
-DongxuZhou                                              
-SUKANTAKUMARPRADHAN                                     
-AmitPandey                                              
-SusanJohnston                                           
-SumanPaul                                               
-MaziarKandelous                                         
-VirginiaBoso                                            
-Suzan(Suzie)Kardong-Edgren                              
-AlexMaina                                               
-user50038                                               
-Veletsianos                                             
-susiegooch                                              
-ElenaSawyer                                             
-user50286                                               
-ElisaGiuliani                                           
-TosiakiMiyati                                           
-TorstenWappler                                          
-ChamindaHewage                                          
-BenMarwick                                              
-BenjaminJMorgan                                         
-JohnLees-Miller                                         
-SwatiChakraborty                                        
-MitraTavakoli                                           
-TimVines                                                
-ronenbarzel                                             
-SusanESearing                                           
-SusanLea                                                
-susannamaltoni                                          
-CarinavanRooyen                                         
-chihaytong                                              
-frzeghretr                                              
-Allen_H_Renear                                          
-user50162                                               
-user50021                                               
-user50097                                               
-YangYifan                                               
-user50961                                               
-PabloEcheverria                                         
-KuldeepSingh                                            
-Iain                                                    
-user50621                                               
-PetervanLaarhoven                                       
-user50672                                               
-user51970                                               
-Susanhelp                                               
-user50144                                               
-user50261                                               
-user50016                                               
-TG                                                      
-EliseHuchard                                            
-ElizabethMoss                                           
-user50083                                               
-DanMcGlinn                                              
-user51124                                               
-LuigiFoschini                                           
-GaryFooks                                               
-ElizabethRamsey                                         
-ElizabethOBrien                                         
-user50139                                               
-user50197                                               
-user50242                                               
-user50265                                               
-user50283                                               
-DavidErnst                                              
-ejfitzgerald                                            
-user50327                                               
-ElizabethWickes                                         
-user50069                                               
-user50138                                               
-user50167                                               
-user50036                                               
-user50334                                               
-EmaFerreira                                             
-user50210                                               
-LuizRocha                                               
-EllenKimmel                                             
-JanChristensen                                          
-ramgopalrao                                             
-AlexGonzalez-Aguero                                     
-user50401                                               
-ElizabethTanguay                                        
-user50402                                               
-user50524                                               
-user50388                                               
-user50307                                               
-EmilyBrown                                              
-bjeyapragashB                                           
-user50488                                               
-SilviaSala                                              
-user50552                                               
-RitaSieracki                                            
-user50604                                               
-user50664                                               
-EMFerreira                                              
-user50629                                               
-user50516                                               
-user50411                                               
-GregCaporaso                                            
-user50558                                               
-user50472                                               
-RichGonzalez                                            
-JenDavison                                              
-user50779                                               
-AlbertoEscribano                                        
-JenniferHoward                                          
-EmilyFidelman                                           
-geboro                                                  
-user50697                                               
-user50806                                               
-user50602                                               
-EmmanuelMaragos                                         
-user50641                                               
-user50684                                               
-user50705                                               
-EricPrice                                               
-user50945                                               
-SilviaKoller                                            
-user50911                                               
-heathertest232                                          
-ericalenton2431                                         
-EnriqueMacpherson                                       
-EnricoFranconi                                          
-KennyHelsens                                            
-user50649                                               
-SeinoJongkees                                           
-ReneeHobbs                                              
-klaas.vandepoele                                        
-EmmaCahill                                              
-user50845                                               
-user50814                                               
-user50728                                               
-user50868                                               
-user51028                                               
-EricaSchattle                                           
-ChristinaHwang                                          
-user51042                                               
-user51101                                               
-aa72532                                                 
-user50979                                               
-user51116                                               
-LoetLeydesdorff                                         
-AmitVikram                                              
-KellyGarrett                                            
-NickWehner                                              
-user50932                                               
-DanielMoreira                                           
-user50909                                               
-user50875                                               
-vsevolodpeshkov                                         
-user51103                                               
-user51078                                               
-EnriqueMendizabal                                       
-user51009                                               
-LukeHarmon                                              
-IngridParker                                            
-user50996                                               
-EricSwenson                                             
-NeilInfield                                             
-DoloresBallesteros                                      
-RodericPage                                             
-ScottEdmunds                                            
-PerfectoHerrera                                         
-OmriBarak                                               
-user51129                                               
-RichardNaples                                           
-PaulAlbert                                              
-OlivierLepais                                           
-PhilipKim                                               
-user50977                                               
-user51131                                               
-user51203                                               
-user51307                                               
-user51152                                               
-user51065                                               
-RobertHoehndorf                                         
-ErinGallagher                                           
-SiegfriedHekimi                                         
-user51412                                               
-SimonElliott                                            
-PeterKrawczel                                           
-RuiBernardes                                            
-user51269                                               
-simon                                                   
-JoyButler                                               
-TReese                                                  
-RussellPoldrack                                         
-user51319                                               
-SergioAlonso                                            
-RolandKays                                              
-user51394                                               
-user51205                                               
-user51211                                               
-anarchivist                                             
-TeganDarnell                                            
-TestAccount                                             
-JulieSpeer                                              
-user50920                                               
-AlexWebb                                                
-user51251                                               
-user51252                                               
-MichaelBLewis                                           
-user51268                                               
-ChrisMaloney                                            
-user51500                                               
-user51446                                               
-StanislasGrassin-Delyle                                 
-ChunChoo                                                
-user51323                                               
-user51516                                               
-TimRead                                                 
-user51532                                               
-user51463                                               
-ScottBaraban                                            
-MaartenBlaauw                                           
-ScottKeogh                                              
-user51396                                               
-user51358                                               
-user51359                                               
-MartaSotoGonzalez                                       
-StewartBrower                                           
-user51370                                               
-user51459                                               
-patloria                                                
-ErinKnight                                              
-TamerÖzsu                                               
-user51304                                               
-WillWhiteley                                            
-user51492                                               
-trevor                                                  
-EthelAllue                                              
-VangelisSimeonidis                                      
-ErwanFloch                                              
-WilfriedElmenreich                                      
-user51477                                               
-AdrianHegeman                                           
-SallyGore                                               
-user51441                                               
-RobertWalker                                            
-TitaBeaven                                              
-ThomasVogt                                              
-TeganDarnell2                                           
-user51514                                               
-JordiPaps                                               
-PabloSolisFernandez                                     
-moussabenhamed                                          
-ArthurHunt                                              
-DinaVrkic2961                                           
-keithtan                                                
-DillJankeLebowski                                       
-evelienvandeperre                                       
-PeterKraker                                             
-FernandaSanJuan                                         
-PeterRoopnarine                                         
-JenniferSmith                                           
-BimbisarIrom                                            
-TerezaSimandlova                                        
-ChristianHauschke                                       
-StianHåklev                                             
-IngridYoung                                             
-CharityRowland                                          
-DevinScannell                                           
-JanMach                                                 
-user51197                                               
-NateSanders                                             
-DavidRoss                                               
-JoachimNeubert                                          
-MathieuRouard                                           
-ManuelSebastián                                         
-EvelinePipp                                             
-MARIAJOSECARRILLO                                       
-RuthTimme                                               
-SarahDoherty                                            
-EvanCornett                                             
-AdamWest                                                
-MichaelHaydon                                           
-BehnamAkhavan                                           
-RobinChampieux5554                                      
-evaortollOrtoll                                         
-faizazubair                                             
-JasonWest                                               
-AndreVellino                                            
-FarahJamal                                              
-OdileHologne                                            
-RorySie                                                 
-ThereseNolan-brown                                      
-RameshSharda                                            
-ExioChaparro-Martinez                                   
-user51587                                               
-CarolColasacco                                          
-RogerWhitson                                            
-PeterTieleman                                           
-StewartBrower2178                                       
-RichardHunter                                           
-FedericoBotella                                         
-FedericoGordo                                           
-ChelseaLeachman                                         
-PatrickRegan                                            
-EduardoMoreno                                           
-AdrianLee                                               
-OleksandrVoznyy                                         
-AlexaRamirez                                            
-BlumaLesch                                              
-PedroBeltrao                                            
-FionnualaBoyce                                          
-FilipPoscic                                             
-RussAltman                                              
-FIDELAROCHE                                             
-JohnJesus                                               
-RicardoMateus                                           
-VittorioBrando                                          
-AlessondraSpringmann                                    
-StevePotter                                             
-JosePabloGalloLeon                                      
-SarahBarbrow                                            
-AlexaMccray                                             
-CorDietvorst                                            
-user51210                                               
-user51657                                               
-user50744                                               
-StevenHandler                                           
-SanjayMolur                                             
-NicholasFabina                                          
-RebeccaMiller                                           
-RichFitzjohn                                            
-SatrajitGhosh                                           
-MonicaWagner                                            
-BenjaminStauch                                          
-AgustinAranda                                           
-EugeneKrustev                                           
-JonathanAitchison                                       
-OlivierAcher                                            
-RebelCummings-Sauls                                     
-MsfOca                                                  
-SebastianRamos                                          
-TedLiefeld                                              
-ForrestWright                                           
-user51585                                               
-StaschLapinski                                          
-FolkertKuipers                                          
-user51183                                               
-NickHiggs                                               
-user51596                                               
-DavidBickel                                             
-MuliaSulistiyono                                        
-RodericPage9932                                         
-WilliamRoss                                             
-EricaSmith                                              
-NoelleBeckman                                           
-AndreaStephens                                          
-RikkeOgawa                                              
-RandyOlson                                              
-user51409                                               
-ClaudiaLienhard                                         
-user51489                                               
-JohnAdams                                               
-SebastienDupont                                         
-ZacharyWood                                             
-PatrikRydberg                                           
-StacyFischer                                            
-AnnalisaBarla                                           
-RebeccaBest                                             
-RitaCastilho                                            
-user50783                                               
-VeronicaLencinas                                        
-SolbrittTest99                                          
-FlorieBorel                                             
-BMDuggan                                                
-dietkart                                                
-ThomasHapke                                             
-TessaFrancis                                            
-AmyMacDonald                                            
-pohkamwong                                              
-RichardMoberly                                          
-CTGPublicValue                                          
-AdrienneSutton                                          
-JeffreyPomerantz                                        
-LorraineLescure                                         
-PabloCarbonell                                          
-ZhengYe                                                 
-WaldoKrugell                                            
-CharlesChoe                                             
-ViníciusKernTest                                        
-RogerHarbord                                            
-RuibangLuo                                              
-BenTatler                                               
-IkkiOhmukai                                             
-enyarko                                                 
-JimWoodgett                                             
-KevinWheeler                                            
-user51200                                               
-LeoniekeAalders                                         
-user51419                                               
-user51721                                               
-NaderAleEbrahim                                         
-user51880                                               
-user51981                                               
-AhmedGehad                                              
-sdflkjimpactstory                                       
-PierreYvesLouis                                         
-user51872                                               
-RBRobey                                                 
-OpenScience85229                                        
-VadimMarkel                                             
-NilsOlavHandegard                                       
-user51349                                               
-ValerieGay                                              
-PaulBastijns                                            
-user51882                                               
-TiffiniTravis                                           
-LibraryMRCLMB                                           
-francescofulvi                                          
-AndreaBurattin                                          
-claudioatzori                                           
-user51713                                               
-user51637                                               
-OpenScience                                             
-user51884                                               
-Anne-WilHarzing                                         
-user51908                                               
-user51927                                               
-user51739                                               
-user51719                                               
-user51683                                               
-HerveMenager                                            
-FranciscoMolina-Freaner                                 
-DanielKliebenstein                                      
-user51694                                               
-user51711                                               
-user51855                                               
-user51763                                               
-user51865                                               
-user51666                                               
-user51921                                               
-BradleyWhite                                            
-user51930                                               
-user51943                                               
-MoiraBent                                               
-BrianDean                                               
-JerryChen                                               
-AlexGarnett                                             
-MamunM.AL                                               
-user51792                                               
-MichelleDalton                                          
-user51656                                               
-shubhadanagarkar                                        
-user51875                                               
-AdaCheung                                               
-user50025                                               
-NarendranKodandapani                                    
-FrankEgerton                                            
-user51878                                               
-DanielMcKenna                                           
-MaitreyaDunham                                          
-am3228                                                  
-user51390                                               
-BoyangLi                                                
-ToddRJackman                                            
-user50395                                               
-StefanMüller                                            
-user51193                                               
-user51584                                               
-ChristopherBartlett1207                                 
-IvanGuerra                                              
-LareenNewman                                            
-CraigBunt                                               
-user51576                                               
-TeresaFishel                                            
-NeeleshDahanukar                                        
-MakotoFukuda                                            
-BradCardinal                                            
-FrankHassebrock                                         
-user51085                                               
-cleidsonalves                                           
-user51473                                               
-FreeRam                                                 
-user50225                                               
-danielklevebring                                        
-user51678                                               
-user50686                                               
-TimothyOsborn                                           
-user50142                                               
-ChristophTraxler                                        
-user51662                                               
-JimWitkins                                              
-user50452                                               
-MarciaMacDonald                                         
-user51664                                               
-JamesYoung                                              
-GaelVaroquaux                                           
-TamasFarago                                             
-user51593                                               
-KentAdams                                               
-ScottLapinski                                           
-bckirkup                                                
-Actamedica                                              
-ChristieWilcox                                          
-GuidoMachado                                            
-ernestoabadal                                           
-gabrieladepaz                                           
-AlexanderOHolcombeAlexanderOHolcombe                    
-BrendaBerkelaar                                         
-user50791                                               
-saorinaquillo                                           
-andreamilan                                             
-user51533                                               
-BrendanThompson                                         
-RaekaAiyar                                              
-GaryLupyan                                              
-user51425                                               
-RyanRaaum                                               
-KIMiller                                                
-PhilipRoberts                                           
-SarahAnnThompson                                        
-ArthurdelPrado                                          
-AtoZnovaspraticaseminformacaoeconhecimento              
-GeraldineMarsh                                          
-user50075                                               
-GeorgeBritovsek                                         
-SerdarBalci                                             
-GaryWard                                                
-fabiobartolini                                          
-user51582                                               
-NedPotter                                               
-herrerosolana                                           
-JoaquindeNavascues                                      
-GeorgePetelin                                           
-user50259                                               
-NeilErnst                                               
-DavidBishop904                                          
-SeverinUebbing                                          
-BarbaraDeFelice                                         
-GeorgeLincoln                                           
-RobertCagna                                             
-user50724                                               
-clintlalonde                                            
-NeilSarkar                                              
-RobinPoell                                              
-ManassesVicente                                         
-scimarina                                               
-JoseJimenez                                             
-akiramuto                                               
-JamesRon                                                
-BrentMetz                                               
-GenevieveSzablya                                        
-JoseMariaAlvarezMartinez                                
-GiuseppeLaquidara                                       
-NicolasLimare                                           
-TatsuyaTAKAGI                                           
-FlorenceMugambi                                         
-terry.mcglynn                                           
-JulieBayley                                             
-LucaSalvatici                                           
-GiancarloCotella                                        
-IbrahimMusa                                             
-StacieDaugherty                                         
-NialWheate                                              
-GerardParmentier                                        
-AndrewBarbour                                           
-GernotDesoye                                            
-cwtskkcwtskk                                            
-CoryRoot                                                
-BenSidders                                              
-CameronGhalambor                                        
-testofapaperrand                                        
-GhiaOsseiran                                            
-EllenKetterson                                          
-GregCarter                                              
-SendhilMullainathan                                     
-JeremyKun                                               
-pedrazafeli                                             
-pdpolly                                                 
-abadalfeliz                                             
-ChristineBurgess                                        
-AndrewCreamer                                           
-KristyAMartire                                          
-ErinRoger                                               
-wkeithcampbell                                          
-CaitlinPepperell                                        
-BrianBot                                                
-BořivojBrdička                                          
-PedroMartinez                                           
-ernestabad                                              
-CynthiaAdcock                                           
-MakotoFukuda6873                                        
-GloriaHaskell                                           
-TeresaWelsh                                             
-BrentSinclair                                           
-DebraSilver                                             
-BrianHodges                                             
-giuseppeliberti                                         
-PrashantSrivastava                                      
-DavidLankes                                             
-BrianDEarp                                              
-StefanLlewellynSmith                                    
-JamesACotton                                            
-ElizabethMBatty                                         
-AfricaGomez                                             
-Jonathan_Klassen                                        
-StevenRussell                                           
-rafalab                                                 
-BrettOlivier                                            
-BrianKoser                                              
-guallarfeliz                                            
-alicesteiner                                            
-GolamKibria                                             
-simecek                                                 
-fumerofeli                                              
-JoeMontibello                                           
-malumbres                                               
-RebeccaParker                                           
-MorganRoupret                                           
-tramullasfeli                                           
-TheodoraBloom                                           
-SophieForcadell                                         
-ClaireEyers                                             
-LukasGroschner                                          
-HinneHettema                                            
-BulloMamo                                               
-user50561                                               
-user50365                                               
-VladimirBlagoderov                                      
-ManuelHernández                                         
-CharlesTucker                                           
-robinsonfeli                                            
-KeerthiValluru                                          
-BryanSmith                                              
-FaridPeiravian                                          
-gthornicroft                                            
-JoseAlbertoClaro                                        
-MangalaSrinivas                                         
-BrookeRosenzweig                                        
-BirteReichstein                                         
-user50158                                               
-GaryHolden                                              
-mbaudis                                                 
-BrigitNonoRius                                          
-carlheneghan                                            
-BrianJolly                                              
-BrianFisher                                             
-BastinMyriam                                            
-PeterVanGalen                                           
-JamesonKHirsch                                          
-LeeRitterband                                           
-zeleniy                                                 
-SebastienKURY                                           
-shiwen                                                  
-YannRimbaud                                             
-ManuelDurand-barthez                                    
-SylviaKuenne                                            
-jameshill                                               
-heathertestimpactstory2                                 
-ManuelSebastian                                         
-GuglielmoRussino                                        
-BurcuDURMAZ                                             
-TianYe                                                  
-NiinaMVieno                                             
-RaulBeltran-Debon                                       
-BrookeFlammang                                          
-CarlosPacheco                                           
-MatthewParker                                           
-StefanFrielingsdorf                                     
-BridMcGrath                                             
-GregoryVerdon909                                        
-brokenbroken                                            
-NatalieBaddour                                          
-JohnDumay                                               
-emiliodelgado                                           
-SimonCockell                                            
-EdTallent3308                                           
-ErikKlemetti                                            
-KristianRother                                          
-JanetViljoen                                            
-AnaMiquel                                               
-MackenzieGavery                                         
-JamieOBrien                                             
-NicolasDellaPenna                                       
-carlosp420                                              
-JOSERAMONALBARRAN                                       
-CarlyMarino                                             
-johnlee                                                 
-ResearchProject_ElisabethVogler                         
-AndreaSchreier                                          
-MariadelCarmenMartinMarichal                            
-JongkyuHa                                               
-RobertaPierattelli                                      
-AsifDoja                                                
-BrentThoma                                              
-BruceNapier                                             
-AlcoholResearchInterestGroupARIGUCL                     
-123Test                                                 
-HaukeHeekeren                                           
-SusanneGannon                                           
-BerndReiter                                             
-burak                                                   
-NiktaFakhri3600                                         
-sdfsdf22728                                             
-canbesimoglu                                            
-RosarioGuiard                                           
-JosephineAdams                                          
-AsifAlNoor                                              
-CallyArdington                                          
-GregoryRamshaw                                          
-AsknKESER                                               
-sarehd                                                  
-ToddOakleyToddOakley                                    
-DaleStorie                                              
-pengwang                                                
-SaraKuebbing                                            
-OnnoBroekmans                                           
-testtest                                                
-MatsGeijer                                              
-EdwardLee                                               
-39b8529e5c5829ca90c5d262b61f6f1d                        
-GeorgWalther                                            
-TomaszStrzaa                                            
-AndriaTieman                                            
-CarlosAizenman                                          
-GlenNuckolls                                            
-vijaykalmani                                            
-MuhammedMurtaza                                         
-GuillaumeRieucau                                        
-GuusBartholome                                          
-blairesteven                                            
-CarlosGuijarro                                          
-user50427                                               
-NicolasChristoforou                                     
-CaryStothart                                            
-user50433                                               
-user51977                                               
-AlasdairRoberts                                         
-DenisLacroix                                            
-ScottVeirs                                              
-AlexandreSerres                                         
-CarlyLassig                                             
-MarcelS.Pawlowski                                       
-EmilyShumchenia                                         
-NavdeepTangri                                           
-FlorenciaPratto                                         
-CarlosDiaz-Castillo                                     
-CatherineAllan                                          
-GulshanMohammad                                         
-ChristinaGodfrey1077                                    
-MarcelloRuta                                            
-KassoOkoudjou                                           
-CaslavBozic                                             
-CSt                                                     
-NorikoCable                                             
-MarcRobinson-Rechavi                                    
-CarmenRodriguez                                         
-oscarperpinan                                           
-AnupKumarDas                                            
-MarefatMah                                              
-CarlosHotta                                             
-JonathanEisensSoftware                                  
-MarcoBravi                                              
-ClementTang                                             
-JorgSteinkamp                                           
-MarcelHolyoak                                           
-user50181                                               
-CarlosPedrós-Alió                                       
-MargaretBrown-Sica                                      
-MarieKennedy                                            
-DanCosley                                               
-ThomasCauchy                                            
-WarrenKoch                                              
-ChristianGronroos                                       
-MariaFilomenaSustelo                                    
-GustaDrenthe                                            
-BrianSaelens                                            
-MargaretDriscoll                                        
-MarcusSilva                                             
-CarmelOSullivan                                         
-AlisonPischedda                                         
-delgadofeliz                                            
-AlyssaCho                                               
-MariaFox                                                
-Chuukwei                                                
-user51029                                               
-user51187                                               
-user51415                                               
-MarioSuva                                               
-MariusTheriault                                         
-JeffreyCarver                                           
-Katejf                                                  
-EdwardSchenk                                            
-lllloooo                                                
-bpb                                                     
-KoujiHarada                                             
-AlysiaVrailas-Mortimer                                  
-ChristianBird                                           
-MargaretSampson                                         
-GwenaelGabard                                           
-HeatherOlins                                            
-JonasKubilius                                           
-MatthiasGeiger                                          
-MyrtoPanagiotaZacharof                                  
-RenaudDel                                               
-user51499                                               
-maricarmen                                              
-MariaHolmlund                                           
-andrebote                                               
-BridgetMorant                                           
-RichardHeeks                                            
-MarkAdams                                               
-user51817                                               
-MarkFunk                                                
-JosedeArriba                                            
-RichardSmith                                            
-RickieLeeMorey                                          
-hwelkjrsdfsdfsf                                         
-MarieClark                                              
-MariaTourna                                             
-CraigCarlson                                            
-MarkMarucot                                             
-MarlonPierce                                            
-JoseAlmeidaCruz                                         
-Maria-JoseBanos-Moreno                                  
-HaidarHarmanani                                         
-AaronDeLoughery                                         
-JamesBeck                                               
-hamoudaghonem                                           
-MariannevanderHeijden                                   
-MarioBerberan-Santos                                    
-HadrienChauvin                                          
-maricarmenmarco                                         
-RichardPatterson                                        
-SteliosKatsanevakis                                     
-user50507                                               
-MartaRapado                                             
-RomainFrancois                                          
-AbderrahmanHachani                                      
-user50865                                               
-MartinPrince                                            
-arpadmike                                               
-MarkTebeau                                              
-MarkHolder                                              
-MarkSkilton                                             
-BelindaMiddleweek                                       
-ElenaDuque                                              
-CaitlynFrazier                                          
-adrianabora13                                           
-EstebanParra                                            
-AndreaZonca                                             
-MarjoleinDrent                                          
-MarleneLee                                              
-MarkCarrigan                                            
-MarjanSlakRupnik                                        
-HamzaYazid                                              
-MartinThanbichler                                       
-MarkHahnel                                              
-adrianaalcara                                           
-MarkPallen                                              
-user50662                                               
-AndrewLepp                                              
-SebastienRenaut                                         
-OliverFischer                                           
-MarkNijland                                             
-RutgerVos                                               
-HaniSuleiman                                            
-MartinSladek                                            
-Han-JungKo                                              
-MarioVallejo-Marin                                      
-HanlieStrydom                                           
-BassemHassan                                            
-user50183                                               
-MartinHepp                                              
-A.BenWagner                                             
-LeaEngle                                                
-BenjaminSaunders                                        
-MarthaKelehan                                           
-HaralamposHarissis                                      
-EulaliaGuiuPuget                                        
-martinweller                                            
-MatthewHirschey                                         
-KarinMeyer                                              
-user50707                                               
-MartinJohnson                                           
-MatthewBerginski                                        
-MartinSchaefer                                          
-HardikShah                                              
-HannoGerdMeyer                                          
-HansPetterSejrup1                                       
-user51134                                               
-MathiasEhrich                                           
-HelenaBarnard                                           
-HaydenHayden                                            
-HelenPerkins                                            
-MattProbert                                             
-MattHayward                                             
-MartinKronbichler                                       
-hashematapour                                           
-HarshadHarde                                            
-MatthewSmith1729                                        
-MatthewSimonson                                         
-MartinZehl                                              
-CarolineKenny                                           
-mattcornock                                             
-MatthiasMachner                                         
-MathiasLoesch                                           
-MáximaBolaños-Pizarro                                   
-MatthieuLaneuville                                      
-MatthiasGrossePerdekamp                                 
-mattdhall                                               
-HelenaDonato                                            
-mbaccarini                                              
-MaureenMecozzi                                          
-MauricioDelfin                                          
-angelborrego                                            
-CharlesMullighan                                        
-MeenooRami                                              
-HelenRoss                                               
-MaxMoritz                                               
-MichelCastagne                                          
-MaunoVihinen                                            
-hemangkothari                                           
-MartinZapotocky                                         
-AnnaComas-Quinn                                         
-MaxKemman                                               
-MichaelO'Donovan                                        
-MelissaHaendel                                          
-HelenaReis                                              
-MatthewNolan                                            
-MelissaJohnson                                          
-MichaelLauer                                            
-mg                                                      
-MelissaGasparotto                                       
-MelnickAri                                              
-HenrydeVries47465                                       
-michaelfralick                                          
-michaelnolan                                            
-HemantShukla                                            
-MichaelRogawski                                         
-MichaelEddy                                             
-MBLCourse                                               
-MblwhoiLibrary                                          
-MichaelMaciel                                           
-MeganPoore                                              
-meghannormond                                           
-MicahVandergrift                                        
-MichaelCant                                             
-merlofeli                                               
-MichaelGallagher                                        
-MelanieFriend                                           
-MichaelBales                                            
-KatinaToufexis4648                                      
-MichaelSalter                                           
-MichaelWells                                            
-HidehiroSakurai98                                       
-MihaiPop                                                
-MikeWebster                                             
-MichaelOsland                                           
-gabrielgallezot                                         
-MichaelTaylor15568                                      
-MichaelToddEdwards                                      
-MichelaTinelli                                          
-MichelleBaker                                           
-MichaelMcCarthy                                         
-MichelleSidler32438                                     
-HannahBradby                                            
-HiroyukiHonnma                                          
-MichaelNevels                                           
-MichaelStocks                                           
-MichaelBecich                                           
-HirokoWatanabe                                          
-HiroshiYamaguchi                                        
-MikeCrang                                               
-MepoLiz                                                 
-MikeCullen                                              
-MichaelRoberts                                          
-SelenaKillick                                           
-michellepearse                                          
-HumbertoGarciaMuniz                                     
-JenniferLaherty                                         
-RussellDinnage2779                                      
-IanManners                                              
-MichelleFrancl                                          
-IanMilligan                                             
-MicheleDudash                                           
-NathalieLeclair                                         
-MichaelWeinstock                                        
-PamelaPollock                                           
-LesleySkalla2927                                        
-ChristopherDean                                         
-RaulFerrer                                              
-IhabYounis                                              
-microBEnet                                              
-MichellePrice                                           
-IanScoones                                              
-MichaelWatts                                            
-MichelleOyen                                            
-MiguelNavascués                                         
-MikeShallos                                             
-imad_dnayahoo.comimad                                   
-IdrisAini                                               
-JamesHanes                                              
-JakobHarnesk                                            
-jamesobeirne                                            
-SimonGarnier                                            
-ShawnGraham5342                                         
-RobertoFiammengo                                        
-IrinaKogan                                              
-JanaSchmidt                                             
-IlonaTrtikova                                           
-ianhambleton                                            
-ineshorvat                                              
-HouryPuzantian                                          
-IoannisPhinikettos                                      
-InnocentAwasom                                          
-IngeHermann                                             
-IoannisParapontis                                       
-JacquesBazin                                            
-IvanScales                                              
-JacquiEwart                                             
-JamesMcKenna                                            
-JamesBriscoe                                            
-AdriaanKlinkenberg                                      
-JanieJohnson                                            
-JanKunnas                                               
-ChrisDiaz                                               
-user50537                                               
-JasnaPeter-Katalinic                                    
-user50007                                               
-JangYunji                                               
-JaneWooster                                             
-JaneSmith                                               
-user51297                                               
-JasonBedford                                            
-SimonNewstead                                           
-CaioMaximino                                            
-PatrickLowenthal                                        
-NabinPaudel                                             
-IvarVermeulen                                           
-JanisRussell                                            
-JamesEvans                                              
-janefoo                                                 
-JaneBarlow                                              
-PatriciaCabezas                                         
-J.BradfordCampbell                                      
-jangkumyeoun                                            
-GiuseppeCamara                                          
-JasonWhite                                              
-JayLunden                                               
-JeanNudell                                              
-PedroMargolles                                          
-JeanHelie                                               
-ShreejoyTripathy                                        
-PedroLeao                                               
-JayWolofsky                                             
-MiroslavBeblavy2595                                     
-Jean-FrancoisHausman                                    
-JeanCarlosFerreiradosSantos                             
-JasonBrown                                              
-DuncanNicholas                                          
-JCOonline                                               
-dsolter                                                 
-ghouatiahmed                                            
-JonMorgan                                               
-EdRodley                                                
-JenniferAdler                                           
-JeffMeek                                                
-pedro                                                   
-EmilyKothe                                              
-ElizabethKendall                                        
-JenelleShanley                                          
-JessecaCornelson                                        
-NunoFerreira                                            
-jennifersmart                                           
-JensJuulHolst                                           
-JuanMiguelGarrido                                       
-StephenHenderson                                        
-JenniferGristock                                        
-AlbertoGranzotto                                        
-ElishaChiware                                           
-RichardPinner                                           
-JesseHolcomb                                            
-Fay-WeiLi                                               
-Minh-DuyPhan                                            
-JoaoPedroFrade                                          
-BarbaraWells                                            
-paperaltmetric                                          
-Jen-chienYu                                             
-JohnAlbarran607                                         
-PhillipLord                                             
-DanielGayoAvello                                        
-JohnDumay7244                                           
-GintareTautkeviciene                                    
-AcademyofManagementJournal                              
-JesusZamoraBonilla                                      
-J.J.SylviaIV                                            
-JeremyCullis                                            
-jocelynquigley                                          
-JohannaCohoon                                           
-PatrickMcknight                                         
-JohnHansen-Flaschen                                     
-RaidellAvello                                           
-rachbrarian                                             
-PrabhatJha                                              
-KiriakosKutulakos                                       
-johnlevis                                               
-RyleeDionigi                                            
-JonathanFranca-Koh70083                                 
-roddillon                                               
-JorgeWismann                                            
-JohnDixon                                               
-JohanAhlgren                                            
-StefanLuschnig                                          
-ElinaRantanen                                           
-JessicaConnor                                           
-GizemKalay                                              
-KarenRupp-Serrano                                       
-JoohoLee                                                
-Juanbarahona                                            
-JohnMarzluff                                            
-JohnOliffe                                              
-JonathanHarwell                                         
-jr                                                      
-JoseFranciscoGarcia-Rodriguez                           
-JohnPinney                                              
-KarolinaZborzynska                                      
-karinamcinnis                                           
-JuanPareja                                              
-GiudittaLecca                                           
-KadambotSiddique                                        
-JohnSmith7684                                           
-JudyLi                                                  
-JRalph                                                  
-KarenAyles                                              
-charleskishman                                          
-JohnReda                                                
-JuliaWarner                                             
-JosephineSciortino                                      
-JungEunKim                                              
-JulieBetsch                                             
-KamenSimeonov                                           
-GemmaSanCornelio                                        
-KandasamyBalachandrakumar                               
-KhaledAlnkhailan                                        
-KevinTyler                                              
-user50829                                               
-J.W.FoppevanMil                                         
-GarySteele                                              
-RichardKulczak                                          
-AndrewTredennick74652                                   
-BobBertsch                                              
-AviMaayan                                               
-JoanneBailey                                            
-RobertJohnson                                           
-JuanAPareja                                             
-RandallLeveque                                          
-KateBushby                                              
-KatherineMcGonagle                                      
-karthikeyank                                            
-JosueRamos                                              
-KathyRobison                                            
-AnthonyClevenger                                        
-MatthewAsmussen                                         
-MarcoAbad                                               
-MarjorieSorensen                                        
-KarenMcAllister                                         
-Ruano-Ravina                                            
-WarrenGLewis                                            
-lorenzorosasco                                          
-MarkElkins                                              
-MadaleneEarp                                            
-user51802                                               
-MadhavanRaghavan                                        
-LovemoreKusekwa                                         
-HenryHerrera                                            
-RengarajanPelapur                                       
-MarkCorreia                                             
-Z.GodwinWang                                            
-RobertKiley                                             
-hhbennett                                               
-luiscodina                                              
-LuciadaSilveira                                         
-RobertLanfear                                           
-user50403                                               
-marinaBattaglia                                         
-RolandoGarcia-milian                                    
-MargoLecompte-VanPoucke                                 
-MarkElliot                                              
-MarcoMeola                                              
-MaciasMercedes                                          
-LuisSantos                                              
-MadhuriChavan                                           
-MasakiTomonaga                                          
-RonaldSnijder                                           
-MarkGroover                                             
-MuneerMohammad                                          
-MikhailSpivakov                                         
-MasoodParvania                                          
-JKiggins                                                
-patrickflack                                            
-CarlosSanz_Rodriguez                                    
-NickParr                                                
-OwenLancaster                                           
-FintanWBracken                                          
-MaryShelley                                             
-MarcSpooner                                             
-MikeWhitfield                                           
-SameerKumar                                             
-mathijsvanleeuwen                                       
-PaulLevett                                              
-MasashiIWAI                                             
-TedHuang                                                
-LauraI.Furlong                                          
-RebeccaPriestley                                        
-AlviseRaccanelli                                        
-Pierre-RichardCornely                                   
-MiikaTapio                                              
-TahirSiddiqi                                            
-SarahSimpkin                                            
-StevenLiss                                              
-VanessaMay                                              
-user51980                                               
-SarahJelbert                                            
-SamiRifai                                               
-titom                                                   
-ChristianHardtke                                        
-user50942                                               
-TaraMalone                                              
-tahmasbbr                                               
-TestUser                                                
-urturner                                                
-carusonm                                                
-UllaWimmer                                              
-PedroMaricato                                           
-SandraBraun                                             
-GenClark                                                
-robynread                                               
-MelissaSaul                                             
-UdayMurthy                                              
-ThomasJansson                                           
-SariYrjanainen                                          
-UeliAngst                                               
-TonyCardone                                             
-SamuelChang                                             
-TabitoMatsuura                                          
-shaditabatabaei                                         
-SydneyEverhart                                          
-TimEdwards                                              
-TaiHsinHsu                                              
-StevenWitt                                              
-user50787                                               
-VenkatachalamUdhayakumar                                
-TrevorTolhurst                                          
-TracyYoung-Pearse                                       
-VenkataKrishnanRamaswamy                                
-UlrichSchroeders                                        
-umashankerkeshri                                        
-WernerVogels                                            
-wgsawyer                                                
-TiinaSipola                                             
-TibautHouzanme                                          
-TomAdams                                                
-VirginiaPannabecker                                     
-user51314                                               
-yi.liu                                                  
-WataruNunomura                                          
-vahidSadr                                               
-user51241                                               
-ThomasWheatland                                         
-TomasRooimans                                           
-TimothyLau                                              
-ValeryGond                                              
-VictorHenning                                           
-VladimirDobrydnyev                                      
-ThomasLottermoser                                       
-TomLawson                                               
-XavierLaudo                                             
-virginiasavova                                          
-XianwenWang5406                                         
-zahrayousefi                                            
-VasilyBunakov                                           
-WeiyiLiu1                                               
-WilliamCRay                                             
-yonastekle                                              
-ZeynelCebeci                                            
-Yen-PingHsueh                                           
-XinHuang                                                
-MonaPuggal                                              
-ChrisPalazzolo                                          
-scottkoga-browes                                        
-VanessaMardones                                         
-WonchoelLee                                             
-VictorGaba                                              
-ZhengguoGu                                              
-VIMALADITHANArunachalam                                 
-ZheGuan                                                 
-zhouyongbin                                             
-WilliamCohen                                            
-Yu-HuiChing                                             
-yangyang                                                
-yabebalfantaye                                          
-YaminaPressler                                          
-VoxHiberioncum                                          
-yvette                                                  
-FynnHolst                                               
-ShawnLeroux                                             
-CharlesAllan                                            
-SebastianKurscheid                                      
-SebastienThuault                                        
-ZierfischerrEINER                                       
-WilliamMuntean                                          
-SimonYoung                                              
-SimonHarper                                             
-ZuhairAl-Johar                                          
-ShelleyMinteer                                          
-SuseJohnston                                            
-sokchengkan                                             
-user51723                                               
-JialaiWang                                              
-ZuhairAl-Johar4353                                      
-AaronMeyer                                              
-dianeclark                                              
-CaseyRawson                                             
-RonaldoDalio                                            
-MartaDeyrup                                             
-srikanthpilla                                           
-ShinichiOide                                            
-SimonGarnier52370                                       
-AmarKulkarni                                            
-WendyMachalicek                                         
-FabioMaltoni                                            
-VikramSaini                                             
-salinastorres                                           
-AbhishekGarg                                            
-RobBriers                                               
-user51392                                               
-AnnOkerson                                              
-AndrewLJackson                                          
-HelenMorris                                             
-NicholasRobin                                           
-DanielColquitt                                          
-SaraEbrahimiNasrabady                                   
-MarkMcClain                                             
-AmartyaBose                                             
-CristopheGueret                                         
-RobHooft                                                
-C.SavioChan                                             
-AlainAbran                                              
-pallavimurthy                                           
-MichaelProulx                                           
-ariovazquez                                             
-CraigMcClain                                            
-ColinSage                                               
-trvrb                                                   
-KirkHevener                                             
-ChanLin                                                 
-DavidLitting                                            
-ChristianKowalkowski                                    
-CarolineBNcube                                          
-user51130                                               
-user50479                                               
-PeterAlbion                                             
-CoryDunn                                                
-DavidMoultonDavidMoulton                                
-JanMach5043                                             
-TerkkoLibrary                                           
-AndradaNeacsiu                                          
-AlexanderWeigand                                        
-user50802                                               
-KathrynOliver                                           
-KathrynMHouk                                            
-user51271                                               
-AnneMeneghetti                                          
-AnneRauh                                                
-TapioSchneider                                          
-hashematapour8920                                       
-TaroNakai                                               
-FrancoisBastardie                                       
-YeseniaGuadalupeTrejoAlfaro                             
-NektariosTavernarakis                                   
-ChristophBecker                                         
-JoshuaRosenbloom                                        
-RobertScott                                             
-AneJean-Michel                                          
-TedKalbfleisch                                          
-JanSchmidt                                              
-ColinCotter                                             
-EduardoRemor                                            
-ClintonBaugess                                          
-CatarinaAlmeida                                         
-HamidR.Jamali                                           
-ArkaitzZubiaga                                          
-AlexanderIlyichev                                       
-cdessimoz                                               
-GarryPeterson                                           
-LoreleiRutledge                                         
-AntonKorshunov                                          
-TeppeiFujikawa                                          
-LaurieBonnici                                           
-JordiBarquinero                                         
-GeorginaBinns                                           
-TomCoenye                                               
-AnthonyPatterson                                        
-RamanChandrasekar                                       
-SaraMagliacane                                          
-ClaytonSinyai3                                          
-user50292                                               
-user50439                                               
-DianeGraves                                             
-AmbroseAkinlo                                           
-ViniciusMKern                                           
-andrewdavison                                           
-JoBates                                                 
-user51670                                               
-MiriamRigby                                             
-Jan_Hjalmarsson                                         
-KylePotts                                               
-irischang                                               
-CraigHayden                                             
-DanielleWhittaker                                       
-GuillaumeGruere                                         
-DanielJoudrey                                           
-bruce-darcus                                            
-ChristopherCline                                        
-LizzJennings                                            
-user50129                                               
-user51016                                               
-FranciscoSaenzdeValluerca                               
-JohannesKruse                                           
-JohnPultz                                               
-BiljanaKosanovicP                                       
-theresenolan                                            
-TiloHartmann                                            
-SalimaRehemtula                                         
-AlexNaf                                                 
-Mohamedchetouani                                        
-InesGil-Jaurena                                         
-DwaneCates                                              
-DonnaHughes                                             
-SimonSherry                                             
-user51933                                               
-tpatwood                                                
-AltheaLazzaro                                           
-EricHartnett                                            
-AshtonVerdery                                           
-HeatherGendron                                          
-HannaCeloch                                             
-PeterWilf                                               
-DmitryKireev                                            
-YulyFuentes_Medel                                       
-AurielFournier                                          
-user50502                                               
-AndreaKosavic                                           
-TiffanySaulter                                          
-IgorCalzada                                             
-JuliaLovett                                             
-AipingDing                                              
-KevinBrick                                              
-LisaStein                                               
-RobstaPowell                                            
-IgorVivanco                                             
-IvetaSimera                                             
-AndersMattiasLundmark                                   
-AlysonYoungblood                                        
-BarnaliChaudhuri                                        
-LauraMielke                                             
-ChristianDeschepper                                     
-AuroreVandeWalle                                        
-HiroyukiGood                                            
-barakrotblat                                            
-fsdsfd                                                  
-VijaiJoseph                                             
-tiffanypattinson                                        
-user51488                                               
-BashirAl-Diri                                           
-AndradaNeacsiu5889                                      
-VitorSeabra                                             
-FatimaRaja                                              
-HadleyBergstrom                                         
-JulianAusserhofer                                       
-FredericdeLamotte                                       
-harryh                                                  
-user51149                                               
-DakeZhang                                               
-DanielMorton                                            
-DanielToolan                                            
-UlrikSartipy                                            
-AlbertQuintana                                          
-DiJia                                                   
-AlexBogdanoff                                           
-DavidEdwards                                            
-EstherDZK                                               
-CITARJournal                                            
-ClaireStent                                             
-KieronFlanagan                                          
-CurrenKatz                                              
-GunasekaranSubbiah                                      
-ElizabethDupuis                                         
-GraceShin                                               
-GeoffHaines-Stiles                                      
-EllenMcDonald                                           
-user50017                                               
-user50024                                               
-user50039                                               
-ClaudeLegault                                           
-user50046                                               
-user50112                                               
-FirstnameBranum-Martin                                  
-YukinoriO                                               
-KathleenMatthews                                        
-HeatherVincent                                          
-FLMELO                                                  
-user50163                                               
-luciaschoombee                                          
-ChrisRusbridge                                          
-DavidJoubert                                            
-GlennHansen                                             
-user50135                                               
-PaulAyris                                               
-user50051                                               
-DenisShields                                            
-DanielSmith                                             
-CieraMartinez                                           
-VGiannikas                                              
-GraemeEarl                                              
-user50204                                               
-user50366                                               
-user50318                                               
-user50500                                               
-user50346                                               
-DaveLunt                                                
-ClareRowan                                              
-FayeChristenberry                                       
-AlanRothman                                             
-ChrisCarswell                                           
-user50169                                               
-DeniseFrost                                             
-user50457                                               
-user50632                                               
-user50635                                               
-user50519                                               
-CordWiljes                                              
-sebastiandaniel                                         
-user50599                                               
-user50506                                               
-JudithSmith                                             
-CharlesWatkinson                                        
-user50813                                               
-user50838                                               
-johngrundy                                              
-user50831                                               
-user50851                                               
-JuanSuárez                                              
-ChrisSkedgel                                            
-user50948                                               
-user50799                                               
-BethGazley                                              
-SheilaMacneill                                          
-user51003                                               
-user51018                                               
-user51022                                               
-user51021                                               
-user51118                                               
-user51145                                               
-user51273                                               
-KarenJensen                                             
-JaniceJaguszewski                                       
-user51165                                               
-user51276                                               
-user51072                                               
-user51357                                               
-user51403                                               
-user51164                                               
-SampathRangasamy                                        
-JohnStockie                                             
-BjörnHammarfelt                                         
-XiaolingShen                                            
-user51464                                               
-user51283                                               
-AdrianStanley                                           
-WesleyBeaulieu                                          
-user51474                                               
-ChristinaGodfrey                                        
-ChetanPhadke                                            
-WenchiPan                                               
-BeckyThoms                                              
-IPOL_Journal                                            
-DavidMassoubre                                          
-CesarBerrios-Otero                                      
-ChristianFleck                                          
-XoséRamónRodríguez-polo                                 
-JChandra                                                
-JuanEscalante                                           
-LoriLach                                                
-JustineHaeberli-Kaul                                    
-JenStevens                                              
-JanineBarchas                                           
-PascalP                                                 
-fkayiwa                                                 
-tvanlaer                                                
-LucindaHearn                                            
-masakataogawa                                           
-MakotoMiwa                                              
-TobiasKind                                              
-user51259                                               
-user51958                                               
-user51783                                               
-AntonioE.Serrano-López                                  
-akepsel                                                 
-ConstanzaBoschAlessio                                   
-J.RamonGil-Garcia                                       
-user50315                                               
-ColleenGanley                                           
-user50600                                               
-TomasLarsson                                            
-FabiniOrata                                             
-JaneMcKeating                                           
-diegoceccarelli                                         
-AntonioVdeAguiar                                        
-GustavoGarciautz                                        
-user51804                                               
-user51853                                               
-CourtneyKing                                            
-user50060                                               
-SarahShreeves                                           
-AlannaRoss                                              
-Dimitrios-GeorgiosKontopoulos                           
-AmandaKelley                                            
-sshasan                                                 
-BenjaminCaraco                                          
-user50008                                               
-MalgorzataRychlik                                       
-user51592                                               
-user51926                                               
-user51300                                               
-user50903                                               
-AllanHanbury                                            
-brhipp                                                  
-BrennaEllison                                           
-ChristineShaw-Daigle                                    
-BrennaHelmstutler912                                    
-user50580                                               
-HelenMcmanus                                            
-TamirHassan                                             
-TimHead                                                 
-HeatherHarrisWright                                     
-CrystalMaier                                            
-noellecowling                                           
-AdolfoAmezquita                                         
-BrianReed                                               
-YingDing                                                
-adamkeithwalker                                         
-AlisaSurkis1605                                         
-briankelly                                              
-manuelmenendez                                          
-FranciscoDelgado                                        
-RichardHuysmans                                         
-JoseAntonioMerloVega                                    
-BrunoGasnier                                            
-BruceBerriman                                           
-refset-fji8ri                                           
-jasonwilde                                              
-StephaneChevrier                                        
-TomNarock                                               
-MargotNash                                              
-GeoffreyThomson                                         
-BruceHerbert                                            
-KennethWelch                                            
-JohannesCvanderWouden                                   
-TomOHara                                                
-ManuelRuiz-de-Luzuriaga                                 
-FirstCollection                                         
-TomokiTakeda                                            
-BillLuecke                                              
-GaryBeaupre                                             
-ChrisEvans                                              
-JaneBeitler                                             
-XianyuHuang                                             
-CelkaStraughn                                           
-TheresaMudrock                                          
-AmandeepSangha                                          
-IJASCSE-                                                
-ChristianBartels                                        
-KristenThyng                                            
-CarlaWilhite                                            
-TomRees                                                 
-thomaspadilla                                           
-BobNicholson                                            
-rchbeir                                                 
-fafa                                                    
-PeterOhly                                               
-HarrietAlexander                                        
-LuisAmaral                                              
-CaoilteOCiardha                                         
-ShinaCarolineLynnKamerlin                               
-TrevorClancy                                            
-ToshifumiYokota                                         
-CarlyMccuaig                                            
-TristanLane                                             
-LSEImpactblog                                           
-NATASHASERNOVA                                          
-Der-ChenChang                                           
-HelmutBuergmann                                         
-PhilMcAleer                                             
-chinghualee                                             
-Peleglab                                                
-TeresaChan                                              
-MargaGual                                               
-KatieLidster                                            
-CarolynSchubert                                         
-TheodorosRousakis                                       
-TsuyoshiMiyakawa                                        
-EricJohnson                                             
-HUAZHOU                                                 
-MarkLeggott                                             
-hvdstest                                                
-ChrisTaylor                                             
-EusebioPerdiguero                                       
-user50867                                               
-IainJohnston                                            
-rpazza                                                  
-SusieMacfarlane                                         
-ColinMeiklejohn                                         
-AstrijsKvassnes                                         
-LisaPettibone                                           
-JAVIERGAVILANES                                         
-sunkwok                                                 
-CassandraKrone                                          
-RafaelMaia                                              
-NTULib_Beta                                             
-RossWhitehead                                           
-jeromyanglim                                            
-TaneyaKoonce                                            
-ElizabethOutler                                         
-AdaiTefera                                              
-MarkusStrohmaier                                        
-HeidiHofer                                              
-alexandradima                                           
-MarioBarbatti                                           
-AhmedFaik                                               
-MelissaMcCormick                                        
-MartinHamilton                                          
-moorepants                                              
-user51460                                               
-JohnKealy                                               
-user50187                                               
-MichaelSankey                                           
-KunioMinato                                             
-AntónioBarros                                           
-user50377                                               
-FZBorstel                                               
-MichaelaPlein                                           
-PeterLoewe                                              
-micheleburford                                          
-user51257                                               
-FelixZajitschek                                         
-AndrewSu                                                
-LucaBorger                                              
-VivekArora                                              
-MRius                                                   
-ValerieMcCarthy                                         
-DirkJandeKoning                                         
-MilanesYusnelkis                                        
-LutLynen                                                
-serranofeli                                             
-AlannaRoss1001                                          
-AnneHarzing                                             
-MariaBoixadera                                          
-MattiaVaccari                                           
-MarniHarrington                                         
-DagmarRiedel                                            
-MariaVila                                               
-AxelKristinsson                                         
-JoanneChapman                                           
-KaraFedermeier                                          
-paulfisher                                              
-BhumiSingh                                              
-ReinhardKlenke                                          
-CarloCombi                                              
-BettyRozum                                              
-AlessandroVilla                                         
-MartinJN                                                
-VitorVLopes                                             
-ZhiguoWang                                              
-NikolajMandsberg                                        
-JanReedijk                                              
-KateLloyd                                               
-GiuseppeIannaccone                                      
-EvgenyPetrovskiy                                        
-christopheboudry                                        
-MariaAngelaPerito                                       
-StacyKonkiel                                            
-HamidRezaNaji                                           
-JuanGorraiz                                             
-MargaretPaxson                                          
-MartinHallberg                                          
-AlexandreLopez-Borrull                                  
-BENOITLACOMBE                                           
-mariobezares                                            
-vivianchen                                              
-HubertusKohle                                           
-DorianoLamba                                            
-StevenZuiker                                            
-SeanFullerton                                           
-DamienGervasoni                                         
-IngoGrass                                               
-DamonHuber                                              
-HaileyPate                                              
-SophieMcDonald                                          
-KeiKurakawa                                             
-IsidinmaN                                               
-VijayBarve                                              
-CheongXinChan                                           
-JuanMaldonado                                           
-Mouradkorichi                                           
-MyAccount                                               
-WhitneyWyckoff                                          
-EagleGenomics                                           
-PauloBranco                                             
-WayneGetz                                               
-AnneMenkens                                             
-saigusahisashi                                          
-DanielTorres-Salinas                                    
-TazroOhta                                               
-HyunjinSeo                                              
-nohaalaa                                                
-Jhfrudd                                                 
-PhilipBarton                                            
-ArnarPalsson                                            
-collinpayne                                             
-kevinjohnson                                            
-MelissaGresalfi                                         
-N_PSingh                                                
-WarrenRaye                                              
-BruceWylie                                              
-MiroslavBeblavy                                         
-manojkumarpraharaj                                      
-TamaraHeartsillScalley                                  
-refset-r5em8r                                           
-Jia-RenLiu                                              
-AndrewBeckerman                                         
-LauraCzerniewicz                                        
-refset-448afg                                           
-BastiaanBoh                                             
-SusannaMarie                                            
-refset-cxauoi                                           
-CurtFischer                                             
-DiegoSotomayor                                          
-refset-j7y73u                                           
-refset-exo1xb                                           
-CarolynFSchubert                                        
-RobKitchin                                              
-StarrHoffman                                            
-user51093                                               
-MaryShultz                                              
-LucyDelap                                               
-benjamin_geisler                                        
-JessicaRohde                                            
-GalileoGroup                                            
-refset-37bgqi                                           
-digizen                                                 
-eshachhabra                                             
-ChristopherBaldassano                                   
-DerekHodgson                                            
-AnnetteGoodwin                                          
-user51237                                               
-ArielBierbaum                                           
-refset-nukrij                                           
-refset-wmkcfx                                           
-BenSweatervest                                          
-user51467                                               
-ElizabethIorns                                          
-JamesBruceStewart                                       
-PatrickHoefler                                          
-AndreasBoland                                           
-LucyMontgomery                                          
-dimplepatel                                             
-aarontay                                                
-PaulRoyster                                             
-KellyBogh                                               
-refset-qytnoy                                           
-dlebauer                                                
-WarrenWiechmann                                         
-user50832                                               
-WillyRozenbaum                                          
-user51191                                               
-TshiyaMasuda                                            
-MarkRobinson                                            
-hasanalirezaee                                          
-refset-wfw390                                           
-NoellaNatalino                                          
-YousefElHasadi                                          
-ThomasChurilla                                          
-user50757                                               
-JosephGelfer                                            
-SonjeDuToit                                             
-SaschaTopolinski                                        
-PaulaSalgado                                            
-PaulKinahan                                             
-KoenVanderStraeten                                      
-RobinChinRoemer                                         
-JuliaMalakie                                            
-RobertEkblom                                            
-user51551                                               
-AnaliPerry                                              
-TomWilson                                               
-JonnaEriksson                                           
-YukinoriOkada                                           
-user50559                                               
-NolitaCoelho                                            
-CaraLewis                                               
-ScottHodges                                             
-JohnWillsLloyd                                          
-MatthieuFrombaum                                        
-CableGreen                                              
-dariotessicini                                          
-VladimirChupakhin                                       
-StevenMaccall                                           
-ThomasHaverkamp                                         
-AmySuiter                                               
-JaredLorince                                            
-SandieSuchet-Pearson                                    
-MannyAres                                               
-claudiavidale                                           
-RyszardKierzek                                          
-NoamRoss                                                
-ChristianWillmes                                        
-KirkFrancis                                             
-GabrielMerino                                           
-StevenSchockaert                                        
-user51064                                               
-YvetteCastaneda                                         
-JeannePavy                                              
-mareeboyle                                              
-DoraLuzGonzalez-bañales                                 
-LiviaMeszaros3108                                       
-ŁukaszBolikowski                                        
-JoseBaltazar                                            
-EugenioBattaglia                                        
-SarahKansa                                              
-IsabelleJohansson                                       
-RossFlett                                               
-LuWang                                                  
-LuisaAlvarezdeToledo                                    
-TrevorBranch                                            
-zoltanszantoi                                           
-LisaFerguson                                            
-SimonRogers                                             
-MarkMeekan                                              
-milamorena                                              
-EvalizaFuentes                                          
-JohnShepard                                             
-ZhenchaoWen                                             
-PeterCock                                               
-PaulLane                                                
-MatiasPiipari                                           
-Sheng-ShuHou                                            
-HeikeAlthen                                             
-CristobalCobo                                           
-MichaelUnwin                                            
-FizoTmao                                                
-SarahMesrobian                                          
-SaraSantos                                              
-KlausZinöcker                                           
-MelissaLaning                                           
-MarcoDelmastro                                          
-OlaPilerot                                              
-RandyMcbride                                            
-MikSa                                                   
-RasaRasa                                                
-AnitaEppelin                                            
-RussellDinnage                                          
-RafaelRepiso                                            
-JordiGaria                                              
-MichaelSears                                            
-PriyankaParsai                                          
-ZhanjunWu                                               
-JamesDavisReimer                                        
-PedroFernandes                                          
-carmelocarlo-stella2093                                 
-PedroJordano                                            
-AzeroualAbdelhamid                                      
-noreleekennedy4348                                      
-BeatricePulliam                                         
-LaszloBalkanyi                                          
-PeterJHJones                                            
-AaronLuebbe                                             
-AndreaPerego                                            
-MarvinMoser                                             
-NataliaMadjarevic                                       
-OscarOviedo-Trespalacios                                
-TonyHorava                                              
-AndrzejTomczyk                                          
-AdrienneZell                                            
-PhoebeAyers                                             
-AntonSirota                                             
-JessicaBay                                              
-SunW.Kim                                                
-AbelPacker                                              
-BrendanO'Connell                                        
-PeterBrown                                              
-AndrewCasey                                             
-ShunsukeTakahashi                                       
-CarlMichal                                              
-EricEdsinger                                            
-AliciaGonzalez                                          
-PaulManning                                             
-tomkeays                                                
-schmuck-soldan                                          
-DamienMagoni                                            
-DieterLukas                                             
-BramZandbelt                                            
-ScottCarlson8226                                        
-SusanJohnston4439                                       
-CorinneBishop                                           
-DustinRubenstein                                        
-AntonioFigueras                                         
-mingzheng                                               
-luispedro                                               
-RyanMills                                               
-LouDore                                                 
-wangrui                                                 
-noahfierer                                              
-JackBellis                                              
-MichelVanCamp                                           
-cranston                                                
-danieltakahashi                                         
-ShawnNevers                                             
-DamienDebecker                                          
-BarbaraFerreira                                         
-ArkadiuszStopczynski                                    
-AlasdairSmith                                           
-AaronBenjamin                                           
-AlexLiberzon                                            
-MaxwellShafer                                           
-AdrianaCuervo                                           
-aditibandyopadhyay7149                                  
-AlasdairJGGray                                          
-802                                                     
-AlastairJohnston                                        
-AkihitoChugun                                           
-AlbertFu                                                
-aammd                                                   
-WEITAO                                                  
-VarshaPatel                                             
-2                                                       
-AJ                                                      
-JoyJohnson                                              
-Anne-MarieDeitering                                     
-AndreaWirth                                             
-AlexanderBeecroft                                       
-AlexisCabrera                                           
-AmandaMurdie                                            
-AlexVermeer                                             
-DamianDowling                                           
-AlexandrKalinin                                         
-AlexanderLorenz                                         
-AlesiaZuccala                                           
-AlkisPaipetis                                           
-allardjongman                                           
-AlonsoEstrada-Cuzcano                                   
-AnirbanMudi                                             
-AlexPrice                                               
-JohnMurphy                                              
-AntonAngelo                                             
-ArunaSeneviratne                                        
-AsahikoMatsuda                                          
-ElizabethFarrellClifford                                
-AndreasGruber                                           
-BensonMwangi                                            
-AnnaBlom                                                
-AngelikiGkouvousi                                       
-AndriyMarin                                             
-AnnaGrear                                               
-AlexandrosPoulopoulos                                   
-BagherArdeshirLarijani                                  
-AndrewLeyshon                                           
-AnaRamoss                                               
-AndrewCooper                                            
-SteffenLemke                                            
-KayTucker                                               
-KenTruman                                               
-pjacock                                                 
-BetsyRolland                                            
-ChrisDean                                               
-ChristinaBrage                                          
-brucemontgomery                                         
-asfasfaafasdfasf                                        
-AsunSempere                                             
-ChrisThompson                                           
-BlancaHimes                                             
-BarnabasKing                                            
-BernardRous                                             
-ChristianParisod                                        
-BarbaraTschirren                                        
-DanielLawson                                            
-DavidSteen                                              
-ClaudineLussier                                         
-DavidMcElroy                                            
-deepakpateel                                            
-erikWijnker                                             
-CarolePalmer                                            
-AriBFriedman                                            
-DarioGrattapaglia                                       
-DocShyr                                                 
-DanteArturoRodriguez-Trejo                              
-JRodrigues                                              
-EirikSovik                                              
-user50475                                               
-GeorgeAranjuez                                          
-EricMJohnson                                            
-CarolineHadley                                          
-JohnVidale                                              
-FrancescoNapoletano                                     
-StefanoTenca                                            
-MayraVelez-Serrano                                      
-MichaelWarren                                           
-ReginaRoberts                                           
-Pankajmyhr                                              
-JoostMiedema                                            
-JanosToth                                               
-KyleMandli                                              
-MichaelHsieh                                            
-PaulManis                                               
-JungseobLee                                             
-MikeShowalter                                           
-NinaHuntemann                                           
-JohnMartin                                              
-MichaelWhitehead                                        
-KimberleyWilliams                                       
-RalphdeWit                                              
-user50976                                               
-JoStichbury                                             
-user51968                                               
-TiagoGuerreiro                                          
-StefT                                                   
-RemoRohs                                                
-saorinfeli                                              
-ArnaKarick                                              
-RUSCUniversitiesandKnowledgeSocietyJournal              
-fuensantamonroy                                         
-JonathanRoberts                                         
-JanelleHedstrom                                         
-ArlieAdkins                                             
-TransitionMagazine                                      
-Rob_van_der_Lans                                        
-carlossalmeron                                          
-SuzanneScott                                            
-s                                                       
-AnikaBatenburg                                          
-sn                                                      
-JadineLannon                                            
-GuillaumeThibault                                       
-jianzhang1982                                           
-LindaShackle                                            
-CarolineCage                                            
-KarimN'Diaye                                            
-AndreaMichalek                                          
-user51685                                               
-EtiennePLeBel                                           
-user50685                                               
-ChristianAndres                                         
-AdisDuderija                                            
-BillyMeinke                                             
-ashadesai                                               
-MortezaDorrigiv                                         
-DylanMacKay                                             
-Dr.NaderAle_Ebrahim                                     
-AlbertoCarbonell                                        
-ArnoKlein                                               
-DennisEckmeier                                          
-HeatherAdams                                            
-CedricMaurange                                          
-AntonioDeNicola                                         
-ValerioMagnaghi                                         
-JoyceSeitzinger                                         
-JaclynDynia                                             
-AngusFerraro                                            
-JohnDumbacher                                           
-GustavoOlivares                                         
-DPThomas                                                
-evawiner                                                
-HolgerHoffmann                                          
-JakeBialer                                              
-CentersforMendelianGenomics                             
-CaitlinRivers                                           
-EtienneRuppe                                            
-PatrickWilliams                                         
-FlorianDuclot                                           
-CatherineEbenezer                                       
-ChinParker                                              
-DonaldHaider-MarkelDonaldHaider-Markel                  
-DobriyanBenov                                           
-MelindaStewart                                          
-StephenTurner                                           
-DanielMarinha                                           
-KatieBrown                                              
-VicenteBaos                                             
-bramvanginneken                                         
-FrancescoDessi-Fulgheri                                 
-ruiwang                                                 
-windhamdavid                                            
-NedelinaTchangalova                                     
-CihanErkut                                              
-PauloFonseca                                            
-SarahCallaghan                                          
-OscarGonzalez                                           
-MelissaRethlefsen                                       
-MarkPearce                                              
-prabinshakya                                            
-pathogenomenick                                         
-MarcioPortal                                            
-PedroFernandes8969                                      
-JornWoerdeman                                           
-LisaHinchliffe                                          
-LauraDelaFuente                                         
-ScottBrown                                              
-MichaelHarvey                                           
-MegKribble                                              
-TamikaHeiden                                            
-AndrewBateman                                           
-rmflight                                                
-PierreDenise                                            
-SandraRacionero-Plaza                                   
-CharlotteRoh                                            
-PranabChatterjee                                        
-LucyJones                                               
-SebastiaanMathot                                        
-user51050                                               
-JoThompsonCoon                                          
-FransvanDunne                                           
-JonathanGray                                            
-JessicaBreiman                                          
-AnilkumarHanumappa                                      
-NATASERNOVA                                             
-CathDavey                                               
-LiviaVeress                                             
-MatthewPrice                                            
-StephenBollinger                                        
-RodrigoAldecoa                                          
-ChristianNiklas3893                                     
-ErkinKuru                                               
-TobyHabash                                              
-EvelinCotella                                           
-GuidoTiemann                                            
-EllenRichardson                                         
-mkurako                                                 
-raoulpoupon                                             
-Yong-YeolAhn                                            
-tricycle                                                
-manojroy                                                
-VincentPlagnol                                          
-RachelArteaga                                           
-ruthcontreras                                           
-AlessandroVespignani                                    
-MagdalenaMaslon                                         
-RikkMulligan                                            
-LeeGettler                                              
-SallyDowling                                            
-LucaComai                                               
-AndreyChursov                                           
-csabapal                                                
-EdwardHollox                                            
-AbbyAdamczyk                                            
-DavidBierie                                             
-JohnCrawford                                            
-JackCannon                                              
-AlexandreChabotLeclerc                                  
-ChrisPavey                                              
-EmilyMcGinn                                             
-carolinag.ojeda                                         
-SivakumarG                                              
-SarahPickle                                             
-JessicaOtis                                             
-LauraAydelotte                                          
-johnweiner9473                                          
-PaigeHarden                                             
-femke                                                   
-DeborahJ.Nelson                                         
-LuisEnriqueAmador-delAngel                              
-ErinFruchey                                             
-AngelicaAlzate                                          
-robinSHANNON                                            
-VanCleve                                                
-DavidHowerter                                           
-GentryHolbert                                           
-mirellaramirez                                          
-ElenaGonzalez                                           
-HeatherDavidson                                         
-LucasSanchez                                            
-yuyamilan                                               
-danielcaetano                                           
-T.N.Shanthakumara                                       
-AndersJensen                                            
-RobinSinn                                               
-user51264                                               
-RoyeWerner                                              
-ScottHertzberg                                          
-chriskilsby                                             
-AhmetUysal                                              
-MohEl-Naggar                                            
-MiquelCodina-Vila                                       
-EstebanMoro                                             
-ChristianJorgensen                                      
-AlanRuddock                                             
-EmilyDavenport                                          
-KorayKaplica                                            
-HuiqinGao                                               
-StephenRichard                                          
-SternNeill                                              
-JasonJ.Jung                                             
-StuartAuld                                              
-FernandoGarcia                                          
-SteveMoss                                               
-StinusLindgreen                                         
-StuartLawson                                            
-BRTest                                                  
-NatalieHutchings                                        
-Federico_Scarpa                                         
-StinaJohansson                                          
-StephenFrancoeur                                        
-StuartWigby                                             
-JanJensen                                               
-stevepowell99                                           
-MichaelSchwarz                                          
-JantinaDeVries                                          
-CarmenRuizLeon                                          
-DavidLythgoe                                            
-DavidLythgoe4505                                        
-JarvistMooreFrost                                       
-jarededecker                                            
-BjoernGruening                                          
-StianSoiland-Reyes                                      
-JanWildenhain                                           
-StevenKelly                                             
-JanPolowinski                                           
-JariJussila                                             
-DanielGros                                              
-BerndSmarsly                                            
-MariVallez                                              
-JayajitDas                                              
-NaderAleEbrahim69325                                    
-YishayMor                                               
-NicWeber                                                
-mariobbezares                                           
-manuelcolombo                                           
-martijnroelandse                                        
-DavidDavies2828                                         
-RiinaVuorikari                                          
-davidsinclair                                           
-melaniemaslem                                           
-srj                                                     
-AmandaDiekman                                           
-DioKavalieratos                                         
-JeremyBerg                                              
-PromitaChatterji                                        
-YanlingZhang                                            
-mschilli                                                
-DavidCox                                                
-LionelSchouveiler                                       
-ZuzanaStorchova                                         
-mcneilsteve                                             
-AndrewSimkin                                            
-fatimafatima                                            
-ThomasWhite                                             
-FranjoPehar                                             
-YunHauNg                                                
-RebeccaSlager                                           
-SureshRana                                              
-LisaMcAllister                                          
-ZALFAltmetrics                                          
-BettinaGnagi                                            
-AmberBeckley                                            
-HenriDelanghe                                           
-SarahMurphy                                             
-FeiZhao                                                 
-DaleepSingh                                             
-YongWeonYi                                              
-EdithZemanick                                           
-AzadehDastyari                                          
-ElishaBignell                                           
-AntiaSalgado                                            
-EmilyMazure                                             
-YeenLau                                                 
-TomDeNies                                               
-GiuseppeGangarossa                                      
-RenaNadjafova                                           
-MasaoIwai                                               
-BeaTurpin                                               
-DavidOwen                                               
-chepec                                                  
-MavisJones                                              
-MarkGreenberg                                           
-NicholasSchurch                                         
-AliBagheri                                              
-dehoyosmariadelcanto                                    
-JenniRikala                                             
-LennartWirthmueller214                                  
-TamarLoach                                              
-MatthewAustin                                           
-VladoVivoda                                             
-TiffanyRoman                                            
-KennethUren                                             
-JanCombopiano                                           
-InaSmith                                                
-AndreasKirchner                                         
-KateLovibond                                            
-HiltonGibson                                            
-NicholasGardner                                         
-Katelaskowski                                           
-MeritxellEstebanell                                     
-LindaHenkel                                             
-BethHall                                                
-AndreaPetroczi                                          
-KatherineBoydell                                        
-LeandroGalli                                            
-MariannePeso                                            
-BrandonBarker                                           
-LalithSuraganiVenu                                      
-TuulaOksanen                                            
-OliverWalton                                            
-CarolinaBonilla                                         
-MercedesRamas                                           
-NachiketKashikar                                        
-SeanDevenish                                            
-NathanHuttner                                           
-AlexandraGreer                                          
-NikolaiSlavov                                           
-NicholasMatzke                                          
-ScottMcCairns                                           
-MartinHeeney                                            
-AmlenduPrabhakar                                        
-ORNLDAAC                                                
-LauraMorris                                             
-KayBuchanan                                             
-MariaJoseLlorca                                         
-BiancavanBers                                           
-KinLanHan                                               
-MichaelAkeroyd                                          
-PalmerFliss                                             
-MatthewFeickert                                         
-MurrayLeslie                                            
-MartinaFranzen                                          
-PhilippeZitoun                                          
-brigitsullivan                                          
-ClaudiePaye                                             
-AliKhalili                                              
-RosaMariaMedir                                          
-MassimoAlessandra                                       
-RomanStilling                                           
-MiguelValdes-Mas                                        
-JafarKolahi                                             
-BenDantzer                                              
-LennartWirthmueller                                     
-RachelPotter                                            
-NikolaiTatarnic                                         
-PaulMitchell3197                                        
-PaulTurner                                              
-GuidoSerini                                             
-OrkidCoskuner                                           
-QuentinSkousen                                          
-sebastianbrauchi                                        
-SharonPotter                                            
-SashaDall                                               
-TARAGRIMALDOS                                           
-SarahBrown                                              
-PhyuWinKyaw                                             
-SimonSchneider                                          
-OliverStegle                                            
-SungSillLee                                             
-HumbertoGonzalez-Diaz                                   
-EdziaCarvalho                                           
-SheaSwauger                                             
-EstherLee                                               
-DeborahKahn                                             
-LuisPuente                                              
-JayDolmage                                              
-AnilPandey                                              
-DScottBrandt                                            
-deepikapannu                                            
-AndreaWheeler                                           
-IkerZuriguel                                            
-RichardKerber                                           
-JessicaEnoch                                            
-HannahLittle                                            
-pietervansteenkiste1406                                 
-JesslynBrown                                            
-giselabutera                                            
-AxelTschentscher                                        
-J.BryceKalmbach                                         
-MartinKopecky                                           
-HugoPardoKuklinski                                      
-JoeLandry                                               
-J.MarkCock                                              
-OliverOndrejka                                          
-JacopoGrilli                                            
-JulieAllen                                              
-MohsenKayal                                             
-ColbyRaley                                              
-MargaridaLimaRego                                       
-JoseVicenteFrancesVillora                               
-GaryFelton                                              
-JoseManuelGomezMontesdeOca                              
-SeanBruna                                               
-PuneetPatra                                             
-JohanKarlssonSchaffer                                   
-PranayGoel                                              
-JinyoungPark                                            
-JuneFrost                                               
-wanlinglee                                              
-JianyaoWu                                               
-BrandonGamble                                           
-MadhanKumarSrinivasan                                   
-CarolGarzon-Lopez                                       
-JunbinQian                                              
-kariendubruyn6804                                       
-JuneOhata                                               
-PiercarloValdesolo                                      
-OlgaMinguez                                             
-JohnHogenesch                                           
-JulieMeyer6212                                          
-LindaSizemore                                           
-microBEnetreferences                                    
-VincenzoChiochia                                        
-JuliannCouture                                          
-TonyFujs                                                
-MarianaVasconcellos                                     
-KAlixHayden                                             
-JoseMagno                                               
-MargaretMetz                                            
-MargaretBremner                                         
-jalpasuthar                                             
-OwenHoekenga                                            
-Marie-joseeCros                                         
-KateByrne                                               
-LuisLopez-Maury                                         
-TimSackton                                              
-mariacosta                                              
-KarienDuBruyn                                           
-NickJeffery                                             
-J.SteenHoyer                                            
-SiLayKhaing                                             
-LuisPortes                                              
-NickBlackbourn                                          
-AnriettePretorius                                       
-TonyPerry                                               
-PaulKellner                                             
-karolinaimiolek                                         
-fernandacastano                                         
-rememelero                                              
-sadeghzafari                                            
-CeliaRabinowitz                                         
-KarenYLo                                                
-VikramSekar                                             
-ThomasSharpton                                          
-PierreMaret                                             
-xx8117                                                  
-ThomasBartoschek                                        
-VirginieKeller                                          
-yousefrezaeichianeh                                     
-MitsuhiroHashimoto                                      
-MichelleEberle                                          
-PraveenJaiswal                                          
-ZinaidaBezverhni                                        
-MarkFielder                                             
-MeredithCornett                                         
-RichardSear                                             
-ColumbiaAcademicCommons                                 
-KayHofmann                                              
-CelesteSimoes                                           
-SasankoSekharGantayat9664                               
-AUDREYBATTIMELLI                                        
-DirkTunger                                              
-NicolasGuyon                                            
-AnnaFerris                                              
-JoshuaHerr                                              
-AlejandroCearreta                                       
-RuthInigo                                               
-JoseAntonioLangaritaAdiego                              
-HermanWirshing                                          
-BrianMason                                              
-XabierBarandiaran                                       
-AlfonsoDiestroFernandez                                 
-ErjiaYan                                                
-AitorMartinezRosell                                     
-franzpinz                                               
-antoniofederico                                         
-RaviIndla                                               
-RosarioGamez                                            
-IgorCalzada9866                                         
-MeganBetz                                               
-RichardEmes                                             
-Chung-MinPark                                           
-LeticiaStrehl                                           
-ChristophePoulet                                        
-LanTran                                                 
-AndrewMcCutcheon                                        
-KevinDrees                                              
-JustinReich                                             
-DickonCopsey                                            
-KarenBaston                                             
-ThomasHalliday                                          
-MajedAkhter                                             
-James.M.Scobbie                                         
-martasainz                                              
-AndreasHoffmann                                         
-JohannesHoja                                            
-AlisonLarsen                                            
-EmilianoMerlo                                           
-DanielFleischhacker                                     
-MirnaAguayo-Salinas                                     
-GloriaSoto                                              
-BonnieDixon                                             
-AnastasiaPapazafeiropoulou                              
-AnaMargheritis                                          
-DagmarWaltemath                                         
-KevinOutterson                                          
-EuniceSchroeder                                         
-ChristineHo                                             
-francescocilurzo8656                                    
-CharlesFoster                                           
-LauraStemmle                                            
-MonderRam                                               
-PatriciaHeyn                                            
-RianavanStaden                                          
-SarahHameed                                             
-RobertoToro                                             
-PaulBurton                                              
-ChrisRawson                                             
-MaximilianPress                                         
-LisaPrice                                               
-LeahEades                                               
-JohnKraemer                                             
-JesusCarrete                                            
-YaowuYuan                                               
-SimonCobbold                                            
-NikhilKrishna                                           
-KarenArchambault                                        
-MurrayAdam                                              
-ArranzJuanJose                                          
-RhysThatcher                                            
-GIGA                                                    
-RyanVacca                                               
-JonathanHavercroft                                      
-JanThiele                                               
-EvaVeres                                                
-KaisuLankinen                                           
-AndersKastberg                                          
-PamBrannon                                              
-grantshimer                                             
-MaurzioCarpita                                          
-CarlaArena                                              
-SamanEhsan                                              
-ThomasHornschemeyer                                     
-MimiUrbanc                                              
-SharonFriesen                                           
-HelenJarvie                                             
-LibraryBoM                                              
-MaggieHardy                                             
-ThomasNi                                                
-KarineLeRoch                                            
-AshleySherry                                            
-CathyCraig                                              
-MattMawer                                               
-guillermosanchez                                        
-RoslynBill                                              
-parikshasingh                                           
-FernandoAlda                                            
-SueWatlinig                                             
-StefaniaBriganti                                        
-Mariabenevolo                                           
-annacazzolle                                            
-MarcelBrannemann                                        
-GrantTrewartha                                          
-michellewalker                                          
-TonyKwon                                                
-helengorrill                                            
-DavidChiu                                               
-SaraEvans-Lacko                                         
-CatherineManthorpe                                      
-MuhammadSafder                                          
-MaxRein                                                 
-KarenMarkey                                             
-ChrisEvans2022                                          
-AmritpalSinghBhullar                                    
-YassineSouimi                                           
-MubeenSyed                                              
-KristinRauch                                            
-PaulineMelgoza                                          
-basvanvliet                                             
-JillBennett                                             
-ToniHaastrup                                            
-HendrikFerreira                                         
-VitorPamplona                                           
-CarmenMitchell                                          
-jenniferfishman                                         
-DavidArdell                                             
-consolgarciagomez                                       
-DuncanHilchey                                           
-MonicaGandia                                            
-MArkvanLoosdrecht                                       
-LaurentLhuillier                                        
-ThomasBuckley                                           
-FernandoMateos-Gonzalez                                 
-SarahVital                                              
-AshikaJayanthy                                          
-LenaForgaard                                            
-ArnoVillringer                                          
-MariaPazDeza                                            
-FinnAarupNielsen                                        
-thomytonia                                              
-RosemarieTruman                                         
-LyannSim                                                
-Jin-ChenYang                                            
-MohdRoslanMohdNor                                       
-Samuelebovo                                             
-rgc                                                     
-DanielvonSchiller                                       
-TslilAst                                                
-JohannesTextor                                          
-PatrickFafard                                           
-MatthewDavis                                            
-heather                                                 
-AndrewReid                                              
-johnparker                                              
-MesraSendir                                             
-LavanyaPremvardhan                                      
-JanetteNicolle                                          
-IngoBobel                                               
-NazeefaFatima                                           
-GiacomoFiumara                                          
-NicoleTrentacoste                                       
-EricGrollman                                            
-MathieuGONNET                                           
-EuanReavie                                              
-DanielLidar                                             
-NunoFonseca                                             
-Sally-AnneStephenson                                    
-IngaMertens-Walker                                      
-matthewfrieman                                          
-MurrayLeibbrandt                                        
-KarlKozlowski                                           
-MariaDornelas                                           
-NafizZamanShuva                                         
-HansvanderMeij                                          
-johnstratoulis                                          
-ShannonDeMaria                                          
-ElizabethKelly                                          
-ThozhukatSathyapalan                                    
-MicahAllen                                              
-CreedAndrew                                             
-LeahRodriguez                                           
-BruceHerbert8656                                        
-preater                                                 
-CristinaRigutto                                         
-MartinaLindorfer                                        
-ChengrongChen                                           
-RaphaelPoss                                             
-SergiiIermakov                                          
-CibyJacob                                               
-NazlinBhimani                                           
-MaryCummings                                            
-SanjayAntony-Babu                                       
-KentMimura                                              
-MicheleNapier                                           
-JenniferYttri                                           
-IJHPMq                                                  
-DianeBuhay                                              
-lauraclarke                                             
-ThaoTran                                                
-ElinVidevall                                            
-SilviaRodriguez-Donaire                                 
-DavidFofi                                               
-PipCrosbie                                              
-PhyloSift                                               
-jennifercrossley                                        
-AnaCarolaValdivia                                       
-GarrettMorris                                           
-LiamSwiss                                               
-EricaBaranski                                           
-RyanWright                                              
-KathrynGlasswell                                        
-BennyZhang                                              
-HenryRowen                                              
-AntonioJacinto                                          
-NavjotBhullar                                           
-AnneClinio                                              
-CarolineJay                                             
-itziarmunoz                                             
-jorgebossio                                             
-SueliMitikoYanoSuga                                     
-GundulaMuldner                                          
-ChristopherDrovandi                                     
-CharlieStamm                                            
-AthulaNaranpanawa                                       
-RajeswaranViswanathan                                   
-ColombiaMedica                                          
-AdamVorsino                                             
-NicolaPirastu                                           
-AnaisBaudot7631                                         
-CandleWester                                            
-LuisEduardoBravo                                        
-SiavashGheshmi                                          
-JarlAndreasAnmarkrud                                    
-LarrySchlesinger                                        
-ChristopherCotter                                       
-PanosGeorgiou                                           
-arnelindqvist                                           
-JoshuaLee                                               
-SimonTanner                                             
-HansWilson                                              
-HelenHeyes                                              
-SamanEhsan3939                                          
-KarinaDeSousa                                           
-FriederikeWelter                                        
-MatthiasSchmuth                                         
-zivastahl                                               
-giorapacciuolo                                          
-ClareInwood                                             
-FracassettiMarco                                        
-JoergMeerpohl                                           
-Jas.Collier                                             
-GrahamBrogden                                           
-EmilyBoyd                                               
-rominatorres-robles                                     
-LaurenBrent                                             
-LeiWang                                                 
-SergeyFomel                                             
-Jean-ClaudeGuedon                                       
-GataHult                                                
-DeenFreelon                                             
-Lars-GoranEriksson                                      
-DanielleSchultz                                         
-zhenzhang                                               
-ArashKianianmomeni                                      
-LukasKlement                                            
-AnnelieseGillard                                        
-MarkDing                                                
-JimiaBoutouba                                           
-MartinShepperd                                          
-AnneMadden                                              
-TERESAGARIN-MUNOZ                                       
-AndreDiedrich                                           
-AyindeFlores                                            
-PamelaRatner                                            
-JavierBlanco-Rivero                                     
-DagThelle                                               
-MaraGuerreiro                                           
-CecilevanderWeert                                       
-SeverianoDosAnjosVilaboa                                
-juanmanueligeaaznar                                     
-Kyung-SunKim                                            
-KambizBahaadinbeigy                                     
-CarlosEduardoDazaOrozco                                 
-HilaryGeoghegan2852                                     
-HuibvanLangevelde                                       
-lukelavallee                                            
-lionelpaolella                                          
-JuhoHamari                                              
-JesusRomanMartinezAlvarez                               
-KrisannaMachtmes                                        
-CarolineLeopold                                         
-RamonFlecha                                             
-SilkeFrank                                              
-GregoryBouquet                                          
-GarrettRogers                                           
-JonKlein                                                
-RemoMasut                                               
-MikeSmith                                               
-JohannesStelzer                                         
-SheilaWebber                                            
-MichaelMerchant                                         
-IlcheongYi                                              
-KatyaPotapenko                                          
-ChaoDeng                                                
-GaryMotteram                                            
-RicardoCalderonGonzalez                                 
-TytusBernas                                             
-RinkeHoekstra                                           
-DavideCareglio                                          
-ChrisFulton                                             
-SjorsScheres                                            
-CarolineLaroche                                         
-DeniseDunlap                                            
-MohammadrezaKaramad                                     
-MarioDAmore                                             
-DavidFredman                                            
-RuthEvans                                               
-MarieNordstrom                                          
-MikelBecerro                                            
-RebeccaKuglitsch                                        
-JaspervandenBosch                                       
-CristinaOrtega-Villasante                               
-drbruceherbert                                          
-DavidSchultz                                            
-ElmarHolschbach                                         
-JohnAntonakis                                           
-RosemaryMardling                                        
-KatherineMorley                                         
-felipenuvoloni                                          
-MatthiasBerth                                           
-CarmenSanMartin                                         
-PeterKraft                                              
-MatthewVonHendy                                         
-WilliamWade                                             
-ElizabethFox                                            
-JosephVarghese                                          
-ClaudiaWienberg                                         
-LucyDipper                                              
-DavidHubbard1902                                        
-TiffanyPrete                                            
-OliverBossdorf                                          
-MartinEessalu                                           
-fengwang                                                
-JesusFontecha                                           
-ScottHarding                                            
-SanahujaPeris                                           
-AlfonsoSanchez                                          
-HeatherChesters                                         
-LucaDeVico                                              
-RyanPace                                                
-MRocioCruzDiaz                                          
-DulcieVousden                                           
-jeremielefevre                                          
-ChristophLahtz                                          
-MandarPaingankar                                        
-joelrios                                                
-TheresaWinchester-Seeto                                 
-DominicGlover                                           
-PatricioBorgesMaracaja                                  
-MedwennaBuckland                                        
-DespinaBiri                                             
-MarkSephton                                             
-CorinnaGries                                            
-DavidReigada                                            
-StevenVerjans                                           
-DanielaDAndreta                                         
-MariaBezaitis                                           
-JohnDuke                                                
-FrancisRemedios1881                                     
-MalekBajbouj                                            
-MatthewFisher-Post                                      
-SteveRounsley                                           
-GaryWard6908                                            
-JulieKent                                               
-ElizabethKingdom                                        
-LIDAH                                                   
-SamiraSiahrostami                                       
-MandarPaingankar748                                     
-StuartAndrews                                           
-GergelyJSzollosi                                        
-WilliamLuther                                           
-KaiHinrichMuller                                        
-ZaminIqbal                                              
-GorkaNavarrete                                          
-JesusGarcia-Parra                                       
-MahavirSingh                                            
-DjordjeBajic                                            
-AllisonFullard                                          
-SonaliMestry                                            
-StellaNg                                                
-MeredithNiles                                           
-JohnMulley                                              
-DennisEvangelista                                       
-EdgarGonzalez                                           
-MarkMorrison                                            
-Dr.PramodKUMAR                                          
-RebeccaTrueman                                          
-AuroraArding                                            
-LipingLi                                                
-margotschlusselhuber                                    
-DuncanGillespie                                         
-PeterClegg                                              
-AmandaLaw                                               
-MichaelBailey                                           
-TintHlaHlaHtoo4667                                      
-AlfonsoVargas-Sanchez                                   
-RhondaOliver                                            
-AliceHarpole                                            
-NadaKrasevec                                            
-FelixLopez                                              
-DouglasMcCauley                                         
-NicolasVandenberghe                                     
-KatherineRenwick                                        
-ChisangaLwatula                                         
-JessicaMeeuwig                                          
-ChristopherHodge                                        
-BenjaminCarr                                            
-LynnWaterhouse                                          
-ingahaugen                                              
-SharynneMcLeod                                          
-YudeisyPerezGonzalez                                    
-AlexandreFranco                                         
-felixmoronta                                            
-CiaranQuinn                                             
-PaulSzyszka                                             
-MirelaTulbure                                           
-RachaelOrben                                            
-EdwardMotea                                             
-VeronicaNanton                                          
-EmmaScott                                               
-Yao-YiChiang                                            
-robertomasabanda                                        
-ClementdeLoubens                                        
-emmanuelvillermaux                                      
-DiamantisSellis                                         
-TomAugust                                               
-LIDAJ                                                   
-ScholarWorks                                            
-GhissMoncef                                             
-ToddBlayone                                             
-JeffreyHolmquist                                        
-JohnWeiner                                              
-jasonkneip                                              
-NikolaDobric                                            
-ProsperGbolo                                            
-JuanAntonioVizcaino8456                                 
-LeahNichols                                             
-abdullahalabdali                                        
-ClaraJoergensen                                         
-PatriceLeGal                                            
-christophealmarcha                                      
-christopheBenaroya                                      
-TrishMcCluskey                                          
-CraigMcClain4625                                        
-AnaFresco-Santalla                                      
-NarayananRaghupathy                                     
-FrancesGriffiths                                        
-skycroeser                                              
-REBECCASTOWE                                            
-XiaogangZhong                                           
-graememcleod                                            
-nesetakozbek                                            
-AnilChandraker                                          
-MargaretStanley                                         
-gautierverhille                                         
-ElenaWilhelm                                            
-VitorRamos                                              
-GraemeSmith                                             
-PaulClavin                                              
-CeliaJanineBernstein                                    
-DominicBroadhurst                                       
-ManiAmoozadeh                                           
-ChristopheEloy                                          
-RadamesCordero                                          
-SaulSosnowski                                           
-VirginiaJones                                           
-WendyBowles                                             
-DanielMetje                                             
-DanielMietchen                                          
-DanielMontesinos                                        
-DanielNoesgaard                                         
-DanielMunch                                             
-DanielMoore                                             
-JanOhlberger                                            
-AnnetteGraae                                            
-GuidoFanelli4246                                        
-JesusAlonso-Regalado                                    
-AlexRubinsteyn                                          
-KatjaReuter                                             
-JohnDennis                                              
-JohanNordholm                                           
-JohnFurfey                                              
-JohnReynolds                                            
-JenniferWarburton                                       
-gundulpacu                                              
-WilliamWetzel                                           
-JessicaFolsom                                           
-BjornHammarfelt                                         
-JanVandenBulck                                          
-JohnKratz                                               
-JasonAli                                                
-JennSeiler                                              
-JennyBryan                                              
-JenWaller                                               
-JonJureidini                                            
-Jens-ChristianSvenning                                  
-JenniferWhittal                                         
-CatherineEpstein                                        
-Joel                                                    
-JoergRieckermann                                        
-JillJameson                                             
-jereodell                                               
-KayKim                                                  
-JennyCDunn                                              
-JodiSchneider                                           
-joljols                                                 
-TimMoss1599                                             
-JohnTowns                                               
-JohnWilbanks                                            
-CameronCraddock                                         
-josemariadiezborque                                     
-MarkReed                                                
-FedericaVacondio                                        
-JorgosAchtsivassilis                                    
-JoMcEntyre                                              
-JonasGilbert                                            
-NoahFahlgren                                            
-RobertColautti                                          
-philipwfowler                                           
-tomezard                                                
-DiegoDeStefani                                          
-DyutiSamanta                                            
-BobEponge                                               
-AchilleasSamaras                                        
-DanielOcampoDaza                                        
-gustavoefischman                                        
-MelissaMallon                                           
-AparnaGudlur                                            
-SamTonddast-Navaei                                      
-ConnorNorwood7395                                       
-AmyMilton                                               
-PeterMidford                                            
-DanielParker9108                                        
-UlrichHerb                                              
-MarcVanWanrooij                                         
-DavidMills                                              
-augustodebenedetti                                      
-DasaptaErwinIrawan                                      
-renatafreitas                                           
-LauraLorenzon                                           
-sushilchoudhary                                         
-JarrettByrnes                                           
-AmandaWhitmire                                          
-JustinDemmerle                                          
-LuisA.Hernandez-Ibanez                                  
-GIGAPublications                                        
-jobflorianvalqui                                        
-MelanieBarwick                                          
-VirginiaWilson                                          
-KatharineWhite                                          
-JeremyAnquetin                                          
-BruceKendall                                            
-user5000                                                
-CynthiaWhitchurch                                       
-TeodoroEspinosa                                         
-Fernando-ArielLópez                                     
-MaryCodd                                                
-MarisaBotha                                             
-drghirlanda                                             
-user50352                                               
-RichardFerrers                                          
-StefanoLariccia                                         
-RobAughey                                               
-JoseGutierrezFernandez                                  
-CharlieRapple                                           
-NicSurawski                                             
-noelbsalazar                                            
-ZacharyTaich                                            
-ChrisAlenSula                                           
-srinivasaraoryali                                       
-DanielSeah                                              
-NunoHenriqueFranco                                      
-IsabelLara                                              
-MaurizioPetrelli                                        
-iovita                                                  
-ThomasVogel                                             
-MelissaTallman                                          
-ChristopherVerrico                                      
-FelipedeJesusPatronEspinosa                             
-matthewbotvinick                                        
-MichaelHoffman                                          
-BrianWestra                                             
-AbdullaAburomman                                        
-LucianoCavani                                           
-InakiRuiz-Trillo                                        
-MicheleTobias                                           
-FrancescoRosati                                         
-HakanOlin                                               
-HakanOlin1342                                           
-YuvalEbenstein                                          
-JIANHUAYE                                               
-JayaramSubramanian                                      
-M.HumayunKabir                                          
-MariaBonn                                               
-josefbruna                                              
-mssongyue                                               
-DKP                                                     
-RHMcDonald                                              
-StephenSoumerai                                         
-SahilSeth                                               
-joseantoniocelades                                      
-stefanoluminari                                         
-FeliciaGiovannotti                                      
-JokinCort                                               
-EmilyKnox                                               
-RobWilliams                                             
-StefanBerti                                             
-LeonardoSaravia                                         
-tomwphillips                                            
-VittorioSanguineti                                      
-ElefteriaKoseoglou                                      
-Dr.WafaaDawoud                                          
-Lisa-MarieShillito                                      
-RussoAntonio                                            
-EimearKenny                                             
-DougMacLeod                                             
-AshleySanders                                           
-AnwerMujeeb                                             
-RomanBauer                                              
-ConnorNorwood                                           
-PhillipMelton                                           
-AlfredHJKim                                             
-YasmeenShorish                                          
-TimRees                                                 
-StephaneSanchez                                         
-ChrisBrown                                              
-ClaireVaughan                                           
-LesTumilty                                              
-JohnLloyd                                               
-MarieKenny                                              
-SebastienS.Dufresne                                     
-IvoBaron                                                
-EricWood7405                                            
-RameshGunaratna                                         
-PetruA.Simionescu                                       
-AmberThomas                                             
-HosseinDehdari                                          
-LuciParmer                                              
-IanHawke                                                
-ArnaudDechesne                                          
-VincePolito                                             
-NikeshNarayanan                                         
-user50930                                               
-HouqiangYu                                              
-DRabina                                                 
-JohnVallier                                             
-RachelSchwartz                                          
-AdamHanley                                              
-AbielAguilar-Gonzalez                                   
-DamayantiChakravarty                                    
-RachelBorchardt                                         
-AndrewCharlton-Perez                                    
-KristofferGreaves                                       
-AashiqKachroo                                           
-MingluWang                                              
-SurHerreraParedes                                       
-AbigailGoben                                            
-MARIADELMARPEREZHIDALGO                                 
-FereshtehDidegah                                        
-IgorLozynski                                            
-AndrewCallaway                                          
-JaniceWinkler                                           
-robincr                                                 
-ElaineLasdaBergman                                      
-SarahWozny                                              
-LeonidasPapachristopoulos                               
-TizianoDeGiacomo                                        
-AdamBrisk                                               
-MatthewTepiMclaughlin                                   
-NicolasBARTS                                            
-SophiedeBoer                                            
-DiogoProvete                                            
-ShaneHogle                                              
-ElizabethWaring                                         
-SeanDavis5830                                           
-VincenzoDesiderio                                       
-VenkataPradeepIndrakanti                                
-FrancescoVersaci                                        
-RicoRaquel                                              
-ColinGillespie                                          
-ElizabethYates                                          
-padraicstack                                            
-ChristineVialKayser                                     
-PabloGarcia7713                                         
-RobertBradley                                           
-TimothySchofield2185                                    
-ClaraEnzaUrzi                                           
-CarlaRaffaelli                                          
-AdamEtkin                                               
-FrancoisMichonneau                                      
-MatthewNilles                                           
-amandarinehart                                          
-RahulKarnik                                             
-JoseMariaTenias                                         
-DarioDonnarumma                                         
-JosephMcVeigh                                           
-MeganCEvans                                             
-PietroCipresso                                          
-MichaelRaghunath                                        
-PietroGL                                                
-SCICOMMLTER                                             
-JoeBruce                                                
-MariaL.Granados                                         
-MaryChao                                                
-Jo-AnneBright                                           
-RichardWoodward                                         
-AngeloRestivo                                           
-NateHough-Snee                                          
-MelitaGiummarra                                         
-AmirSariaslan                                           
-AdianFatchurRochim                                      
-UzainQazi                                               
-valerioramieri                                          
-RavinderSharma                                          
-MarSaenz                                                
-isabelmuniz                                             
-VaidaJankauskaite                                       
-RhysStevens                                             
-LorenzoMagnani                                          
-YohannaWaliyaJoseph                                     
-IaraVidal                                               
-amchelsinki                                             
-JenniferHodge                                           
-GilbertoCamara                                          
-NenadCelarevic                                          
-MariaDominguezdePaz                                     
-TychoHoogland                                           
-vamsegoutam                                             
-PranavNaithani8092                                      
-WaqasKhawaja                                            
-PaolaMartinez                                           
-AmySummerville                                          
-peterkokol                                              
-MariliaMachado                                          
-YannisMarkonis                                          
-AndreaGaetanoChiariello                                 
-yaronshemer                                             
-ViolanteDiDonato                                        
-IoannisPapadimitriou                                    
-markwilkinson                                           
-KristinBriney                                           
-HerveThevenon                                           
-MicheleForzan                                           
-EugeniaKim                                              
-GustavoArciniegas                                       
-HarryChristie                                           
-LutzBornmann                                            
-RobertoPizzala                                          
-lynott                                                  
-AngelaAguayo                                            
-j.girardpitt.eduGirard                                  
-AndrewPilecki                                           
-CLAUDIARIOSGOMEZ                                        
-alisonhicks                                             
-TodJones                                                
-ValentynaKovalenko                                      
-AzusaTanaka                                             
-AbramAnders                                             
-AlexBowe                                                
-RonaldoPrati                                            
-CristianGil                                             
-MuhammadFaiyaz                                          
-YanhaoDong                                              
-EdenGalan-Rodas                                         
-AdalgisaSinicropi                                       
-VERONICASALIDO                                          
-EamonnMaguire                                           
-AndyKaras                                               
-GirirajKulkarni                                         
-ROLANDHATZENPICHLER                                     
-projectaltmetrics                                       
-MaritzaGil                                              
-FraserMuir                                              
-RTijssen                                                
-CourtneyGamston                                         
-DipanjanMukherjee                                       
-xuefengfeng                                             
-KirkStueve                                              
-AntonioCarlosLessa8902                                  
-oikossyntheses                                          
-JasonSmith                                              
-ItziarMunoz1010                                         
-JuliaAguilar                                            
-MarcoBecht                                              
-TomasBocanegra                                          
-SaikiranChandha3454                                     
-SandrineAlarcon-Symonds                                 
-ShandraProtzko                                          
-scottkoga-browes4162                                    
-NaifAlotaibi                                            
-JingxinXu                                               
-Svetalshukla9974                                        
-ScottTurner                                             
-AlexanderHayes                                          
-DanielSlade                                             
-AltunaAkalin                                            
-user50833                                               
-BirgitSchmidt                                           
-EdwardKozaczka                                          
-EdelmiroLopezIglesias                                   
-CarmenSanchez                                           
-InternationalCentreforTaxandDevelopmentICTD             
-AgataIgnaciuk                                           
-JoseCarlosMorilloMoreno                                 
-AnaFortuno                                              
-AnneCostigan297                                         
-SalmaBouchiba                                           
-LovedeepGondara                                         
-patriciaarriaga                                         
-CarmenD                                                 
-aaroncollie                                             
-InternationalCentreforTaxandDevelopmentICTD4141         
-TinaChen                                                
-zhidaohu                                                
-CristianBotezatu                                        
-DeepakPrasad                                            
-JaySheth                                                
-DavidHerron                                             
-AntoineBlanchard                                        
-BrendanBarrett                                          
-KatiaBravo                                              
-MarcWilson                                              
-laleemasenanayake                                       
-ALEJANDROESTRADA                                        
-NicholeABroderick                                       
-KateHertweck                                            
-josuemartinez                                           
-XiaojuanLiu                                             
-CILT_UCT                                                
-EDITORIJARBS                                            
-HazelHall                                               
-nikhiljillawar                                          
-FedirGontsa                                             
-CarlosL.LeopardiVerde                                   
-WilliamPeterman                                         
-SusanaDiazNovillo                                       
-EstherDiez                                              
-UCLUCLHNIHRBiomedicalResearchCentre                     
-RinkajGoyal                                             
-GonzaloSolisSanchez                                     
-MarjoleinStern                                          
-ChrisSeidel                                             
-andreymorgun                                            
-onoriucolacel                                           
-MariaLauraMartin-diaz                                   
-EkaterinaChelpanova                                     
-AkwasiAsamoah                                           
-LuizIrber                                               
-GonzaloLujanVillarreal                                  
-MartinAdalbertoTenaEspinozadelosMonteros                
-UxiaTenreiro                                            
-LoriAnnGionti                                           
-KirstenHecht                                            
-DarioVianello                                           
-IRENEMASEDA                                             
-ChristopherLortie                                       
-SridharGutam                                            
-XaviSanchis                                             
-BorisKlumov                                             
-MatjazJogan                                             
-DavidHubbard9218                                        
-KimMoney                                                
-PabloGarcia                                             
-LuisTorres                                              
-snahlatasingh                                           
-AnaFreitas                                              
-GerhardKlimeck                                          
-simonrayner                                             
-nescenttrialII                                          
-Tzu-LinSun                                              
-AlySaad                                                 
-ClaraRincon                                             
-ElenaCotarelo                                           
-UCLUCLHNIHRBiomedicalResearchCentre6702                 
-AhmedMoustafa                                           
-KaraWoo                                                 
-MHBeals                                                 
-YaldaE                                                  
-CoreySigurdson                                          
-OliverGriffith1134                                      
-PierreCasadebaig                                        
-SokratisVavilis                                         
-gunbenaksu                                              
-EricErkenbrack                                          
-AnabelaGradim                                           
-adeliocravo                                             
-MartinGirardin                                          
-riskmatiya                                              
-CarolinaMuscoli                                         
-SusanSwanton                                            
-PeteBachant                                             
-JuliaGlauberman                                         
-DarioBugada                                             
-WilliamRaffaeli                                         
-DominikSeemann                                          
-ChristianCompagnone                                     
-JordiCabot                                              
-DanielBecker                                            
-gauravsharma                                            
-monirehniazi                                            
-AngelaSimone                                            
-lbcollister                                             
-CarsonSievert                                           
-GulIHinaAslam                                           
-fileunderwater                                          
-KimWilson                                               
-TeresaCosta                                             
-LucieDubail                                             
-MarkJohnson                                             
-LisaCarter-Harris                                       
-BenjaminTurner                                          
-debralyon                                               
-SarahClark                                              
-KarenRowlett                                            
-iamarino                                                
-hazmanaziz                                              
-AnnemieGeeraerd6519                                     
-MartinKlima                                             
-georgestranjalis                                        
-KieranFenby-Hulse6463                                   
-ChrisLeBeau                                             
-AlperDemirdogen                                         
-DarrellOgilvie-Harris                                   
-LouiseJones                                             
-KatherineWills                                          
-DHIRENDRARAY                                            
-MegAsh                                                  
-MarceloSvirsky                                          
-MehdiGolari                                             
-JohnBaglow                                              
-BhojarajuGunjal                                         
-DorothyBarr                                             
-KuanTan                                                 
-MohammadAl-Sayah                                        
-ThomasCochrane                                          
-siouxsie                                                
-SaranyaP.E                                              
-lamaAbuhassan                                           
-MathiasAstell5305                                       
-RebeccaJacobson                                         
-AndrewPatterson                                         
-LauraKrier                                              
-PatrickColegrove                                        
-DanielSmith4731                                         
-CristinaMarinovici                                      
-PanagiotisSymvoulidis                                   
-PaulMaharg                                              
-ArneSmolders3283                                        
-DanielMarcelino                                         
-YannLeBorgne                                            
-JameMoses                                               
-KeithBradnam                                            
-laurasheble5371                                         
-ZhenCao                                                 
-HollieRomain                                            
-JakeSnaddon                                             
-GuillaumeLavoue                                         
-StefanoGuerzoni                                         
-MicahVandegrift4215                                     
-AnaAlfonso                                              
-FalkReckling                                            
-PascalAventurier4283                                    
-LindaHammarback                                         
-GPIInvestigacion                                        
-GustauCamps-Valls                                       
-JoshPasek                                               
-DiegoHernandez                                          
-AraKooser                                               
-ChristopherWinchester                                   
-SimonFunke                                              
-Md.ImranHosain                                          
-DavidSmith                                              
-KathrynTurner                                           
-timsherratt                                             
-EmmanuelleRobert                                        
-JessRobertson4844                                       
-CarlyMoody                                              
-DenisLebel                                              
-GailSteinhart                                           
-SimonGoring                                             
-ShirleyZhao                                             
-JamesBoocock                                            
-HyunJungPark                                            
-DavidFrew                                               
-EvaBlomqvist                                            
-zfaulkes                                                
-MikhailShugay                                           
-JuanLoor                                                
-shabnamheydari                                          
-MonicaLopezLopez                                        
-AndresGuerrero                                          
-StefanoGuerzoni3770                                     
-RitaPellen                                              
-cindypinzon                                             
-ChristinaHo                                             
-KaterynaArtyushkova                                     
-SelenTurkay                                             
-CemOzel                                                 
-MikeSchafer1950                                         
-d                                                       
-AliciaPerez-Porro                                       
-BenjaminMartin                                          
-yh_taguchi                                              
-ThomasBerkemeier                                        
-poppov                                                  
-RichardInger                                            
-MarthaDowns                                             
-EwaldSchnug                                             
-dormanm                                                 
-ColinHales                                              
-ElizabethHellen                                         
-TommasoAlpina                                           
-RemiDaigle                                              
-FranSupek                                               
-RoyBrown                                                
-ValmirPassarelli                                        
-BradleyWebb                                             
-brian-lau                                               
-JorgeSaturno                                            
-JohnOverington                                          
-subramanyannamboodirivaranakkottu                       
-DevinScannell3529                                       
-JagosRadovic                                            
-MichaelBielecki                                         
-HamidrezaMokhtariAski                                   
-EtienneRoesch                                           
-DominikaSeblova                                         
-NickFarris                                              
-MikaelJergefelt                                         
-FlorianMueller                                          
-TravisBeddoe                                            
-YuriYanishevski                                         
-JoeMahan                                                
-DavidWright                                             
-MohammadHasan                                           
-KyleVanHoutan                                           
-JonHill6045                                             
-LeslieChan                                              
-AxelMangelsdorf                                         
-EdwinRodriguez-Ubinas                                   
-TaizanChan                                              
-MadhusudanKatti                                         
-HuangSHINI                                              
-DanieleFanteria                                         
-harmitmalik                                             
-EugenioLlanos                                           
-francescoschettino                                      
-digicmb                                                 
-StefanoBistarelli                                       
-TeresaGrandal                                           
-RahulPratapSinghKaurav                                  
-AndrzejKlimczuk                                         
-MarcosLopez                                             
-CliffordAnderson                                        
-YvesVandePeer                                           
-Heidi1Julien                                            
-WestonPlatter                                           
-BiancaKramer                                            
-MarkBarrow                                              
-Mariamal-Attar                                          
-MeganBallou                                             
-ChiaraAbrescia                                          
-HidemasaBono                                            
-PeterDeWulf                                             
-MelanieMalan                                            
-Jean-ChristopheRenauld                                  
-AndrewHolding                                           
-KiratPalSingh                                           
-fblanco                                                 
-MichelleLin                                             
-KyleCranmer                                             
-AlexanderBucksch                                        
-AndrewSpencer                                           
-ShivendraSingh                                          
-LaurenSallan                                            
-TimoNiedermeyer9123                                     
-FabriceLeclerc                                          
-JoshuaSilberg                                           
-Abdalsamadkeramatfar                                    
-TakanoriHayashi                                         
-CaitlinCurtis                                           
-MayaABOUMATTAR                                          
-IPDGC                                                   
-jmrphy                                                  
-JuanCao                                                 
-BrunoGrande                                             
-JensOldeland                                            
-MahmudHasanKayesh                                       
-UzairAhmed1441                                          
-MatthewCalamia933                                       
-SamuelWai-PanNg                                         
-MariaBoixadera5292                                      
-PeterCowman                                             
-SherryPagoto                                            
-lambo                                                   
-KerryOBrien                                             
-FelixNaughton                                           
-GiovanniBergamin                                        
-AlbertoBaccini                                          
-nazarovets                                              
-StephenWiggins                                          
-GottfriedStrasser                                       
-IgnasiBartomeus                                         
-SOCRATESJOURNAL                                         
-GabriellaMcMichael                                      
-ariel.rokem                                             
-TerenceJackson                                          
-MatthewLaFave                                           
-PeterBai                                                
-VitalManuelDaSilvaDomingues                             
-IHECanada                                               
-Jia-MingChang                                           
-SanuShameer                                             
-JasonAffourtit                                          
-JosepMDuart                                             
-PatrickShine                                            
-BrianEdwards                                            
-GurdasSandhu                                            
-josefinesternvik                                        
-edwbaker                                                
-AnwarSunna                                              
-OlehShylyuk                                             
-JohnMingers                                             
-JillWalkerRettberg                                      
-BeatrizAlvarez                                          
-EgonWillighagen                                         
-PollyCollege                                            
-CelineBellot                                            
-EmilioBruna                                             
-a                                                       
-MariaR.OsunaAlarcon                                     
-ShkelqimMillaku                                         
-JuanPabloAlperin                                        
-MauricioNunez-Regueiro                                  
-KarenRLips                                              
-IrakliLoladze                                           
-MigueldeVal-Borro                                       
-AndrewMarsh                                             
-QuentinGroom                                            
-JamesKing                                               
-MireiaPerezCervera                                      
-DiegoMolla-Aliod                                        
-DavidKetcheson                                          
-MassimoFranco                                           
-StevenPergam                                            
-RodrigoQuiroga                                          
-DanielCrawford                                          
-EliasArner                                              
-CSBQQCBS                                                
-KelseySedgwick                                          
-AllysonPollock                                          
-StephanieBarr                                           
-JusueTorres                                             
-JakeBowers                                              
-CostasGabrielatos                                       
-JonathanWhittall                                        
-CarlosBlondel                                           
-NafisFaizi                                              
-rrellanalvarez                                          
-PRIME                                                   
-NinaChang                                               
-ChrisSampson87                                          
-MichaelNones                                            
-BrentHueth                                              
-GinesViscor                                             
-ArwenFrick-Cheng                                        
-RichardKravitz                                          
-AllanMcDevitt                                           
-RichardStringer-Hye                                     
-JordanDalton1647                                        
-ColletteWeinberger                                      
-nbsclib                                                 
-norconor                                                
-LewisWatson                                             
-abbasamarshi                                            
-DavidGomez                                              
-KrzysztofOlszewski                                      
-ThiagoTalmaAlvesRibeiro                                 
-KimberlyAnderson                                        
-SpyridonChamperisTsaniras                               
-isabelgarcia                                            
-MehulBhatt                                              
-JonathanAgbenyega                                       
-BradfordCondon                                          
-GautamiNewakar                                          
-NatalieClairoux                                         
-chancp                                                  
-LisaLouis                                               
-akankshabeniwal                                         
-KatarzynaWac                                            
-HariharHegde                                            
-EleanorFrajka                                           
-AlexLopezBorrull                                        
-MatthieuChavent                                         
-zeyneptufekci                                           
-MikeBorowczak                                           
-TimothyBartik                                           
-JoeHuggins                                              
-AndreMerzky                                             
-BenjaminLaken                                           
-DeborahLudwig                                           
-TusharPatel                                             
-ShashankBharill                                         
-UlrichLeopold                                           
-GuillaumePoirier                                        
-PedroLeao6824                                           
-CarlosGrohmann                                          
-JamesMartin                                             
-shadigolchin                                            
-PatrickBerube                                           
-AlkimOzaygen3933                                        
-TanmoyBhattacharya                                      
-EmmaMolls                                               
-AdamBezdicek                                            
-AlkimOzaygen                                            
-PatriciaMabrouk                                         
-AshishBajaj                                             
-Dr.VishalPrakashGiri                                    
-MangalaRao                                              
-AnushaNatarajan                                         
-JoseListe-Noya                                          
-MichaelLewis6783                                        
-OlivierRamare                                           
-TOMASGALLARDOGARCIA                                     
-AgustinOstachuk                                         
-AndreaThomer                                            
-ChristianStolte                                         
-HaldunAkoglu                                            
-mmmm                                                    
-RohitkumarSrinivasa                                     
-SwarnChatterjee                                         
-AnneChristensen                                         
-LaleemaSenanayake4446                                   
-AmitSinha                                               
-FNadeau                                                 
-MarkBellingham                                          
-DeveshJoshi                                             
-JuanJSalazar                                            
-SahadevSharma                                           
-lymhwang                                                
-FotisPsomopoulos                                        
-MuftiMahmud                                             
-DanielOhanian                                           
-jod999                                                  
-ozcanozmen                                              
-MilanRaicevic                                           
-LexNederbragt                                           
-MichaelHabib                                            
-LaurentGatto                                            
-JeannetteEkstrom                                        
-HegoiManzano                                            
-VictorTagliacollo                                       
-SuthaharanPeramapalam                                   
-KarenGutzman3968                                        
-RobertNasi                                              
-farooq                                                  
-SilviaBenemei                                           
-MauroConti                                              
-AnnaMariaVogler                                         
-BemgbaNyakuma                                           
-ppgardne                                                
-AmitSharma                                              
-ChathurangiKamburapola                                  
-JenniferEhmann                                          
-JoniceOliveira                                          
-SanjaSchreiber                                          
-belennovoa4910                                          
-KarimAbbasian                                           
-MohamedBadran                                           
-BenGook                                                 
-HarounHabib                                             
-user50028                                               
-CeciliaArighi                                           
-FernandoGabrielGutierrez                                
-AprilHines                                              
-AhmedTealeb                                             
-MennatallahAbdAl-Aziz                                   
-CarlaPais-Vieira                                        
-BaharSateli                                             
-StevenKembel                                            
-W.M.TharangaDilrukRanasinghe                            
-NiklasHultin                                            
-thabettlili                                             
-BrendanGodley                                           
-franciscoramos                                          
-AlexanderPico                                           
-DawnEagle                                               
-PaulTrevorrow                                           
-LyleBurgoon                                             
-JohnQuinn                                               
-MoushiraElamrawy                                        
-HugoSimkin                                              
-RICARDOEITO-BRUN                                        
-DawnJensen                                              
-SimonColes                                              
-AmeliaLopezMartinez                                     
-PacoMar                                                 
-JenniferMurray                                          
-ImmacolataConcezioneForino                              
-ChristaHarstallDemo                                     
-GaladrielChilton                                        
-EnricoPetretto                                          
-LinhongZhu                                              
-GianmarcoAlberti                                        
-ManuelaDeGregori                                        
-MarniHarrington9832                                     
-YolandaGil                                              
-laurentBegue                                            
-MatthewMacLennan                                        
-NathalieSibille                                         
-AleciaCarter                                            
-ritobrotosengupta                                       
-ChristopherLee                                          
-wikiselev                                               
-PauloTeixeira                                           
-BingyanGAO                                              
-MaiAggerbeck                                            
-Luannefreund                                            
-MarianaAmorimFraga                                      
-MattHill                                                
-PascalAventurier                                        
-photobooth-hire                                         
-AliceTark                                               
-UttamPal                                                
-CatiaMatos                                              
-AdamFrank                                               
-SonyPandey                                              
-MagnusJohnson                                           
-FranciscoJoseEiroa-Orosa                                
-leiding                                                 
-ErjiaYan2005                                            
-KelongFan                                               
-SamerHassan                                             
-CrazyScientist                                          
-K.S.LasithGunawardena                                   
-AdamWilson                                              
-MichaelQuayle                                           
-GregoryMatuszek                                         
-AnthonyCurtis                                           
-YuhaoZhu                                                
-MatiasGuzmanNaranjo                                     
-MilicaStankovic                                         
-KwanHoongNg                                             
-JessRobertson                                           
-LokeKokKeong                                            
-StefanLorkowski                                         
-OleksandrBulbuk                                         
-user50562                                               
-MichaelFisher                                           
-LuigiPonti                                              
-PedroSilva                                              
-bonnieswoger                                            
-LailaGad                                                
-PatrickMcCauley                                         
-SimonPlatt                                              
-NicolaMisani                                            
-MatthewAnderson                                         
-nurulfattihaishak                                       
-LeeHickey                                               
-AndreiAlexandrescu                                      
-JamesDUke                                               
-NasirMemon                                              
-ukpdc                                                   
-AgustinoMartinez-Antonio                                
-ChandramouliChandrasekaran469                           
-PayDrechsel                                             
-minetaroarita                                           
-wikify                                                  
-DIegoCalderon                                           
-SitiNurmaHanimHadie                                     
-ChandraPrakash                                          
-EduardBaladia                                           
-TroyCross                                               
-YingtingZhang                                           
-BrianLarsen                                             
-ErickTurner                                             
-hywelwilliams                                           
-pillutlagopalakrishnamohan                              
-JoseBras                                                
-ChristopherShanahan                                     
-DeveshMistry                                            
-JieFu                                                   
-PEDROSERRANO-CASTRO                                     
-JIAYU                                                   
-PERAJASEKHARAN                                          
-sumeyyeakca                                             
-LeonardoCandela                                         
-CedricNotredame                                         
-ThomasTorsney-Weir                                      
-CarlosPeres                                             
-LakshminarayanaVemireddy                                
-vimalkumar                                              
-AmberBudden                                             
-ArturoRivera                                            
-ChristianLettner                                        
-CarrieLShaffer                                          
-HarryMarshall                                           
-WilliamTyburczy                                         
-RahulNahire                                             
-IsaakPapadopoulos                                       
-DilipK.Prasad                                           
-vellutini                                               
-MayaGervits                                             
-ErnestoPriego                                           
-EdmondoBattista                                         
-RebeccaRaszewski                                        
-ScottCunningham                                         
-MulyohadiaAli                                           
-MarshallHagins                                          
-PippaNorris8108                                         
-StevenDRussell                                          
-RahulSatija                                             
-PippaNorris                                             
-JavierMartinez                                          
-JonathanParker                                          
-DeniseTrollCovey                                        
-JonathanDursi                                           
-MaryAagard1217                                          
-PhivosMylonas                                           
-DavidKalfert                                            
-LeonelMorgado                                           
-JenniferSoutter                                         
-alivaheedy                                              
-JoshBishoff                                             
-PramodDobal                                             
-IoannisXenarios                                         
-JohnVincent                                             
-RuggeroTurra                                            
-LisaTjosvold                                            
-HelenEke                                                
-ValentinLoux                                            
-FilipeCorreia                                           
-WojciechFrancuzik                                       
-MarkusLuczak-Roesch                                     
-DongJoonLee                                             
-baharravaei                                             
-carlystrasser                                           
-FahamKhamesipour                                        
-ReynaJenkyns                                            
-lukfor                                                  
-GiuliaPiaggio                                           
-AntoninoLauria                                          
-DanielBond                                              
-FabioPetito                                             
-AbdelazizAl-Rihawi                                      
-charltonmcilwain                                        
-RidgwayGR                                               
-VassilisDalakas                                         
-TinaWey                                                 
-KarenHanson                                             
-guizhenfan                                              
-OliverKohlbacher                                        
-SaulBlanco                                              
-katedrewitt                                             
-DanielEscudero                                          
-MARIADELMARPEREZHIDALGO6679                             
-Capdarest                                               
-ManojSa                                                 
-NongmaithemSadanandaSingh                               
-RebeccaLeydon                                           
-InoShibby                                               
-MukeshJain                                              
-RamiJRIBI                                               
-PeterMcQuilton7333                                      
-DylanMiner                                              
-GyorgyOrosz                                             
-GabrielAgrisi                                           
-AdamTaylor                                              
-RehabO.AbdelRahman                                      
-EusebioMedina                                           
-MarcialGonzalez                                         
-JohnPye                                                 
-jamalAl-Qawasmi                                         
-AntonellaDeLeonardis                                    
-CodyCook                                                
-TizianoRovelli                                          
-JustinShanks                                            
-dcaraban                                                
-ProfessorHerculesHaralambides                           
-SaravananKumar                                          
-HenrykMarjak                                            
-MaykenEspinoza                                          
-MassimoAllegri                                          
-HeshamAttalla1786                                       
-Jee-HyubKim                                             
-TeresaParodi                                            
-Jordi_Paps                                              
-MulinJunLi                                              
-RakeshKhanal                                            
-HisayoshiFujikawa                                       
-NicolaiBrodersenHansen                                  
-KevinGray                                               
-VICENTESISTO                                            
-PietVanhoenacker                                        
-ErikRanschaert                                          
-MNO                                                     
-TarsoMazzotti                                           
-MarcoBisogno                                            
-ethanwhite                                              
-RachelLerner                                            
-CarlosSilva7024                                         
-ElizaGrice                                              
-PradeepReddyRaamana                                     
-ZhangqiYin                                              
-FlorianEchtler                                          
-Upendrasingh                                            
-HunjuLee                                                
-SimoneRosenkranz                                        
-StephanieOrfano                                         
-GustavoMotta                                            
-SarahBlackwood                                          
-ThomasGuillerme                                         
-Rodriguez-Sanchez                                       
-sabrinesabi                                             
-RaniaM.Zahem                                            
-courtneymcdonald                                        
-SylviaKwon                                              
-SagnikBhattacharyya                                     
-andre.rendeiro                                          
-GuillermoBanzato                                        
-SenthilKumarSubramanian                                 
-IsaacHarris                                             
-PhilipOsteen                                            
-ChristinaSheley                                         
-JeannetteEkstroem                                       
-DavidJenkins                                            
-AndrewMilne                                             
-CourtneyAmundson                                        
-RicardoBerbara                                          
-ZulmaYadiraMedranoHuratdo                               
-JonathanEisen4504                                       
-Myung-JaHan                                             
-bulentpetik                                             
-TimothyBowman                                           
-harshwardhanarya                                        
-NievesGlez                                              
-DavidMitchell                                           
-MaryRichardson                                          
-MichaelEkstrand                                         
-RosarieCoughlan                                         
-KevinEscandon-Vargas                                    
-KlausGottlieb                                           
-Seong-TaeKim                                            
-AlessioRovere1545                                       
-CeliaBrown                                              
-muhsinMohammedRashid                                    
-MarcoRuella                                             
-TaoWang                                                 
-FILIPPOZATTI                                            
-DarwishBadran                                           
-IndiaOrnelas                                            
-ChinthakaGamage                                         
-Aleixandre-BenaventRafael                               
-HansVerstraelen                                         
-SandraKlatt                                             
-CarolLau                                                
-hlapp                                                   
-UrsulaHenderson                                         
-STIPolicyReviewSTIPolicyReview                          
-SvenGrimm                                               
-KenFujiuchi                                             
-ErikOlsen                                               
-MariaJesusJimenezHierro                                 
-NoriyukiKodera                                          
-MatejVinko                                              
-hajaehwan                                               
-JoannaHare                                              
-UlrichLehner                                            
-AlexBlanes                                              
-HiroFukukawa                                            
-RizalHariadi                                            
-PaulSelmants                                            
-PrithviSimha                                            
-aysegultahirogluyolga                                   
-CeliaEmmelhainz0                                        
-AlloingCamille                                          
-ChristianHammer                                         
-JaclynMyers                                             
-PeterHickey                                             
-GingerAllington                                         
-YukiKondo                                               
-MFabianaKubke                                           
-testgeheimtest_nichtzufinden23                          
-MargaretHenderson                                       
-FatmaHamed                                              
-HollyBik                                                
-MichaelRCrusoe                                          
-SonyaJones                                              
-FeiYu                                                   
-DanielGraziotin                                         
-NicoBuls                                                
-ZhenhuaGuo                                              
-Carl-JohanCarling                                       
-RachelleAnnechino                                       
-BillHowe                                                
-matinshahivand                                          
-kiranBavirisetti                                        
-NicolasGaltier                                          
-PetarColovic                                            
-RobertoPerez                                            
-dhimmel                                                 
-FredericBouche                                          
-KeijoNenonen                                            
-AinoHelariutta                                          
-JohnMorrongiell                                         
-KARTHIKM                                                
-NurfadzilahYahaya                                       
-ZhongbiChen                                             
-SimonaTabacaru                                          
-RachelWynberg                                           
-NicholasJackson                                         
-chrislutz                                               
-JiamingLi                                               
-EduardPogorskiy                                         
-PalWrange                                               
-MireiaGuerau                                            
-AndrewHill                                              
-ShahidKhan                                              
-SeanElvidge                                             
-GregoryOwens                                            
-BruceCaron2611                                          
-lightonphiri                                            
-VickeryLebbin                                           
-ChristophHauert                                         
-AgustinDiezCastillo                                     
-GuillaumeLobet                                          
-DebjitRay                                               
-raphael-susewind                                        
-aidadiez                                                
-KandyWoodfield                                          
-SarahOtto                                               
-EmmanuelBoss                                            
-MathieuHainselin                                        
-JuanAntonioVizcaino                                     
-KaisaWilson                                             
-EstebanPeguero-Sanchez                                  
-ChennakesavuluKattela                                   
-DavidTaras                                              
-LaurentCiavaglia                                        
-AdamOrlowski                                            
-MasanoriOsawa                                           
-robjhyndman                                             
-RajeshBahadurThapa                                      
-GeorgeLazaroiu                                          
-user93721                                               
-JamesHumble                                             
-JiteshAhuja                                             
-SarahCharing                                            
-AliceTai                                                
-CharlesMenguy                                           
-MatthewMcMurray                                         
-KartikChandran                                          
-helloitsme                                              
-YuriyVovk                                               
-DmitriyDemin                                            
-SelinaDavenport                                         
-FEPSINFO                                                
-GiuseppeCurro                                           
-JonWatts                                                
-HarisParengal                                           
-TakumiTakeuchi                                          
-SandraRodil                                             
-GullyGully                                              
-OsbelAlmoraRodriguez                                    
-AmnayaAwasthi                                           
-PetaStapleton                                           
-NilsHolmberg                                            
-StephaniePierce                                         
-StavrosKassinos                                         
-PramodDash                                              
-LucieMelicharova                                        
-MargoBargheer                                           
-olivierberton                                           
-JensSundstrom                                           
-RonaldoAraujo                                           
-jwbazeley                                               
-surreyeconomics                                         
-AdelaFeldru                                             
-DianaPatriciaGilGomez                                   
-skonkiel                                                
-dickoah                                                 
-NancySeitz                                              
-RobertCostanza7742                                      
-ClaireStewart                                           
-LAURENTLINGUET                                          
-KimberlyMears                                           
-KateStewart                                             
-StephaneDRAGON                                          
-SamiMahroum                                             
-JenniferShelton                                         
-GaleOren                                                
-AnneOsterrieder                                         
-scotttrent                                              
-MuhammadIlyas                                           
-SamDiazMunoz                                            
-PrabhakarMarepalli                                      
-MohsenMesgaran                                          
-KristenDybala                                           
-JarlBastianen                                           
-MEDIVIJAYKUMAR                                          
-danielskatz                                             
-AdamBriggle                                             
-AshtonBradley                                           
-AnneGadomski                                            
-ScottWeingart                                           
-RoumianaMetcheva                                        
-SamirSuweis                                             
-namalWijesinghe                                         
-NaelAG                                                  
-StephenJannetts                                         
-JessicaTheodor                                          
-seyedzoalroshd                                          
-KirstinDougan                                           
-RogerWhitson7102                                        
-StaceyMcGowen                                           
-JaimeGomezRivas                                         
-MehmetSENEL                                             
-DilrubaMahbuba                                          
-PaolaModesti                                            
-VivekN                                                  
-NickZografos                                            
-JanetHughes                                             
-Santiago-Mengual-Andres                                 
-JeanLouJustine                                          
-essepuntato                                             
-RandallGentry                                           
-LuisHestres                                             
-StephenSeiler                                           
-MaksimMisin                                             
-KeithCollier538                                         
-FernandoMaestre                                         
-SalmanShifa                                             
-RobertaWoodgate                                         
-cbahlai                                                 
-KyleNiemeyer                                            
-AndresLopez-Sepulcre                                    
-MartinCorley                                            
-SamanehTabatabaei                                       
-AndreaGutierrezGarcia                                   
-BronwenWhitney                                          
-JonathanLiria                                           
-PaoloPadovani                                           
-ESterErnest                                             
-JudithGreen                                             
-JeroenJansen                                            
-JaneJane                                                
-FabianWeber                                             
-DariaGaydur                                             
-JamesTill                                               
-AdamBress                                               
-NELSONSILVA                                             
-kamermanpr                                              
-ChemConnector                                           
-LisaKruesi                                              
-FacundoMunoz                                            
-AgnieszkaSwiatek                                        
-TranHuuTrung                                            
-JennyOstini                                             
-SamWilliams                                             
-RiazAhmedShaikh                                         
-mustafaalsudani                                         
-HarrietBarker                                           
-JosephCaspermeyer                                       
-KalmerLauk                                              
-RebeccaDevon                                            
-SaadSalman                                              
-UlrichSimon                                             
-MatthewBJones                                           
-MatthijsdeZwaan                                         
-MyriamRodrigues                                         
-MaryStansbury                                           
-SophieMERITET                                           
-PabloSoto                                               
-LaiKeiPang                                              
-SamanthaSampson                                         
-KevinEngel                                              
-ColleenMorgan                                           
-gonuke                                                  
-WenboWu                                                 
-LauraDebacker                                           
-ReganEarly4427                                          
-JudithWinters                                           
-kannannalan5853                                         
-LennartdeNooijer                                        
-VanitaKhanchandani                                      
-FabioNaselli                                            
-SSI                                                     
-ChristineDaigle                                         
-SimonCook                                               
-CaseyGreene                                             
-zahrachenari                                            
-wowter                                                  
-YanirisRodriguez                                        
-KatieWilson                                             
-OliverSkanberg-Tippen                                   
-wouterhendrickx                                         
-SimonNeil                                               
-AmrDraz                                                 
-CarolePalmer215                                         
-DaironMedina                                            
-ClinicalTrialsUnitLSHTM                                 
-AshtonMaherry                                           
-masoomraza                                              
-JeffreyRoizen                                           
-schlakrmu.eduSchlak                                     
-dskempes                                                
-MargaretCasado                                          
-PaulSmaldino                                            
-JamesTaylor                                             
-PeterDown                                               
-ThomasDietz                                             
-VidhyaNagarajan                                         
-WeiPan                                                  
-MassimoBonacchi                                         
-pierpaolocoluccia                                       
-giorgimiqadze                                           
-lasanthaGamage                                          
-YuwenZhang                                              
-AmyBrand5687                                            
-AndersLund                                              
-ManagalaSundaram                                        
-VincentKoppelmans                                       
-AamirMemon                                              
-DavidJBridgett                                          
-RickFarouni                                             
-MathewRobin                                             
-CarlosP.Carmona                                         
-qianqianyu                                              
-AnthonyDesloges                                         
-LixinWang                                               
-BodhrajAcharya                                          
-SomaDasgupta                                            
-IdhamHalim                                              
-serenacima                                              
-MAHDIALLKHAMIS                                          
-MichelleDoty                                            
-AaronSathyanesan                                        
-AnjaliRameshbabu                                        
-GabrielMendivil                                         
-KeithWalker                                             
-davidmcgonigle                                          
-SheldonJJKwok                                           
-FilippoSantuccideMagistris                              
-HollyKindsvater                                         
-RamiroAguilar                                           
-DinaVrkic                                               
-ShinyaMaenosono                                         
-IlamiYasna                                              
-RajaniMishra                                            
-EloiseStephenson                                        
-WendyWong                                               
-JamesBowen                                              
-BurtonTienken                                           
-OscarClaveria                                           
-AaltoUniversity                                         
-JBrittHolbrook                                          
-StefanoOlgiati                                          
-briandconnelly                                          
-RaviMurugesan                                           
-JohnCurry                                               
-user50133                                               
-NormanTrujillo                                          
-OscarPrieto-Flores                                      
-NuriaBautista                                           
-PetterBaeBrandtzaeg                                     
-MarcoBecht3871                                          
-MarcoVignetti                                           
-HeshamAtef                                              
-ShameerKhader                                           
-OlivierLeDeuff8988                                      
-RaghavendraPaknikar                                     
-MargueriteKoole                                         
-YphtachLelkes                                           
-MathieuRouard6533                                       
-KathrynJeffery                                          
-user51705                                               
-MattHolland9752                                         
-ChristineBlack                                          
-NakulSharma                                             
-andreanascimento                                        
-SantiagoElena                                           
-JonathanSinger                                          
-MarioJorgeGoncalves                                     
-PaulThirion                                             
-MarcelaAyala                                            
-EvangeliaZampeli                                        
-InesDomingues                                           
-CaterinaViglianisi                                      
-AntonelloLorenzini                                      
-PauloCintra                                             
-tkuhn                                                   
-GillianByrne                                            
-snim2                                                   
-BradMorrison                                            
-John-ArneRottingen                                      
-MichaelCummings                                         
-user50408                                               
-MohamedLamineFares                                      
-nickoal                                                 
-drnickmorris                                            
-AlbaIrollo                                              
-JoshuaSbicca                                            
-ChristopherMcCrum                                       
-BelislePipon                                            
-QusayMahmoud                                            
-EulaliaCespedes                                         
-PavaniMedapuram                                         
-DiogoMelo                                               
-JH                                                      
-GarryAllison                                            
-JavadZarrin                                             
-ReinhardSimon                                           
-GiovannaCavazzini                                       
-EhsanKazemi                                             
-TatsuyaTAKAGI4222                                       
-CindyVeldhuis                                           
-MichaelSchultz                                          
-DeepakChouracia                                         
-AniMatei                                                
-AhmadHalwani                                            
-CourtneyFuson                                           
-GabrielFinkelstein                                      
-HollyGanz4263                                           
-LindaGalloway                                           
-DaisieIrisHuang                                         
-IsidroGonzalez                                          
-RobertHye                                               
-WilliamAnderson                                         
-BinoyJose                                               
-JorgeGomez                                              
-IsidroGonzalez1131                                      
-jonnorberg                                              
-JuanManuelZuritaSanchez                                 
-EvalyneMuiruri                                          
-benkeele                                                
-PaulaQuintano                                           
-AntoineBlanchard5846                                    
-KevinGorey                                              
-lidianecarvalho                                         
-VARUNKAPOOR                                             
-NAZIAHOSSAIN                                            
-LokmanMeho                                              
-VukovicNikola                                           
-LoretoRodriguez                                         
-JudyBailey                                              
-jeff                                                    
-LYYeo                                                   
-javiermata                                              
-MasaoTakaku                                             
-AfrozAhmadShah                                          
-xiacuijun                                               
-EleeWood                                                
-SureshPanneerselvam                                     
-MichaelKolios                                           
-PilarGomez-Bachmann                                     
-GregorFranssen                                          
-ErolGelenbe                                             
-ElisabethStes                                           
-grahamsteel                                             
-EnricoBucci                                             
-JosefaRomeroMartinez                                    
-DavidHarris2048                                         
-RudraSensarma                                           
-DelaPuenteBujidosIsabel                                 
-AlessandroVilla5209                                     
-ClaraBuencampo                                          
-FelixLohmeier                                           
-DanaDenick                                              
-PalmiraSeixas                                           
-EwanGrant                                               
-onkardhande                                             
-SantiagoSoliveres                                       
-MariaJosepMerliGimeno                                   
-user56944                                               
-JosefaR.Martinez                                        
-MarieRoux                                               
-RossMounce                                              
-JazminAlejandraNavarroMunera                            
-BaydenRussell                                           
-RobertoMartin                                           
-InodeBruijn                                             
-KristinaYapova                                          
-AydaSefidaniforough                                     
-MariellePetrova                                         
-LunaTerrer                                              
-PrasadiJayasekara                                       
-CarlosMarioArroyave                                     
-PerMilberg                                              
-TreavorRiley                                            
-NicoleRobinson                                          
-PierreBellec                                            
-GemmaMasdeu                                             
-CristinaCapittini                                       
-CameronNeylon                                           
-RaquelEscribano                                         
-CyrilPernet                                             
-CanCenik                                                
-waseemraja                                              
-UFOpenAccessPublicationFund                             
-MachhindraKoirala                                       
-LarryYork                                               
-LodeGoukens                                             
-DennisWeber                                             
-HeatherPiwowar                                          
-BorisTaganov                                            
-AntonioVidal-Infer                                      
-RadovanPetrik                                           
-TomasRos                                                
-NicoleLoorbach                                          
-JoWolfe                                                 
-AmyRobinson                                             
-CristinaRomanelli                                       
-ChitraGautham                                           
-GermainVallverdu                                        
-CarmiCronje                                             
-TamarGanor                                              
-DennisWeber6232                                         
-GoncaloFernandes                                        
-VincentCosta6455                                        
-AdrianC.Prelipcean                                      
-MichaelCianfrocco                                       
-OswellRusinga                                           
-ManuelAlves                                             
-brisasf                                                 
-RishabhShrivastava                                      
-AustinLeach                                             
-MFernandaGarzon-Farinos                                 
-FernandaGarzon-Farinos                                  
-MichaelaSaisana                                         
-driscience                                              
-GabrieleMascherini                                      
-hahsdfas                                                
-MeghanaSanjeeva                                         
-ChiawLingTee                                            
-pbulsink                                                
-DineshGovindaraj                                        
-MondayIgwe                                              
-PeterSasvari                                            
-kheloulnassim                                           
-RobertZ.SeldenJr.                                       
-ArifWibowo                                              
-VenkataRamayya                                          
-KiratPal                                                
-JamesStoner                                             
-AmirHosseinHaratiNejadTorbati                           
-SaumyaKrishna                                           
-StefanPukatzki                                          
-batscamille                                             
-DaniellyRibeiro                                         
-ArifWibowo6035                                          
-dennispetkiewicz                                        
-PaulDitterline                                          
-sahebjadasrujana                                        
-LeonDicks                                               
-lims                                                    
-tanyanarahari                                           
-StephaneBoyer                                           
-TerriGilbert                                            
-JesusColprim                                            
-ChristinaSorensen9622                                   
-VicentGimenezChornet                                    
-AnaBaltar                                               
-LutingLiu                                               
-mariselamontenegro                                      
-JoydipKundu                                             
-KannyChang                                              
-DeborahFitchett                                         
-KatieFraser                                             
-SpencerMamer                                            
-UdayaDampage                                            
-MahmoudKamalAhmadi                                      
-GuilhermeGualda                                         
-SaeedGhafghazi                                          
-SukhdeepSingh                                           
-HeatherCoates                                           
-AlexisMorenoPulido                                      
-MeganSappNelson                                         
-HiradRoshandel                                          
-EranElhaik                                              
-VildeaneBorba                                           
-user94736                                               
-MarkRubin                                               
-NigelTemperton                                          
-DylanStorey                                             
-nicolebasile                                            
-LisaOHara                                               
-ClaudioPoggio                                           
-CiciliaConceicaodeMaria                                 
-SiobhanBanks                                            
-javadzaraat                                             
-Achala                                                  
-MattiaMichieletto                                       
-stevenraywilson                                         
-AlexandraLippman                                        
-AmericoMendes9152                                       
-AmericoMendes                                           
-jgfrey                                                  
-DavidDavies                                             
-GaryBrown                                               
-DanielRandles                                           
-MarcCadotteMarcCadotte                                  
-IvanYecidPovedaChoconta                                 
-MartinMorris                                            
-KarenLeeMcKee"""
-
-url_slugs_to_redirect = [slug.strip().lower() for slug in url_slugs_string.split()]
-
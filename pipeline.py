@@ -0,0 +1,389 @@
+from time import time
+from collections import defaultdict
+from multiprocessing import Pool
+from multiprocessing import Queue as ProcessQueue
+from multiprocessing.pool import ThreadPool
+from Queue import Queue
+from Queue import Empty
+import argparse
+import os
+import sys
+import traceback
+
+from app import db
+from util import elapsed
+from util import chunks
+
+import jobs
+from jobs import update_registry
+from jobs import iter_id_windows
+from jobs import run_chunk_in_pool_worker
+from jobs import print_skip_counts
+from models.job_keys import claim_objects
+from models.job_keys import clear_job_keys
+from models.refset import update_refsets
+from models.refset import update_badge_percentiles
+from models.refset import refset_inputs_changed
+
+# needs to be imported so the definitions get loaded into the registry
+import jobs_defs
+
+
+"""
+runs the weekly batch cycle as one pipeline instead of one command after another:
+
+    Person.refresh -> update_refsets -> update_badge_percentiles
+                   -> Person.email_new_stuff  (with --email)
+
+the refresh goes through the people a range of ids at a time.  per-range stages
+(email) start on a range as soon as it's refreshed.  global stages (refsets)
+start once every range is done, and are skipped if nothing they read has changed.
+i/o-bound stages run on a thread pool, cpu-bound ones on a process pool.
+
+per-range stages skip the same things update.py does: anything already queued
+or running, or done less than the update's fresh_for seconds ago (see
+models/job_keys.py).  --fresh-for changes that, and --force skips nothing.
+
+python pipeline.py --limit 1000 --email
+"""
+
+
+class Stage(object):
+    """
+    One step of the pipeline.  Per-range stages run a registered update over
+    each range of ids; global stages run fn once.
+
+    A stage with inputs_changed is skipped when it returns False, and so is a
+    stage whose dependencies were all skipped.
+    """
+
+    def __init__(self, name, update_name=None, fn=None, depends_on=None, cpu=False, inputs_changed=None):
+        self.name = name
+        self.update = update_registry.get(update_name) if update_name else None
+        self.fn = fn
+        self.depends_on = depends_on or []
+        self.cpu = cpu
+        self.inputs_changed = inputs_changed
+
+    @property
+    def per_range(self):
+        return self.update is not None
+
+
+def weekly_stages(email=False):
+    stages = [
+        Stage("refresh", update_name="Person.refresh"),
+        Stage("refsets", fn=update_refsets, depends_on=["refresh"], cpu=True, inputs_changed=refset_inputs_changed),
+        Stage("percentiles", fn=update_badge_percentiles, depends_on=["refsets"], cpu=True)
+    ]
+    if email:
+        stages.append(Stage("email", update_name="Person.email_new_stuff", depends_on=["refresh"]))
+    return stages
+
+
+def record_pool_worker_pid(pid_queue):
+    # each cpu pool worker says when it starts, so the pipeline can tell when one's been replaced
+    pid_queue.put(os.getpid())
+
+
+def run_global_stage_in_worker(fn):
+    start = time()
+    try:
+        fn()
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    db.session.remove()
+    return (None, error, elapsed(start))
+
+
+class Pipeline(object):
+
+    def __init__(self, stages, io_workers=8, cpu_workers=2, window_size=1000, chunk_size=10, limit=None,
+                 ranges_in_flight=3, fresh_for=None, force=False):
+        self.stages = dict((stage.name, stage) for stage in stages)
+        root_stages = [stage for stage in stages if stage.per_range and not stage.depends_on]
+        if len(root_stages) != 1:
+            raise ValueError("a pipeline needs exactly one per-range stage with no dependencies")
+        self.root = root_stages[0]
+
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self.window_size = window_size
+        self.chunk_size = chunk_size
+        self.limit = limit
+        self.ranges_in_flight = ranges_in_flight
+        self.fresh_for = fresh_for  # None means each update's own fresh_for
+        self.force = force
+
+        self.ranges = []  # (first id, last id) of each window of the root stage, in id order
+        self.windows = None
+        self.windows_done = False
+
+        self.scheduled = set()  # stage names, and (stage name, range index)
+        self.num_pending = {}  # (stage name, range index) or stage name: chunks still running
+        self.ranges_done = dict((name, set()) for name in self.stages)
+        self.global_done = set()
+        self.skipped = set()
+        self.failures = []
+        self.events = Queue()
+        self.skip_counts = defaultdict(int)
+        self.claimed_chunks = {}  # (stage name, first id): (update name, ids) for chunks not done yet
+
+    def run(self):
+        start = time()
+
+        # fork the process pool before we have any connections to hand it
+        db.session.remove()
+        db.engine.dispose()
+        self.cpu_pool_pid_queue = ProcessQueue()
+        self.cpu_pool_pids = set()
+        self.cpu_pool = Pool(processes=self.cpu_workers, initializer=record_pool_worker_pid,
+                             initargs=(self.cpu_pool_pid_queue, ))
+        self.io_pool = ThreadPool(processes=self.io_workers)
+
+        # the threads share this process's engine, so update_fn mustn't dispose of it
+        jobs.warm_process = True
+
+        self.windows = iter_id_windows(self.root.update.cls, self.root.update.query, self.window_size, self.limit)
+        cpu_pool_healthy = True
+        try:
+            self.schedule()
+            while not self.is_done():
+                # with a timeout, so ctrl-c gets through and a dead worker gets noticed
+                try:
+                    self.handle_event(self.events.get(True, 60))
+                except Empty:
+                    pass
+                cpu_pool_healthy = self.check_cpu_pool()
+                if not cpu_pool_healthy:
+                    break
+                self.schedule()
+        finally:
+            self.io_pool.close()
+            self.io_pool.join()
+            if cpu_pool_healthy:
+                self.cpu_pool.close()
+            else:
+                # close() would wait forever for the lost task
+                self.cpu_pool.terminate()
+            self.cpu_pool.join()
+            jobs.warm_process = False
+            self.release_unfinished_chunks()
+
+        print u"finished pipeline in {}sec over {} ranges. skipped: {}. {} chunks failed.".format(
+            elapsed(start), len(self.ranges), sorted(self.skipped) or "nothing", len(self.failures))
+        print_skip_counts(self.skip_counts)
+        for (name, object_ids_chunk, error) in self.failures:
+            print u"{} failed on {}: {}".format(name, object_ids_chunk, error.strip().splitlines()[-1])
+        return not self.failures
+
+    def check_cpu_pool(self):
+        # a worker process that dies (killed for memory, say) takes its task with it and
+        # the pool quietly starts another, so the task's callback never comes.  workers
+        # are only replaced when one dies, so more workers than we asked for means a lost task.
+        while True:
+            try:
+                self.cpu_pool_pids.add(self.cpu_pool_pid_queue.get_nowait())
+            except Empty:
+                break
+        if len(self.cpu_pool_pids) <= self.cpu_workers:
+            return True
+
+        lost_names = set()
+        for (key, num_pending) in self.num_pending.iteritems():
+            name = key[0] if isinstance(key, tuple) else key
+            if num_pending and self.stages[name].cpu:
+                lost_names.add(name)
+        error = u"a cpu worker process died, stopping the pipeline"
+        self.failures.append((u", ".join(sorted(lost_names)) or u"cpu pool", None, error))
+        print error
+        return False
+
+    def release_unfinished_chunks(self):
+        # chunks that finished after we stopped listening have their own keys set already
+        while True:
+            try:
+                (key, (object_ids_chunk, error, chunk_elapsed)) = self.events.get_nowait()
+            except Empty:
+                break
+            if object_ids_chunk:
+                name = key[0] if isinstance(key, tuple) else key
+                self.claimed_chunks.pop((name, object_ids_chunk[0]), None)
+
+        # so the next run doesn't skip them as queued
+        for (update_name, object_ids_chunk) in self.claimed_chunks.values():
+            clear_job_keys(update_name, object_ids_chunk)
+        self.claimed_chunks = {}
+
+    def is_done(self):
+        if not self.windows_done:
+            return False
+        for stage in self.stages.values():
+            if stage.per_range and len(self.ranges_done[stage.name]) < len(self.ranges):
+                return False
+            if not stage.per_range and stage.name not in self.global_done:
+                return False
+        return True
+
+    def schedule(self):
+        # keep a few ranges of the root stage going, so there's always work for the later stages
+        while not self.windows_done and \
+                len(self.ranges) - len(self.ranges_done[self.root.name]) < self.ranges_in_flight:
+            try:
+                window = self.windows.next()
+            except StopIteration:
+                self.windows_done = True
+                break
+            self.ranges.append((window[0], window[-1]))
+            self.start_range_stage(self.root, len(self.ranges) - 1, window)
+
+        # anything whose inputs are now ready.  skipped and empty stages are done as
+        # soon as they start, which can make more stages ready, so go until nothing starts.
+        started_something = True
+        while started_something:
+            started_something = False
+            for stage in self.stages.values():
+                if stage.per_range:
+                    for range_index in range(len(self.ranges)):
+                        if (stage.name, range_index) not in self.scheduled and self.range_inputs_ready(stage, range_index):
+                            self.start_range_stage(stage, range_index)
+                            started_something = True
+                elif stage.name not in self.scheduled and self.global_inputs_ready(stage):
+                    self.start_global_stage(stage)
+                    started_something = True
+
+    def range_inputs_ready(self, stage, range_index):
+        for name in stage.depends_on:
+            if self.stages[name].per_range:
+                if range_index not in self.ranges_done[name]:
+                    return False
+            elif name not in self.global_done:
+                return False
+        return True
+
+    def global_inputs_ready(self, stage):
+        if not self.windows_done:
+            return False
+        for name in stage.depends_on:
+            if self.stages[name].per_range:
+                if len(self.ranges_done[name]) < len(self.ranges):
+                    return False
+            elif name not in self.global_done:
+                return False
+        return True
+
+    def get_pool(self, stage):
+        return self.cpu_pool if stage.cpu else self.io_pool
+
+    def start_range_stage(self, stage, range_index, object_ids=None):
+        self.scheduled.add((stage.name, range_index))
+        cls = stage.update.cls
+
+        if object_ids is None:
+            # this stage's own query, for the same range of ids as the root stage
+            (first_id, last_id) = self.ranges[range_index]
+            q = stage.update.query.order_by(None).order_by(cls.id)
+            q = q.filter(cls.id >= first_id).filter(cls.id <= last_id)
+            object_ids = [row[0] for row in q.all()]
+            db.session.remove()
+
+        # the same freshness check enqueue_jobs does, so a profile refreshed today isn't refreshed again
+        fresh_for = stage.update.fresh_for if self.fresh_for is None else self.fresh_for
+        (object_ids, skipped) = claim_objects(stage.update.name, object_ids, fresh_for, force=self.force)
+        for (state, count) in skipped.iteritems():
+            self.skip_counts[state] += count
+
+        update_fn_kwargs = {
+            "load_columns": stage.update.load_columns,
+            "load_relationships": stage.update.load_relationships,
+            "dedupe": True
+        }
+        object_ids_chunks = list(chunks(object_ids, self.chunk_size))
+        self.num_pending[(stage.name, range_index)] = len(object_ids_chunks)
+        if not object_ids_chunks:
+            self.ranges_done[stage.name].add(range_index)
+            return
+
+        for index, object_ids_chunk in enumerate(object_ids_chunks):
+            self.claimed_chunks[(stage.name, object_ids_chunk[0])] = (stage.update.name, object_ids_chunk)
+            chunk_args = (cls, stage.update.method.__name__, object_ids_chunk, index, update_fn_kwargs)
+            self.get_pool(stage).apply_async(
+                run_chunk_in_pool_worker,
+                [chunk_args],
+                callback=lambda result, key=(stage.name, range_index): self.events.put((key, result))
+            )
+
+    def start_global_stage(self, stage):
+        self.scheduled.add(stage.name)
+
+        if stage.depends_on and all([name in self.skipped for name in stage.depends_on]):
+            print u"skipping {}, nothing it depends on ran".format(stage.name)
+            self.skip(stage)
+            return
+        if stage.inputs_changed and not stage.inputs_changed():
+            print u"skipping {}, its inputs haven't changed".format(stage.name)
+            self.skip(stage)
+            return
+
+        print u"starting {}".format(stage.name)
+        self.num_pending[stage.name] = 1
+        self.get_pool(stage).apply_async(
+            run_global_stage_in_worker,
+            [stage.fn],
+            callback=lambda result, key=stage.name: self.events.put((key, result))
+        )
+
+    def skip(self, stage):
+        self.skipped.add(stage.name)
+        self.global_done.add(stage.name)
+
+    def handle_event(self, event):
+        (key, (object_ids_chunk, error, chunk_elapsed)) = event
+        name = key[0] if isinstance(key, tuple) else key
+        if object_ids_chunk:
+            self.claimed_chunks.pop((name, object_ids_chunk[0]), None)
+        if error:
+            self.failures.append((name, object_ids_chunk, error))
+            print u"{} FAILED after {}sec:\n{}".format(name, chunk_elapsed, error)
+
+        self.num_pending[key] -= 1
+        if self.num_pending[key]:
+            return
+
+        if isinstance(key, tuple):
+            (name, range_index) = key
+            self.ranges_done[name].add(range_index)
+            print u"{} done for ids {} to {} ({} of {} ranges so far)".format(
+                name, self.ranges[range_index][0], self.ranges[range_index][1],
+                len(self.ranges_done[name]), len(self.ranges))
+        else:
+            self.global_done.add(name)
+            print u"{} done in {}sec".format(name, chunk_elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the weekly batch cycle as a pipeline.")
+    parser.add_argument('--limit', type=int, default=None, help="only refresh this many people")
+    parser.add_argument('--email', action="store_true", default=False, help="email people about new stuff as they're refreshed")
+    parser.add_argument('--io-workers', type=int, default=8, help="threads for the api-calling stages")
+    parser.add_argument('--cpu-workers', type=int, default=2, help="processes for the cpu-bound stages")
+    parser.add_argument('--window', type=int, default=1000, help="how many ids in each range")
+    parser.add_argument('--chunk', type=int, default=10, help="how many ids each thread or process takes at a time")
+    parser.add_argument('--fresh-for', type=int, default=None, help="skip things done less than this many seconds ago")
+    parser.add_argument('--force', action="store_true", default=False, help="don't skip anything")
+    parsed_args = parser.parse_args()
+
+    pipeline = Pipeline(
+        weekly_stages(email=parsed_args.email),
+        io_workers=parsed_args.io_workers,
+        cpu_workers=parsed_args.cpu_workers,
+        window_size=parsed_args.window,
+        chunk_size=parsed_args.chunk,
+        limit=parsed_args.limit,
+        fresh_for=parsed_args.fresh_for,
+        force=parsed_args.force
+    )
+    success = pipeline.run()
+    db.session.remove()
+    sys.exit(0 if success else 1)
@@ -2,12 +2,27 @@ import optparse
 import os
 import sys
 import logging
+import resource
+import signal
+from multiprocessing import Process
+from sqlalchemy import text
+from sqlalchemy import exc
 from rq import Worker
+from rq import SimpleWorker
 from rq import Queue
 from rq import Connection
 from rq.job import JobStatus
 from app import redis_rq_conn
 from app import ti_queues
+from app import ti_high_priority_queue
+from app import db
+import jobs
+from models import metrics
+from jobs import split_timed_out_job
+
+# needs to be imported so the definitions get loaded into the registry, for split_timed_out_job
+import jobs_defs
+from rq.timeouts import JobTimeoutException
 import argparse
 
 
@@ -18,22 +33,123 @@ def failed_job_handler(job, exc_type, exc_value, traceback):
     print "RQ job failed! {}. here's more: {} {} {}".format(
         job.meta, exc_type, exc_value, traceback
     )
+    metrics.inc("ti_rq_jobs_failed_total", {"queue": job.origin, "function": job.func_name})
+    metrics.flush()
+
+    if exc_type is JobTimeoutException and job.func_name == "jobs.update_fn":
+        if split_timed_out_job(job):
+            return False  # requeued as smaller chunks, so not failed
     return True  # job failed, drop to next level error handling
 
+# a warm worker exits with this when it wants the supervisor to start a fresh one
+restart_exit_code = 3
+
+
+def get_memory_mb():
+    # ru_maxrss is in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def check_db_connection():
+    # the warm process keeps its connections between jobs, so make sure they're still good
+    try:
+        db.session.execute(text("select 1"))
+    except exc.DBAPIError:
+        print u"db connection went bad between jobs, reconnecting"
+        db.session.rollback()
+        db.engine.dispose()
+    finally:
+        db.session.remove()
+
+
+class WarmWorker(SimpleWorker):
+    """
+    Runs jobs in this process instead of forking for each one, so the engine,
+    refset cutoffs, badge registry and api sessions stay warm between jobs.
+
+    Stops after max_jobs jobs or once it's used max_memory_mb, so that
+    supervise_warm_worker can start a fresh one.
+    """
+
+    def __init__(self, queues, max_jobs=None, max_memory_mb=None, **kwargs):
+        SimpleWorker.__init__(self, queues, **kwargs)
+        self.max_jobs = max_jobs
+        self.max_memory_mb = max_memory_mb
+        self.num_jobs = 0
+        self.restart_needed = False
+
+    def execute_job(self, job):
+        check_db_connection()
+        SimpleWorker.execute_job(self, job)
+        self.num_jobs += 1
+
+        if self.max_jobs and self.num_jobs >= self.max_jobs:
+            print u"done {} jobs, restarting the worker".format(self.num_jobs)
+            self.restart_needed = True
+        elif self.max_memory_mb and get_memory_mb() >= self.max_memory_mb:
+            print u"using {}MB after {} jobs, restarting the worker".format(int(get_memory_mb()), self.num_jobs)
+            self.restart_needed = True
+
+        if self.restart_needed:
+            self._stop_requested = True
+
+
 def start_worker(queue_name):
     print "starting worker '{}'...".format(queue_name)
 
     with Connection(redis_rq_conn):
-        worker = Worker(Queue(queue_name), exc_handler=failed_job_handler)
+        # high priority jobs first, so they don't wait behind a backfill
+        worker = Worker([ti_high_priority_queue, Queue(queue_name)], exc_handler=failed_job_handler)
         worker.work()
 
 
+def start_warm_worker(queue_name, max_jobs=None, max_memory_mb=None):
+    print "starting warm worker '{}'...".format(queue_name)
+
+    # update_fn mustn't throw away our connections after every job
+    jobs.warm_process = True
+
+    with Connection(redis_rq_conn):
+        worker = WarmWorker(
+            [ti_high_priority_queue, Queue(queue_name)],
+            max_jobs=max_jobs,
+            max_memory_mb=max_memory_mb,
+            exc_handler=failed_job_handler
+        )
+        worker.work()
+
+    sys.exit(restart_exit_code if worker.restart_needed else 0)
+
+
+def supervise_warm_worker(queue_name, max_jobs=None, max_memory_mb=None):
+    # signals go to the whole process group, so the worker gets its own and
+    # shuts down warmly.  we just need to not start another one.
+    stopping = []
+    def stop(signum, frame):
+        stopping.append(signum)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while True:
+        worker_process = Process(target=start_warm_worker, args=(queue_name, max_jobs, max_memory_mb))
+        worker_process.start()
+        while worker_process.is_alive():
+            worker_process.join(1)
+
+        if stopping or worker_process.exitcode != restart_exit_code:
+            print u"warm worker exited with {}, not restarting".format(worker_process.exitcode)
+            return worker_process.exitcode
+
+
 
 if __name__ == '__main__':
 
     # get args from the command line:
     parser = argparse.ArgumentParser(description="Run RQ workers on a given queue.")
     parser.add_argument('queue_number', type=int, help="the queue number you want this worker to listen on.")
+    parser.add_argument('--warm', action="store_true", default=False, help="run jobs in one long-lived process instead of forking for each")
+    parser.add_argument('--max-jobs', type=int, default=1000, help="with --warm, restart the worker after this many jobs")
+    parser.add_argument('--max-memory-mb', type=int, default=400, help="with --warm, restart the worker once it uses this much memory")
 
     args = vars(parser.parse_args())
 
@@ -42,5 +158,8 @@ if __name__ == '__main__':
     print u"Starting an RQ worker, listening on '{queue_name}'\n".format(
         queue_name=queue_name
     )
-    start_worker(queue_name)
+    if args["warm"]:
+        sys.exit(supervise_warm_worker(queue_name, args["max_jobs"], args["max_memory_mb"]))
+    else:
+        start_worker(queue_name)
 
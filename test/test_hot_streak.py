@@ -0,0 +1,90 @@
+import datetime
+import random
+import unittest
+from collections import defaultdict
+from time import time
+
+from models.badge import get_hot_streak_length
+from models.badge_features import add_events_per_month
+from util import days_ago
+
+
+def make_event_dates(days_ago_list):
+    # noon, so an event doesn't move a day while the test runs
+    today = datetime.datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    return [(today - datetime.timedelta(days=n)).isoformat() for n in days_ago_list]
+
+
+def old_hot_streak_length(event_dates):
+    # how hot_streak used to do it: a list of 30 days for each month, checked against every event
+    streak_length = 0
+    all_event_days_ago = [days_ago(e) for e in event_dates]
+    for month in range(0, 10*12):  # do up to 10 years
+        streak_length += 1
+        relevant_days = [month*30 + day for day in range(0, 30)]
+        matching_days_count = len([d for d in all_event_days_ago if d in relevant_days])
+        if matching_days_count <= 0:
+            break
+    return streak_length
+
+
+def new_hot_streak_length(event_dates):
+    events_per_month = defaultdict(int)
+    add_events_per_month(events_per_month, event_dates)
+    return get_hot_streak_length(events_per_month)
+
+
+class TestHotStreak(unittest.TestCase):
+
+    event_lists = [
+        [],
+        [0],
+        [29, 30],
+        [0, 30, 60, 90, 120],
+        [5, 35, 95],  # gap in the third month
+        [29, 59, 89, 119, 149, 179],
+        [0, 31, 62, 93, 124, 155],  # drifts a day later each month
+        [10, 10, 10, 40, 40, 70],
+        [-3, 0, 30],  # events in the future are ignored
+        range(0, 10*12*30, 7),  # every week for ten years, hits the cap
+        range(3000, 4000, 3),  # all long ago, so no streak
+    ]
+
+    def test_matches_old_loop(self):
+        for days_ago_list in self.event_lists:
+            event_dates = make_event_dates(days_ago_list)
+            self.assertEqual(
+                new_hot_streak_length(event_dates),
+                old_hot_streak_length(event_dates),
+                u"streaks differ for events {} days ago".format(days_ago_list)
+            )
+
+    def test_matches_old_loop_on_random_events(self):
+        my_random = random.Random(0)
+        for i in range(50):
+            num_events = my_random.randint(0, 100)
+            days_ago_list = [my_random.randint(0, my_random.choice([60, 400, 4000])) for j in range(num_events)]
+            event_dates = make_event_dates(days_ago_list)
+            self.assertEqual(new_hot_streak_length(event_dates), old_hot_streak_length(event_dates))
+
+    def test_benchmark(self):
+        # two years of a very busy profile: tens of thousands of events, 40 a day
+        event_dates = make_event_dates(range(0, 2*365) * 40)
+        self.assertGreaterEqual(len(event_dates), 20000)
+
+        start = time()
+        old_length = old_hot_streak_length(event_dates)
+        old_seconds = time() - start
+
+        start = time()
+        new_length = new_hot_streak_length(event_dates)
+        new_seconds = time() - start
+
+        print u"\nhot_streak on {} events: old loop {:.4f}sec, histogram {:.4f}sec".format(
+            len(event_dates), old_seconds, new_seconds)
+        self.assertEqual(new_length, old_length)
+        self.assertLess(new_seconds, old_seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
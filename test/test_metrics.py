@@ -0,0 +1,44 @@
+import unittest
+
+from models.metrics import format_samples
+from models.metrics import format_labels
+
+
+class TestFormatSamples(unittest.TestCase):
+
+    def make_histogram_samples(self, method, buckets, total, count):
+        samples = {}
+        for (le, value) in buckets:
+            samples[u"ti_update_chunk_seconds_bucket" + format_labels({"method": method, "le": le})] = value
+        samples[u"ti_update_chunk_seconds_sum" + format_labels({"method": method})] = total
+        samples[u"ti_update_chunk_seconds_count" + format_labels({"method": method})] = count
+        return samples
+
+    def test_histogram_series_are_grouped(self):
+        samples = {}
+        samples.update(self.make_histogram_samples(u"Person.refresh", [(0.5, 1), (10, 2), ("+Inf", 2)], 7.3, 2))
+        samples.update(self.make_histogram_samples(u"Person.calculate", [(0.5, 0), (10, 3), ("+Inf", 4)], 40, 4))
+        samples[u"ti_update_chunks_total" + format_labels({"method": u"Person.refresh"})] = 2
+
+        lines = format_samples(samples).splitlines()
+        self.assertEqual(lines, [
+            u"# HELP ti_update_chunk_seconds Time for update_fn to load, run and commit one chunk.",
+            u"# TYPE ti_update_chunk_seconds histogram",
+            u"ti_update_chunk_seconds_bucket{le=\"0.5\",method=\"Person.calculate\"} 0",
+            u"ti_update_chunk_seconds_bucket{le=\"10\",method=\"Person.calculate\"} 3",
+            u"ti_update_chunk_seconds_bucket{le=\"+Inf\",method=\"Person.calculate\"} 4",
+            u"ti_update_chunk_seconds_sum{method=\"Person.calculate\"} 40",
+            u"ti_update_chunk_seconds_count{method=\"Person.calculate\"} 4",
+            u"ti_update_chunk_seconds_bucket{le=\"0.5\",method=\"Person.refresh\"} 1",
+            u"ti_update_chunk_seconds_bucket{le=\"10\",method=\"Person.refresh\"} 2",
+            u"ti_update_chunk_seconds_bucket{le=\"+Inf\",method=\"Person.refresh\"} 2",
+            u"ti_update_chunk_seconds_sum{method=\"Person.refresh\"} 7.3",
+            u"ti_update_chunk_seconds_count{method=\"Person.refresh\"} 2",
+            u"# HELP ti_update_chunks_total Chunks of objects update_fn has run.",
+            u"# TYPE ti_update_chunks_total counter",
+            u"ti_update_chunks_total{method=\"Person.refresh\"} 2"
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
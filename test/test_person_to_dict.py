@@ -0,0 +1,78 @@
+import datetime
+import unittest
+from time import time
+
+from models.person import Person
+from models.product import Product
+from models.badge import Badge
+from models.badge import BadgeAssigner
+from models.badge import all_badge_assigner_names
+
+
+def old_my_badge_type(self):
+    # how Badge.my_badge_type used to do it: scan the sorted subclasses, then make an
+    # assigner, whose constructor made a whole new Badge
+    assigners = BadgeAssigner.__subclasses__()
+    assigners.sort(key=lambda x: x.group)
+    for assigner in assigners:
+        if assigner.__name__ == self.name:
+            my_assigner = assigner()
+            Badge(name=assigner.__name__)
+            return my_assigner
+    return None
+
+
+def make_person(num_products):
+    my_person = Person()
+    my_person.orcid_id = u"0000-0000-0000-0001"
+    my_person.given_names = u"Ada"
+    my_person.family_name = u"Lovelace"
+    my_person.created = datetime.datetime.utcnow()
+    for i in range(num_products):
+        my_person.products.append(Product(doi=u"10.1234/{}".format(i), title=u"paper {}".format(i), year=u"2015"))
+    for (i, name) in enumerate(all_badge_assigner_names()):
+        my_person.badges.append(Badge(name=name, value=i + 1, percentile=(i % 10) / 10.0))
+    return my_person
+
+
+def time_to_dict(my_person, repeat=20):
+    start = time()
+    for i in range(repeat):
+        my_person.to_dict()
+    return time() - start
+
+
+class TestPersonToDict(unittest.TestCase):
+
+    def test_badges_match_old_lookup(self):
+        my_person = make_person(10)
+        new_dict = my_person.to_dict()
+
+        new_my_badge_type = Badge.my_badge_type
+        Badge.my_badge_type = property(old_my_badge_type)
+        try:
+            old_dict = my_person.to_dict()
+        finally:
+            Badge.my_badge_type = new_my_badge_type
+
+        self.assertEqual(new_dict["badges"], old_dict["badges"])
+        self.assertEqual(new_dict["overview_badges"], old_dict["overview_badges"])
+
+    def test_benchmark(self):
+        my_person = make_person(500)
+        new_seconds = time_to_dict(my_person)
+
+        new_my_badge_type = Badge.my_badge_type
+        Badge.my_badge_type = property(old_my_badge_type)
+        try:
+            old_seconds = time_to_dict(my_person)
+        finally:
+            Badge.my_badge_type = new_my_badge_type
+
+        print u"\nPerson.to_dict with {} products and {} badges: old lookup {:.4f}sec, registry {:.4f}sec".format(
+            len(my_person.products), len(my_person.badges), old_seconds, new_seconds)
+        self.assertLess(new_seconds, old_seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
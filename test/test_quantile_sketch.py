@@ -0,0 +1,114 @@
+import random
+import unittest
+
+from models.quantile_sketch import QuantileSketch
+from models.quantile_sketch import default_relative_accuracy
+
+
+def exact_cutoffs(values, num_cutoffs=100):
+    # what calculate_refset_cutoffs gets from postgres: the first value of each
+    # of num_cutoffs nearly-equal chunks of the sorted values
+    values = sorted(values)
+    n = len(values)
+    ranks = [i * (n / num_cutoffs) + min(i, n % num_cutoffs) for i in range(min(n, num_cutoffs))]
+    return [values[rank] for rank in ranks]
+
+
+def max_relative_error(exact, approx):
+    errors = []
+    for (exact_value, approx_value) in zip(exact, approx):
+        if exact_value:
+            errors.append(abs(approx_value - exact_value) / abs(exact_value))
+        else:
+            errors.append(abs(approx_value))
+    return max(errors) if errors else 0
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    # a little slack for floating point at the bucket edges
+    allowed_error = default_relative_accuracy * 1.0001
+
+    def make_values(self, my_random, num_values):
+        # badge values look like this: lots of zeros, small counts, and a long tail
+        values = []
+        for i in range(num_values):
+            kind = my_random.random()
+            if kind < 0.3:
+                values.append(0)
+            elif kind < 0.7:
+                values.append(my_random.randint(1, 20))
+            elif kind < 0.95:
+                values.append(my_random.lognormvariate(3, 2))
+            else:
+                values.append(round(my_random.random(), 4))
+        return values
+
+    def assert_accurate(self, sketch, values):
+        exact = exact_cutoffs(values)
+        approx = sketch.cutoffs()
+        self.assertEqual(len(approx), len(exact))
+        self.assertLessEqual(max_relative_error(exact, approx), self.allowed_error)
+
+    def test_cutoffs_are_accurate(self):
+        my_random = random.Random(0)
+        for num_values in [1, 5, 99, 100, 101, 1000, 20000]:
+            values = self.make_values(my_random, num_values)
+            sketch = QuantileSketch()
+            for value in values:
+                sketch.add(value)
+            self.assertEqual(sketch.count, len(values))
+            self.assert_accurate(sketch, values)
+
+    def test_cutoffs_are_accurate_after_changes(self):
+        # badge values changing and being lost, the way the redis deltas record them
+        my_random = random.Random(1)
+        values = self.make_values(my_random, 5000)
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        for i in range(3000):
+            index = my_random.randrange(len(values))
+            sketch.remove(values[index])
+            if my_random.random() < 0.2:
+                values.pop(index)
+            else:
+                values[index] = self.make_values(my_random, 1)[0]
+                sketch.add(values[index])
+
+        self.assertEqual(sketch.count, len(values))
+        self.assert_accurate(sketch, values)
+
+    def test_negative_values(self):
+        my_random = random.Random(2)
+        values = [my_random.uniform(-100, 100) for i in range(2000)] + [0] * 100
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+        self.assert_accurate(sketch, values)
+
+    def test_merge_and_bucket_counts(self):
+        # update_refsets keeps the sketch in the db and the deltas in redis, then adds them up
+        my_random = random.Random(3)
+        values = self.make_values(my_random, 3000)
+        whole = QuantileSketch()
+        first_half = QuantileSketch()
+        second_half = QuantileSketch()
+        for (i, value) in enumerate(values):
+            whole.add(value)
+            (first_half if i % 2 else second_half).add(value)
+
+        merged = QuantileSketch.from_dict(first_half.to_dict())
+        merged.add_bucket_counts(dict((key, str(count)) for (key, count) in second_half.bucket_counts().iteritems()))
+        self.assertEqual(merged.bucket_counts(), whole.bucket_counts())
+        self.assertEqual(merged.cutoffs(), whole.cutoffs())
+
+    def test_empty(self):
+        sketch = QuantileSketch()
+        self.assertEqual(sketch.count, 0)
+        self.assertEqual(sketch.cutoffs(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
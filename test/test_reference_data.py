@@ -0,0 +1,97 @@
+import unittest
+from time import time
+
+from models import reference_data
+from models.country import country_info
+from models.reference_data import url_slugs_to_redirect
+from models.reference_data import scientists_twitter
+from models.reference_data import is_url_slug_to_redirect
+from models.reference_data import is_scientist_on_twitter
+from models.reference_data import get_country_name_from_iso
+
+
+def old_get_name_from_iso(iso_name):
+    # how country.get_name_from_iso used to do it, a scan of country_info
+    for country_name, country_dict in country_info.iteritems():
+        if iso_name == country_dict["iso"]:
+            return country_name
+    return None
+
+
+def time_lookups(lookup, keys, repeat=20):
+    start = time()
+    for i in range(repeat):
+        for key in keys:
+            lookup(key)
+    return time() - start
+
+
+class TestReferenceData(unittest.TestCase):
+
+    def test_url_slugs(self):
+        self.assertGreater(len(url_slugs_to_redirect()), 10000)
+        self.assertTrue(is_url_slug_to_redirect(u"JohannesKarstensen"))
+        self.assertTrue(is_url_slug_to_redirect(u"johanneskarstensen"))
+        self.assertFalse(is_url_slug_to_redirect(u"about"))
+        self.assertFalse(is_url_slug_to_redirect(u""))
+
+    def test_scientists_twitter(self):
+        self.assertEqual(len(scientists_twitter()), 50)
+        self.assertTrue(is_scientist_on_twitter(u"neiltyson"))
+        self.assertTrue(is_scientist_on_twitter(u"NeilTyson"))
+        self.assertFalse(is_scientist_on_twitter(u"someone_else"))
+
+    def test_country_names_match_old_scan(self):
+        isos = [country_dict["iso"] for country_dict in country_info.values()] + ["XX", None]
+        for iso in isos:
+            self.assertEqual(get_country_name_from_iso(iso), old_get_name_from_iso(iso))
+
+    def test_tables_are_cached(self):
+        self.assertIs(url_slugs_to_redirect(), url_slugs_to_redirect())
+        self.assertIs(scientists_twitter(), scientists_twitter())
+
+    def test_import_loads_nothing(self):
+        # the point of the module: a process that never looks anything up never reads the files
+        start = time()
+        reload(reference_data)
+        import_seconds = time() - start
+        print u"\nreference_data import: {:.4f}sec".format(import_seconds)
+        self.assertEqual(reference_data._tables, {})
+        self.assertLess(import_seconds, 0.1)
+
+    def test_first_load_time(self):
+        reference_data._tables.clear()
+        for table_fn in [url_slugs_to_redirect, scientists_twitter, reference_data.country_names_by_iso]:
+            start = time()
+            table = table_fn()
+            load_seconds = time() - start
+
+            start = time()
+            table_fn()
+            cached_seconds = time() - start
+
+            print u"\n{} ({} entries): first load {:.4f}sec, cached {:.6f}sec".format(
+                table_fn.__name__, len(table), load_seconds, cached_seconds)
+            self.assertLess(load_seconds, 0.25)
+            self.assertLess(cached_seconds, load_seconds)
+
+    def test_benchmark(self):
+        # the old modules kept the slugs and handles in lists, so compare against a list scan
+        slugs_list = list(url_slugs_to_redirect())
+        slugs = slugs_list[::500] + [u"not-a-slug"]
+        old_seconds = time_lookups(lambda slug: slug.lower() in slugs_list, slugs)
+        new_seconds = time_lookups(is_url_slug_to_redirect, slugs)
+        print u"\n{} slug lookups: list scan {:.4f}sec, frozenset {:.4f}sec".format(
+            len(slugs) * 20, old_seconds, new_seconds)
+        self.assertLess(new_seconds, old_seconds)
+
+        isos = [country_dict["iso"] for country_dict in country_info.values()]
+        old_seconds = time_lookups(old_get_name_from_iso, isos)
+        new_seconds = time_lookups(get_country_name_from_iso, isos)
+        print u"{} country lookups: scan {:.4f}sec, dict {:.4f}sec".format(
+            len(isos) * 20, old_seconds, new_seconds)
+        self.assertLess(new_seconds, old_seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
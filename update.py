@@ -1,6 +1,7 @@
 from time import time
 from app import db
 import argparse
+import sys
 from jobs import update_registry
 from util import elapsed
 
@@ -14,6 +15,28 @@ examples of calling this:
 # update everything
 python update.py Person.refresh --limit 10 --chunk 5 --rq
 
+# --limit takes the lowest ids, except for shuffled updates like Person.refresh,
+# where it takes a random sample (the default limit is 1000)
+
+# update everything on every core of this machine, no rq
+python update.py Person.assign_badges --limit 10000 --chunk 100 --workers 8
+
+# refresh one profile ahead of whatever backfill is running
+python update.py Person.refresh --orcid 0000-1111-2222-3333 --rq --high-priority
+
+# name a run to checkpoint it.  if it dies, carry on from where it stopped,
+# then rerun the chunks that failed
+python update.py Person.refresh --limit 10 --chunk 5 --rq --name weekly-refresh
+python update.py Person.refresh --limit 10 --chunk 5 --rq --name weekly-refresh --resume
+python update.py Person.refresh --rq --name weekly-refresh --retry-failures
+
+# an rq run's pending chunks that are still on the queue are left to their jobs.
+# if the queue was lost, empty it while resuming, so they're all queued again
+python update.py Person.refresh --rq --name weekly-refresh --resume --empty-queue
+
+# refresh people even if they're already queued or were just refreshed
+python update.py Person.refresh --limit 10 --rq --force
+
 # update one thing not using rq
 python update.py Person.refresh --orcid 0000-1111-2222-3333
 
@@ -21,10 +44,24 @@ python update.py Person.refresh --orcid 0000-1111-2222-3333
 
 def parse_update_optional_args(parser):
     # just for updating lots
-    parser.add_argument('--limit', "-l", nargs="?", type=int, help="how many jobs to do")
+    parser.add_argument('--limit', "-l", nargs="?", type=int, help="how many jobs to do, a random sample for shuffled updates")
     parser.add_argument('--chunk', "-ch", nargs="?", type=int, help="how many to take off db at once")
+    parser.add_argument('--target-seconds', nargs="?", type=float, help="size chunks to take about this long each")
     parser.add_argument('--after', nargs="?", type=str, help="minimum id or id start, ie 0000-0001")
     parser.add_argument('--rq', action="store_true", default=False, help="do jobs in this thread")
+    parser.add_argument('--workers', nargs="?", type=int, help="run chunks in this many local processes instead of one")
+    parser.add_argument('--high-priority', action="store_true", default=False, help="use the high priority queue and rate limit share")
+
+    # things already queued, running, or done in the last --fresh-for seconds are skipped
+    parser.add_argument('--fresh-for', nargs="?", type=int, help="skip things done less than this many seconds ago")
+    parser.add_argument('--force', action="store_true", default=False, help="don't skip anything")
+    parser.add_argument('--empty-queue', action="store_true", default=False, help="empty the rq queue before enqueueing")
+
+    # for picking up a run that stopped.  only named runs are checkpointed, and a name
+    # with unfinished work can't be started again, only resumed or retried
+    parser.add_argument('--name', nargs="?", type=str, help="name to checkpoint this run under")
+    parser.add_argument('--resume', action="store_true", default=False, help="carry on from where the named run stopped")
+    parser.add_argument('--retry-failures', action="store_true", default=False, help="rerun only the ids that failed in the named run")
 
     # just for updating one
     parser.add_argument('--id', nargs="?", type=str, help="id of the one thing you want to update")
@@ -46,16 +83,26 @@ def run_update(parsed_args):
         my_person = db.session.query(Person).filter(Person.orcid_id==parsed_args.orcid).first()
         parsed_args.id = my_person.id
 
-    update.run(
+    success = update.run(
         use_rq=parsed_args.rq,
         obj_id=parsed_args.id,  # is empty unless updating just one row
         min_id=parsed_args.after,  # is empty unless minimum id
         num_jobs=parsed_args.limit,
-        chunk_size=parsed_args.chunk
+        chunk_size=parsed_args.chunk,
+        workers=parsed_args.workers,
+        high_priority=parsed_args.high_priority,
+        run_name=parsed_args.name,
+        resume=parsed_args.resume,
+        retry_failures=parsed_args.retry_failures,
+        target_seconds=parsed_args.target_seconds,
+        fresh_for=parsed_args.fresh_for,
+        force=parsed_args.force,
+        empty_queue_first=parsed_args.empty_queue
     )
 
     db.session.remove()
     print "finished update in {}sec".format(elapsed(start))
+    return success
 
 
 
@@ -64,6 +111,6 @@ if __name__ == "__main__":
     # for everything
     parser.add_argument('fn', type=str, help="what function you want to run")
     parsed_args = parse_update_optional_args(parser)
-    run_update(parsed_args)
+    sys.exit(0 if run_update(parsed_args) else 1)
 
 
@@ -0,0 +1,69 @@
+from time import time
+from multiprocessing import Pool
+from sqlalchemy import orm
+import argparse
+
+from app import db
+from util import elapsed
+from util import safe_commit
+
+from models.product import Product
+from models.product import calculate_reading_level
+
+# backfills Product.reading_level.  textstat is cpu-bound, so the grade levels
+# are calculated in a process pool; reading and saving stay in this process.
+# python update_reading_levels.py --processes=4 --chunk=1000
+
+def update_reading_levels(processes=None, chunk_size=1000, limit=None, recalculate=False):
+    pool = Pool(processes=processes)
+    num_done = 0
+    last_id = None
+
+    while True:
+        start = time()
+        q = db.session.query(Product).options(orm.undefer(Product.altmetric_api_raw))
+        if not recalculate:
+            q = q.filter(Product.reading_level_text_hash == None)
+        if last_id:
+            q = q.filter(Product.id > last_id)
+        q = q.order_by(Product.id).limit(chunk_size)
+        products = q.all()
+        if not products:
+            break
+
+        texts = [p.get_reading_level_text() for p in products]
+        reading_levels = pool.map(calculate_reading_level, texts)
+        for (my_product, text, reading_level) in zip(products, texts, reading_levels):
+            my_product.set_reading_level_from_text(text, reading_level)
+
+        safe_commit(db)
+        num_done += len(products)
+        last_id = products[-1].id
+        print u"set reading levels on {} products, {} so far, in {}sec".format(
+            len(products), num_done, elapsed(start))
+
+        if limit and num_done >= limit:
+            break
+
+    pool.close()
+    pool.join()
+    return num_done
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run stuff.")
+    parser.add_argument('--processes', type=int, default=None, help="size of the process pool (default: number of cpus)")
+    parser.add_argument('--chunk', type=int, default=1000, help="how many products to read and save at a time")
+    parser.add_argument('--limit', type=int, default=None, help="stop after about this many products")
+    parser.add_argument('--all', action="store_true", default=False, help="recalculate products that already have a reading level")
+    parsed_args = parser.parse_args()
+
+    start = time()
+    num_done = update_reading_levels(
+        processes=parsed_args.processes,
+        chunk_size=parsed_args.chunk,
+        limit=parsed_args.limit,
+        recalculate=parsed_args.all
+    )
+    db.session.remove()
+    print "finished reading levels for {} products in {}sec".format(num_done, elapsed(start))
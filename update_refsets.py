@@ -5,13 +5,35 @@ from util import safe_commit
 import argparse
 
 from models.refset import update_refsets
+from models.refset import update_refsets_from_sketches
+from models.refset import compare_refset_sketches_to_exact
+from models.refset import update_badge_percentiles
 
 # needs to be imported so the definitions get loaded into the registry
 import jobs_defs
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run stuff.")
+    parser.add_argument('--from-sketches', action="store_true", default=False,
+                        help="just rederive the cutoffs from the stored sketches and recent badge changes")
+    parser.add_argument('--check-sketches', action="store_true", default=False,
+                        help="print how far the sketch cutoffs are from the exact ones, don't save anything")
+    parser.add_argument('--percentiles-only', action="store_true", default=False,
+                        help="don't change the refsets, just update all the badge percentiles from them")
+    parsed_args = parser.parse_args()
+
     start = time()
-    update_refsets()
+    if parsed_args.check_sketches:
+        compare_refset_sketches_to_exact()
+    elif parsed_args.percentiles_only:
+        update_badge_percentiles()
+    else:
+        if parsed_args.from_sketches:
+            update_refsets_from_sketches()
+        else:
+            update_refsets()
+        # stored percentiles are stale as soon as the cutoffs change
+        update_badge_percentiles()
     db.session.remove()
     print "finished update in {}sec".format(elapsed(start))
 
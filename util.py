@@ -75,10 +75,8 @@ def cached_property(property_name):
 
 
 def get_badge_description(badge_name, badge_value):
-    from models.badge import get_badge_assigner, dummy_badge_assigner
-    assigner = get_badge_assigner(badge_name)
-    assigner = assigner() if assigner else dummy_badge_assigner()
-    description_template = assigner.description
+    from models.badge import get_badge_type
+    description_template = get_badge_type(badge_name).description
     description_string = description_template.format(
         value=conversational_number(badge_value),
         one_hundred_minus_value=conversational_number(100 - badge_value)
@@ -24,7 +24,8 @@ from models.refset import num_people_in_db
 from models.badge import Badge
 from models.badge import badge_configs
 from models.search import autocomplete
-from models.url_slugs_to_redirect import url_slugs_to_redirect
+from models.reference_data import is_url_slug_to_redirect
+from models.metrics import render_metrics
 from models.twitter import get_twitter_creds
 from util import safe_commit, get_badge_description
 from util import elapsed
@@ -49,6 +50,7 @@ from requests_oauthlib import OAuth1
 import os
 import sys
 import json
+import hmac
 import logging
 from operator import attrgetter
 from urlparse import parse_qs, parse_qsl
@@ -109,7 +111,7 @@ def abort_json(status_code, msg, **kwargs):
 @app.route("/")
 def index_view(path="index", page=""):
 
-    if page.lower() in url_slugs_to_redirect:
+    if is_url_slug_to_redirect(page):
         return redirect(u"http://v1.impactstory.org/{}".format(page.strip()), code=302)
 
     return render_template(
@@ -175,6 +177,22 @@ def favicon_ico():
 ###########################################################################
 # API
 ###########################################################################
+@app.route("/metrics")
+def metrics_endpoint():
+    # prometheus text format, summed across all the worker dynos.
+    # off unless METRICS_TOKEN is set, and then scrapers send it as a bearer token.
+    metrics_token = os.getenv("METRICS_TOKEN")
+    if not metrics_token:
+        abort_json(404, "Metrics aren't turned on here.")
+    authorization = request.headers.get("Authorization", u"").encode("utf-8")
+    if not hmac.compare_digest(authorization, "Bearer " + metrics_token):
+        abort_json(401, "You need a metrics token to see this.")
+
+    resp = make_response(render_metrics(), 200)
+    resp.headers["Content-Type"] = "text/plain; version=0.0.4; charset=utf-8"
+    return resp
+
+
 @app.route("/api")
 def api_test():
     return json_resp({"resp": "Impactstory: The Next Generation."})
@@ -333,7 +351,7 @@ def modify_profile_endpoint(orcid_id):
 @app.route("/api/person/<orcid_id>/refresh", methods=["POST"])
 @app.route("/api/person/<orcid_id>/refresh.json", methods=["POST"])
 def refresh_profile_endpoint(orcid_id):
-    my_person = refresh_profile(orcid_id)
+    my_person = refresh_profile(orcid_id, high_priority=True)
     return json_resp(my_person.to_dict())
 
 
@@ -492,7 +510,7 @@ def me():
 @app.route("/api/me/refresh", methods=["POST"])
 @login_required
 def refresh_me():
-    refresh_person(g.my_person)
+    refresh_person(g.my_person, high_priority=True)
     return jsonify({"token":  g.my_person.get_token()})
 
 @app.route("/api/me/promos", methods=["GET"])